@@ -0,0 +1,31 @@
+# PLANIFICATEUR PERT/CPM (paquet pert_gantt)
+# L'import du paquet ne fait aucun calcul et ne charge aucun module : les noms
+# ci-dessous sont résolus à la première utilisation (démarrage des processus de
+# calcul et de la ligne de commande en quelques millisecondes).
+
+_EXPORTS = {
+    'Task': 'scheduler',
+    'AdvancedTask': 'scheduler',
+    'ProjectScheduler': 'scheduler',
+    'CompiledGraph': 'cpm_engine',
+    'TaskStore': 'task_store',
+    'WorkCalendar': 'work_calendar',
+    'SchedulingService': 'service',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = value  # Les accès suivants ne passent plus par __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,4 @@
+# python -m pert_gantt input.csv -o out.csv : même commande que `schedule`
+from .cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,273 @@
+# PROBABILITÉ D'ACHÈVEMENT ANALYTIQUE (APPROXIMATION DE CLARK / SCULLI)
+# Alternative rapide à la simulation Monte Carlo : moyenne et variance des
+# dates sont propagées en un seul passage topologique, le maximum de deux lois
+# normales aux points de convergence étant approché par les formules de Clark.
+#
+# Chaque date est tenue sous forme canonique
+#     X = moyenne + Σ a_i·Z_i + résidu indépendant
+# où Z_i est l'aléa (loi normale centrée réduite) de la durée de la tâche i.
+# Les coefficients a_i donnent la corrélation entre chemins qui partagent des
+# tâches ; seuls les `sources` plus forts sont conservés par date (le reste
+# passe dans le résidu), ce qui borne le coût à O(sources) par lien.
+# Avec sources=0, toutes les dates sont indépendantes : méthode de Sculli.
+#
+# Coût réel : un maximum de Clark par lien, en Python. Pour 100 000 tâches et
+# 300 000 liens, compter environ 6 s avec 16 sources (7 fois schedule_project,
+# 50 fois le seul passage avant compilé) et 3,4 s avec sources=0 ; environ
+# 4 fois moins qu'une simulation Monte Carlo de 2 000 itérations. Réduire
+# `sources` accélère le calcul mais rapproche le résultat de Sculli (écart-type
+# sous-estimé).
+
+import heapq
+import math
+from statistics import NormalDist
+
+from .cpm_engine import FS, SS, FF
+
+MAX_SOURCES = 16  # Coefficients de corrélation conservés par date
+VARIANCE_TOLERANCE = 1e-12
+DOMINANCE = 8.0  # Écart (en écarts-types) au-delà duquel le maximum est la plus grande des deux dates
+_SQRT2 = math.sqrt(2)
+
+
+class _Normal:
+    """Date aléatoire sous forme canonique (moyenne, coefficients, variance résiduelle)"""
+
+    __slots__ = ('mean', 'coefficients', 'residual', '_variance')
+
+    def __init__(self, mean, coefficients=None, residual=0.0, variance=None):
+        self.mean = mean
+        self.coefficients = coefficients or {}
+        self.residual = residual
+        self._variance = variance  # Calculée au premier accès (une date sert à chaque successeur)
+
+    @property
+    def variance(self):
+        if self._variance is None:
+            self._variance = sum([a * a for a in self.coefficients.values()]) + self.residual
+        return self._variance
+
+    def shifted(self, constant, source=None, scale=0.0, variance=0.0, sign=1.0):
+        """X + constante (± la durée aléatoire d'une tâche : source, écart-type scale)"""
+        if not scale and not variance:
+            return _Normal(self.mean + constant, self.coefficients, self.residual, self._variance)
+        coefficients = dict(self.coefficients)
+        residual = self.residual
+        if source is not None:
+            coefficients[source] = coefficients.get(source, 0.0) + sign * scale
+        else:
+            residual += variance
+        return _Normal(self.mean + constant, coefficients, residual)
+
+
+def _maximum(a, b, sources):
+    """
+    max(A, B) par les formules de Clark (corrélation comprise)
+
+    Returns:
+        (loi normale approchée, probabilité que A soit le maximum)
+    """
+    variance_a, variance_b = a.variance, b.variance
+    # Écart de moyennes au-delà de DOMINANCE fois l'écart-type maximal de A - B : inutile
+    # de calculer la covariance (cas le plus fréquent sur un grand réseau)
+    gap = a.mean - b.mean
+    if abs(gap) >= DOMINANCE * (math.sqrt(variance_a) + math.sqrt(variance_b)):
+        return (a, 1.0) if gap >= 0 else (b, 0.0)
+    ca, cb = a.coefficients, b.coefficients
+    shared = ca.keys() & cb.keys()  # Tâches communes aux deux chemins
+    covariance = sum([ca[i] * cb[i] for i in shared])
+    theta2 = variance_a + variance_b - 2 * covariance
+    if theta2 <= VARIANCE_TOLERANCE:
+        return (a, 1.0) if a.mean >= b.mean else (b, 0.0)
+    theta = math.sqrt(theta2)
+    alpha = (a.mean - b.mean) / theta
+    if abs(alpha) >= DOMINANCE:  # Un chemin l'emporte presque sûrement : loi inchangée
+        return (a, 1.0) if alpha > 0 else (b, 0.0)
+    tightness = 0.5 * (1.0 + math.erf(alpha / _SQRT2))
+    density = math.exp(-0.5 * alpha * alpha) / math.sqrt(2 * math.pi)
+    mean = a.mean * tightness + b.mean * (1 - tightness) + theta * density
+    second = (a.mean ** 2 + variance_a) * tightness + (b.mean ** 2 + variance_b) * (1 - tightness) \
+        + (a.mean + b.mean) * theta * density
+    variance = max(0.0, second - mean * mean)
+
+    other = 1 - tightness
+    coefficients = {i: value * tightness for i, value in ca.items()}
+    coefficients.update({i: value * other for i, value in cb.items()})
+    for i in shared:
+        coefficients[i] = ca[i] * tightness + cb[i] * other
+    if len(coefficients) > sources:
+        coefficients = _strongest(coefficients, sources)
+    explained = sum([value * value for value in coefficients.values()])
+    if explained > variance:  # Coefficients ramenés à la variance de Clark
+        scale = math.sqrt(variance / explained) if explained > 0 else 0.0
+        coefficients = {i: value * scale for i, value in coefficients.items()}
+        explained = variance
+    return _Normal(mean, coefficients, variance - explained, variance), tightness
+
+
+def _strongest(coefficients, sources):
+    """Les `sources` coefficients de plus grande valeur absolue"""
+    if not sources:
+        return {}
+    threshold = sorted(map(abs, coefficients.values()), reverse=True)[sources - 1]
+    kept = {i: value for i, value in coefficients.items() if abs(value) >= threshold}
+    if len(kept) > sources:  # Ex aequo au seuil
+        kept = dict(heapq.nlargest(sources, kept.items(), key=lambda item: abs(item[1])))
+    return kept
+
+
+class CompletionDistribution:
+    """
+    Loi (normale) de la durée du projet et indices de criticité
+
+    Même interface que monte_carlo.SimulationResult pour les percentiles et
+    la probabilité d'achèvement, sans itérations.
+
+    Attributs:
+        mean, std: Durée moyenne du projet et écart-type (jours)
+        percentiles: {50: P50, 80: P80, 95: P95}
+        finish: {task_id: (moyenne, écart-type)} de la fin au plus tôt de chaque tâche
+        criticality: {task_id: probabilité approchée d'être sur le chemin le plus long}
+    """
+
+    def __init__(self, mean, std, finish, criticality, calendar=None):
+        self.mean = mean
+        self.std = std
+        self.finish = finish
+        self.criticality = criticality
+        self.calendar = calendar
+        self.percentiles = {p: self.percentile(p) for p in (50, 80, 95)}
+
+    def percentile(self, p):
+        """Durée du projet atteinte avec une probabilité de p %"""
+        if self.std <= 0:
+            return self.mean
+        return NormalDist(self.mean, self.std).inv_cdf(p / 100)
+
+    def probability_of_completion(self, deadline):
+        """
+        Probabilité de terminer le projet au plus tard à `deadline`
+        (décalage en jours, ou date incluse convertie par le calendrier du projet)
+        """
+        from .work_calendar import offset_converter
+
+        deadline = offset_converter(self.calendar)(deadline, finish=True)
+        if self.std <= 0:
+            return 1.0 if self.mean <= deadline else 0.0
+        return NormalDist(self.mean, self.std).cdf(deadline)
+
+    def completion_date(self, p):
+        """Date de fin atteinte avec une probabilité de p % (nécessite le calendrier)"""
+        if self.calendar is None:
+            raise ValueError("Calendrier du projet inconnu")
+        return self.calendar.finish_date(self.percentile(p))
+
+    def metrics(self, deadlines=()):
+        """
+        Indicateurs pour la table project_analytics : {metric_name: (valeur, metadata)}
+        (voir db_loader.save_metrics)
+        """
+        metrics = {'completion_mean': (self.mean, {'std': self.std})}
+        for p, value in self.percentiles.items():
+            metadata = {}
+            if self.calendar is not None:
+                metadata['date'] = self.completion_date(p).isoformat()
+            metrics[f'completion_p{p}'] = (value, metadata)
+        for deadline in deadlines:
+            key = deadline.isoformat() if hasattr(deadline, 'isoformat') else f'{deadline:g}'
+            metrics[f'completion_probability_{key}'] = (self.probability_of_completion(deadline),
+                                                        {'deadline': key})
+        return metrics
+
+
+def _argument_weights(tightness):
+    """
+    Probabilité que chaque argument d'un maximum calculé de proche en proche
+    soit le plus grand : max(...max(max(X0, X1), X2)..., Xm), tightness[i-1]
+    étant la probabilité que le maximum partiel l'emporte sur Xi
+    """
+    weights = [0.0] * (len(tightness) + 1)
+    remaining = 1.0
+    for i in range(len(tightness), 0, -1):
+        weights[i] = remaining * (1 - tightness[i - 1])
+        remaining *= tightness[i - 1]
+    weights[0] = remaining
+    return weights
+
+
+def completion_distribution(graph, deviations, sources=MAX_SOURCES, calendar=None):
+    """
+    Loi de la durée du projet en un passage topologique (Clark / Sculli)
+
+    Args:
+        graph: CompiledGraph (durées = moyennes PERT)
+        deviations: Écart-type de la durée de chaque tâche (liste par index)
+        sources: Coefficients de corrélation conservés par date (0 = Sculli)
+        calendar: WorkCalendar du projet (dates de fin et échéances en dates)
+    Returns:
+        CompletionDistribution
+    """
+    n = len(graph)
+    durations = graph.durations.tolist()
+    pred_ptr = graph.pred_ptr.tolist()
+    pred_idx = graph.pred_idx.tolist()
+    pred_type = graph.pred_type.tolist()
+    pred_lag = graph.pred_lag.tolist()
+
+    def random_duration(v):  # Arguments (source, scale, variance) de _Normal.shifted
+        if sources:
+            return v, deviations[v], 0.0
+        return None, 0.0, deviations[v] ** 2
+
+    start, finish = [None] * n, [None] * n
+    weights = [None] * n  # Poids des arguments du maximum de ES (pred_ptr[v]..), ES >= 0 exclu
+    zero = _Normal(0.0)
+    for v in graph.order:
+        d = durations[v]
+        own = random_duration(v)
+        current, tightness = zero, []
+        for k in range(pred_ptr[v], pred_ptr[v + 1]):
+            u, t = pred_idx[k], pred_type[k]
+            if t == FS:
+                candidate = finish[u].shifted(pred_lag[k])
+            elif t == SS:
+                candidate = start[u].shifted(pred_lag[k])
+            else:  # FF, SF : contrainte sur la fin de v, moins sa propre durée
+                candidate = (finish[u] if t == FF else start[u]).shifted(pred_lag[k] - d, *own, sign=-1.0)
+            current, share = _maximum(current, candidate, sources)
+            tightness.append(share)
+        start[v] = current
+        finish[v] = current.shifted(d, *own)
+        weights[v] = _argument_weights(tightness)[1:]
+
+    # Fin du projet : maximum des fins des tâches terminales. Une tâche suivie
+    # d'un lien FS ou FF de lag >= 0 finit avant son successeur : elle est omise.
+    order = graph.order.tolist()
+    succ_ptr, succ_type, succ_lag = graph.succ_ptr.tolist(), graph.succ_type.tolist(), graph.succ_lag.tolist()
+    ends = [v for v in order
+            if not any((succ_type[k] == FS or succ_type[k] == FF) and succ_lag[k] >= 0
+                       for k in range(succ_ptr[v], succ_ptr[v + 1]))]
+    project, tightness = finish[ends[0]] if ends else zero, []
+    for v in ends[1:]:
+        project, share = _maximum(project, finish[v], sources)
+        tightness.append(share)
+
+    # Criticité : probabilités de « tension » remontées depuis la fin du projet
+    start_weight, finish_weight = [0.0] * n, [0.0] * n
+    for v, w in zip(ends, _argument_weights(tightness)):
+        finish_weight[v] = w
+    for v in reversed(order):
+        weight = start_weight[v] = start_weight[v] + finish_weight[v]
+        for k, w in zip(range(pred_ptr[v], pred_ptr[v + 1]), weights[v]):
+            u, t = pred_idx[k], pred_type[k]
+            if t == FS or t == FF:
+                finish_weight[u] += weight * w
+            else:
+                start_weight[u] += weight * w
+
+    ids = graph.ids
+    return CompletionDistribution(
+        project.mean, math.sqrt(project.variance),
+        {ids[v]: (finish[v].mean, math.sqrt(finish[v].variance)) for v in range(n)},
+        {ids[v]: min(1.0, start_weight[v]) for v in range(n)},
+        calendar)
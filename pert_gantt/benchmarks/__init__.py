@@ -0,0 +1,4 @@
+# BENCHMARKS DU PLANIFICATEUR (sous-paquet pert_gantt.benchmarks)
+# Réseaux synthétiques (networks) et mesures lancées en module :
+#   python -m pert_gantt.benchmarks.bench_scheduler --sizes 100 10000
+#   python -m pert_gantt.benchmarks.bench_memory 100000 3
@@ -0,0 +1,58 @@
+# BENCHMARK MÉMOIRE : objets Task vs stockage compact (TaskStore)
+# Usage : python -m pert_gantt.benchmarks.bench_memory [nombre_de_tâches] [arcs_par_tâche]
+
+import gc
+import sys
+import tracemalloc
+
+from .networks import build_compact, build_scheduler, load_engine, mixed_dag
+
+
+def measure(build):
+    """
+    Mémoire retenue (octets) par le projet construit puis planifié,
+    hors données d'entrée
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    result.schedule_project()
+    result._graph = None  # Le graphe compilé de travail n'est pas conservé entre deux calculs
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def _fresh_strings(network):
+    """Copie des identifiants et noms : les chaînes retenues par le projet sont comptées"""
+    return network._replace(ids=[task_id.encode().decode() for task_id in network.ids],
+                            names=[name.encode().decode() for name in network.names])
+
+
+def main(n=100_000, edges_per_task=3):
+    engine = load_engine()
+    network = mixed_dag(n, edges_per_task)
+    edges = network.edges
+
+    def build_objects():
+        return build_scheduler(engine, _fresh_strings(network))
+
+    def build_store():
+        return build_compact(engine, _fresh_strings(network))
+
+    objects, objects_bytes = measure(build_objects)
+    del objects
+    compact, compact_bytes = measure(build_store)
+
+    print(f"=== MÉMOIRE PAR TÂCHE PLANIFIÉE ({n} tâches, {len(edges)} dépendances) ===")
+    print(f"Objets Task      : {objects_bytes / n:8.1f} octets/tâche")
+    print(f"TaskStore        : {compact_bytes / n:8.1f} octets/tâche "
+          f"(dont colonnes numériques {compact._store.memory_usage() / n:.1f})")
+    print(f"Réduction        : x{objects_bytes / compact_bytes:.1f}")
+    print("(identifiants et noms compris : chaînes str par tâche, StringColumn pour le TaskStore)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,194 @@
+# BENCHMARK DU PLANIFICATEUR : temps par phase et pic mémoire
+# Usage :
+#   python -m pert_gantt.benchmarks.bench_scheduler --sizes 100 10000 1000000 -o resultats.json
+#   python -m pert_gantt.benchmarks.bench_scheduler --compare avant.json apres.json
+#
+# Chaque phase de ProjectScheduler est chronométrée séparément (meilleur de
+# --repeat exécutions) ; le pic mémoire de chaque phase est mesuré lors d'une
+# exécution séparée sous tracemalloc, qui ralentit fortement le calcul.
+# Les résultats sont écrits en JSON pour comparer deux versions du code.
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from .networks import GENERATORS, build_compact, build_scheduler, load_engine
+
+PHASES = ('forward_pass', 'backward_pass', 'calculate_float', 'find_critical_path', 'export_to_csv')
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000)
+BUILDERS = {'objects': build_scheduler, 'compact': build_compact}
+REGRESSION_THRESHOLD = 1.10  # Ratio de temps signalé par --compare
+
+
+def run_phases(scheduler, csv_path, timer=time.perf_counter, memory=False):
+    """
+    Exécute les phases du calcul dans l'ordre de schedule_project, puis l'export CSV
+    Le passage avant inclut la compilation du graphe (ProjectScheduler.compile).
+
+    Returns:
+        {phase: secondes} ou, avec memory=True, {phase: pic mémoire en octets}
+    """
+    steps = {
+        'forward_pass': scheduler.forward_pass,
+        'backward_pass': scheduler.backward_pass,
+        'calculate_float': scheduler.calculate_float,
+        'find_critical_path': scheduler.find_critical_path,
+        'export_to_csv': lambda: scheduler.export_to_csv(csv_path),
+    }
+    measures = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for phase in PHASES:
+            if memory:
+                gc.collect()
+                tracemalloc.reset_peak()
+                current = tracemalloc.get_traced_memory()[0]
+                steps[phase]()
+                measures[phase] = tracemalloc.get_traced_memory()[1] - current
+            else:
+                start = timer()
+                steps[phase]()
+                measures[phase] = timer() - start
+    return measures
+
+
+def bench_case(engine, generator, size, mode, repeat, memory, workdir):
+    """Mesures d'un réseau (générateur, taille) dans un mode de stockage"""
+    network = GENERATORS[generator](size)
+    csv_path = os.path.join(workdir, f"{generator}_{size}_{mode}.csv")
+    gc.collect()
+    start = time.perf_counter()
+    scheduler = BUILDERS[mode](engine, network)
+    build_seconds = time.perf_counter() - start
+
+    runs = [run_phases(scheduler, csv_path) for _ in range(repeat)]
+    peaks = {}
+    if memory:
+        del scheduler
+        gc.collect()
+        tracemalloc.start()
+        scheduler = BUILDERS[mode](engine, network)
+        peaks = run_phases(scheduler, csv_path, memory=True)
+        peaks['build'] = tracemalloc.get_traced_memory()[0]  # Mémoire retenue par le projet planifié
+        tracemalloc.stop()
+    os.remove(csv_path)
+
+    results = [{
+        'generator': generator, 'size': size, 'edges': len(network.edges), 'mode': mode,
+        'phase': 'build', 'seconds': build_seconds, 'runs': [build_seconds],
+        'peak_bytes': peaks.get('build'),
+    }]
+    for phase in PHASES:
+        timings = [run[phase] for run in runs]
+        results.append({
+            'generator': generator, 'size': size, 'edges': len(network.edges), 'mode': mode,
+            'phase': phase, 'seconds': min(timings), 'runs': timings, 'peak_bytes': peaks.get(phase),
+        })
+    return results
+
+
+def environment():
+    """Description de la machine et de la version du code mesurée"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(__file__),
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def run(sizes=DEFAULT_SIZES, generators=tuple(GENERATORS), modes=('objects',), repeat=3, memory=True):
+    """Lance tous les cas et retourne le document JSON des résultats"""
+    engine = load_engine()
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            for generator in generators:
+                for mode in modes:
+                    case = bench_case(engine, generator, size, mode, repeat, memory, workdir)
+                    print_case(case)
+                    results.extend(case)
+    return {'environment': environment(), 'phases': list(PHASES), 'results': results}
+
+
+def print_case(case):
+    first = case[0]
+    print(f"\n{first['generator']:<8} {first['size']:>9} tâches {first['edges']:>9} arcs ({first['mode']})")
+    for row in case:
+        peak = f"{row['peak_bytes'] / 2**20:10.1f} Mo" if row['peak_bytes'] is not None else ""
+        print(f"  {row['phase']:<20} {row['seconds'] * 1000:12.2f} ms{peak}")
+
+
+def compare(before_path, after_path, threshold=REGRESSION_THRESHOLD):
+    """
+    Compare deux fichiers de résultats, cas par cas
+    Retourne le nombre de régressions (ratio de temps > threshold).
+    """
+    with open(before_path, encoding='utf-8') as file:
+        before = json.load(file)
+    with open(after_path, encoding='utf-8') as file:
+        after = json.load(file)
+
+    def key(row):
+        return row['generator'], row['size'], row['mode'], row['phase']
+
+    previous = {key(row): row for row in before['results']}
+    print(f"=== COMPARAISON {before['environment'].get('commit')} -> {after['environment'].get('commit')} ===")
+    regressions = 0
+    for row in after['results']:
+        old = previous.get(key(row))
+        if old is None or not old['seconds']:
+            continue
+        ratio = row['seconds'] / old['seconds']
+        flag = ""
+        if ratio > threshold:
+            regressions += 1
+            flag = "  <-- RÉGRESSION"
+        print(f"{row['generator']:<8} {row['size']:>9} {row['mode']:<8} {row['phase']:<20} "
+              f"{old['seconds'] * 1000:10.2f} -> {row['seconds'] * 1000:10.2f} ms  x{ratio:5.2f}{flag}")
+    print(f"{regressions} régression(s) au-delà de x{threshold:.2f}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark des phases du calcul PERT/CPM")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="Nombres de tâches (jusqu'à 1000000)")
+    parser.add_argument('--generators', nargs='+', choices=list(GENERATORS), default=list(GENERATORS))
+    parser.add_argument('--modes', nargs='+', choices=list(BUILDERS), default=['objects'],
+                        help="Objets Task et/ou stockage compact (TaskStore)")
+    parser.add_argument('--repeat', type=int, default=3, help="Exécutions chronométrées par cas")
+    parser.add_argument('--no-memory', action='store_true', help="Ne pas mesurer le pic mémoire")
+    parser.add_argument('-o', '--output', default='benchmark_results.json')
+    parser.add_argument('--compare', nargs=2, metavar=('AVANT', 'APRES'),
+                        help="Compare deux fichiers de résultats au lieu de lancer les mesures")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return 1 if compare(*args.compare) else 0
+
+    document = run(args.sizes, args.generators, args.modes, args.repeat, not args.no_memory)
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(document, file, indent=1)
+    print(f"\n💾 Résultats écrits dans: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
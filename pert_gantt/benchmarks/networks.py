@@ -0,0 +1,113 @@
+# GÉNÉRATEURS DE RÉSEAUX DE PROJET SYNTHÉTIQUES POUR LES BENCHMARKS
+# Chaque générateur est déterministe (graine) et retourne un Network : les
+# colonnes attendues par TaskStore, réutilisables pour construire des objets Task.
+
+import random
+from collections import namedtuple
+
+TYPE_NAMES = ('FS', 'SS', 'FF', 'SF')  # Codes 0..3 de cpm_engine
+MIXED_LAGS = (0, 0, 0, 1, 2, 5, -1, -2)  # Délais (lag) et avances (lead) des réseaux mixtes
+
+# edges : tuples (index prédécesseur, index successeur, code du type, lag)
+Network = namedtuple('Network', 'ids names durations edges')
+
+
+def load_engine():
+    """Module du planificateur (Task, ProjectScheduler)"""
+    from .. import scheduler
+
+    return scheduler
+
+
+def _tasks(n, rnd):
+    ids = [f"T{i:07d}" for i in range(n)]
+    names = [f"Tâche {i}" for i in range(n)]
+    durations = [rnd.randint(1, 20) for _ in range(n)]
+    return ids, names, durations
+
+
+def _link(rnd, mixed):
+    if mixed:
+        return rnd.randrange(4), rnd.choice(MIXED_LAGS)
+    return 0, 0
+
+
+def chain(n, seed=42, mixed=False):
+    """Chaîne unique T0 -> T1 -> ... : profondeur maximale, une dépendance par tâche"""
+    rnd = random.Random(seed)
+    ids, names, durations = _tasks(n, rnd)
+    edges = [(v - 1, v, *_link(rnd, mixed)) for v in range(1, n)]
+    return Network(ids, names, durations, edges)
+
+
+def layered(n, width=100, edges_per_task=3, seed=42, mixed=False):
+    """
+    DAG en couches de `width` tâches : chaque tâche dépend de `edges_per_task`
+    tâches distinctes de la couche précédente (réseau large et peu profond)
+    """
+    rnd = random.Random(seed)
+    ids, names, durations = _tasks(n, rnd)
+    edges = []
+    for v in range(width, n):
+        layer_start = (v // width - 1) * width
+        for u in rnd.sample(range(layer_start, layer_start + width), min(edges_per_task, width)):
+            edges.append((u, v, *_link(rnd, mixed)))
+    return Network(ids, names, durations, edges)
+
+
+def random_dag(n, edges_per_task=3.0, window=None, seed=42, mixed=False):
+    """
+    DAG aléatoire de densité réglable
+
+    Args:
+        edges_per_task: Nombre moyen de prédécesseurs par tâche (peut être fractionnaire)
+        window: Les prédécesseurs sont pris parmi les `window` tâches précédentes
+                (None : parmi toutes les tâches précédentes)
+        mixed: Types FS/SS/FF/SF et lags/leads tirés au hasard (sinon FS sans lag)
+    """
+    rnd = random.Random(seed)
+    ids, names, durations = _tasks(n, rnd)
+    whole, fraction = int(edges_per_task), edges_per_task - int(edges_per_task)
+    edges = []
+    for v in range(1, n):
+        first = 0 if window is None else max(0, v - window)
+        count = min(whole + (rnd.random() < fraction), v - first)
+        predecessors = set()
+        while len(predecessors) < count:
+            predecessors.add(rnd.randrange(first, v))
+        for u in sorted(predecessors):
+            edges.append((u, v, *_link(rnd, mixed)))
+    return Network(ids, names, durations, edges)
+
+
+def mixed_dag(n, edges_per_task=3.0, window=200, seed=42):
+    """DAG aléatoire local avec les quatre types de dépendance, délais et avances"""
+    return random_dag(n, edges_per_task, window, seed, mixed=True)
+
+
+GENERATORS = {
+    'chain': chain,
+    'layered': layered,
+    'random': random_dag,
+    'mixed': mixed_dag,
+}
+
+
+def build_scheduler(engine, network):
+    """Planificateur à objets Task (engine : module chargé par load_engine)"""
+    scheduler = engine.ProjectScheduler()
+    tasks = [engine.Task(task_id, name, duration=duration)
+             for task_id, name, duration in zip(network.ids, network.names, network.durations)]
+    for task in tasks:
+        scheduler.add_task(task)
+    for u, v, code, lag in network.edges:
+        tasks[v].add_dependency(tasks[u], TYPE_NAMES[code], lag)
+    return scheduler
+
+
+def build_compact(engine, network):
+    """Planificateur adossé à un stockage compact (TaskStore)"""
+    from ..task_store import TaskStore
+
+    store = TaskStore(network.ids, network.durations, network.edges, network.names)
+    return engine.ProjectScheduler.from_store(store)
@@ -0,0 +1,50 @@
+# LIGNE DE COMMANDE : schedule input.csv -o out.csv
+# Planifie un projet décrit en CSV (format de schedule_csv : ID, Nom, Durée,
+# Prédécesseurs) et écrit le planning calculé. Seuls argparse et le module
+# CSV sont chargés au démarrage ; le moteur l'est une fois les arguments lus.
+
+import argparse
+import sys
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='schedule',
+        description="Calcule le planning PERT/CPM d'un projet décrit en CSV "
+                    "(colonnes ID, Nom, Durée, Prédécesseurs ; les autres sont recalculées)")
+    parser.add_argument('input', help="fichier CSV du projet")
+    parser.add_argument('-o', '--output', help="CSV du planning calculé (sortie standard par défaut)")
+    parser.add_argument('--order', choices=('topological', 'earliest_start', 'insertion'),
+                        default='topological', help="ordre des lignes écrites (défaut : topological)")
+    parser.add_argument('--compact', action='store_true',
+                        help="stockage compact en tableaux (très gros projets)")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="pas de synthèse sur la sortie d'erreur")
+    return parser
+
+
+def main(argv=None):
+    """
+    Point d'entrée de la commande `schedule`
+    Retourne le code de sortie : 0, 1 si le projet n'est pas planifiable
+    (cycle, dépendance inconnue...), 2 si les arguments sont invalides.
+    """
+    arguments = build_parser().parse_args(argv)
+
+    from .schedule_csv import write_schedule
+    from .scheduler import ProjectScheduler
+
+    try:
+        scheduler = ProjectScheduler.from_csv(arguments.input, compact=arguments.compact)
+        scheduler.schedule_project()
+    except (OSError, ValueError, KeyError) as error:  # CycleError est une ValueError
+        print(f"schedule: {arguments.input}: {error}", file=sys.stderr)
+        return 1
+
+    output = arguments.output or sys.stdout
+    count = write_schedule(scheduler, output, arguments.order)
+    if not arguments.quiet:
+        critical = ' -> '.join(str(task.id) for task in scheduler.critical_path)
+        print(f"{count} tâches, durée {scheduler.project_duration:g} jours, chemin critique : {critical}",
+              file=sys.stderr)
+    return 0
@@ -0,0 +1,387 @@
+# MOTEUR CPM COMPILÉ - PASSAGES AVANT/ARRIÈRE ITÉRATIFS SUR TABLEAUX PLATS
+# Remplace les fermetures récursives de ProjectScheduler par des boucles sur index entiers
+
+from array import array
+from itertools import accumulate
+from operator import itemgetter
+
+from .validation import (CycleError, GraphValidationError, ValidationReport,
+                        find_cycles, find_duplicate_edges, find_orphans)
+
+# Codes internes des types de dépendance (stockés sur un octet par arc)
+FS, SS, FF, SF = 0, 1, 2, 3
+DEPENDENCY_CODES = {'FS': FS, 'SS': SS, 'FF': FF, 'SF': SF}
+DEPENDENCY_NAMES = ('FS', 'SS', 'FF', 'SF')
+
+NUMPY_MIN_EDGES = 10000  # Nombre d'arcs à partir duquel le CSR est construit avec NumPy
+_DTYPES = {'i': 'intc', 'b': 'int8', 'd': 'float64'}  # Typecodes array -> dtypes NumPy
+
+
+class CompiledGraph:
+    """
+    Graphe de projet compilé en tableaux plats
+
+    Chaque tâche reçoit un index entier (ordre d'insertion). Les arcs sont
+    stockés au format CSR dans les deux sens :
+        - pred_ptr / pred_idx / pred_type / pred_lag : arcs entrants par tâche
+        - succ_ptr / succ_idx / succ_type / succ_lag : arcs sortants par tâche
+    Les résultats ES/EF/LS/LF sont remplis par forward_pass / backward_pass.
+    Le diagnostic de validation (voir validation.py) est conservé dans `report`.
+    """
+
+    def __init__(self, ids, durations, edges, report=None):
+        """
+        Args:
+            ids: Identifiants des tâches, dans l'ordre des index
+            durations: Durées des tâches (même ordre que ids)
+            edges: Itérable de tuples (index_pred, index_succ, code_type, lag)
+            report: ValidationReport à compléter (créé si absent)
+        
+        Raises:
+            CycleError: si le graphe contient des cycles (tous sont rapportés)
+            GraphValidationError: si `report` contient déjà des erreurs
+        """
+        edges = list(edges)
+        if edges:
+            sources, targets, types, lags = (list(column) for column in zip(*edges))
+        else:
+            sources, targets, types, lags = [], [], [], []
+        self._build(ids, durations, sources, targets, types, lags, report)
+
+    @classmethod
+    def from_columns(cls, ids, durations, sources, targets, types, lags, report=None, check=True):
+        """
+        Construit le graphe à partir des arcs en colonnes (forme envoyée aux
+        processus de calcul, voir collect_columns et portfolio.py)
+
+        Avec check=False, les avertissements (liens en double, tâches isolées)
+        ne sont recherchés qu'à l'appel de check() ; les cycles sont toujours détectés.
+        """
+        graph = cls.__new__(cls)
+        graph._build(ids, durations, _column(sources), _column(targets), _column(types), _column(lags),
+                     report, check)
+        return graph
+
+    def _build(self, ids, durations, sources, targets, types, lags, report, check=True):
+        self.ids = list(ids)
+        self._index = None
+        n = len(self.ids)
+        self.durations = array('d', durations)
+        if len(self.durations) != n:
+            raise ValueError("Le nombre de durées ne correspond pas au nombre de tâches")
+
+        self.pred_ptr, pick = _csr_offsets(targets, n)
+        self.pred_idx = pick(sources, 'i')
+        self.pred_type = pick(types, 'b')
+        self.pred_lag = pick(lags, 'd')
+
+        self.succ_ptr, pick = _csr_offsets(sources, n)
+        self.succ_idx = pick(targets, 'i')
+        self.succ_type = pick(types, 'b')
+        self.succ_lag = pick(lags, 'd')
+
+        self.report = report if report is not None else ValidationReport()
+        self._checked = False
+        if check:
+            self.check()
+        else:
+            self.report.raise_for_errors()
+        self.order = self._topological_order()
+
+        # Résultats des passages
+        self.earliest_start = array('d', bytes(8 * n))
+        self.earliest_finish = array('d', bytes(8 * n))
+        self.latest_start = array('d', bytes(8 * n))
+        self.latest_finish = array('d', bytes(8 * n))
+        self.project_duration = 0
+        self.forward_relaxations = self.backward_relaxations = 0  # Mises à jour de ES / LF
+        self.removed_edges = 0  # Liens redondants retirés avant calcul (voir reduction.py)
+
+    @classmethod
+    def from_tasks(cls, tasks):
+        """Compile une collection d'objets Task (ex: scheduler.tasks.values()), voir collect_columns"""
+        return cls.from_columns(*collect_columns(tasks))
+
+    def columns(self):
+        """Forme en colonnes du graphe (arguments de from_columns), arcs groupés par tâche cible"""
+        ptr = self.pred_ptr
+        targets = array('i', [v for v in range(len(self.ids)) for _ in range(ptr[v + 1] - ptr[v])])
+        return (self.ids, self.durations, self.pred_idx, targets, self.pred_type, self.pred_lag,
+                self.report)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def index(self):
+        """Dictionnaire id -> index, construit à la première utilisation"""
+        if self._index is None:
+            self._index = {task_id: i for i, task_id in enumerate(self.ids)}
+        return self._index
+
+    @property
+    def edge_count(self):
+        return len(self.pred_idx)
+
+    def check(self):
+        """
+        Liens en double et tâches isolées (avertissements, coût linéaire),
+        recherchés une seule fois ; retourne le rapport de validation
+        """
+        if self._checked:
+            return self.report
+        self._checked = True
+        n = len(self.ids)
+        ids = self.ids
+        self.report.duplicate_edges.extend(
+            (ids[u], ids[v], DEPENDENCY_NAMES[code], lag) for u, v, code, lag in
+            find_duplicate_edges(n, self.pred_ptr, self.pred_idx, self.pred_type, self.pred_lag)
+        )
+        self.report.orphans.extend(ids[v] for v in find_orphans(n, self.pred_ptr, self.succ_ptr))
+        self.report.raise_for_errors()
+        return self.report
+
+    def _topological_order(self):
+        """
+        Tri topologique de Kahn
+        En cas d'échec, les cycles sont localisés par Tarjan parmi les tâches
+        restantes et CycleError est levée avec le rapport complet.
+        """
+        n = len(self.ids)
+        succ_ptr = self.succ_ptr.tolist()
+        succ_idx = self.succ_idx.tolist()
+        pred_ptr = self.pred_ptr.tolist()
+        indegree = [b - a for a, b in zip(pred_ptr, pred_ptr[1:])]
+
+        order = [v for v in range(n) if indegree[v] == 0]
+        append = order.append
+        for u in order:  # La liste s'allonge pendant le parcours (file FIFO)
+            for w in succ_idx[succ_ptr[u]:succ_ptr[u + 1]]:
+                indegree[w] -= 1
+                if not indegree[w]:
+                    append(w)
+
+        if len(order) < n:
+            blocked = [v for v in range(n) if indegree[v] > 0]
+            components, cycles = find_cycles(n, succ_ptr, succ_idx, blocked)
+            self.report.cyclic_components = [[self.ids[v] for v in c] for c in components]
+            self.report.cycles = [[self.ids[v] for v in cycle] for cycle in cycles]
+            self.report.raise_for_errors()
+        return array('i', order)
+
+    def forward_pass(self):
+        """
+        Passage avant itératif : ES/EF dans l'ordre topologique
+        Retourne la durée du projet (max des EF)
+        """
+        n = len(self.ids)
+        dur = self.durations.tolist()
+        ptr = self.pred_ptr.tolist()
+        src = self.pred_idx.tolist()
+        typ = self.pred_type.tolist()
+        lag = self.pred_lag.tolist()
+        es = [0.0] * n
+        ef = [0.0] * n
+        relaxed = 0
+
+        for v in self.order:
+            d = dur[v]
+            start = 0.0  # ES ne peut pas être négatif
+            for k in range(ptr[v], ptr[v + 1]):
+                u = src[k]
+                t = typ[k]
+                if t == FS:
+                    constraint = ef[u] + lag[k]
+                elif t == SS:
+                    constraint = es[u] + lag[k]
+                elif t == FF:
+                    constraint = ef[u] + lag[k] - d
+                else:  # SF
+                    constraint = es[u] + lag[k] - d
+                if constraint > start:
+                    start = constraint
+                    relaxed += 1
+            es[v] = start
+            ef[v] = start + d
+
+        self.earliest_start = array('d', es)
+        self.earliest_finish = array('d', ef)
+        self.project_duration = max(ef, default=0)
+        self.forward_relaxations = relaxed
+        return self.project_duration
+
+    def backward_pass(self, project_duration=None):
+        """
+        Passage arrière itératif : LS/LF dans l'ordre topologique inverse
+        Les tâches sans successeur finissent au plus tard à la fin du projet.
+        """
+        if project_duration is None:
+            project_duration = self.project_duration
+        n = len(self.ids)
+        dur = self.durations.tolist()
+        ptr = self.succ_ptr.tolist()
+        dst = self.succ_idx.tolist()
+        typ = self.succ_type.tolist()
+        lag = self.succ_lag.tolist()
+        ls = [0.0] * n
+        lf = [0.0] * n
+        inf = float('inf')
+        relaxed = 0
+
+        for v in reversed(self.order):
+            d = dur[v]
+            first, last = ptr[v], ptr[v + 1]
+            if first == last:
+                finish = project_duration
+            else:
+                finish = inf
+                for k in range(first, last):
+                    w = dst[k]
+                    t = typ[k]
+                    if t == FS:
+                        constraint = ls[w] - lag[k]
+                    elif t == SS:
+                        constraint = ls[w] - lag[k] + d
+                    elif t == FF:
+                        constraint = lf[w] - lag[k]
+                    else:  # SF
+                        constraint = lf[w] - lag[k] + d
+                    if constraint < finish:
+                        finish = constraint
+                        relaxed += 1
+            lf[v] = finish
+            ls[v] = finish - d
+
+        self.latest_start = array('d', ls)
+        self.latest_finish = array('d', lf)
+        self.backward_relaxations = relaxed
+
+    def calculate_float(self, project_duration=None):
+        """
+        Flottements total et libre et état critique (mêmes formules que
+        ProjectScheduler.calculate_float) : colonnes total_float, free_float, critical
+        """
+        if project_duration is None:
+            project_duration = self.project_duration
+        n = len(self.ids)
+        dur = self.durations.tolist()
+        es, ef = self.earliest_start.tolist(), self.earliest_finish.tolist()
+        ls = self.latest_start.tolist()
+        ptr = self.succ_ptr.tolist()
+        dst = self.succ_idx.tolist()
+        typ = self.succ_type.tolist()
+        lag = self.succ_lag.tolist()
+        total, free = [0.0] * n, [0.0] * n
+        critical = bytearray(n)
+
+        for v in range(n):
+            total[v] = ls[v] - es[v]
+            first, last = ptr[v], ptr[v + 1]
+            if first == last:
+                free[v] = project_duration - ef[v]
+            else:
+                d = dur[v]
+                min_successor_es = float('inf')
+                for k in range(first, last):
+                    w = dst[k]
+                    t = typ[k]
+                    if t == FS:
+                        constraint = es[w] - lag[k]
+                    elif t == SS:
+                        constraint = es[w] - lag[k] + d
+                    else:  # FF et SF
+                        constraint = ef[w] - lag[k] - d + d
+                    if constraint < min_successor_es:
+                        min_successor_es = constraint
+                free[v] = max(0, min_successor_es - ef[v])
+            critical[v] = abs(total[v]) < 0.001
+
+        self.total_float = array('d', total)
+        self.free_float = array('d', free)
+        self.critical = critical
+
+
+def _column(values):
+    """Colonne d'arcs indexable (les tableaux et listes sont utilisés sans copie)"""
+    return values if isinstance(values, (array, list)) else list(values)
+
+
+def _csr_offsets(keys, n):
+    """
+    Regroupe les arcs selon `keys` (index de tâche)
+    Retourne (ptr, pick) : ptr[v]:ptr[v + 1] délimite les arcs de la tâche v
+    et pick(colonne, typecode) réordonne une colonne d'arcs dans cet ordre
+    (array du typecode donné). Comptage et tri vectorisés si NumPy est installé.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None and len(keys) >= NUMPY_MIN_EDGES:
+        return _csr_offsets_numpy(np, keys, n)
+
+    counts = [0] * (n + 1)
+    for key in keys:
+        counts[key + 1] += 1
+    ptr = array('i', accumulate(counts))
+    # Tri stable : l'ordre d'insertion des arcs est conservé pour chaque tâche
+    permutation = sorted(range(len(keys)), key=keys.__getitem__)
+    if len(permutation) > 1:
+        getter = itemgetter(*permutation)
+        pick = lambda column, typecode: array(typecode, getter(column))
+    else:
+        pick = lambda column, typecode: array(typecode, [column[k] for k in permutation])
+    return ptr, pick
+
+
+def _csr_offsets_numpy(np, keys, n):
+    """_csr_offsets par bincount / argsort stable (mêmes tableaux en sortie)"""
+    keys = np.asarray(keys, dtype=np.intp)
+    ptr = np.zeros(n + 1, dtype=np.intc)
+    np.cumsum(np.bincount(keys, minlength=n), out=ptr[1:])
+    permutation = np.argsort(keys, kind='stable')
+
+    def pick(column, typecode):
+        values = np.asarray(column)[permutation].astype(_DTYPES[typecode], copy=False)
+        picked = array(typecode)
+        picked.frombytes(values.tobytes())
+        return picked
+
+    picked = array('i')
+    picked.frombytes(ptr.tobytes())
+    return picked, pick
+
+
+def collect_columns(tasks):
+    """
+    Arcs d'une collection d'objets Task en colonnes (arguments de CompiledGraph.from_columns)
+
+    Les types de dépendance inconnus sont traités comme FS, comme le
+    faisait la branche `else` des passages récursifs, et signalés dans
+    le rapport de validation. Les prédécesseurs absents du planificateur
+    sont tous rapportés avant de lever GraphValidationError.
+
+    Returns:
+        (ids, durées, sources, cibles, types, lags, rapport)
+    """
+    tasks = list(tasks)
+    index = {task.id: i for i, task in enumerate(tasks)}
+    report = ValidationReport()
+    sources, targets, types, lags = [], [], [], []
+    for v, task in enumerate(tasks):
+        for pred_task, dep_type, lag in task.predecessors:
+            u = index.get(pred_task.id)
+            if u is None:
+                report.missing_tasks.append((pred_task.id, task.id))
+                continue
+            code = DEPENDENCY_CODES.get(dep_type)
+            if code is None:
+                report.unknown_types.append((pred_task.id, task.id, dep_type))
+                code = FS
+            sources.append(u)
+            targets.append(v)
+            types.append(code)
+            lags.append(lag)
+    report.raise_for_errors()
+    return ([task.id for task in tasks], [task.duration for task in tasks],
+            array('i', sources), array('i', targets), array('b', types), array('d', lags), report)
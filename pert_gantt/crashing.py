@@ -0,0 +1,461 @@
+# COMPRESSION DES DÉLAIS AU MOINDRE COÛT (CRASHING)
+# Courbe durée-coût exacte du projet par la méthode de Phillips-Dessouky :
+# à chaque étape, une coupe minimale du sous-réseau critique désigne les tâches
+# à comprimer (et celles, déjà comprimées, à rallonger) pour gagner un jour au
+# moindre coût ; la longueur du pas est calculée exactement par un passage avant
+# dérivé. Chaque sommet de la courbe est optimal, sans énumérer de combinaisons.
+#
+# Réseau d'événements : début s_v et fin f_v de chaque tâche (f_v = s_v + d_v),
+# liens FS/SS/FF/SF avec décalage entre les événements correspondants, source
+# (ES >= 0) et puits (fin du projet).
+#
+# Coût : chaque segment de la courbe demande un passage avant / arrière, le
+# passage avant dérivé et un flot maximal sur le sous-réseau critique. Le flot
+# d'un segment sert de point de départ au suivant (voir _MinCut), mais le
+# nombre de segments croît avec la taille du projet : pour un réseau de
+# plusieurs milliers de tâches, passer `target` arrête le calcul dès la durée
+# visée au lieu de parcourir la courbe jusqu'à la durée minimale.
+
+from collections import deque, namedtuple
+
+from .cpm_engine import CompiledGraph, FS, SS, FF, SF
+
+TOLERANCE = 1e-9
+INF = float('inf')
+
+CrashSegment = namedtuple('CrashSegment', 'start_duration end_duration start_cost end_cost changes')
+CrashSegment.__doc__ = """
+Portion linéaire de la courbe durée-coût
+
+    changes: {index de tâche: variation de durée sur tout le segment}
+             (négative = compression, positive = tâche rallongée)
+"""
+
+
+class CrashCurve:
+    """
+    Courbe durée-coût d'un projet : du planning normal (coût 0) à la durée
+    minimale atteignable (ou à la durée cible demandée)
+
+    Attributs:
+        normal_duration: Durée du projet sans compression
+        min_duration: Plus courte durée calculée
+        points: [(durée, coût)] sommets de la courbe, durées décroissantes
+        segments: [CrashSegment]
+    """
+
+    def __init__(self, ids, normal, normal_duration, segments):
+        self.ids = ids
+        self.normal = normal
+        self.segments = segments
+        self.normal_duration = normal_duration
+        self.min_duration = segments[-1].end_duration if segments else normal_duration
+        self.points = [(normal_duration, 0.0)]
+        self.points += [(segment.end_duration, segment.end_cost) for segment in segments]
+
+    def _locate(self, duration):
+        if duration > self.normal_duration + TOLERANCE:
+            duration = self.normal_duration
+        if duration < self.min_duration - TOLERANCE:
+            raise ValueError(f"Durée {duration:g} inatteignable (minimum {self.min_duration:g})")
+        return duration
+
+    def cost(self, duration):
+        """Surcoût minimal pour finir en `duration` jours (interpolation linéaire)"""
+        duration = self._locate(duration)
+        for segment in self.segments:
+            if duration >= segment.end_duration - TOLERANCE:
+                span = segment.start_duration - segment.end_duration
+                share = (segment.start_duration - duration) / span if span > 0 else 1.0
+                return segment.start_cost + share * (segment.end_cost - segment.start_cost)
+        return self.segments[-1].end_cost if self.segments else 0.0
+
+    def durations(self, duration):
+        """
+        Durées des tâches du plan optimal pour finir en `duration` jours
+        Returns:
+            {task_id: durée} des seules tâches dont la durée change
+        """
+        duration = self._locate(duration)
+        current = {}
+        for segment in self.segments:
+            if duration >= segment.start_duration - TOLERANCE:
+                break
+            span = segment.start_duration - segment.end_duration
+            share = min(1.0, (segment.start_duration - duration) / span) if span > 0 else 1.0
+            for v, change in segment.changes.items():
+                current[v] = current.get(v, self.normal[v]) + share * change
+            if share < 1.0:
+                break
+        return {self.ids[v]: d for v, d in current.items() if abs(d - self.normal[v]) > TOLERANCE}
+
+
+def time_cost_curve(graph, costs, limits, target=None):
+    """
+    Courbe durée-coût exacte (Phillips-Dessouky) d'un graphe compilé
+
+    Args:
+        graph: CompiledGraph (non modifié)
+        costs: Coût d'un jour de compression par tâche (liste par index)
+        limits: Durée minimale par tâche (liste par index ; égale à la durée = incompressible)
+        target: Durée cible ; le calcul s'arrête dès qu'elle est atteinte
+                (recommandé sur un grand réseau, voir le coût en tête du module)
+    Returns:
+        CrashCurve
+    """
+    graph = CompiledGraph.from_columns(*graph.columns())  # Durées modifiées sur une copie
+    n = len(graph)
+    normal = graph.durations.tolist()
+    durations = list(normal)
+    limits = [min(limit, d) for limit, d in zip(limits, normal)]
+    pred_ptr = graph.pred_ptr.tolist()
+    pred_idx = graph.pred_idx.tolist()
+    pred_type = graph.pred_type.tolist()
+    pred_lag = graph.pred_lag.tolist()
+    order = graph.order.tolist()
+    succ = (graph.succ_ptr.tolist(), graph.succ_idx.tolist(), graph.succ_type.tolist(), graph.succ_lag.tolist())
+    # Une seule tâche porte un arc de capacité finie (son coût) : borne de toutes les coupes finies
+    min_cut = _MinCut(2 * n + 2, 2 * sum(costs[v] for v in range(n) if limits[v] < normal[v]) + 1.0)
+
+    segments = []
+    cost = 0.0
+    normal_duration = None
+    while True:
+        es, ef, ls, project = _passes(graph, durations, order, *succ)
+        if normal_duration is None:
+            normal_duration = project
+        if target is not None and project <= target + TOLERANCE:
+            break
+        tolerance = TOLERANCE * max(1.0, project)
+        critical = [v for v in range(n) if ls[v] - es[v] <= tolerance]
+        x = _cut(critical, es, ef, project, durations, normal, limits, costs,
+                 pred_ptr, pred_idx, pred_type, pred_lag, tolerance, min_cut)
+        if x is None:
+            break  # Coupe infinie : plus aucune compression possible
+        rate, step = _step(x, es, ef, project, durations, normal, limits, order,
+                           pred_ptr, pred_idx, pred_type, pred_lag, succ[0], succ[1], tolerance, target)
+        if rate <= tolerance or step <= tolerance:
+            break
+        changes = {v: -direction * step for v, direction in x.items()}
+        slope = sum(costs[v] * direction for v, direction in x.items())
+        for v, change in changes.items():
+            durations[v] += change
+            if abs(durations[v] - limits[v]) <= tolerance:
+                durations[v] = limits[v]
+            elif abs(durations[v] - normal[v]) <= tolerance:
+                durations[v] = normal[v]
+        end_cost = cost + slope * step
+        segments.append(CrashSegment(project, project - rate * step, cost, end_cost, changes))
+        cost = end_cost
+    return CrashCurve(graph.ids, normal, normal_duration, segments)
+
+
+def _passes(graph, durations, order, succ_ptr, succ_idx, succ_type, succ_lag):
+    """ES/EF et LS du réseau, toutes les fins étant bornées par la fin du projet"""
+    for v, d in enumerate(durations):
+        graph.durations[v] = d
+    project = graph.forward_pass()
+    es = graph.earliest_start.tolist()
+    ef = graph.earliest_finish.tolist()
+    lf = [0.0] * len(es)
+    ls = [0.0] * len(es)
+    # Le passage arrière du moteur ne borne par la fin du projet que les tâches
+    # sans successeur : avec des liens SS/SF, une fin peut dépasser le projet
+    for v in reversed(order):
+        d = durations[v]
+        finish = project
+        for k in range(succ_ptr[v], succ_ptr[v + 1]):
+            w, t = succ_idx[k], succ_type[k]
+            if t == FS:
+                constraint = ls[w] - succ_lag[k]
+            elif t == SS:
+                constraint = ls[w] - succ_lag[k] + d
+            elif t == FF:
+                constraint = lf[w] - succ_lag[k]
+            else:  # SF
+                constraint = lf[w] - succ_lag[k] + d
+            if constraint < finish:
+                finish = constraint
+        lf[v] = finish
+        ls[v] = finish - d
+    return es, ef, ls, project
+
+
+def _cut(critical, es, ef, project, durations, normal, limits, costs,
+         pred_ptr, pred_idx, pred_type, pred_lag, tolerance, min_cut):
+    """
+    Coupe minimale du sous-réseau critique (bornes inférieures sur les arcs des tâches)
+
+    Arc s_v -> f_v d'une tâche critique, selon sa durée d (c = coût journalier) :
+        limite < d < normale : [c, c]   (comprimer coûte c, rallonger rapporte c)
+        d = normale          : [0, c]   + arc f_v -> s_v infini (pas de rallongement)
+        d = limite           : [c, inf] (plus de compression)
+    Les liens de précédence sont de capacité infinie.
+
+    Returns:
+        {index: +1 (comprimée) ou -1 (rallongée)}, ou None si la coupe est infinie
+    """
+    on_path = set(critical)
+    arcs = []  # (i, j, borne inférieure, capacité) ; s_v = 2v + 2, f_v = s_v + 1, 0 = source, 1 = puits
+    for v in critical:
+        s = 2 * v + 2
+        d, c = durations[v], costs[v]
+        can_crash = d > limits[v] + tolerance
+        can_extend = d < normal[v] - tolerance
+        arcs.append((s, s + 1, c if can_extend else 0.0, c if can_crash else INF))
+        if not can_extend:
+            arcs.append((s + 1, s, 0.0, INF))
+        if es[v] <= tolerance:
+            arcs.append((0, s, 0.0, INF))
+        if ef[v] >= project - tolerance:
+            arcs.append((s + 1, 1, 0.0, INF))
+        for k in range(pred_ptr[v], pred_ptr[v + 1]):
+            u = pred_idx[k]
+            if u not in on_path:
+                continue
+            t = pred_type[k]
+            if t == SS or t == SF:
+                source, value = 2 * u + 2, es[u] + pred_lag[k]
+            else:
+                source, value = 2 * u + 3, ef[u] + pred_lag[k]
+            if t == FS or t == SS:
+                if abs(es[v] - value) <= tolerance:
+                    arcs.append((source, s, 0.0, INF))
+            elif abs(ef[v] - value) <= tolerance:
+                arcs.append((source, s + 1, 0.0, INF))
+
+    reachable = min_cut.side(arcs)
+    for i, j, low, high in arcs:
+        if high == INF and reachable[i] and not reachable[j]:
+            return None
+    x = {}
+    for v in critical:
+        s = 2 * v + 2
+        if reachable[s] and not reachable[s + 1]:
+            x[v] = 1
+        elif reachable[s + 1] and not reachable[s]:
+            x[v] = -1
+    return x
+
+
+class _MinCut:
+    """
+    Coupes minimales successives des segments d'une même courbe
+
+    Côté source d'une coupe minimisant  Σ capacités (S -> T) - Σ bornes
+    inférieures (T -> S) : une borne inférieure l sur i -> j vaut
+    l·([i ∈ S] - [j ∈ S]) plus une coupe de capacité u - l ; elle devient un
+    arc i -> puits et un arc source -> j de capacité l (à une constante près),
+    d'où un seul flot maximal (Dinic).
+
+    D'un segment à l'autre, seules quelques tâches changent d'état ou
+    deviennent critiques : le flot maximal précédent sert de flot initial.
+    Le flot d'un arc réduit ou disparu est ramené à sa nouvelle capacité ;
+    le déséquilibre créé à ses extrémités est repris par leurs arcs source ->
+    v et v -> puits, augmentés tous deux d'une même quantité si nécessaire
+    (toutes les coupes varient alors de cette quantité : la coupe minimale ne
+    change pas). Dinic ne cherche ensuite que les chemins augmentants manquants.
+    """
+
+    def __init__(self, n, big):
+        self.n = n  # Nœuds numérotés une fois pour toutes (voir _cut)
+        self.big = big  # Capacité des arcs infinis, supérieure au double de toute coupe finie
+        self.eps = TOLERANCE * big
+        self.flows = {}  # (i, j) -> flot
+        self.inflow = {}  # v -> flot de l'arc source -> v
+        self.outflow = {}  # v -> flot de l'arc v -> puits
+
+    def side(self, arcs, source=0, sink=1):
+        """
+        Args:
+            arcs: [(i, j, borne inférieure, capacité)]
+        Returns:
+            bytearray des nœuds atteignables depuis la source dans le résiduel
+        """
+        big, eps = self.big, self.eps
+        capacity, balance = {}, {}
+        for i, j, low, high in arcs:
+            key = (i, j)
+            capacity[key] = capacity.get(key, 0.0) + (big if high == INF else high) - low
+            if low:
+                balance[i] = balance.get(i, 0.0) + low
+                balance[j] = balance.get(j, 0.0) - low
+
+        # Flot précédent ramené aux nouvelles capacités ; excess : entrées - sorties créées
+        previous, flows, excess = self.flows, {}, {}
+        for key, c in capacity.items():
+            f = previous.pop(key, 0.0)
+            if f > c:
+                i, j = key
+                excess[i] = excess.get(i, 0.0) + f - c
+                excess[j] = excess.get(j, 0.0) - f + c
+                f = c
+            flows[key] = f
+        for (i, j), f in previous.items():  # Arcs disparus
+            excess[i] = excess.get(i, 0.0) + f
+            excess[j] = excess.get(j, 0.0) - f
+
+        inflow, outflow = self.inflow, self.outflow
+        terminals = []  # (v, capacité source -> v, flot, capacité v -> puits, flot)
+        for v in set(balance) | set(excess) | set(inflow) | set(outflow):
+            if v == source or v == sink:
+                continue
+            b = balance.get(v, 0.0)
+            into, out = (-b if b < -eps else 0.0), (b if b > eps else 0.0)
+            need = inflow.get(v, 0.0) - outflow.get(v, 0.0) - excess.get(v, 0.0)
+            f_in, f_out = (need, 0.0) if need > 0 else (0.0, -need)
+            shift = max(0.0, f_in - into, f_out - out)
+            terminals.append((v, into + shift, f_in, out + shift, f_out))
+
+        head = [[] for _ in range(self.n)]
+        to, cap = [], []
+
+        def add(i, j, c, f):
+            head[i].append(len(to))
+            to.append(j)
+            cap.append(c - f)
+            head[j].append(len(to))
+            to.append(i)
+            cap.append(f)
+
+        keys = list(flows)
+        for key in keys:
+            add(key[0], key[1], capacity[key], flows[key])
+        edges = []
+        for v, into, f_in, out, f_out in terminals:
+            e_in = e_out = None
+            if into > eps:
+                e_in = len(to)
+                add(source, v, into, f_in)
+            if out > eps:
+                e_out = len(to)
+                add(v, sink, out, f_out)
+            edges.append((v, e_in, e_out))
+        _dinic(head, to, cap, source, sink, eps)
+
+        self.flows = {key: cap[2 * k + 1] for k, key in enumerate(keys)}
+        self.inflow = {v: cap[e + 1] for v, e, _ in edges if e is not None}
+        self.outflow = {v: cap[e + 1] for v, _, e in edges if e is not None}
+
+        reachable = bytearray(self.n)
+        reachable[source] = 1
+        queue = deque([source])
+        while queue:
+            v = queue.popleft()
+            for e in head[v]:
+                w = to[e]
+                if cap[e] > eps and not reachable[w]:
+                    reachable[w] = 1
+                    queue.append(w)
+        return reachable
+
+
+def _dinic(head, to, cap, source, sink, eps):
+    """Flot maximal (Dinic, parcours en profondeur itératif) ; modifie cap"""
+    n = len(head)
+    total = 0.0
+    while True:
+        level = [-1] * n
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            v = queue.popleft()
+            if v == sink:
+                break  # Les niveaux au-delà du puits sont inutiles
+            depth = level[v] + 1
+            for e in head[v]:
+                w = to[e]
+                if level[w] < 0 and cap[e] > eps:
+                    level[w] = depth
+                    queue.append(w)
+        if level[sink] < 0:
+            return total
+        pointer = [0] * n
+        stack, path = [source], []
+        while stack:
+            v = stack[-1]
+            if v == sink:
+                pushed = min(cap[e] for e in path)
+                for e in path:
+                    cap[e] -= pushed
+                    cap[e ^ 1] += pushed
+                total += pushed
+                # Reprise depuis le premier arc saturé du chemin
+                for position, e in enumerate(path):
+                    if cap[e] <= eps:
+                        del stack[position + 1:], path[position:]
+                        break
+                continue
+            edges = head[v]
+            depth = level[v] + 1
+            position, end = pointer[v], len(edges)
+            while position < end:
+                e = edges[position]
+                if cap[e] > eps and level[to[e]] == depth:
+                    break
+                position += 1
+            pointer[v] = position
+            if position < end:
+                stack.append(to[e])
+                path.append(e)
+            else:
+                level[v] = -1  # Impasse : le parent passe à l'arc suivant
+                stack.pop()
+                if path:
+                    path.pop()
+
+
+def _step(x, es, ef, project, durations, normal, limits, order,
+          pred_ptr, pred_idx, pred_type, pred_lag, succ_ptr, succ_idx, tolerance, target):
+    """
+    Passage avant dérivé : vitesse de recul de chaque date quand les durées
+    varient de -x·δ, et plus grand pas δ sur lequel ces vitesses restent
+    constantes (aucune contrainte relâchée ne devient active, aucune durée ne
+    franchit ses bornes, cible non dépassée)
+
+    Seules les tâches en aval d'une tâche dont une date recule sont examinées :
+    ailleurs toutes les vitesses sont nulles et aucune contrainte ne change d'état.
+
+    Returns:
+        (vitesse de raccourcissement du projet, pas δ)
+    """
+    n = len(es)
+    start_rate = [0.0] * n
+    finish_rate = [0.0] * n
+    moving = bytearray(n)  # Un prédécesseur au moins a une vitesse non nulle
+    slack = []  # Pas auxquels une contrainte change d'état
+    for v in order:
+        xv = x.get(v, 0)
+        if not xv and not moving[v]:
+            continue
+        candidates = [(0.0, 0.0)]  # ES >= 0
+        for k in range(pred_ptr[v], pred_ptr[v + 1]):
+            u, t = pred_idx[k], pred_type[k]
+            if t == FS:
+                candidates.append((ef[u] + pred_lag[k], finish_rate[u]))
+            elif t == SS:
+                candidates.append((es[u] + pred_lag[k], start_rate[u]))
+            elif t == FF:
+                candidates.append((ef[u] + pred_lag[k] - durations[v], finish_rate[u] - xv))
+            else:  # SF
+                candidates.append((es[u] + pred_lag[k] - durations[v], start_rate[u] - xv))
+        rate = min(r for value, r in candidates if value >= es[v] - tolerance)
+        start_rate[v] = rate
+        finish_rate[v] = rate + xv
+        for value, r in candidates:
+            if value < es[v] - tolerance and rate > r:
+                slack.append((es[v] - value) / (rate - r))
+        if rate or xv:
+            for k in range(succ_ptr[v], succ_ptr[v + 1]):
+                moving[succ_idx[k]] = 1
+
+    project_rate = min((finish_rate[v] for v in range(n) if ef[v] >= project - tolerance), default=0.0)
+    for v in range(n):
+        if ef[v] < project - tolerance and project_rate > finish_rate[v]:
+            slack.append((project - ef[v]) / (project_rate - finish_rate[v]))
+    for v, direction in x.items():
+        slack.append(durations[v] - limits[v] if direction > 0 else normal[v] - durations[v])
+    if target is not None and project_rate > 0:
+        slack.append((project - target) / project_rate)
+    return project_rate, min(slack, default=0.0)
+
@@ -0,0 +1,231 @@
+# CHEMINS CRITIQUES ET QUASI CRITIQUES
+# Marge de chaque lien, sous-graphe critique et énumération des chemins par
+# marge croissante (les K plus longs chemins du réseau) sans explosion
+# combinatoire : recherche best-first guidée par la marge minimale exacte
+# restant jusqu'à la fin du projet.
+
+import heapq
+from itertools import count
+
+from .cpm_engine import DEPENDENCY_CODES, FS, SS, FF
+
+TOLERANCE = 0.001  # même tolérance que ProjectScheduler.calculate_float
+
+
+def edge_slack(graph):
+    """
+    Marge de chaque lien (ordre de l'adjacence CSR des successeurs)
+
+    Écart entre la date de la tâche successeur et la contrainte imposée par le
+    lien : 0 pour un lien « pilotant » (c'est lui qui fixe ES du successeur).
+        FS: ES(succ) - (EF(pred) + lag)    SS: ES(succ) - (ES(pred) + lag)
+        FF: EF(succ) - (EF(pred) + lag)    SF: EF(succ) - (ES(pred) + lag)
+    """
+    es, ef = graph.earliest_start.tolist(), graph.earliest_finish.tolist()
+    ptr = graph.succ_ptr.tolist()
+    dst, typ, lag = graph.succ_idx.tolist(), graph.succ_type.tolist(), graph.succ_lag.tolist()
+    slack = [0.0] * len(dst)
+    for u in range(len(graph)):
+        for k in range(ptr[u], ptr[u + 1]):
+            w, t = dst[k], typ[k]
+            if t == FS:
+                value = es[w] - (ef[u] + lag[k])
+            elif t == SS:
+                value = es[w] - (es[u] + lag[k])
+            elif t == FF:
+                value = ef[w] - (ef[u] + lag[k])
+            else:  # SF
+                value = ef[w] - (es[u] + lag[k])
+            slack[k] = value if value > TOLERANCE else 0.0
+    return slack
+
+
+def link_slack(predecessor, successor, dependency_type, lag):
+    """Marge d'un lien entre deux objets Task (mêmes formules que edge_slack)"""
+    code = DEPENDENCY_CODES.get(dependency_type, FS)
+    if code == FS:
+        value = successor.earliest_start - (predecessor.earliest_finish + lag)
+    elif code == SS:
+        value = successor.earliest_start - (predecessor.earliest_start + lag)
+    elif code == FF:
+        value = successor.earliest_finish - (predecessor.earliest_finish + lag)
+    else:  # SF
+        value = successor.earliest_finish - (predecessor.earliest_start + lag)
+    return value if value > TOLERANCE else 0.0
+
+
+def driving_critical_path(tasks, origin=0, project_duration=None):
+    """
+    Une chaîne critique complète parmi des tâches planifiées : de la première
+    tâche critique non pilotée (débutant au plus tard à `origin`, début du
+    projet ou date d'état) jusqu'à une tâche sans successeur, ou finissant avec
+    le projet sans suite pilotante (successeurs SS/FF/SF), en ne suivant que
+    des liens pilotants (marge nulle) entre tâches critiques.
+    Parcours en profondeur avec retour arrière ; coût proportionnel au
+    sous-réseau critique.
+
+    Args:
+        project_duration: Fin du projet (par défaut, EF maximal des tâches)
+    """
+    critical = [task for task in tasks if task.is_critical]
+    if project_duration is None:
+        project_duration = max((task.earliest_finish for task in critical), default=0)
+    dead = set()
+    for start in critical:
+        if start.earliest_start > origin + TOLERANCE or start.id in dead or any(
+                pred.is_critical and link_slack(pred, start, dep_type, lag) == 0.0
+                for pred, dep_type, lag in start.predecessors):
+            continue
+        path = [start]
+        branches = [iter(start.successors)]
+        on_path = {start.id}
+        while path:
+            task = path[-1]
+            if not task.successors:
+                return path
+            for succ, dep_type, lag in branches[-1]:
+                if (succ.is_critical and succ.id not in dead and succ.id not in on_path
+                        and link_slack(task, succ, dep_type, lag) == 0.0):
+                    path.append(succ)
+                    branches.append(iter(succ.successors))
+                    on_path.add(succ.id)
+                    break
+            else:
+                if task.earliest_finish >= project_duration - TOLERANCE:
+                    return path  # Finit avec le projet : chaîne complète
+                dead.add(task.id)  # Aucune suite critique depuis cette tâche
+                on_path.discard(task.id)
+                path.pop()
+                branches.pop()
+    return []
+
+
+class PathAnalysis:
+    """
+    Marges d'un réseau planifié pour l'analyse des chemins
+
+    Un chemin est une suite de liens qui commence par une tâche débutant avec
+    le projet (ES = 0, sans lien pilotant entrant) et se termine par une tâche
+    sans successeur ou finissant avec le projet. Sa marge est la somme des
+    marges de ses liens + (durée du projet - EF(dernière tâche)) : les chemins
+    de marge nulle sont les chaînes critiques, et la longueur d'un chemin est
+    durée du projet - marge.
+
+    Attributs:
+        slack: Marge de chaque lien (voir edge_slack)
+        end_slack: Marge de fin de chaque tâche (inf si un chemin ne peut pas s'y arrêter :
+                   tâche avec successeurs, sauf si elle finit avec le projet sans suite critique)
+        to_end: Marge minimale d'une tâche jusqu'à la fin du projet
+        from_start: Marge minimale depuis le début du projet jusqu'à la tâche
+    """
+
+    def __init__(self, graph, project_duration=None):
+        if project_duration is None:
+            project_duration = graph.project_duration
+        self.graph = graph
+        self.project_duration = project_duration
+        n = len(graph)
+        self.succ_ptr = graph.succ_ptr.tolist()
+        self.succ_idx = graph.succ_idx.tolist()
+        self.slack = edge_slack(graph)
+        ptr, dst, slack = self.succ_ptr, self.succ_idx, self.slack
+        es, ef = graph.earliest_start.tolist(), graph.earliest_finish.tolist()
+        order = graph.order.tolist()
+        inf = float('inf')
+
+        driven = bytearray(n)  # Date de début fixée par un lien pilotant
+        for k, value in enumerate(slack):
+            if value == 0.0:
+                driven[dst[k]] = 1
+        self.starts = [v for v in order if es[v] <= TOLERANCE and not driven[v]]
+        end_slack = [max(project_duration - ef[v], 0.0) if ptr[v] == ptr[v + 1] else inf
+                     for v in range(n)]
+
+        to_end = end_slack[:]
+        for u in reversed(order):
+            best = to_end[u]
+            for k in range(ptr[u], ptr[u + 1]):
+                value = slack[k] + to_end[dst[k]]
+                if value < best:
+                    best = value
+            if best > TOLERANCE and project_duration - ef[u] <= TOLERANCE:
+                # Finit avec le projet sans suite critique (successeurs SS/FF/SF) : fin de chemin
+                best = end_slack[u] = max(project_duration - ef[u], 0.0)
+            to_end[u] = best
+        self.end_slack = end_slack
+        from_start = [inf] * n
+        for v in self.starts:
+            from_start[v] = es[v]
+        for u in order:
+            base = from_start[u]
+            for k in range(ptr[u], ptr[u + 1]):
+                value = base + slack[k]
+                if value < from_start[dst[k]]:
+                    from_start[dst[k]] = value
+        self.to_end = to_end
+        self.from_start = from_start
+
+    def path_float(self, v):
+        """Marge du meilleur chemin passant par la tâche v"""
+        return self.from_start[v] + self.to_end[v]
+
+    def subgraph(self, max_float=0.0):
+        """
+        Tâches et liens appartenant à au moins un chemin de marge <= max_float
+        Returns:
+            (index des tâches, liens (index_pred, index_succ, index_arc CSR))
+        """
+        limit = max_float + TOLERANCE
+        nodes = [v for v in range(len(self.graph)) if self.path_float(v) <= limit]
+        edges = []
+        ptr, dst, slack = self.succ_ptr, self.succ_idx, self.slack
+        for u in nodes:
+            base = self.from_start[u]
+            for k in range(ptr[u], ptr[u + 1]):
+                if base + slack[k] + self.to_end[dst[k]] <= limit:
+                    edges.append((u, dst[k], k))
+        return nodes, edges
+
+    def paths(self, max_float=None, limit=None):
+        """
+        Énumère les chemins par marge croissante : (marge, [index des tâches])
+
+        Recherche best-first où chaque chemin partiel est évalué par sa marge
+        exacte (marge acquise + to_end) : chaque chemin complet extrait est le
+        suivant dans l'ordre, et le nombre de chemins partiels explorés reste
+        proportionnel au nombre de chemins produits multiplié par leur longueur.
+        Les chemins partiels partagent leurs préfixes (listes chaînées).
+
+        Args:
+            max_float: Marge maximale des chemins (None : pas de seuil)
+            limit: Nombre maximal de chemins (None : pas de limite)
+        """
+        ptr, dst, slack, to_end = self.succ_ptr, self.succ_idx, self.slack, self.to_end
+        end_slack = self.end_slack
+        inf = float('inf')
+        bound = inf if max_float is None else max_float + TOLERANCE
+        tie = count()
+        es = self.graph.earliest_start
+        # Entrées : (marge totale, départage, marge acquise, chemin chaîné, chemin terminé)
+        heap = [(es[v] + to_end[v], next(tie), es[v], (v, None), False)
+                for v in self.starts if es[v] + to_end[v] <= bound]
+        heapq.heapify(heap)
+        produced = 0
+        while heap and (limit is None or produced < limit):
+            total, _, acquired, path, complete = heapq.heappop(heap)
+            if complete:
+                tasks = []
+                while path is not None:
+                    tasks.append(path[0])
+                    path = path[1]
+                produced += 1
+                yield total, tasks[::-1]
+                continue
+            u = path[0]
+            if end_slack[u] < inf and acquired + end_slack[u] <= bound:
+                heapq.heappush(heap, (acquired + end_slack[u], next(tie), acquired, path, True))
+            for k in range(ptr[u], ptr[u + 1]):
+                w = dst[k]
+                value = acquired + slack[k]
+                if value + to_end[w] <= bound:
+                    heapq.heappush(heap, (value + to_end[w], next(tie), value, (w, path), False))
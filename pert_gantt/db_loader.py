@@ -0,0 +1,483 @@
+# CHARGEMENT ET SAUVEGARDE DU PLANNING EN BASE (tables tasks / dependencies)
+# Lecture en flux par curseur côté serveur (psycopg2 / psycopg 3) et écriture
+# des résultats CPM par COPY dans une table temporaire puis un seul UPDATE.
+# Fonctionne aussi avec sqlite3 (mêmes noms de tables et colonnes) pour les essais locaux.
+
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+FETCH_SIZE = 10000
+
+# Durée NULL : valeur par défaut de la colonne (1 jour ouvré)
+TASKS_QUERY = """
+    SELECT id, name, COALESCE(duration, 1)
+    FROM tasks
+    WHERE project_id = {ph}
+"""
+
+# Les dépendances dont la source appartient à un autre projet sont ignorées
+DEPENDENCIES_QUERY = """
+    SELECT d.source_task_id, d.target_task_id, d.type, d.lag_days
+    FROM dependencies d
+    JOIN tasks target ON target.id = d.target_task_id
+    JOIN tasks source ON source.id = d.source_task_id
+    WHERE target.project_id = {ph} AND source.project_id = {ph}
+"""
+
+PROJECT_START_QUERY = """
+    SELECT COALESCE(p.start_date, (SELECT MIN(t.start_date) FROM tasks t WHERE t.project_id = p.id))
+    FROM projects p
+    WHERE p.id = {ph}
+"""
+
+# Ressources actives du projet ; la capacité est exprimée en équivalents temps plein
+RESOURCES_QUERY = """
+    SELECT id, capacity_hours_per_week
+    FROM resources
+    WHERE project_id = {ph} AND is_active
+"""
+
+# Besoin d'une tâche en ressource : allocation la plus forte sur ses semaines
+ALLOCATIONS_QUERY = """
+    SELECT a.task_id, a.resource_id, MAX(a.allocation_percentage)
+    FROM resource_allocations a
+    JOIN tasks t ON t.id = a.task_id
+    WHERE t.project_id = {ph}
+    GROUP BY a.task_id, a.resource_id
+"""
+
+# Coût horaire des ressources d'une tâche (allocation la plus forte sur ses semaines)
+CRASH_COSTS_QUERY = """
+    SELECT x.task_id, SUM(r.hourly_rate * x.percentage / 100)
+    FROM (SELECT a.task_id, a.resource_id, MAX(a.allocation_percentage) AS percentage
+          FROM resource_allocations a
+          JOIN tasks t ON t.id = a.task_id
+          WHERE t.project_id = {ph}
+          GROUP BY a.task_id, a.resource_id) x
+    JOIN resources r ON r.id = x.resource_id
+    WHERE r.hourly_rate IS NOT NULL
+    GROUP BY x.task_id
+"""
+
+# Hiérarchie WBS : seules les tâches ayant un parent
+HIERARCHY_QUERY = """
+    SELECT id, parent_task_id
+    FROM tasks
+    WHERE project_id = {ph} AND parent_task_id IS NOT NULL
+"""
+
+# Avancement réel : une seule requête groupée sur time_entries, limitée aux tâches commencées
+PROGRESS_QUERY = """
+    SELECT t.id, t.progress, t.kanban_column = 'done', t.start_date, t.end_date,
+           MIN(e.log_date), MAX(e.log_date), COALESCE(SUM(e.hours_logged), 0)
+    FROM tasks t
+    LEFT JOIN time_entries e ON e.task_id = t.id
+    WHERE t.project_id = {ph}
+    GROUP BY t.id, t.progress, t.kanban_column, t.start_date, t.end_date
+    HAVING t.progress > 0 OR t.kanban_column = 'done' OR COUNT(e.id) > 0
+"""
+
+INSERT_METRIC_QUERY = """
+    INSERT INTO project_analytics (project_id, metric_name, metric_value, recorded_date, metadata)
+    VALUES ({ph}, {ph}, {ph}, {ph}, {ph}{json})
+"""
+
+HOURS_PER_WEEK = 40  # Valeur par défaut de resources.capacity_hours_per_week
+
+PROJECT_CALENDAR_QUERY = """
+    SELECT working_days_per_week, exclude_weekends, country_code
+    FROM projects
+    WHERE id = {ph}
+"""
+
+RESULT_COLUMNS = ('task_id', 'earliest_start', 'earliest_finish', 'latest_start', 'latest_finish',
+                  'total_float', 'free_float', 'is_critical')
+
+CREATE_RESULTS_TABLE = """
+    CREATE TEMP TABLE pert_results (
+        task_id UUID PRIMARY KEY,
+        earliest_start DATE,
+        earliest_finish DATE,
+        latest_start DATE,
+        latest_finish DATE,
+        total_float INTEGER,
+        free_float INTEGER,
+        is_critical BOOLEAN
+    )
+"""
+
+UPDATE_FROM_RESULTS = """
+    UPDATE tasks SET
+        earliest_start = r.earliest_start,
+        earliest_finish = r.earliest_finish,
+        latest_start = r.latest_start,
+        latest_finish = r.latest_finish,
+        total_float = r.total_float,
+        free_float = r.free_float,
+        is_critical = r.is_critical
+    FROM pert_results AS r
+    WHERE tasks.id = r.task_id
+"""
+
+
+def load_project(connection, project_id, scheduler, task_factory, fetch_size=FETCH_SIZE):
+    """
+    Construit le graphe d'un projet dans `scheduler` en une seule passe
+
+    Les tâches sont indexées par leur UUID ; `type` et `lag_days` de la table
+    dependencies deviennent le type et le décalage de Task.add_dependency
+    (source = prédécesseur, target = successeur).
+
+    Args:
+        connection: Connexion DB-API (psycopg2, psycopg 3 ou sqlite3)
+        project_id: Identifiant du projet (projects.id)
+        scheduler: ProjectScheduler à remplir (généralement vide)
+        task_factory: Classe ou fonction (id, name, duration=...) -> Task
+        fetch_size: Nombre de lignes lues par aller-retour
+    Returns:
+        Le scheduler rempli ; scheduler.start_date reçoit la date de début du projet
+    """
+    ph = _placeholder(connection)
+    tasks = scheduler.tasks
+
+    with _server_cursor(connection, 'projexolve_tasks', fetch_size) as cursor:
+        cursor.execute(TASKS_QUERY.format(ph=ph), (project_id,))
+        for task_id, name, duration in _stream(cursor, fetch_size):
+            scheduler.add_task(task_factory(task_id, name, duration=duration))
+
+    with _server_cursor(connection, 'projexolve_dependencies', fetch_size) as cursor:
+        cursor.execute(DEPENDENCIES_QUERY.format(ph=ph), (project_id, project_id))
+        for source_id, target_id, dep_type, lag_days in _stream(cursor, fetch_size):
+            tasks[target_id].add_dependency(tasks[source_id], dep_type or 'FS', lag_days or 0)
+
+    scheduler.start_date = load_project_start(connection, project_id)
+    scheduler.calendar = load_project_calendar(connection, project_id, scheduler.start_date)
+    return scheduler
+
+
+def load_project_store(connection, project_id, fetch_size=FETCH_SIZE):
+    """
+    Variante compacte de load_project : colonnes et adjacence CSR (task_store.TaskStore)
+    construites directement depuis le flux, sans objet Task intermédiaire.
+    """
+    from .task_store import TaskStore, dependency_code
+
+    ph = _placeholder(connection)
+    ids, names, durations = [], [], []
+    with _server_cursor(connection, 'projexolve_tasks', fetch_size) as cursor:
+        cursor.execute(TASKS_QUERY.format(ph=ph), (project_id,))
+        for task_id, name, duration in _stream(cursor, fetch_size):
+            ids.append(task_id)
+            names.append(name)
+            durations.append(duration)
+
+    index = {task_id: i for i, task_id in enumerate(ids)}
+    edges = []
+    with _server_cursor(connection, 'projexolve_dependencies', fetch_size) as cursor:
+        cursor.execute(DEPENDENCIES_QUERY.format(ph=ph), (project_id, project_id))
+        for source_id, target_id, dep_type, lag_days in _stream(cursor, fetch_size):
+            edges.append((index[source_id], index[target_id], dependency_code(dep_type), lag_days or 0))
+
+    return TaskStore(ids, durations, edges, names)
+
+
+def load_project_start(connection, project_id):
+    """Date de début du projet (projects.start_date, sinon plus petite date de début de tâche)"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(PROJECT_START_QUERY.format(ph=_placeholder(connection)), (project_id,))
+        row = cursor.fetchone()
+    finally:
+        cursor.close()
+    return _as_date(row[0] if row else None)
+
+
+def load_resources(connection, project_id):
+    """
+    Capacités et besoins en ressources d'un projet pour le nivellement
+    (voir ProjectScheduler.level_resources)
+
+    Returns:
+        (capacités {resource_id: ETP}, besoins {task_id: [(resource_id, ETP)]}),
+        une ressource de 40 h/semaine valant 1 et une allocation de 100 % valant 1
+    """
+    ph = _placeholder(connection)
+    capacities = {}
+    demands = {}
+    cursor = connection.cursor()
+    try:
+        cursor.execute(RESOURCES_QUERY.format(ph=ph), (project_id,))
+        for resource_id, hours in cursor.fetchall():
+            capacities[resource_id] = float(hours if hours is not None else HOURS_PER_WEEK) / HOURS_PER_WEEK
+        cursor.execute(ALLOCATIONS_QUERY.format(ph=ph), (project_id,))
+        for task_id, resource_id, percentage in cursor.fetchall():
+            if resource_id in capacities:
+                demands.setdefault(task_id, []).append((resource_id, float(percentage) / 100))
+    finally:
+        cursor.close()
+    return capacities, demands
+
+
+def load_crash_costs(connection, project_id, premium=1.0, hours_per_day=HOURS_PER_WEEK / 5):
+    """
+    Coût d'un jour de compression par tâche (voir ProjectScheduler.time_cost_curve)
+
+    Comprimer une tâche d'un jour revient à payer une journée supplémentaire de
+    ses ressources (heures supplémentaires, renfort) : coût horaire × allocation
+    × heures par jour, multiplié par `premium` (majoration, ex: 1.25).
+
+    Returns:
+        {task_id: coût par jour} des tâches ayant des ressources valorisées
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(CRASH_COSTS_QUERY.format(ph=_placeholder(connection)), (project_id,))
+        return {task_id: float(rate) * hours_per_day * premium for task_id, rate in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+
+def load_hierarchy(connection, project_id):
+    """Hiérarchie WBS d'un projet : {task_id: parent_task_id} (voir ProjectScheduler.set_hierarchy)"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(HIERARCHY_QUERY.format(ph=_placeholder(connection)), (project_id,))
+        return dict(cursor.fetchall())
+    finally:
+        cursor.close()
+
+
+def load_progress(connection, project_id):
+    """
+    Avancement réel des tâches commencées d'un projet (voir ProjectScheduler.schedule_from_status)
+
+    Début réel : première saisie de temps (sinon tasks.start_date) ; une tâche
+    terminée (progress = 100 ou colonne 'done') finit à sa dernière saisie
+    (sinon tasks.end_date). Les heures saisies sont totalisées par la même requête.
+
+    Returns:
+        {task_id: status_date.TaskProgress}
+    """
+    from .status_date import TaskProgress
+
+    progress = {}
+    cursor = connection.cursor()
+    try:
+        cursor.execute(PROGRESS_QUERY.format(ph=_placeholder(connection)), (project_id,))
+        for task_id, percent, done, start_date, end_date, first_log, last_log, hours in cursor.fetchall():
+            percent = 100 if done else (percent or 0)
+            start = _as_date(first_log if first_log is not None else start_date)
+            finish = _as_date(last_log if last_log is not None else end_date) if percent >= 100 else None
+            progress[task_id] = TaskProgress(start, finish, percent, float(hours))
+    finally:
+        cursor.close()
+    return progress
+
+
+def load_project_calendar(connection, project_id, start_date=None):
+    """
+    Calendrier de travail du projet (work_calendar.WorkCalendar) d'après
+    projects.working_days_per_week, exclude_weekends et country_code (jours fériés)
+    Retourne None si la date de début du projet est inconnue.
+    """
+    from .work_calendar import WorkCalendar
+
+    if start_date is None:
+        start_date = load_project_start(connection, project_id)
+    if start_date is None:
+        return None
+    cursor = connection.cursor()
+    try:
+        cursor.execute(PROJECT_CALENDAR_QUERY.format(ph=_placeholder(connection)), (project_id,))
+        row = cursor.fetchone()
+    finally:
+        cursor.close()
+    working_days_per_week, exclude_weekends, country_code = row or (None, None, None)
+    if exclude_weekends is not None and not exclude_weekends:
+        working_days = range(1, 8)
+    else:
+        working_days = range(1, (working_days_per_week or 5) + 1)
+    return WorkCalendar(start_date, working_days, country_code=country_code)
+
+
+def offset_to_calendar_date(start_date):
+    """Conversion par défaut décalage (jours) -> date : jours calendaires depuis le début"""
+    def to_date(offset):
+        return start_date + timedelta(days=round(offset))
+    return to_date
+
+
+def save_schedule(connection, scheduler, to_date=None, batch_size=FETCH_SIZE):
+    """
+    Écrit ES/EF/LS/LF, flottements et état critique de toutes les tâches
+    (tâches récapitulatives WBS comprises)
+
+    Les résultats sont copiés dans une table temporaire (COPY si le pilote le
+    permet, sinon executemany par lots) puis appliqués par un seul UPDATE.
+    La transaction n'est pas validée : l'appelant garde la main sur commit().
+
+    Args:
+        to_date: Calendrier (work_calendar.WorkCalendar, fins incluses) ou fonction
+                 décalage -> date ; par défaut scheduler.calendar, sinon jours
+                 calendaires depuis scheduler.start_date
+    Returns:
+        Nombre de tâches mises à jour
+    """
+    if to_date is None:
+        to_date = getattr(scheduler, 'calendar', None)
+    if to_date is None:
+        if scheduler.start_date is None:
+            raise ValueError("Date de début du projet inconnue : fournir to_date ou scheduler.start_date")
+        to_date = offset_to_calendar_date(scheduler.start_date)
+    tasks = scheduler.tasks.values()
+    wbs = getattr(scheduler, 'wbs', None)
+    if wbs is not None and wbs.summaries:
+        tasks = wbs.visible(scheduler.tasks)  # Jalons sans ligne en base, tâches récapitulatives agrégées
+    return save_tasks(connection, tasks, to_date, batch_size)
+
+
+def save_tasks(connection, tasks, to_date, batch_size=FETCH_SIZE):
+    """Variante de save_schedule pour une collection de tâches (Task ou TaskView)"""
+    sqlite = _is_sqlite(connection)
+    calendar_dates = getattr(to_date, 'task_dates', None)
+
+    def rows():
+        for task in tasks:
+            if calendar_dates is not None:
+                dates = calendar_dates(task)
+            else:
+                dates = [to_date(offset) for offset in (task.earliest_start, task.earliest_finish,
+                                                        task.latest_start, task.latest_finish)]
+            if sqlite:
+                dates = [value.isoformat() for value in dates]
+            yield (task.id, *dates, round(task.total_float), round(task.free_float), bool(task.is_critical))
+
+    cursor = connection.cursor()
+    try:
+        # Table laissée par une sauvegarde interrompue sur la même connexion
+        cursor.execute("DROP TABLE IF EXISTS pert_results")
+        cursor.execute(CREATE_RESULTS_TABLE)
+        _bulk_insert(cursor, rows(), batch_size, '?' if sqlite else '%s')
+        cursor.execute(UPDATE_FROM_RESULTS)
+        updated = cursor.rowcount
+        cursor.execute("DROP TABLE pert_results")
+    finally:
+        cursor.close()
+    return updated
+
+
+def save_metrics(connection, project_id, metrics, recorded_date=None):
+    """
+    Ajoute des indicateurs dans project_analytics (une ligne par indicateur)
+    La transaction n'est pas validée : l'appelant garde la main sur commit().
+
+    Args:
+        metrics: {metric_name: valeur ou (valeur, metadata)},
+                 ex: analytic_risk.CompletionDistribution.metrics()
+        recorded_date: Date de la mesure (par défaut, aujourd'hui)
+    Returns:
+        Nombre d'indicateurs écrits
+    """
+    import json
+
+    sqlite = _is_sqlite(connection)
+    ph = _placeholder(connection)
+    recorded_date = recorded_date or date.today()
+    rows = []
+    for name, value in metrics.items():
+        value, metadata = value if isinstance(value, tuple) else (value, {})
+        rows.append((project_id, name, float(value),
+                     recorded_date.isoformat() if sqlite else recorded_date, json.dumps(metadata)))
+    cursor = connection.cursor()
+    try:
+        cursor.executemany(INSERT_METRIC_QUERY.format(ph=ph, json='' if sqlite else '::jsonb'), rows)
+    finally:
+        cursor.close()
+    return len(rows)
+
+
+def _bulk_insert(cursor, rows, batch_size, ph):
+    """Remplit pert_results par COPY (psycopg 3 / psycopg2) ou executemany par lots"""
+    columns = ', '.join(RESULT_COLUMNS)
+    if hasattr(cursor, 'copy'):  # psycopg 3
+        with cursor.copy(f"COPY pert_results ({columns}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
+    elif hasattr(cursor, 'copy_expert'):  # psycopg2
+        cursor.copy_expert(f"COPY pert_results ({columns}) FROM STDIN", _CopyStream(rows))
+    else:
+        placeholders = ', '.join(ph for _ in RESULT_COLUMNS)
+        query = f"INSERT INTO pert_results ({columns}) VALUES ({placeholders})"
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                cursor.executemany(query, batch)
+                batch = []
+        if batch:
+            cursor.executemany(query, batch)
+
+
+class _CopyStream:
+    """Flux texte COPY généré à la demande (mémoire bornée)"""
+
+    def __init__(self, rows):
+        self._lines = ('\t'.join(_copy_value(value) for value in row) + '\n' for row in rows)
+        self._buffer = bytearray()
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line.encode('utf-8')
+        if size < 0:
+            size = len(self._buffer)
+        chunk = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return chunk
+
+
+def _copy_value(value):
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    return str(value)
+
+
+@contextmanager
+def _server_cursor(connection, name, fetch_size):
+    """Curseur nommé côté serveur si le pilote le permet (psycopg), sinon curseur simple"""
+    try:
+        cursor = connection.cursor(name=name)
+        cursor.itersize = fetch_size
+    except TypeError:
+        cursor = connection.cursor()
+    try:
+        yield cursor
+    finally:
+        cursor.close()
+
+
+def _stream(cursor, fetch_size):
+    while True:
+        batch = cursor.fetchmany(fetch_size)
+        if not batch:
+            return
+        yield from batch
+
+
+def _as_date(value):
+    """Date lue en base (sqlite3 renvoie une chaîne ISO)"""
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
+
+
+def _is_sqlite(connection):
+    return type(connection).__module__.startswith('sqlite3')
+
+
+def _placeholder(connection):
+    return '?' if _is_sqlite(connection) else '%s'
@@ -0,0 +1,245 @@
+# DÉMONSTRATIONS DU PLANIFICATEUR PERT/CPM
+# Exemples complets avec tous les types de dépendances, exécutés uniquement à
+# la demande : python -m pert_gantt.demo [--complet]
+
+import argparse
+
+from .scheduler import ProjectScheduler, Task
+
+
+def create_example_project():
+    """
+    Exemple d'utilisation avec tous les types de dépendances
+    Projet : Développement d'une application web
+    """
+    scheduler = ProjectScheduler()
+    
+    # Création des tâches avec estimation PERT
+    tasks = {
+        'PLAN': Task('PLAN', 'Planification', duration=3),
+        'DESIGN': Task('DESIGN', 'Design UI/UX', optimistic_time=3, most_likely_time=5, pessimistic_time=7),
+        'DB': Task('DB', 'Création base données', optimistic_time=2, most_likely_time=4, pessimistic_time=6),
+        'API': Task('API', 'Développement API', optimistic_time=6, most_likely_time=8, pessimistic_time=12),
+        'FRONT': Task('FRONT', 'Développement Frontend', optimistic_time=5, most_likely_time=7, pessimistic_time=9),
+        'TEST_UNIT': Task('TEST_UNIT', 'Tests unitaires', optimistic_time=2, most_likely_time=3, pessimistic_time=4),
+        'TEST_INT': Task('TEST_INT', 'Tests intégration', optimistic_time=3, most_likely_time=4, pessimistic_time=5),
+        'DOC': Task('DOC', 'Documentation', optimistic_time=1, most_likely_time=2, pessimistic_time=3),
+        'FORM': Task('FORM', 'Formation utilisateurs', optimistic_time=2, most_likely_time=3, pessimistic_time=4),
+        'DEPLOY': Task('DEPLOY', 'Déploiement', duration=1)
+    }
+    
+    # Ajout des tâches au planificateur
+    for task in tasks.values():
+        scheduler.add_task(task)
+    
+    # DÉFINITION DES DÉPENDANCES AVEC TOUS LES TYPES :
+    
+    # 1. FINISH-TO-START (FS) - Le plus courant
+    tasks['DESIGN'].add_dependency(tasks['PLAN'], 'FS', 0)
+    tasks['DB'].add_dependency(tasks['DESIGN'], 'FS', 1)  # Avec lag de 1 jour
+    tasks['API'].add_dependency(tasks['DB'], 'FS', 0)
+    
+    # 2. START-TO-START (SS) - Démarrage simultané
+    tasks['FRONT'].add_dependency(tasks['DESIGN'], 'SS', 2)  # Frontend commence 2 jours après le début du design
+    tasks['DOC'].add_dependency(tasks['API'], 'SS', 3)       # Doc commence 3 jours après le début de l'API
+    
+    # 3. FINISH-TO-FINISH (FF) - Fin simultanée
+    tasks['TEST_UNIT'].add_dependency(tasks['API'], 'FF', -1)  # Tests finissent 1 jour avant l'API (lead time)
+    tasks['FORM'].add_dependency(tasks['DOC'], 'FF', 0)        # Formation finit en même temps que la doc
+    
+    # 4. START-TO-FINISH (SF) - Plus rare
+    tasks['TEST_INT'].add_dependency(tasks['FRONT'], 'SF', 1)  # Tests d'intég finissent 1 jour après début frontend
+    
+    # Dépendances de fin classiques
+    tasks['TEST_INT'].add_dependency(tasks['API'], 'FS', 0)
+    tasks['TEST_INT'].add_dependency(tasks['TEST_UNIT'], 'FS', 0)
+    
+    tasks['DEPLOY'].add_dependency(tasks['TEST_INT'], 'FS', 0)
+    tasks['DEPLOY'].add_dependency(tasks['FORM'], 'FS', 0)
+    
+    return scheduler
+
+
+def demonstrate_all_dependency_types():
+    """
+    Démontre tous les types de dépendances avec des exemples concrets
+    """
+    print("\n🔗 DÉMONSTRATION DE TOUS LES TYPES DE DÉPENDANCES")
+    print("=" * 60)
+    
+    scheduler = ProjectScheduler()
+    
+    # Exemple concret: Construction d'une application web
+    tasks = {
+        'PLAN': Task('PLAN', 'Planification', duration=3),
+        'DESIGN': Task('DESIGN', 'Design UI/UX', duration=5),
+        'DB': Task('DB', 'Création base données', duration=4),
+        'API': Task('API', 'Développement API', duration=8),
+        'FRONT': Task('FRONT', 'Développement Frontend', duration=7),
+        'TEST_UNIT': Task('TEST_UNIT', 'Tests unitaires', duration=3),
+        'TEST_INT': Task('TEST_INT', 'Tests intégration', duration=4),
+        'DOC': Task('DOC', 'Documentation', duration=2),
+        'FORM': Task('FORM', 'Formation utilisateurs', duration=3),
+        'DEPLOY': Task('DEPLOY', 'Déploiement', duration=1)
+    }
+    
+    # Ajout des tâches
+    for task in tasks.values():
+        scheduler.add_task(task)
+    
+    print("Types de dépendances utilisées:")
+    print("FS = Finish-to-Start (Finir avant commencer)")
+    print("SS = Start-to-Start (Commencer en même temps)")
+    print("FF = Finish-to-Finish (Finir en même temps)")
+    print("SF = Start-to-Finish (Commencer avant finir)\n")
+    
+    # 1. FINISH-TO-START (FS) - Le plus courant
+    print("1. FINISH-TO-START (FS):")
+    tasks['DESIGN'].add_dependency(tasks['PLAN'], 'FS', 0)
+    print("   - Le design commence APRÈS la fin de la planification")
+    
+    tasks['DB'].add_dependency(tasks['DESIGN'], 'FS', 1)  # Avec lag de 1 jour
+    print("   - La création DB commence 1 jour APRÈS la fin du design")
+    
+    tasks['API'].add_dependency(tasks['DB'], 'FS', 0)
+    print("   - L'API commence APRÈS la création de la DB")
+    
+    # 2. START-TO-START (SS) - Démarrage simultané
+    print("\n2. START-TO-START (SS):")
+    tasks['FRONT'].add_dependency(tasks['DESIGN'], 'SS', 2)
+    print("   - Le frontend commence 2 jours APRÈS le début du design")
+    
+    tasks['DOC'].add_dependency(tasks['API'], 'SS', 3)
+    print("   - La documentation commence 3 jours APRÈS le début de l'API")
+    
+    # 3. FINISH-TO-FINISH (FF) - Fin simultanée
+    print("\n3. FINISH-TO-FINISH (FF):")
+    tasks['TEST_UNIT'].add_dependency(tasks['API'], 'FF', -1)  # Lead time
+    print("   - Les tests unitaires finissent 1 jour AVANT la fin de l'API")
+    
+    tasks['FORM'].add_dependency(tasks['DOC'], 'FF', 0)
+    print("   - La formation finit EN MÊME TEMPS que la documentation")
+    
+    # 4. START-TO-FINISH (SF) - Plus rare, mais utile
+    print("\n4. START-TO-FINISH (SF):")
+    tasks['TEST_INT'].add_dependency(tasks['FRONT'], 'SF', 1)
+    print("   - Les tests d'intégration finissent 1 jour APRÈS le début du frontend")
+    
+    # Dépendances classiques de fin
+    tasks['TEST_INT'].add_dependency(tasks['API'], 'FS', 0)
+    tasks['TEST_INT'].add_dependency(tasks['TEST_UNIT'], 'FS', 0)
+    
+    tasks['DEPLOY'].add_dependency(tasks['TEST_INT'], 'FS', 0)
+    tasks['DEPLOY'].add_dependency(tasks['FORM'], 'FS', 0)
+    
+    # Calcul et affichage
+    scheduler.schedule_project()
+    scheduler.print_dependencies()
+    scheduler.print_schedule()
+    scheduler.print_critical_path()
+    
+    return scheduler
+
+
+def analyze_schedule_constraints(scheduler):
+    """
+    Analyse les contraintes et décalages du planning
+    """
+    print("\n📊 ANALYSE DES CONTRAINTES ET DÉCALAGES")
+    print("=" * 50)
+    
+    lag_count = {'FS': 0, 'SS': 0, 'FF': 0, 'SF': 0}
+    total_lag_time = 0
+    lead_time_tasks = []
+    
+    for task in scheduler.tasks.values():
+        for pred_task, dep_type, lag in task.predecessors:
+            lag_count[dep_type] += 1
+            total_lag_time += abs(lag)
+            
+            if lag < 0:
+                lead_time_tasks.append(f"{pred_task.name} -> {task.name} (lead: {abs(lag)} jours)")
+    
+    print(f"Types de dépendances utilisées:")
+    for dep_type, count in lag_count.items():
+        if count > 0:
+            print(f"  - {dep_type}: {count} dépendances")
+    
+    print(f"\nTemps de décalage total: {total_lag_time} jours")
+    
+    if lead_time_tasks:
+        print(f"\nTâches avec lead time (avance):")
+        for task_info in lead_time_tasks:
+            print(f"  - {task_info}")
+    
+    # Analyse du chemin critique
+    critical_tasks = [t for t in scheduler.tasks.values() if t.is_critical]
+    print(f"\nTâches critiques: {len(critical_tasks)}/{len(scheduler.tasks)}")
+    print(f"Pourcentage de tâches critiques: {len(critical_tasks)/len(scheduler.tasks)*100:.1f}%")
+
+
+def run_example():
+    """
+    Exemple d'utilisation de l'algorithme complet
+    """
+    print("🚀 ALGORITHME COMPLET PERT/CPM")
+    print("AVEC TOUS LES TYPES DE DÉPENDANCES")
+    print("=" * 50)
+    
+    # Création et calcul du projet
+    from .instrumentation import ConsoleInstrumentation
+
+    project = create_example_project()
+    project.instrumentation = ConsoleInstrumentation()
+    project.schedule_project()
+    
+    # Affichage des résultats
+    project.print_dependencies()
+    project.print_schedule()
+    project.print_critical_path()
+    
+    # Export CSV
+    project.export_to_csv("planning_projet.csv")
+    print("\n💾 Planning exporté vers: planning_projet.csv")
+    
+    print("\n✅ TYPES DE DÉPENDANCES SUPPORTÉS:")
+    print("   - FS : Finish-to-Start (Finir avant commencer)")
+    print("   - SS : Start-to-Start (Commencer ensemble)")
+    print("   - FF : Finish-to-Finish (Finir ensemble)")
+    print("   - SF : Start-to-Finish (Commencer avant finir)")
+    print("   - Gestion lag/lead time pour tous les types")
+    print("   - Calcul automatique du chemin critique")
+    print("   - Export CSV pour intégration dans votre application")
+
+
+def run_complete_demo():
+    """Démonstration détaillée des types de dépendances, analyse des décalages et export CSV"""
+    demo_scheduler = demonstrate_all_dependency_types()
+    analyze_schedule_constraints(demo_scheduler)
+    demo_scheduler.export_to_csv("planning_exemple_complet.csv", order='earliest_start')
+    print("\n💾 Planning exporté vers: planning_exemple_complet.csv")
+
+    print("\n🎯 RÉCAPITULATIF DE L'ALGORITHME")
+    print("=" * 40)
+    print("✅ Types de dépendances supportés: FS, SS, FF, SF")
+    print("✅ Gestion des décalages (lag) et avances (lead)")
+    print("✅ Calcul PERT avec 3 estimations de temps")
+    print("✅ Identification du chemin critique")
+    print("✅ Calcul des flottements total et libre")
+    print("✅ Export CSV pour intégration")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m pert_gantt.demo', description="Démonstrations PERT/CPM")
+    parser.add_argument('--complet', action='store_true',
+                        help="démonstration détaillée des dépendances (écrit planning_exemple_complet.csv)")
+    arguments = parser.parse_args(argv)
+    if arguments.complet:
+        run_complete_demo()
+    else:
+        run_example()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
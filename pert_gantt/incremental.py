@@ -0,0 +1,196 @@
+# REPLANIFICATION INCRÉMENTALE
+# Recalcule uniquement la partie du réseau touchée par une modification
+# (durée d'une tâche, ajout ou suppression d'une dépendance)
+
+import heapq
+
+from .cpm_engine import CycleError, DEPENDENCY_CODES, FS, SS, FF
+
+
+class TopologicalOrder:
+    """
+    Ordre topologique maintenu dynamiquement (algorithme de Pearce-Kelly)
+
+    `order[r]` est l'identifiant de la tâche de rang r et `rank[id]` son rang.
+    L'ajout d'un arc ne réordonne que les tâches comprises entre les rangs
+    de ses deux extrémités.
+    """
+
+    def __init__(self, ids, positions=None):
+        """
+        Args:
+            ids: Identifiants dans l'ordre topologique ; avec `positions`,
+                 identifiants par index de tâche (ex: CompiledGraph.ids)
+            positions: Index des tâches dans l'ordre topologique (CompiledGraph.order) ;
+                       la liste des identifiants n'est alors construite qu'à la première utilisation
+        """
+        self._ids, self._positions = ids, positions
+        self._order = list(ids) if positions is None else None
+        self._rank = None
+
+    @property
+    def order(self):
+        if self._order is None:
+            ids = self._ids
+            self._order = [ids[v] for v in self._positions]
+            self._ids = self._positions = None
+        return self._order
+
+    @property
+    def rank(self):
+        """Rangs construits à la première modification (planification complète sans surcoût)"""
+        if self._rank is None:
+            self._rank = {task_id: r for r, task_id in enumerate(self.order)}
+        return self._rank
+
+    def insert_edge(self, tasks, predecessor_id, successor_id):
+        """
+        Met à jour l'ordre pour l'arc predecessor -> successor
+        Lève CycleError (sans rien modifier) si l'arc fermerait un cycle.
+        """
+        rank = self.rank
+        lower, upper = rank[successor_id], rank[predecessor_id]
+        if lower > upper:
+            return  # Ordre déjà compatible
+
+        # Descendants du successeur situés avant le prédécesseur
+        forward = self._collect(tasks, successor_id, 'successors', lambda r: r <= upper)
+        if predecessor_id in forward:
+            raise CycleError(
+                f"La dépendance {predecessor_id} -> {successor_id} crée un cycle",
+                [predecessor_id, successor_id],
+            )
+        # Ancêtres du prédécesseur situés après le successeur
+        backward = self._collect(tasks, predecessor_id, 'predecessors', lambda r: r >= lower)
+
+        # Les ancêtres passent avant les descendants, en réutilisant leurs rangs
+        moved = sorted(backward, key=rank.__getitem__) + sorted(forward, key=rank.__getitem__)
+        slots = sorted(rank[task_id] for task_id in moved)
+        for r, task_id in zip(slots, moved):
+            rank[task_id] = r
+            self.order[r] = task_id
+
+    def _collect(self, tasks, start_id, direction, in_window):
+        visited = {start_id}
+        stack = [start_id]
+        rank = self.rank
+        while stack:
+            for other, _, _ in getattr(tasks[stack.pop()], direction):
+                if other.id not in visited and in_window(rank[other.id]):
+                    visited.add(other.id)
+                    stack.append(other.id)
+        return visited
+
+
+def earliest_start(task):
+    """ES d'une tâche à partir de ses prédécesseurs (mêmes formules que cpm_engine)"""
+    d = task.duration
+    start = 0.0
+    for pred_task, dep_type, lag in task.predecessors:
+        code = DEPENDENCY_CODES.get(dep_type, FS)
+        if code == FS:
+            constraint = pred_task.earliest_finish + lag
+        elif code == SS:
+            constraint = pred_task.earliest_start + lag
+        elif code == FF:
+            constraint = pred_task.earliest_finish + lag - d
+        else:  # SF
+            constraint = pred_task.earliest_start + lag - d
+        if constraint > start:
+            start = constraint
+    return start
+
+
+def latest_finish(task, project_duration):
+    """LF d'une tâche à partir de ses successeurs (mêmes formules que cpm_engine)"""
+    if not task.successors:
+        return project_duration
+    d = task.duration
+    finish = float('inf')
+    for succ_task, dep_type, lag in task.successors:
+        code = DEPENDENCY_CODES.get(dep_type, FS)
+        if code == FS:
+            constraint = succ_task.latest_start - lag
+        elif code == SS:
+            constraint = succ_task.latest_start - lag + d
+        elif code == FF:
+            constraint = succ_task.latest_finish - lag
+        else:  # SF
+            constraint = succ_task.latest_finish - lag + d
+        if constraint < finish:
+            finish = constraint
+    return finish
+
+
+def propagate_forward(tasks, topo, seeds):
+    """
+    Recalcule ES/EF à partir des tâches `seeds`, dans l'ordre topologique,
+    en ne poursuivant vers les successeurs que si les valeurs ont changé.
+    Retourne un dictionnaire {id: EF précédent} des tâches dont ES/EF ont changé.
+    """
+    rank = topo.rank
+    heap = [rank[task_id] for task_id in seeds]
+    heapq.heapify(heap)
+    queued = set(seeds)
+    changed = {}
+    while heap:
+        task = tasks[topo.order[heapq.heappop(heap)]]
+        queued.discard(task.id)
+        start = earliest_start(task)
+        finish = start + task.duration
+        if start == task.earliest_start and finish == task.earliest_finish:
+            continue
+        changed[task.id] = task.earliest_finish
+        task.earliest_start = start
+        task.earliest_finish = finish
+        for succ_task, _, _ in task.successors:
+            if succ_task.id not in queued:
+                queued.add(succ_task.id)
+                heapq.heappush(heap, rank[succ_task.id])
+    return changed
+
+
+def propagate_backward(tasks, topo, seeds, project_duration):
+    """
+    Recalcule LS/LF à partir des tâches `seeds`, dans l'ordre topologique
+    inverse, en ne remontant vers les prédécesseurs que si les valeurs ont changé.
+    Retourne l'ensemble des tâches dont LS/LF ont changé.
+    """
+    rank = topo.rank
+    heap = [-rank[task_id] for task_id in seeds]
+    heapq.heapify(heap)
+    queued = set(seeds)
+    changed = set()
+    while heap:
+        task = tasks[topo.order[-heapq.heappop(heap)]]
+        queued.discard(task.id)
+        finish = latest_finish(task, project_duration)
+        start = finish - task.duration
+        if start == task.latest_start and finish == task.latest_finish:
+            continue
+        task.latest_start = start
+        task.latest_finish = finish
+        changed.add(task.id)
+        for pred_task, _, _ in task.predecessors:
+            if pred_task.id not in queued:
+                queued.add(pred_task.id)
+                heapq.heappush(heap, -rank[pred_task.id])
+    return changed
+
+
+def full_backward(tasks, topo, project_duration):
+    """
+    Passage arrière complet dans l'ordre topologique maintenu
+    (utilisé lorsque la durée du projet change)
+    Retourne l'ensemble des tâches dont LS/LF ont changé.
+    """
+    changed = set()
+    for task_id in reversed(topo.order):
+        task = tasks[task_id]
+        finish = latest_finish(task, project_duration)
+        start = finish - task.duration
+        if start != task.latest_start or finish != task.latest_finish:
+            task.latest_start = start
+            task.latest_finish = finish
+            changed.add(task_id)
+    return changed
@@ -0,0 +1,185 @@
+# INSTRUMENTATION DU CALCUL DE PLANNING
+# Points d'accroche appelés par ProjectScheduler à chaque phase du calcul.
+# Par défaut aucun : ni chronométrage ni formatage de texte. Les implémentations
+# fournies affichent la progression (console), journalisent (logging), alimentent
+# un collecteur de métriques ou enregistrent les mesures pour analyse.
+
+import logging
+from collections import namedtuple
+from contextlib import contextmanager
+
+# Libellés affichés par ConsoleInstrumentation (schedule_project numérote les 4 premières)
+PHASE_LABELS = {
+    'forward_pass': "Passage avant (Forward Pass)",
+    'backward_pass': "Passage arrière (Backward Pass)",
+    'calculate_float': "Calcul du flottement",
+    'find_critical_path': "Identification du chemin critique",
+    'reschedule': "Replanification incrémentale",
+    'schedule_parallel': "Calcul parallèle par composantes",
+    'schedule_cached': "Calcul avec cache des résultats",
+    'schedule_from_status': "Replanification à la date d'état",
+}
+
+PhaseStats = namedtuple('PhaseStats', 'phase step wall_time cpu_time tasks edges relaxations')
+PhaseStats.__doc__ = """
+Mesures d'une phase du calcul
+
+    phase: Nom de la phase (clé de PHASE_LABELS)
+    step: Numéro de l'étape dans schedule_project (None hors schedule_project)
+    wall_time, cpu_time: Durées écoulée et CPU du processus, en secondes
+    tasks, edges: Tâches et liens parcourus (None si sans objet)
+    relaxations: Nombre de mises à jour de ES (passage avant) ou LF (passage arrière)
+"""
+
+
+class Instrumentation:
+    """
+    Points d'accroche sans effet (comportement par défaut)
+
+    Une sous-classe redéfinit les méthodes voulues et met `enabled` à True :
+    tant que `enabled` est faux, le planificateur ne mesure rien.
+    """
+
+    enabled = False
+
+    def phase_started(self, phase, step, scheduler):
+        """Début d'une phase"""
+
+    def phase_finished(self, stats, scheduler):
+        """Fin d'une phase (stats : PhaseStats)"""
+
+    def schedule_finished(self, scheduler):
+        """Fin d'un calcul complet (schedule_project)"""
+
+
+NO_INSTRUMENTATION = Instrumentation()
+
+
+class ConsoleInstrumentation(Instrumentation):
+    """Affichage de la progression sur la console (ancien comportement de schedule_project)"""
+
+    enabled = True
+
+    def __init__(self, timings=False):
+        """
+        Args:
+            timings: Affiche aussi la durée de chaque phase
+        """
+        self.timings = timings
+
+    def phase_started(self, phase, step, scheduler):
+        if step == 1:
+            print("=== CALCUL DU PLANNING DE PROJET ===")
+        prefix = f"{step}. " if step is not None else ""
+        print(f"{prefix}{PHASE_LABELS.get(phase, phase)}...")
+
+    def phase_finished(self, stats, scheduler):
+        if self.timings:
+            print(f"   {stats.wall_time * 1000:.2f} ms (CPU {stats.cpu_time * 1000:.2f} ms)")
+
+    def schedule_finished(self, scheduler):
+        print(f"✓ Durée totale du projet: {scheduler.project_duration:.1f} jours")
+        print(f"✓ Nombre de tâches critiques: {len([t for t in scheduler.tasks.values() if t.is_critical])}")
+
+
+class LoggingInstrumentation(Instrumentation):
+    """Journalisation des mesures de chaque phase (formatage différé par logging)"""
+
+    enabled = True
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger('pert_gantt')
+        self.level = level
+
+    def phase_finished(self, stats, scheduler):
+        self.logger.log(self.level, "phase %s: %.3f ms (CPU %.3f ms), tâches=%s liens=%s relaxations=%s",
+                        stats.phase, stats.wall_time * 1000, stats.cpu_time * 1000,
+                        stats.tasks, stats.edges, stats.relaxations)
+
+    def schedule_finished(self, scheduler):
+        self.logger.log(self.level, "planning calculé: durée %.1f jours, %d tâches",
+                        scheduler.project_duration, len(scheduler.tasks))
+
+
+class MetricsInstrumentation(Instrumentation):
+    """
+    Envoi des mesures à un collecteur de métriques (StatsD, Prometheus...)
+    sink(nom, valeur, étiquettes) est appelé pour chaque mesure disponible,
+    ex: sink('pert.forward_pass.wall_seconds', 0.012, {'phase': 'forward_pass'}).
+    """
+
+    enabled = True
+
+    def __init__(self, sink, prefix='pert', tags=None):
+        self.sink = sink
+        self.prefix = prefix
+        self.tags = dict(tags or {})
+
+    def phase_finished(self, stats, scheduler):
+        tags = dict(self.tags, phase=stats.phase)
+        base = f"{self.prefix}.{stats.phase}"
+        self.sink(f"{base}.wall_seconds", stats.wall_time, tags)
+        self.sink(f"{base}.cpu_seconds", stats.cpu_time, tags)
+        for name in ('tasks', 'edges', 'relaxations'):
+            value = getattr(stats, name)
+            if value is not None:
+                self.sink(f"{base}.{name}", value, tags)
+
+
+class PhaseRecorder(Instrumentation):
+    """Enregistre les mesures de chaque phase (attribut phases) ; callback optionnel"""
+
+    enabled = True
+
+    def __init__(self, callback=None):
+        self.phases = []
+        self.callback = callback
+
+    def phase_finished(self, stats, scheduler):
+        self.phases.append(stats)
+        if self.callback is not None:
+            self.callback(stats)
+
+    def slowest(self):
+        """Phase la plus longue (temps écoulé), None si rien n'a été mesuré"""
+        return max(self.phases, key=lambda stats: stats.wall_time, default=None)
+
+
+class CompositeInstrumentation(Instrumentation):
+    """Transmet chaque événement à plusieurs instrumentations"""
+
+    enabled = True
+
+    def __init__(self, *hooks):
+        self.hooks = [hook for hook in hooks if hook.enabled]
+
+    def phase_started(self, phase, step, scheduler):
+        for hook in self.hooks:
+            hook.phase_started(phase, step, scheduler)
+
+    def phase_finished(self, stats, scheduler):
+        for hook in self.hooks:
+            hook.phase_finished(stats, scheduler)
+
+    def schedule_finished(self, scheduler):
+        for hook in self.hooks:
+            hook.schedule_finished(scheduler)
+
+
+@contextmanager
+def instrumented(scheduler, hooks=None):
+    """
+    Active une instrumentation le temps d'un bloc
+
+        with instrumented(scheduler) as recorder:   # PhaseRecorder par défaut
+            scheduler.schedule_project()
+        print(recorder.slowest())
+    """
+    if hooks is None:
+        hooks = PhaseRecorder()
+    previous = scheduler.instrumentation
+    scheduler.instrumentation = hooks
+    try:
+        yield hooks
+    finally:
+        scheduler.instrumentation = previous
@@ -0,0 +1,176 @@
+# PROFILS DE CHARGE DES RESSOURCES (NumPy)
+# Charge journalière de chaque ressource à partir des intervalles planifiés des
+# tâches et de leurs allocations : chaque allocation ne touche que les deux
+# bornes d'un tableau de différences, une somme cumulée donne ensuite toutes
+# les charges d'un coup. Le coût est O(allocations + ressources × jours) au lieu
+# de filtrer les allocations pour chaque semaine et chaque ressource.
+
+from datetime import date
+
+from .resource_leveling import DEFAULT_CAPACITY, CAPACITY_TOLERANCE, task_demands
+
+
+class LoadProfile:
+    """
+    Charge par ressource et par jour ouvré
+
+    Attributs:
+        resources: Identifiants des ressources (ordre des lignes)
+        load: Matrice NumPy ressources × jours (unités : 1 = une ressource à temps plein)
+        capacity: Capacité journalière de chaque ressource (tableau NumPy)
+        calendar: WorkCalendar des jours (agrégation par semaine / mois)
+    """
+
+    def __init__(self, resources, load, capacity, calendar=None):
+        self.resources = resources
+        self.load = load
+        self.capacity = capacity
+        self.calendar = calendar
+        self._rows = {resource: i for i, resource in enumerate(resources)}
+
+    @classmethod
+    def from_intervals(cls, resources, rows, starts, finishes, units, capacity, horizon=None, calendar=None):
+        """
+        Accumulation par tableau de différences
+
+        Args:
+            resources: Identifiants des ressources
+            rows, starts, finishes, units: Une entrée par allocation (ligne de la
+                ressource, début et fin en jours, unités) ; les débuts et fins
+                fractionnaires sont répartis au prorata sur les jours entamés
+            capacity: Capacité journalière par ressource
+            horizon: Nombre de jours (par défaut, jusqu'à la dernière fin)
+        """
+        import numpy as np
+
+        rows = np.asarray(rows, dtype=np.int64)
+        starts = np.asarray(starts, dtype=float)
+        finishes = np.maximum(np.asarray(finishes, dtype=float), starts)
+        units = np.asarray(units, dtype=float)
+        if horizon is None:
+            horizon = int(np.ceil(finishes.max())) if len(finishes) else 0
+        else:  # Allocations tronquées à l'horizon
+            starts, finishes = np.minimum(starts, horizon), np.minimum(finishes, horizon)
+        width = horizon + 2
+
+        # Jour entamé au début (first) et à la fin (last) ; le premier et le
+        # dernier jour ne reçoivent que leur part couverte
+        first = np.floor(starts)
+        last = np.floor(finishes)
+        base = rows * width
+        entries = np.concatenate([base + first, base + first + 1, base + last, base + last + 1]).astype(np.int64)
+        weights = np.concatenate([units * (first + 1 - starts), units * (starts - first),
+                                  units * (finishes - last - 1), -units * (finishes - last)])
+        difference = np.bincount(entries, weights=weights, minlength=len(resources) * width)
+        load = np.cumsum(difference.reshape(len(resources), width), axis=1)[:, :horizon]
+        load[np.abs(load) < CAPACITY_TOLERANCE] = 0.0
+        return cls(list(resources), load, np.asarray(capacity, dtype=float), calendar)
+
+    @property
+    def horizon(self):
+        return self.load.shape[1]
+
+    def daily(self, resource):
+        """Charge journalière d'une ressource (tableau NumPy)"""
+        return self.load[self._rows[resource]]
+
+    def utilization(self):
+        """Charge rapportée à la capacité (1 = pleine capacité), ressources × jours"""
+        import numpy as np
+
+        capacity = np.where(self.capacity > 0, self.capacity, np.inf)
+        return self.load / capacity[:, None]
+
+    def overallocations(self):
+        """
+        Périodes de surcharge : {resource_id: [(premier jour, dernier jour, pic)]}
+        (jours inclus, décalages depuis le début du projet)
+        """
+        import numpy as np
+
+        over = self.load > self.capacity[:, None] + CAPACITY_TOLERANCE
+        edges = np.diff(np.pad(over.astype(np.int8), ((0, 0), (1, 1))), axis=1)
+        # Débuts et fins de surcharge se succèdent dans le même ordre ligne par ligne
+        rows, firsts = np.nonzero(edges == 1)
+        _, ends = np.nonzero(edges == -1)
+        result = {}
+        for row, first, end in zip(rows.tolist(), firsts.tolist(), ends.tolist()):
+            peak = float(self.load[row, first:end].max())
+            result.setdefault(self.resources[row], []).append((first, end - 1, peak))
+        return result
+
+    def aggregate(self, period='week'):
+        """
+        Charge et capacité cumulées par semaine ou par mois (jours ouvrés du calendrier)
+
+        Returns:
+            (débuts de période [date], charge ressources × périodes,
+             capacité ressources × périodes), en jours × unités
+        """
+        import numpy as np
+
+        if self.calendar is None:
+            raise ValueError("Calendrier du projet inconnu : agrégation impossible")
+        if period not in ('week', 'month'):
+            raise ValueError(f"Période inconnue: {period!r} ('week' ou 'month')")
+        if self.horizon == 0:
+            return [], self.load[:, :0], self.load[:, :0]
+        self.calendar.ensure(self.horizon)
+        days = [self.calendar.date_at(k) for k in range(self.horizon)]
+        if period == 'week':
+            keys = [day.toordinal() - day.weekday() for day in days]
+        else:
+            keys = [day.year * 12 + day.month - 1 for day in days]
+        breaks = [0] + [k for k in range(1, len(keys)) if keys[k] != keys[k - 1]]
+        if period == 'week':
+            starts = [date.fromordinal(keys[k]) for k in breaks]  # Lundi de chaque semaine
+        else:
+            starts = [days[k].replace(day=1) for k in breaks]
+        load = np.add.reduceat(self.load, breaks, axis=1)
+        sizes = np.diff(breaks + [self.horizon])
+        return starts, load, self.capacity[:, None] * sizes[None, :]
+
+    def heatmap(self, period='week'):
+        """
+        Carte de charge précalculée, prête à servir en JSON :
+        {'periods': [date ISO], 'resources': [...], 'utilization': [[%]]} (100 = pleine capacité)
+        """
+        import numpy as np
+
+        starts, load, capacity = self.aggregate(period)
+        utilization = np.divide(load, capacity, out=np.zeros_like(load), where=capacity > 0) * 100
+        return {'periods': [day.isoformat() for day in starts],
+                'resources': list(self.resources),
+                'utilization': np.round(utilization, 1).tolist()}
+
+
+def load_profile(tasks, capacities=None, demands=None, starts=None, calendar=None,
+                 default_capacity=DEFAULT_CAPACITY):
+    """
+    Profils de charge d'un planning
+
+    Args:
+        tasks: Tâches planifiées (Task, AdvancedTask ou TaskView)
+        capacities: {resource_id: capacité par jour} (voir db_loader.load_resources)
+        demands: {task_id: [(resource_id, unités)]} remplaçant task.resources
+        starts: {task_id: début} d'un planning nivelé (LevelingResult.start) ; ES sinon
+        calendar: WorkCalendar du projet
+    Returns:
+        LoadProfile
+    """
+    capacities = capacities or {}
+    resources = {resource: i for i, resource in enumerate(capacities)}
+    rows, first, last, units = [], [], [], []
+    for task in tasks:
+        task_needs = demands.get(task.id, ()) if demands is not None else task_demands(task)
+        if not task_needs:
+            continue
+        start = starts.get(task.id, task.earliest_start) if starts is not None else task.earliest_start
+        for resource, amount in task_needs:
+            row = resources.setdefault(resource, len(resources))
+            rows.append(row)
+            first.append(start)
+            last.append(start + task.duration)
+            units.append(amount)
+    capacity = [capacities.get(resource, default_capacity) for resource in resources]
+    return LoadProfile.from_intervals(list(resources), rows, first, last, units, capacity, calendar=calendar)
@@ -0,0 +1,345 @@
+# SIMULATION MONTE CARLO DU RISQUE PLANNING
+# Échantillonne les durées à partir des estimations 3 points (O, M, P) et
+# exécute les passages avant/arrière pour toutes les itérations à la fois,
+# couche topologique par couche topologique (NumPy).
+
+from concurrent.futures import ProcessPoolExecutor
+
+from .cpm_engine import FS, SS, FF, SF
+
+# Nombre maximal de cellules (tâches x itérations) d'une matrice par lot
+SHARD_CELLS = 4_000_000
+CRITICAL_TOLERANCE = 0.001  # même tolérance que ProjectScheduler.calculate_float
+
+
+class SimulationResult:
+    """
+    Résultat d'une simulation Monte Carlo
+
+    Attributs:
+        durations: Durée du projet pour chaque itération (tableau NumPy)
+        percentiles: {50: P50, 80: P80, 95: P95} en jours depuis le début du projet
+        dates: {50: date P50, ...} dates de fin incluses (vide sans calendrier)
+        criticality: {task_id: fraction des itérations où la tâche est critique}
+        sensitivity: {task_id: corrélation durée de la tâche / durée du projet}
+    """
+
+    def __init__(self, durations, criticality, sensitivity, calendar=None):
+        import numpy as np
+
+        self.durations = durations
+        self.iterations = len(durations)
+        self.mean = float(durations.mean())
+        self.std = float(durations.std())
+        self.calendar = calendar
+        self.percentiles = {p: float(np.percentile(durations, p)) for p in (50, 80, 95)}
+        self.dates = {p: calendar.finish_date(value) for p, value in self.percentiles.items()} \
+            if calendar is not None else {}
+        self.criticality = criticality
+        self.sensitivity = sensitivity
+
+    def percentile(self, p):
+        """Durée du projet atteinte dans p % des itérations"""
+        import numpy as np
+
+        return float(np.percentile(self.durations, p))
+
+    def completion_date(self, p):
+        """Date de fin atteinte dans p % des itérations (nécessite le calendrier)"""
+        if self.calendar is None:
+            raise ValueError("Calendrier du projet inconnu")
+        return self.calendar.finish_date(self.percentile(p))
+
+    def probability_of_completion(self, deadline):
+        """
+        Probabilité de terminer le projet au plus tard à `deadline`
+        (décalage en jours, ou date incluse convertie par le calendrier du projet)
+        """
+        from .work_calendar import offset_converter
+
+        deadline = offset_converter(self.calendar)(deadline, finish=True)
+        return float((self.durations <= deadline).mean())
+
+
+class SimulationModel:
+    """
+    Forme compacte et picklable du réseau pour la simulation
+    (envoyée telle quelle aux processus de calcul)
+    """
+
+    def __init__(self, graph, tasks):
+        import numpy as np
+
+        n = len(graph)
+        self.ids = list(graph.ids)
+        self.n = n
+        self.base = np.asarray(graph.durations, dtype=float)
+
+        # Estimations 3 points ; les tâches à durée fixe restent constantes
+        low, mode, high = self.base.copy(), self.base.copy(), self.base.copy()
+        for i, task in enumerate(tasks):
+            o = getattr(task, 'optimistic_time', None)
+            m = getattr(task, 'most_likely_time', None)
+            p = getattr(task, 'pessimistic_time', None)
+            if o is not None and m is not None and p is not None and p > o:
+                low[i], mode[i], high[i] = o, m, p
+        self.random = np.flatnonzero(high > low)
+        self.low, self.mode, self.high = low[self.random], mode[self.random], high[self.random]
+
+        pred_ptr = np.asarray(graph.pred_ptr)
+        succ_ptr = np.asarray(graph.succ_ptr)
+        pred_idx, pred_type = np.asarray(graph.pred_idx), np.asarray(graph.pred_type)
+        succ_idx, succ_type = np.asarray(graph.succ_idx), np.asarray(graph.succ_type)
+        pred_lag, succ_lag = np.asarray(graph.pred_lag), np.asarray(graph.succ_lag)
+
+        depth, height = topological_levels(graph)
+
+        self.roots = np.flatnonzero(np.diff(pred_ptr) == 0)
+        self.sinks = np.flatnonzero(np.diff(succ_ptr) == 0)
+
+        # Passage avant : ES(v) = max(0, [ES|EF](u) + lag [- d(v)])
+        targets = np.repeat(np.arange(n), np.diff(pred_ptr))
+        from_finish = (pred_type == FS) | (pred_type == FF)
+        uses_duration = (pred_type == FF) | (pred_type == SF)
+        self.forward_layers = group_layers(depth, targets, pred_idx + n * from_finish,
+                                      pred_lag, uses_duration)
+
+        # Passage arrière : LF(v) = min([LS|LF](w) - lag [+ d(v)])
+        sources = np.repeat(np.arange(n), np.diff(succ_ptr))
+        to_finish = (succ_type == FF) | (succ_type == SF)
+        adds_duration = (succ_type == SS) | (succ_type == SF)
+        self.backward_layers = group_layers(height, sources, succ_idx + n * to_finish,
+                                       succ_lag, adds_duration)
+
+    def sample(self, rng, size, distribution):
+        """
+        Matrice (tâches x itérations) des durées échantillonnées
+        Une ligne par tâche : les passages lisent des lignes contiguës.
+        """
+        import numpy as np
+
+        durations = np.repeat(self.base[:, None], size, axis=1)
+        if len(self.random):
+            low, mode, high = self.low[:, None], self.mode[:, None], self.high[:, None]
+            if distribution == 'pert':
+                span = high - low
+                alpha = 1 + 4 * (mode - low) / span
+                beta = 1 + 4 * (high - mode) / span
+                durations[self.random] = low + span * rng.beta(alpha, beta, size=(len(low), size))
+            elif distribution == 'triangular':
+                durations[self.random] = rng.triangular(low, mode, high, size=(len(low), size))
+            else:
+                raise ValueError(f"Distribution inconnue: {distribution} (attendu: 'pert' ou 'triangular')")
+        return durations
+
+
+def topological_levels(graph):
+    """
+    Profondeur (plus long chemin depuis une source, en arcs) et hauteur (vers
+    un puits) de chaque tâche : les tâches d'un même niveau sont indépendantes
+    """
+    import numpy as np
+
+    n = len(graph)
+    depth = [0] * n
+    height = [0] * n
+    pred_ptr, pred_idx = graph.pred_ptr.tolist(), graph.pred_idx.tolist()
+    succ_ptr, succ_idx = graph.succ_ptr.tolist(), graph.succ_idx.tolist()
+    order = list(graph.order)
+    for v in order:
+        for k in range(pred_ptr[v], pred_ptr[v + 1]):
+            depth[v] = max(depth[v], depth[pred_idx[k]] + 1)
+    for v in reversed(order):
+        for k in range(succ_ptr[v], succ_ptr[v + 1]):
+            height[v] = max(height[v], height[succ_idx[k]] + 1)
+    return np.asarray(depth), np.asarray(height)
+
+
+def group_layers(level, nodes, rows, values, timed_mask):
+    """
+    Regroupe les arcs par couche (niveau du nœud calculé), puis par créneau
+
+    Le bloc du créneau j contient le j-ième arc de chaque nœud qui en a plus
+    de j, les nœuds étant triés par nombre d'arcs décroissant : la réduction
+    d'une couche ne porte que sur des tranches contiguës (voir reduce_slots),
+    sans reduceat ni indexation par arc. Les arcs « avec durée » (timed_mask :
+    contrainte sur l'autre extrémité du nœud calculé) forment une seconde
+    série de blocs, décalée de la durée une fois par nœud après réduction.
+
+    Chaque couche est un tuple (nœuds, lignes, valeurs, créneaux,
+    créneaux_avec_durée, positions_avec_durée) : lignes et valeurs des arcs
+    dans l'ordre des blocs ; le bloc j d'une série porte sur ses créneaux[j]
+    premiers nœuds, qui sont nœuds[:créneaux[0]] pour la première série et
+    nœuds[positions_avec_durée] pour la seconde.
+    """
+    import numpy as np
+
+    layers = []
+    if len(nodes) == 0:
+        return layers
+    order = np.lexsort((nodes, level[nodes]))
+    nodes, rows, values, timed_mask = nodes[order], rows[order], values[order], timed_mask[order]
+    position = np.empty(len(level), dtype=np.intp)
+    edge_level = level[nodes]
+    bounds = np.flatnonzero(np.diff(edge_level)) + 1
+    for first, last in zip(np.r_[0, bounds], np.r_[bounds, len(nodes)]):
+        plain_edges = first + np.flatnonzero(~timed_mask[first:last])
+        timed_edges = first + np.flatnonzero(timed_mask[first:last])
+        plain_order, plain, plain_nodes = _slots(nodes[plain_edges])
+        timed_order, timed, timed_nodes = _slots(nodes[timed_edges])
+        layer_nodes = np.concatenate([plain_nodes, np.setdiff1d(timed_nodes, plain_nodes)])
+        position[layer_nodes] = np.arange(len(layer_nodes))
+        edges = np.concatenate([plain_edges[plain_order], timed_edges[timed_order]])
+        layers.append((layer_nodes, rows[edges], values[edges], plain, timed, position[timed_nodes]))
+    return layers
+
+
+def _slots(keys):
+    """
+    Arcs (nœud de chaque arc) rangés par créneau : (ordre des arcs, tailles
+    des blocs, nœuds par nombre d'arcs décroissant)
+    """
+    import numpy as np
+
+    if len(keys) == 0:
+        return np.empty(0, dtype=np.intp), [], keys
+    distinct, inverse, degree = np.unique(keys, return_inverse=True, return_counts=True)
+    by_degree = np.argsort(-degree, kind='stable')
+    rank = np.empty_like(by_degree)
+    rank[by_degree] = np.arange(len(by_degree))
+    edge_rank = rank[inverse.ravel()]
+    grouped = np.argsort(edge_rank, kind='stable')
+    sizes = degree[by_degree]
+    slot = np.empty(len(keys), dtype=np.intp)
+    slot[grouped] = np.arange(len(keys)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    return np.lexsort((edge_rank, slot)), np.bincount(slot).tolist(), distinct[by_degree]
+
+
+def reduce_slots(constraints, first, counts, ufunc):
+    """
+    Réduit par `ufunc` (np.maximum, np.minimum) les blocs de créneaux
+    commençant à la ligne `first` : une ligne par nœud, vue sur constraints
+    """
+    best = constraints[first:first + counts[0]]
+    offset = first + counts[0]
+    for count in counts[1:]:
+        ufunc(best[:count], constraints[offset:offset + count], out=best[:count])
+        offset += count
+    return best
+
+
+def earliest_starts(constraints, layer, d):
+    """ES des nœuds d'une couche : max(0, contraintes sur le début, contraintes sur la fin - durée)"""
+    import numpy as np
+
+    nodes, _, _, plain, timed, timed_at = layer
+    if not timed:
+        start = reduce_slots(constraints, 0, plain, np.maximum)
+        return np.maximum(start, 0.0, out=start)
+    start = np.zeros((len(nodes), constraints.shape[1]))
+    if plain:
+        np.maximum(reduce_slots(constraints, 0, plain, np.maximum), 0.0, out=start[:plain[0]])
+    finish = reduce_slots(constraints, sum(plain), timed, np.maximum)
+    finish -= d[nodes[timed_at]]
+    start[timed_at] = np.maximum(start[timed_at], finish)
+    return start
+
+
+def latest_finishes(constraints, layer, d):
+    """LF des nœuds d'une couche : min(contraintes sur la fin, contraintes sur le début + durée)"""
+    import numpy as np
+
+    nodes, _, _, plain, timed, timed_at = layer
+    if not timed:
+        return reduce_slots(constraints, 0, plain, np.minimum)
+    finish = np.full((len(nodes), constraints.shape[1]), np.inf)
+    if plain:
+        finish[:plain[0]] = reduce_slots(constraints, 0, plain, np.minimum)
+    start = reduce_slots(constraints, sum(plain), timed, np.minimum)
+    start += d[nodes[timed_at]]
+    finish[timed_at] = np.minimum(finish[timed_at], start)
+    return finish
+
+
+def simulate_shard(model, seed_sequence, size, distribution):
+    """
+    Simule `size` itérations et retourne les agrégats partiels :
+    (durées projet, comptes critiques, somme d, somme d², somme d·P)
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed_sequence)
+    n = model.n
+    d = model.sample(rng, size, distribution)
+
+    # Passage avant : lignes [0, n) = ES, [n, 2n) = EF
+    early = np.zeros((2 * n, size))
+    early[n + model.roots] = d[model.roots]
+    for layer in model.forward_layers:
+        nodes, rows, lags = layer[:3]
+        constraints = early[rows]
+        constraints += lags[:, None]
+        start = earliest_starts(constraints, layer, d)
+        early[nodes] = start
+        early[n + nodes] = start + d[nodes]
+    project = early[n:].max(axis=0)
+
+    # Passage arrière : lignes [0, n) = LS, [n, 2n) = LF
+    late = np.empty((2 * n, size))
+    late[n + model.sinks] = project
+    late[model.sinks] = project - d[model.sinks]
+    for layer in model.backward_layers:
+        nodes, rows, lags = layer[:3]
+        constraints = late[rows]
+        constraints -= lags[:, None]
+        finish = latest_finishes(constraints, layer, d)
+        late[n + nodes] = finish
+        late[nodes] = finish - d[nodes]
+
+    critical = (np.abs(late[:n] - early[:n]) < CRITICAL_TOLERANCE).sum(axis=1)
+    return project, critical, d.sum(axis=1), (d * d).sum(axis=1), d @ project
+
+
+def run_simulation(model, n_iterations, seed=None, distribution='pert', workers=None, calendar=None):
+    """
+    Lance la simulation par lots de taille fixe (un SeedSequence par lot)
+
+    Le découpage ne dépend que de n_iterations et de la taille du réseau :
+    pour une même graine, le résultat est identique quel que soit `workers`.
+    Avec un calendrier (WorkCalendar), les percentiles sont aussi donnés en dates.
+    """
+    import numpy as np
+
+    if n_iterations <= 0:
+        raise ValueError("n_iterations doit être strictement positif")
+    shard_size = max(1, min(n_iterations, SHARD_CELLS // max(model.n, 1)))
+    sizes = [shard_size] * (n_iterations // shard_size)
+    if n_iterations % shard_size:
+        sizes.append(n_iterations % shard_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = ([model] * len(sizes), seeds, sizes, [distribution] * len(sizes))
+
+    if workers and workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(simulate_shard, *args))
+    else:
+        parts = list(map(simulate_shard, *args))
+
+    project = np.concatenate([part[0] for part in parts])
+    critical = sum(part[1] for part in parts)
+    sum_d = sum(part[2] for part in parts)
+    sum_d2 = sum(part[3] for part in parts)
+    sum_dp = sum(part[4] for part in parts)
+
+    # Corrélation de Pearson entre la durée de chaque tâche et celle du projet
+    count = len(project)
+    mean_d, mean_p = sum_d / count, project.mean()
+    cov = sum_dp / count - mean_d * mean_p
+    var_d = np.maximum(sum_d2 / count - mean_d ** 2, 0.0)
+    std_p = project.std()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        correlation = np.where((var_d > 1e-12) & (std_p > 0), cov / (np.sqrt(var_d) * std_p), 0.0)
+
+    criticality = dict(zip(model.ids, (critical / count).tolist()))
+    sensitivity = dict(zip(model.ids, np.clip(correlation, -1.0, 1.0).tolist()))
+    return SimulationResult(project, criticality, sensitivity, calendar)
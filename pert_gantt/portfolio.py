@@ -0,0 +1,251 @@
+# PLANIFICATION DE PORTEFEUILLE EN PARALLÈLE
+# Chaque projet est envoyé à un processus de calcul sous forme compacte
+# (colonnes picklables, jamais les objets Task chaînés) et ses résultats
+# reviennent au fur et à mesure. Un projet volumineux peut aussi être découpé
+# en composantes faiblement connexes planifiées en parallèle.
+
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .cpm_engine import CompiledGraph
+
+# Colonnes de résultats renvoyées par les processus de calcul
+RESULT_COLUMNS = ('earliest_start', 'earliest_finish', 'latest_start', 'latest_finish',
+                  'total_float', 'free_float', 'critical')
+
+# Nombre de lots par processus lors du découpage d'un projet (équilibrage de charge)
+PARTS_PER_WORKER = 2
+
+
+def schedule_packed(packed, project_duration=None):
+    """
+    Calcul CPM complet d'un projet compact (exécuté dans un processus de calcul)
+
+    Args:
+        packed: CompiledGraph / TaskStore, ou colonnes de CompiledGraph.from_columns
+        project_duration: Fin du projet imposée (par défaut, le plus grand EF)
+    Returns:
+        (durée du projet, colonnes RESULT_COLUMNS, ordre topologique)
+    """
+    graph = packed if isinstance(packed, CompiledGraph) else CompiledGraph.from_columns(*packed)
+    duration = graph.forward_pass()
+    if project_duration is None:
+        project_duration = duration
+    graph.backward_pass(project_duration)
+    graph.calculate_float(project_duration)
+    return project_duration, _results(graph), graph.order
+
+
+def schedule_portfolio(schedulers, workers=None):
+    """
+    Planifie plusieurs projets en parallèle
+
+    Les résultats sont appliqués à chaque planificateur (dates, flottements,
+    chemin critique) dès que son calcul est terminé, sans attendre les autres.
+
+    Args:
+        schedulers: Dictionnaire {clé: ProjectScheduler} ou liste (clé = position)
+        workers: Nombre de processus (par défaut, nombre de cœurs) ; 1 pour un calcul local
+    Yields:
+        (clé, planificateur) dans l'ordre de fin des calculs
+    Raises:
+        CycleError / GraphValidationError du premier projet non planifiable rencontré
+    """
+    items = schedulers.items() if hasattr(schedulers, 'items') else enumerate(schedulers)
+    items = list(items)
+    workers = workers or os.cpu_count() or 1
+
+    if workers <= 1 or len(items) <= 1:
+        for key, scheduler in items:
+            scheduler.apply_results(*schedule_packed(scheduler.pack()))
+            yield key, scheduler
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(items))) as pool:
+        futures = {pool.submit(schedule_packed, scheduler.pack()): (key, scheduler)
+                   for key, scheduler in items}
+        for future in as_completed(futures):
+            key, scheduler = futures[future]
+            scheduler.apply_results(*future.result())
+            yield key, scheduler
+
+
+def schedule_projects(connect, project_ids, workers=None, to_date=None):
+    """
+    Planifie des projets directement en base, un projet par tâche de calcul
+
+    Chaque processus ouvre sa propre connexion, charge le projet sous forme
+    compacte (db_loader.load_project_store), le planifie, écrit les résultats
+    et valide la transaction : seuls les identifiants transitent entre processus.
+
+    Args:
+        connect: Fonction picklable sans argument retournant une connexion DB-API
+                 (ex: functools.partial(psycopg2.connect, dsn))
+        project_ids: Identifiants des projets (projects.id)
+        workers: Nombre de processus (par défaut, nombre de cœurs)
+        to_date: Calendrier ou conversion décalage -> date (voir db_loader.save_schedule) ;
+                 par défaut le calendrier de chaque projet (db_loader.load_project_calendar)
+    Yields:
+        (project_id, durée du projet, nombre de tâches mises à jour), dans l'ordre de fin
+    """
+    project_ids = list(project_ids)
+    workers = workers or os.cpu_count() or 1
+
+    if workers <= 1 or len(project_ids) <= 1:
+        for project_id in project_ids:
+            yield _schedule_in_database(connect, project_id, to_date)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(project_ids))) as pool:
+        futures = [pool.submit(_schedule_in_database, connect, project_id, to_date)
+                   for project_id in project_ids]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _schedule_in_database(connect, project_id, to_date):
+    from .db_loader import load_project_calendar, load_project_store, save_tasks
+    from .task_store import TaskMapping
+
+    connection = connect()
+    try:
+        store = load_project_store(connection, project_id)
+        project_duration, _, _ = schedule_packed(store)
+        if to_date is None:
+            to_date = load_project_calendar(connection, project_id)
+            if to_date is None:
+                raise ValueError(f"Date de début inconnue pour le projet {project_id}")
+        updated = save_tasks(connection, TaskMapping(store).values(), to_date)
+        connection.commit()
+    finally:
+        connection.close()
+    return project_id, project_duration, updated
+
+
+def schedule_components(scheduler, workers=None):
+    """
+    Planifie un projet en répartissant ses composantes faiblement connexes
+    (sous-réseaux sans dépendance entre eux) sur plusieurs processus
+
+    Les composantes sont regroupées en lots équilibrés (tâches + arcs). La fin
+    du projet étant commune à toutes les composantes, le calcul se fait en deux
+    temps : passage avant de chaque lot, puis passage arrière et flottements
+    avec la durée globale ; les graphes compilés font l'aller-retour pour ne
+    pas être reconstruits. Les résultats sont identiques à un calcul complet.
+
+    Returns:
+        Nombre de composantes faiblement connexes
+    """
+    packed = scheduler.pack()
+    columns = packed.columns() if isinstance(packed, CompiledGraph) else packed
+    ids, durations, sources, targets, types, lags, _ = columns
+    n = len(ids)
+    labels, count = weakly_connected_components(n, sources, targets)
+    workers = workers or os.cpu_count() or 1
+
+    if workers <= 1 or count <= 1:
+        scheduler.apply_results(*schedule_packed(packed))
+        return count
+
+    part_of, parts = _balance(labels, count, targets, min(count, workers * PARTS_PER_WORKER))
+    nodes, payloads = split_columns(columns, part_of, parts)
+
+    with ProcessPoolExecutor(max_workers=min(workers, parts)) as pool:
+        graphs = list(pool.map(_forward, payloads))
+        project_duration = max((graph.project_duration for graph in graphs), default=0)
+        results = list(pool.map(_backward, graphs, [project_duration] * parts))
+
+    merged = [array('d', bytes(8 * n)) for _ in RESULT_COLUMNS[:-1]] + [bytearray(n)]
+    order = array('i')
+    for part_nodes, (part_columns, part_order) in zip(nodes, results):
+        for column, values in zip(merged, part_columns):
+            for v, value in zip(part_nodes, values):
+                column[v] = value
+        order.extend(part_nodes[v] for v in part_order)  # Composantes indépendantes : concaténation
+    scheduler.apply_results(project_duration, merged, order)
+    return count
+
+
+def weakly_connected_components(n, sources, targets):
+    """
+    Composantes faiblement connexes par union-find (compression de chemin)
+    Retourne (étiquette de composante par nœud, nombre de composantes).
+    """
+    parent = list(range(n))
+    for u, v in zip(sources, targets):
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]
+            u = parent[u]
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        if u != v:
+            parent[max(u, v)] = min(u, v)
+
+    labels = [0] * n
+    count = 0
+    for v in range(n):  # parent[v] <= v : la racine est déjà étiquetée
+        root = parent[v]
+        if root == v:
+            labels[v] = count
+            count += 1
+        else:
+            while parent[root] != root:
+                root = parent[root]
+            parent[v] = root
+            labels[v] = labels[root]
+    return labels, count
+
+
+def _balance(labels, count, targets, parts):
+    """Répartit les composantes en `parts` lots de taille proche (plus grande d'abord)"""
+    sizes = [0] * count
+    for label in labels:
+        sizes[label] += 1
+    for v in targets:
+        sizes[labels[v]] += 1
+    heap = [(0, part) for part in range(parts)]
+    part_of_component = [0] * count
+    for component in sorted(range(count), key=sizes.__getitem__, reverse=True):
+        load, part = heapq.heappop(heap)
+        part_of_component[component] = part
+        heapq.heappush(heap, (load + sizes[component], part))
+    return [part_of_component[label] for label in labels], parts
+
+
+def split_columns(columns, part_of, parts):
+    """Colonnes de chaque lot (index locaux) et index globaux de ses tâches"""
+    ids, durations, sources, targets, types, lags, _ = columns
+    local = [0] * len(ids)
+    nodes = [array('i') for _ in range(parts)]
+    for v, part in enumerate(part_of):
+        local[v] = len(nodes[part])
+        nodes[part].append(v)
+    edges = [(array('i'), array('i'), array('b'), array('d')) for _ in range(parts)]
+    for u, v, t, lag in zip(sources, targets, types, lags):
+        part_sources, part_targets, part_types, part_lags = edges[part_of[v]]
+        part_sources.append(local[u])
+        part_targets.append(local[v])
+        part_types.append(t)
+        part_lags.append(lag)
+    payloads = [([ids[v] for v in part_nodes], array('d', (durations[v] for v in part_nodes)),
+                 *part_edges) for part_nodes, part_edges in zip(nodes, edges)]
+    return nodes, payloads
+
+
+def _forward(payload):
+    graph = CompiledGraph.from_columns(*payload)
+    graph.forward_pass()
+    return graph
+
+
+def _backward(graph, project_duration):
+    graph.backward_pass(project_duration)
+    graph.calculate_float(project_duration)
+    return _results(graph), graph.order
+
+
+def _results(graph):
+    return tuple(getattr(graph, name) for name in RESULT_COLUMNS)
@@ -0,0 +1,268 @@
+# INDEX D'ACCESSIBILITÉ (ANALYSE D'IMPACT)
+# Répond à « la tâche B dépend-elle, directement ou non, de la tâche A ? » sans
+# parcourir tout le réseau. Chaque tâche reçoit, pour plusieurs parcours en
+# profondeur, un rang topologique et la borne haute des rangs de ses
+# descendants (étiquettes d'intervalle à la GRAIL) : si A atteint B, alors
+# rang(A) < rang(B) et haut(B) <= haut(A). La plupart des réponses négatives
+# sont donc immédiates. À l'inverse, B est accessible dès qu'il appartient au
+# sous-arbre de A dans un des arbres de parcours (numéros préfixes). Les autres
+# cas sont tranchés par un parcours élagué par ces mêmes étiquettes.
+# Les étiquettes sont maintenues lors de l'ajout et de la suppression de
+# dépendances (réordonnancement local de Pearce-Kelly, bornes hautes remontées
+# vers les ancêtres) et recalculées lorsqu'elles sont trop relâchées.
+
+LABELS = 2             # Parcours en profondeur indépendants (filtres cumulés)
+REBUILD_FRACTION = 0.1  # Modifications tolérées (fraction des tâches) avant recalcul des étiquettes
+
+
+class _Labels:
+    """Étiquettes d'un parcours en profondeur"""
+
+    __slots__ = ('rank', 'order', 'high', 'first', 'last', 'parent', 'tree')
+
+    def __init__(self, rank, order, high, first, last, parent):
+        self.rank = rank      # Rang topologique (maintenu)
+        self.order = order    # Tâche de chaque rang
+        self.high = high      # Borne haute des rangs des descendants (maintenue)
+        self.first = first    # Numéro préfixe dans l'arbre de parcours
+        self.last = last      # Plus grand numéro préfixe du sous-arbre
+        self.parent = parent  # Parent dans l'arbre de parcours (-1 pour une racine)
+        self.tree = True      # Faux dès qu'un lien de l'arbre est supprimé
+
+
+class ReachabilityIndex:
+    """
+    Accessibilité transitive sur le graphe des dépendances (tous types de liens)
+
+    Attributs:
+        ids: Identifiants des tâches, dans l'ordre des index
+        index: Dictionnaire id -> index
+    """
+
+    def __init__(self, ids, successors, labels=LABELS):
+        """
+        Args:
+            ids: Identifiants des tâches
+            successors: Index des successeurs de chaque tâche (listes, même ordre que ids)
+            labels: Nombre de parcours d'étiquetage
+        """
+        self.ids = list(ids)
+        self.index = {task_id: i for i, task_id in enumerate(self.ids)}
+        self._succ = [list(targets) for targets in successors]
+        self._pred = [[] for _ in self.ids]
+        for u, targets in enumerate(self._succ):
+            for v in targets:
+                self._pred[v].append(u)
+        self._count = labels
+        self._labels = []  # _Labels par parcours
+        self._edits = 0
+        self._build()
+
+    @classmethod
+    def from_graph(cls, graph, labels=LABELS):
+        """Index d'un cpm_engine.CompiledGraph (ou d'un TaskStore)"""
+        ptr, idx = graph.succ_ptr.tolist(), graph.succ_idx.tolist()
+        return cls(graph.ids, (idx[ptr[v]:ptr[v + 1]] for v in range(len(graph.ids))), labels)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _build(self):
+        """Étiquettes de tous les parcours (O(labels × (tâches + liens)))"""
+        self._labels = [self._label(reverse=bool(k % 2)) for k in range(self._count)]
+        self._edits = 0
+
+    def _label(self, reverse):
+        """
+        Parcours en profondeur (racines et successeurs dans l'ordre des index,
+        ou en sens inverse) : l'ordre postfixe inversé est topologique
+        """
+        n = len(self.ids)
+        succ = self._succ
+        children = (lambda x: reversed(succ[x])) if reverse else (lambda x: succ[x])
+        visited = bytearray(n)
+        post = []
+        first, last, parent = [0] * n, [0] * n, [-1] * n
+        for root in (range(n - 1, -1, -1) if reverse else range(n)):
+            if visited[root]:
+                continue
+            visited[root] = 1
+            first[root] = counter = len(post)
+            stack = [(root, iter(children(root)))]
+            while stack:
+                x, pending = stack[-1]
+                for w in pending:
+                    if not visited[w]:
+                        visited[w] = 1
+                        counter += 1
+                        first[w], parent[w] = counter, x
+                        stack.append((w, iter(children(w))))
+                        break
+                else:
+                    stack.pop()
+                    last[x] = counter
+                    post.append(x)
+        order = post[::-1]
+        rank = [0] * n
+        for r, x in enumerate(order):
+            rank[x] = r
+        # Borne haute : plus grand rang parmi les descendants (tâche comprise)
+        high = [0] * n
+        for x in post:
+            h = rank[x]
+            for w in succ[x]:
+                if high[w] > h:
+                    h = high[w]
+            high[x] = h
+        return _Labels(rank, order, high, first, last, parent)
+
+    def _may_reach(self, u, v):
+        """Filtre nécessaire (u != v) : faux => v n'est pas accessible depuis u"""
+        for labels in self._labels:
+            rank, high = labels.rank, labels.high
+            if rank[u] >= rank[v] or high[v] > high[u]:
+                return False
+        return True
+
+    def _in_tree(self, u, v):
+        """Condition suffisante : v dans le sous-arbre de u d'un arbre de parcours intact"""
+        for labels in self._labels:
+            if labels.tree and labels.first[u] <= labels.first[v] <= labels.last[u]:
+                return True
+        return False
+
+    def _reaches(self, u, v):
+        if u == v:
+            return True
+        if self._edits > max(64, REBUILD_FRACTION * len(self.ids)):
+            self._build()
+        if not self._may_reach(u, v):
+            return False
+        if self._in_tree(u, v):
+            return True
+        # Parcours élagué : seuls les successeurs pouvant encore atteindre v
+        succ, may_reach, in_tree = self._succ, self._may_reach, self._in_tree
+        visited = {u}
+        stack = [u]
+        while stack:
+            for w in succ[stack.pop()]:
+                if w not in visited:
+                    visited.add(w)
+                    if may_reach(w, v) or w == v:
+                        if w == v or in_tree(w, v):
+                            return True
+                        stack.append(w)
+        return False
+
+    def reaches(self, source_id, target_id):
+        """
+        Vrai si target dépend (transitivement) de source, ou si ce sont la même tâche
+        Un lien source -> target est donc possible ssi reaches(target, source) est faux.
+        """
+        return self._reaches(self.index[source_id], self.index[target_id])
+
+    def _collect(self, start, adjacency):
+        visited = {start}
+        stack = [start]
+        while stack:
+            for w in adjacency[stack.pop()]:
+                if w not in visited:
+                    visited.add(w)
+                    stack.append(w)
+        visited.discard(start)
+        return visited
+
+    def descendants(self, task_id):
+        """Identifiants des tâches qui dépendent (transitivement) de task_id"""
+        ids = self.ids
+        return {ids[v] for v in self._collect(self.index[task_id], self._succ)}
+
+    def ancestors(self, task_id):
+        """Identifiants des tâches dont task_id dépend (transitivement)"""
+        ids = self.ids
+        return {ids[v] for v in self._collect(self.index[task_id], self._pred)}
+
+    def affected(self, task_id, targets):
+        """Tâches de `targets` (ex: jalons) qui dépendent de task_id, sans lister tous les descendants"""
+        u = self.index[task_id]
+        index = self.index
+        return [target for target in targets if index[target] != u and self._reaches(u, index[target])]
+
+    def add_edge(self, predecessor_id, successor_id):
+        """
+        Enregistre le lien predecessor -> successor
+        Lève CycleError (sans rien modifier) si le lien fermerait un cycle.
+        """
+        from .cpm_engine import CycleError
+
+        u, v = self.index[predecessor_id], self.index[successor_id]
+        if self._reaches(v, u):
+            raise CycleError(
+                f"La dépendance {predecessor_id} -> {successor_id} crée un cycle",
+                [predecessor_id, successor_id],
+            )
+        self._succ[u].append(v)
+        self._pred[v].append(u)
+        for labels in self._labels:
+            rank, high = labels.rank, labels.high
+            if rank[u] > rank[v]:
+                for x in self._reorder(rank, labels.order, u, v):
+                    self._raise(high, x, rank[x])
+            self._raise(high, u, high[v])
+        self._edits += 1
+
+    def remove_edge(self, predecessor_id, successor_id, count=1):
+        """
+        Retire `count` liens predecessor -> successor (un par type de dépendance)
+        Les étiquettes restent des filtres valides, seulement moins sélectifs.
+        """
+        u, v = self.index[predecessor_id], self.index[successor_id]
+        for _ in range(count):
+            self._succ[u].remove(v)
+            self._pred[v].remove(u)
+        for labels in self._labels:
+            if labels.parent[v] == u and v not in self._succ[u]:
+                labels.tree = False  # Sous-arbres de parcours à recalculer
+        self._edits += 1
+
+    def _reorder(self, rank, order, u, v):
+        """
+        Rétablit l'ordre topologique pour le lien u -> v (rank[u] > rank[v]), comme
+        incremental.TopologicalOrder : seules les tâches entre les deux rangs bougent
+        Retourne les tâches déplacées.
+        """
+        lower, upper = rank[v], rank[u]
+        forward = self._window(v, self._succ, rank, lambda r: r <= upper)
+        backward = self._window(u, self._pred, rank, lambda r: r >= lower)
+        moved = sorted(backward, key=rank.__getitem__) + sorted(forward, key=rank.__getitem__)
+        slots = sorted(rank[x] for x in moved)
+        for r, x in zip(slots, moved):
+            rank[x] = r
+            order[r] = x
+        return moved
+
+    @staticmethod
+    def _window(start, adjacency, rank, in_window):
+        visited = {start}
+        stack = [start]
+        while stack:
+            for w in adjacency[stack.pop()]:
+                if w not in visited and in_window(rank[w]):
+                    visited.add(w)
+                    stack.append(w)
+        return visited
+
+    def _raise(self, high, x, value):
+        """Relève la borne haute de x à `value` et la propage aux ancêtres (haut(u) >= haut(v) par lien)"""
+        if high[x] >= value:
+            return
+        high[x] = value
+        pred = self._pred
+        stack = [x]
+        while stack:
+            y = stack.pop()
+            h = high[y]
+            for p in pred[y]:
+                if high[p] < h:
+                    high[p] = h
+                    stack.append(p)
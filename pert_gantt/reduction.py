@@ -0,0 +1,199 @@
+# RÉDUCTION TRANSITIVE DES DÉPENDANCES
+# Repère les liens dont la contrainte est déjà imposée par un autre chemin du
+# réseau (A -> C à côté de A -> B -> C, doublons, SS couvert par un FS...) afin
+# de les retirer du graphe de calcul ; les tâches conservent tous leurs liens
+# pour l'affichage.
+#
+# Chaque lien est une contrainte entre événements (début S ou fin F) :
+#     FS : S(v) >= F(u) + lag        SS : S(v) >= S(u) + lag
+#     FF : F(v) >= F(u) + lag        SF : F(v) >= S(u) + lag
+# et chaque tâche relie ses événements par F = S + durée. Un lien est redondant
+# s'il existe un autre chemin entre les mêmes événements dont le poids est au
+# moins égal à son lag pour TOUTES les durées positives : seuls les arcs
+# S -> F (poids >= 0) sont empruntés, jamais F -> S. Le résultat ne dépend donc
+# pas des durées et reste valable pour la simulation Monte Carlo, la compression
+# ou un update_duration. ES, EF, LS, LF, flottements et chemin critique sont
+# inchangés. Les liens SF ne sont jamais retirés (formule du flottement libre).
+
+import heapq
+from array import array
+from collections import Counter
+from itertools import compress
+
+from .cpm_engine import FS, SS, FF, SF
+
+MAX_VISITS = 1000   # Tâches explorées au plus par recherche (tâche source et événement)
+WORK_PER_LINK = 32  # Liens parcourus au plus, toutes recherches confondues, par lien du réseau
+MIN_GAIN = 0.2      # Part minimale de liens retirés pour calculer sur le graphe réduit (voir ProjectScheduler.compile)
+SAMPLE = 1000       # Liens examinés avant de pouvoir abandonner la recherche
+
+_NONE = float('-inf')
+
+
+def redundant_edges(graph, max_visits=MAX_VISITS, work_per_link=WORK_PER_LINK, min_gain=MIN_GAIN):
+    """
+    Liens redondants d'un graphe compilé
+
+    Les tâches sont traitées de l'aval vers l'amont ; pour chacune, un plus
+    long chemin borné (fenêtre topologique jusqu'à son successeur le plus
+    éloigné, au plus `max_visits` tâches) part de son début ou de sa fin.
+    Le travail total est borné à `work_per_link` liens parcourus par lien du
+    réseau : chaque recherche dispose de sa part du reste, si bien que les
+    recherches courtes des réseaux à liens locaux laissent davantage aux
+    suivantes. À chaque quart des recherches ou du budget, la recherche est
+    abandonnée si moins de min_gain / 2 des liens examinés (au moins SAMPLE)
+    sont redondants : le graphe réduit ne serait pas retenu (voir
+    ProjectScheduler.compile).
+    Chaque lien retiré est impliqué par les liens conservés ; une recherche
+    écourtée ou abandonnée en retire seulement moins.
+
+    Args:
+        graph: cpm_engine.CompiledGraph
+    Returns:
+        Liste de (index prédécesseur, index successeur, code type, lag)
+    """
+    n = len(graph)
+    succ_ptr = graph.succ_ptr.tolist()
+    rank = [0] * n
+    for r, v in enumerate(graph.order):
+        rank[v] = r
+    # Liens de chaque tâche par rang croissant du successeur : une recherche ne
+    # parcourt que ceux qui restent dans sa fenêtre topologique
+    targets = graph.succ_idx.tolist()
+    permutation = []
+    for u in range(n):
+        permutation += sorted(range(succ_ptr[u], succ_ptr[u + 1]), key=lambda k: rank[targets[k]])
+    succ_idx = [targets[k] for k in permutation]
+    succ_type = [graph.succ_type[k] for k in permutation]
+    edges = _Edges(succ_ptr, succ_idx, succ_type, [graph.succ_lag[k] for k in permutation])
+    removed = bytearray(len(succ_idx))
+
+    searches = []  # (tâche source, depuis sa fin), de l'aval vers l'amont
+    for u in reversed(graph.order):
+        first, last = succ_ptr[u], succ_ptr[u + 1]
+        if last - first < 2:
+            continue
+        types = set(succ_type[first:last])
+        if FS in types or FF in types:
+            searches.append((u, True))
+        if SS in types:
+            searches.append((u, False))
+    total = budget = work_per_link * len(succ_idx)
+    stage, examined = 1, 0
+    for done, (u, from_finish) in enumerate(searches):
+        if 4 * done >= stage * len(searches) or 4 * budget <= (4 - stage) * total:
+            if examined >= SAMPLE and removed.count(1) < min_gain / 2 * examined:
+                break
+            stage += 1
+        examined += succ_ptr[u + 1] - succ_ptr[u]
+        budget -= _reduce_from(u, from_finish, rank, edges, removed, max_visits,
+                               budget // (len(searches) - done))
+
+    return [(u, succ_idx[k], succ_type[k], edges.lag[k])
+            for u in range(n) for k in range(succ_ptr[u], succ_ptr[u + 1]) if removed[k]]
+
+
+class _Edges:
+    """Arcs sortants en listes Python, avec l'événement de départ et d'arrivée de chaque lien"""
+
+    __slots__ = ('ptr', 'target', 'type', 'lag', 'from_finish', 'to_finish')
+
+    def __init__(self, ptr, target, types, lag):
+        self.ptr, self.target, self.type, self.lag = ptr, target, types, lag
+        self.from_finish = [t == FS or t == FF for t in types]
+        self.to_finish = [t == FF or t == SF for t in types]
+
+
+def _reduce_from(u, from_finish, rank, edges, removed, max_visits, max_work):
+    """
+    Plus longs chemins robustes depuis F(u) (from_finish) ou S(u) et retrait
+    des liens de u partant de cet événement qu'un autre chemin domine
+    Retourne le nombre de liens parcourus (au plus max_work environ).
+    """
+    ptr, target, lag = edges.ptr, edges.target, edges.lag
+    edge_from_finish, edge_to_finish = edges.from_finish, edges.to_finish
+    first, last = ptr[u], ptr[u + 1]
+    limit = rank[target[last - 1]]
+    start = {u: _NONE if from_finish else 0.0}  # Plus long chemin vers S(x)
+    finish = {u: 0.0}                           # ... et vers F(x)
+    direct = {}  # {successeur: [(lien, vers F, poids)]} liens de u, évalués à part
+    for k in range(first, last):
+        if removed[k] or (from_finish and not edge_from_finish[k]):
+            continue
+        direct.setdefault(target[k], []).append((k, edge_to_finish[k], lag[k]))
+    heap = [rank[v] for v in direct]
+    heapq.heapify(heap)
+    at_rank = {rank[v]: v for v in direct}
+    visits = work = 0
+    while heap and visits < max_visits and work < max_work:
+        x = at_rank[heapq.heappop(heap)]
+        visits += 1
+        s, f = start.get(x, _NONE), finish.get(x, _NONE)
+        links = direct.get(x)
+        if links:
+            kept = list(links)
+            for link in links:
+                k, to_finish, weight = link
+                if edges.type[k] == SF or edge_from_finish[k] != from_finish:
+                    continue
+                # Meilleur autre chemin : arcs des autres tâches et autres liens directs conservés
+                other_s, other_f = s, f
+                for other in kept:
+                    if other is not link:
+                        if other[1]:
+                            other_f = max(other_f, other[2])
+                        else:
+                            other_s = max(other_s, other[2])
+                if max(other_f, other_s) >= weight if to_finish else other_s >= weight:
+                    removed[k] = 1
+                    kept.remove(link)
+            for _, to_finish, weight in links:  # Un lien retiré est dominé : le maximum ne change pas
+                if to_finish:
+                    f = max(f, weight)
+                else:
+                    s = max(s, weight)
+        if s > f:
+            f = s  # F(x) >= S(x) quelle que soit la durée
+        start[x], finish[x] = s, f
+
+        work += 1
+        for k in range(ptr[x], ptr[x + 1]):
+            y = target[k]
+            if rank[y] > limit:
+                break
+            work += 1
+            if removed[k]:
+                continue
+            source = f if edge_from_finish[k] else s
+            if source == _NONE:
+                continue
+            weight = source + lag[k]
+            values = finish if edge_to_finish[k] else start
+            if weight > values.get(y, _NONE):
+                values[y] = weight
+            if rank[y] not in at_rank:
+                at_rank[rank[y]] = y
+                heapq.heappush(heap, rank[y])
+    return work
+
+
+def kept_edges(columns, edges):
+    """
+    Masque des liens conservés, dans l'ordre des colonnes de CompiledGraph.from_columns
+    (un exemplaire retiré par occurrence de `edges`, voir redundant_edges)
+    """
+    _, _, sources, targets, types, lags, _ = columns
+    pending = Counter(edges)
+    mask = bytearray(b'\x01') * len(sources)
+    for k, key in enumerate(zip(sources, targets, types, lags)):
+        if pending[key]:
+            pending[key] -= 1
+            mask[k] = 0
+    return mask
+
+
+def without_edges(columns, mask):
+    """Colonnes de CompiledGraph.from_columns réduites aux liens du masque (voir kept_edges)"""
+    ids, durations, sources, targets, types, lags, report = columns
+    return (ids, durations, array('i', compress(sources, mask)), array('i', compress(targets, mask)),
+            array('b', compress(types, mask)), array('d', compress(lags, mask)), report)
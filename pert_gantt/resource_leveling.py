@@ -0,0 +1,370 @@
+# NIVELLEMENT DES RESSOURCES (ORDONNANCEMENT SOUS CONTRAINTE DE CAPACITÉ)
+# Générateurs d'ordonnancement série et parallèle guidés par une règle de
+# priorité calculée sur les résultats CPM. La charge de chaque ressource est
+# tenue dans un arbre de segments par jour : vérifier qu'une tâche tient dans
+# la capacité restante et trouver le premier jour saturé coûtent O(log H).
+
+import heapq
+import math
+from array import array
+
+from .cpm_engine import FS, SS, FF
+
+DEFAULT_CAPACITY = 1.0  # Une ressource à temps plein
+CAPACITY_TOLERANCE = 1e-9
+
+# Règles de priorité : clé croissante = tâche planifiée en premier
+PRIORITY_RULES = {
+    'total_float': lambda task: (task.total_float, task.latest_start),
+    'latest_finish': lambda task: task.latest_finish,
+    'latest_start': lambda task: task.latest_start,
+    'earliest_start': lambda task: task.earliest_start,
+    'shortest': lambda task: task.duration,
+}
+
+
+class CapacityTimeline:
+    """
+    Charge d'une ressource par jour (arbre de segments dynamique)
+
+    Ajout sur un intervalle de jours, charge maximale d'un intervalle et
+    premier jour dépassant un seuil en O(log H), H étant l'horizon. Les nœuds
+    ne sont créés que sur les intervalles réservés et l'horizon double à la
+    demande : la mémoire reste proportionnelle au nombre de réservations.
+    """
+
+    def __init__(self, horizon=64):
+        horizon = max(horizon, 1)
+        self.size = 1
+        while self.size < horizon:
+            self.size *= 2
+        # Nœud 0 = racine ; -1 = sous-arbre vide (charge nulle)
+        self._left = array('i', [-1])
+        self._right = array('i', [-1])
+        self._top = array('d', [0.0])  # Charge maximale du sous-arbre (ajout du nœud compris)
+        self._low = array('d', [0.0])  # Charge minimale du sous-arbre (ajout du nœud compris)
+        self._add = array('d', [0.0])  # Charge ajoutée à tout l'intervalle du nœud
+
+    def _node(self):
+        self._left.append(-1)
+        self._right.append(-1)
+        self._top.append(0.0)
+        self._low.append(0.0)
+        self._add.append(0.0)
+        return len(self._top) - 1
+
+    def _grow(self, end):
+        while self.size < end:
+            # L'ancienne racine devient le fils gauche de la nouvelle
+            child = self._node()
+            self._left[child], self._right[child] = self._left[0], self._right[0]
+            self._top[child], self._low[child], self._add[child] = self._top[0], self._low[0], self._add[0]
+            self._left[0], self._right[0] = child, -1
+            self._low[0] = self._add[0] = 0.0  # Moitié droite vide
+            self.size *= 2
+
+    def add(self, start, end, amount):
+        """Ajoute `amount` à la charge des jours [start, end)"""
+        if end <= start:
+            return
+        self._grow(end)
+        self._update(0, 0, self.size, start, end, amount)
+
+    def _update(self, node, lo, hi, start, end, amount):
+        if start <= lo and hi <= end:
+            self._add[node] += amount
+            self._top[node] += amount
+            self._low[node] += amount
+            return
+        mid = (lo + hi) // 2
+        left, right = self._left[node], self._right[node]
+        if start < mid:
+            if left < 0:
+                left = self._left[node] = self._node()
+            self._update(left, lo, mid, start, end, amount)
+        if end > mid:
+            if right < 0:
+                right = self._right[node] = self._node()
+            self._update(right, mid, hi, start, end, amount)
+        self._top[node] = max(self._top[left] if left >= 0 else 0.0,
+                              self._top[right] if right >= 0 else 0.0) + self._add[node]
+        self._low[node] = min(self._low[left] if left >= 0 else 0.0,
+                              self._low[right] if right >= 0 else 0.0) + self._add[node]
+
+    def peak(self, start=0, end=None):
+        """Charge maximale sur les jours [start, end) (tout l'horizon par défaut)"""
+        if end is None:
+            return max(self._top[0], 0.0)
+        return self._peak(0, 0, self.size, start, min(end, self.size)) if start < end else 0.0
+
+    def _peak(self, node, lo, hi, start, end):
+        if node < 0 or end <= lo or hi <= start:
+            return 0.0
+        if start <= lo and hi <= end:
+            return self._top[node]
+        mid = (lo + hi) // 2
+        return self._add[node] + max(self._peak(self._left[node], lo, mid, start, end),
+                                     self._peak(self._right[node], mid, hi, start, end))
+
+    def first_over(self, start, end, limit):
+        """Premier jour de [start, end) dont la charge dépasse `limit`, None sinon"""
+        if limit < 0:
+            return start
+        return self._first_over(0, 0, self.size, start, min(end, self.size), limit)
+
+    def _first_over(self, node, lo, hi, start, end, limit):
+        if end <= lo or hi <= start:
+            return None
+        if node < 0:  # Sous-arbre vide : seule compte la charge des ancêtres
+            return max(lo, start) if limit < 0 else None
+        if self._top[node] <= limit:
+            return None
+        if hi - lo == 1:
+            return lo
+        limit -= self._add[node]
+        mid = (lo + hi) // 2
+        day = self._first_over(self._left[node], lo, mid, start, end, limit)
+        if day is None:
+            day = self._first_over(self._right[node], mid, hi, start, end, limit)
+        return day
+
+    def first_at_most(self, start, limit):
+        """Premier jour à partir de `start` dont la charge ne dépasse pas `limit` (limit >= 0)"""
+        day = self._first_at_most(0, 0, self.size, start, limit)
+        return max(start, self.size) if day is None else day
+
+    def _first_at_most(self, node, lo, hi, start, limit):
+        if hi <= start:
+            return None
+        if node < 0:
+            return max(lo, start) if limit >= 0 else None
+        if self._low[node] > limit:
+            return None
+        if hi - lo == 1:
+            return lo
+        limit -= self._add[node]
+        mid = (lo + hi) // 2
+        day = self._first_at_most(self._left[node], lo, mid, start, limit)
+        if day is None:
+            day = self._first_at_most(self._right[node], mid, hi, start, limit)
+        return day
+
+    def usage(self, day):
+        """Charge du jour `day`"""
+        return self.peak(day, day + 1)
+
+
+class LevelingResult:
+    """
+    Planning nivelé
+
+    Attributs:
+        start, finish: {task_id: date de début / fin nivelée} (jours depuis le début)
+        project_duration: Fin du planning nivelé
+        delays: {task_id: décalage par rapport à ES} pour les tâches retardées
+        peaks: {resource_id: charge maximale atteinte}
+    """
+
+    def __init__(self, start, finish, delays, peaks, rule, method):
+        self.start = start
+        self.finish = finish
+        self.project_duration = max(finish.values(), default=0)
+        self.delays = delays
+        self.peaks = peaks
+        self.rule = rule
+        self.method = method
+
+
+def task_demands(task):
+    """
+    Besoins en ressources d'une tâche : liste de (resource_id, unités)
+
+    AdvancedTask.resources peut contenir des identifiants (1 unité chacun),
+    des tuples (identifiant, unités) ou un dictionnaire {identifiant: unités}.
+    """
+    resources = getattr(task, 'resources', None) or ()
+    if isinstance(resources, dict):
+        return [(resource, float(units)) for resource, units in resources.items() if units]
+    demands = []
+    for resource in resources:
+        if isinstance(resource, tuple):
+            resource, units = resource
+            if units:
+                demands.append((resource, float(units)))
+        else:
+            demands.append((resource, 1.0))
+    return demands
+
+
+def level(graph, tasks, capacities=None, demands=None, rule='total_float', method='serial',
+          default_capacity=DEFAULT_CAPACITY):
+    """
+    Nivelle un planning déjà calculé (passages CPM et flottements)
+
+    Args:
+        graph: Graphe compilé (cpm_engine.CompiledGraph), mêmes index que `tasks`
+        tasks: Tâches planifiées (Task / TaskView) pour la règle de priorité
+        capacities: {resource_id: capacité par jour}, `default_capacity` sinon
+        demands: {task_id: besoins} remplaçant task.resources (voir task_demands)
+        rule: Nom d'une règle de PRIORITY_RULES ou fonction tâche -> clé
+        method: 'serial' (tâche par tâche, au plus tôt) ou 'parallel'
+                (date par date, toutes les tâches prêtes qui tiennent)
+    Returns:
+        LevelingResult
+    """
+    tasks = list(tasks)
+    key = PRIORITY_RULES.get(rule) if isinstance(rule, str) else rule
+    if key is None:
+        raise ValueError(f"Règle de priorité inconnue: {rule} (attendu: {', '.join(PRIORITY_RULES)})")
+    if method not in ('serial', 'parallel'):
+        raise ValueError(f"Méthode inconnue: {method} (attendu: 'serial' ou 'parallel')")
+    capacities = capacities or {}
+
+    needs = []
+    for task in tasks:
+        task_needs = demands.get(task.id, ()) if demands is not None else task_demands(task)
+        # Un besoin supérieur à la capacité mobilise toute la ressource (surallocation planifiée)
+        needs.append([(resource, min(units, capacities.get(resource, default_capacity)))
+                      for resource, units in task_needs])
+
+    horizon = math.ceil(max((task.earliest_finish for task in tasks), default=0)) + 1
+    leveler = _Leveler(graph, needs, capacities, default_capacity, horizon)
+    priority = [key(task) for task in tasks]
+    if method == 'serial':
+        leveler.serial(priority)
+    else:
+        leveler.parallel(priority)
+
+    ids = graph.ids
+    start = dict(zip(ids, leveler.start))
+    finish = dict(zip(ids, leveler.finish))
+    delays = {task.id: s - task.earliest_start for task, s in zip(tasks, leveler.start)
+              if s - task.earliest_start > CAPACITY_TOLERANCE}
+    peaks = {resource: timeline.peak() for resource, timeline in leveler.timelines.items()}
+    return LevelingResult(start, finish, delays, peaks, rule, method)
+
+
+class _Leveler:
+    """État d'un ordonnancement : dates nivelées, charges et prédécesseurs restants"""
+
+    def __init__(self, graph, needs, capacities, default_capacity, horizon):
+        n = len(graph)
+        self.n = n
+        self.dur = graph.durations.tolist()
+        self.pred_ptr, self.pred_idx = graph.pred_ptr.tolist(), graph.pred_idx.tolist()
+        self.pred_type, self.pred_lag = graph.pred_type.tolist(), graph.pred_lag.tolist()
+        self.succ_ptr, self.succ_idx = graph.succ_ptr.tolist(), graph.succ_idx.tolist()
+        self.needs = needs
+        self.timelines = {}
+        self.limits = []
+        for task_needs in needs:
+            limits = []
+            for resource, units in task_needs:
+                if resource not in self.timelines:
+                    self.timelines[resource] = CapacityTimeline(horizon)
+                limits.append((self.timelines[resource],
+                               capacities.get(resource, default_capacity) - units + CAPACITY_TOLERANCE))
+            self.limits.append(limits)
+        self.start = [0.0] * n
+        self.finish = [0.0] * n
+        self.remaining = [self.pred_ptr[v + 1] - self.pred_ptr[v] for v in range(n)]
+
+    def earliest_start(self, v):
+        """Début au plus tôt d'après les dates nivelées des prédécesseurs (formules CPM)"""
+        d = self.dur[v]
+        start = 0.0
+        for k in range(self.pred_ptr[v], self.pred_ptr[v + 1]):
+            u = self.pred_idx[k]
+            t = self.pred_type[k]
+            if t == FS:
+                constraint = self.finish[u] + self.pred_lag[k]
+            elif t == SS:
+                constraint = self.start[u] + self.pred_lag[k]
+            elif t == FF:
+                constraint = self.finish[u] + self.pred_lag[k] - d
+            else:  # SF
+                constraint = self.start[u] + self.pred_lag[k] - d
+            if constraint > start:
+                start = constraint
+        return start
+
+    def blocking_day(self, v, start):
+        """
+        Si v ne tient pas en commençant à `start`, dernier jour de la première
+        période saturée rencontrée (v ne peut pas commencer avant le lendemain)
+        """
+        d = self.dur[v]
+        if d <= 0:
+            return None
+        first, last = math.floor(start), math.ceil(start + d)
+        for timeline, limit in self.limits[v]:
+            day = timeline.first_over(first, last, limit)
+            if day is not None:
+                # Saute toute la période saturée de cette ressource
+                return timeline.first_at_most(day + 1, limit) - 1
+        return None
+
+    def place(self, v, start):
+        """Réserve les ressources de v et retourne les successeurs devenus prêts"""
+        d = self.dur[v]
+        self.start[v] = start
+        self.finish[v] = start + d
+        if d > 0:
+            first, last = math.floor(start), math.ceil(start + d)
+            for resource, units in self.needs[v]:
+                self.timelines[resource].add(first, last, units)
+        ready = []
+        for k in range(self.succ_ptr[v], self.succ_ptr[v + 1]):
+            w = self.succ_idx[k]
+            self.remaining[w] -= 1
+            if self.remaining[w] == 0:
+                ready.append(w)
+        return ready
+
+    def serial(self, priority):
+        """Génération série : la tâche prête la plus prioritaire au plus tôt où elle tient"""
+        eligible = [(priority[v], v) for v in range(self.n) if self.remaining[v] == 0]
+        heapq.heapify(eligible)
+        while eligible:
+            _, v = heapq.heappop(eligible)
+            start = self.earliest_start(v)
+            day = self.blocking_day(v, start)
+            while day is not None:
+                start = float(day + 1)
+                day = self.blocking_day(v, start)
+            for w in self.place(v, start):
+                heapq.heappush(eligible, (priority[w], w))
+
+    def parallel(self, priority):
+        """
+        Génération parallèle : à chaque date de décision, les tâches prêtes
+        sont démarrées par priorité tant que les ressources le permettent.
+        Une tâche qui ne tient pas est reportée à la fin de la période saturée
+        qui la bloque : les charges ne faisant que croître, aucune date
+        antérieure ne peut convenir. Une tâche est d'abord essayée à son début au plus tôt,
+        qui peut précéder la date de décision (liens FF / SF, lags négatifs).
+        """
+        waiting = [(0.0, v) for v in range(self.n) if self.remaining[v] == 0]
+        heapq.heapify(waiting)
+        while waiting:
+            t = waiting[0][0]
+            ready = {}
+            while waiting and waiting[0][0] <= t:
+                start, v = heapq.heappop(waiting)
+                ready[v] = start
+            available = [(priority[v], v) for v in ready]
+            heapq.heapify(available)
+            while available:
+                v = heapq.heappop(available)[1]
+                start = ready[v]
+                day = self.blocking_day(v, start)
+                if day is not None:
+                    heapq.heappush(waiting, (max(t, float(day + 1)), v))
+                    continue
+                for w in self.place(v, start):
+                    start_w = self.earliest_start(w)
+                    if start_w <= t:  # Prête à la date courante : même tour de décision
+                        ready[w] = start_w
+                        heapq.heappush(available, (priority[w], w))
+                    else:
+                        heapq.heappush(waiting, (start_w, w))
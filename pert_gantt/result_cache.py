@@ -0,0 +1,272 @@
+# CACHE DES RÉSULTATS CPM INDEXÉ PAR EMPREINTE DU GRAPHE
+# Un projet inchangé depuis le dernier calcul (tableaux de bord, exports...)
+# n'est pas replanifié : ses résultats sont retrouvés par une empreinte du
+# graphe (identifiants, durées, estimations 3 points, liens). Cache mémoire LRU
+# borné en nombre d'entrées et en octets, avec un niveau disque optionnel.
+# La réutilisation peut aussi se faire par composante faiblement connexe.
+
+import hashlib
+import os
+import pickle
+import tempfile
+from array import array
+from collections import OrderedDict
+
+from .cpm_engine import CompiledGraph, collect_columns
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 256 * 2**20
+FINGERPRINT_VERSION = b'pert-cpm-1'  # À changer si le calcul CPM évolue (invalide les caches disque)
+
+
+def fingerprint(ids, durations, pred_ptr, pred_idx, pred_type, pred_lag, estimates=None):
+    """
+    Empreinte (hexadécimale) d'un graphe sous forme CSR des prédécesseurs
+
+    Calculée sur les octets des colonnes (blake2b) : le coût est celui d'une
+    copie mémoire, sans parcours Python des arcs. L'empreinte dépend de l'ordre
+    des tâches, qui détermine aussi l'ordre des colonnes de résultats.
+
+    Args:
+        estimates: Colonnes (optimiste, probable, pessimiste), NaN pour une durée fixe, ou None
+    """
+    digest = hashlib.blake2b(FINGERPRINT_VERSION, digest_size=20)
+    digest.update('\x1f'.join(map(str, ids)).encode('utf-8'))
+    for column, typecode in ((durations, 'd'), (pred_ptr, 'i'), (pred_idx, 'i'),
+                             (pred_type, 'b'), (pred_lag, 'd')):
+        digest.update(b'\x00')
+        digest.update(_buffer(column, typecode))
+    if estimates is not None:
+        for column in estimates:
+            digest.update(b'\x01')
+            digest.update(_buffer(column, 'd'))
+    return digest.hexdigest()
+
+
+def scheduler_fingerprint(scheduler):
+    """
+    Empreinte d'un planificateur et forme compacte de son graphe
+
+    Returns:
+        (empreinte, forme compacte pour portfolio.schedule_packed)
+    """
+    store = scheduler._store
+    if store is not None:
+        estimates = None
+        if store.optimistic_time is not None:
+            estimates = (store.optimistic_time, store.most_likely_time, store.pessimistic_time)
+        return fingerprint(store.ids, store.durations, store.pred_ptr, store.pred_idx,
+                           store.pred_type, store.pred_lag, estimates), store
+
+    tasks = list(scheduler.tasks.values())
+    packed = collect_columns(tasks)
+    ids, durations, _, targets, types, lags, _ = packed
+    nan = float('nan')
+    estimates = None
+    if any(hasattr(task, 'pessimistic_time') for task in tasks):
+        estimates = tuple(array('d', (getattr(task, name, nan) for task in tasks))
+                          for name in ('optimistic_time', 'most_likely_time', 'pessimistic_time'))
+    return fingerprint(ids, durations, _pred_ptr(targets, len(ids)), packed[2], types, lags,
+                       estimates), packed
+
+
+class ScheduleCache:
+    """
+    Cache LRU des résultats de calcul (durée du projet, colonnes, ordre topologique)
+
+    Niveau mémoire borné par max_entries et max_bytes (taille des colonnes) ;
+    niveau disque optionnel (un fichier pickle par empreinte dans `directory`),
+    consulté en cas d'absence en mémoire et partagé entre processus. Le
+    répertoire ne doit contenir que des fichiers écrits par ce cache (pickle).
+
+    Attributs:
+        hits, disk_hits, misses: Compteurs de consultations
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES, directory=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self._entries = OrderedDict()  # clé -> (valeur, taille)
+        self.size = 0
+        self.hits = self.disk_hits = self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries or (self.directory is not None and os.path.exists(self._path(key)))
+
+    def get(self, key):
+        """Valeur en cache (None si absente) ; une entrée lue sur disque remonte en mémoire"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        if self.directory is not None:
+            try:
+                with open(self._path(key), 'rb') as file:
+                    value = pickle.load(file)
+            except FileNotFoundError:
+                pass
+            else:
+                self.disk_hits += 1
+                self._remember(key, value)
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        """Ajoute une entrée (mémoire, et disque si configuré)"""
+        self._remember(key, value)
+        if self.directory is not None:
+            handle, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(handle, 'wb') as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self._path(key))  # Écriture atomique
+
+    def clear(self, disk=False):
+        self._entries.clear()
+        self.size = 0
+        if disk and self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith('.pickle'):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _remember(self, key, value):
+        size = _size(value)
+        if size > self.max_bytes:
+            return  # Entrée trop volumineuse pour le niveau mémoire
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= previous[1]
+        self._entries[key] = (value, size)
+        self.size += size
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= evicted
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    # --- Planification avec cache ---
+
+    def schedule(self, scheduler):
+        """
+        Planifie un projet, ou applique les résultats en cache s'il n'a pas changé
+        Returns:
+            True si les résultats venaient du cache
+        """
+        from .portfolio import schedule_packed
+
+        key, packed = scheduler_fingerprint(scheduler)
+        value = self.get(key)
+        hit = value is not None
+        if not hit:
+            value = schedule_packed(packed)
+            self.put(key, value)
+        project_duration, columns, order = value
+        # Copies : le planificateur peut modifier ses colonnes, pas l'entrée du cache
+        scheduler.apply_results(project_duration, [column[:] for column in columns], order[:])
+        return hit
+
+    def schedule_components(self, scheduler):
+        """
+        Planifie un projet composante par composante (faiblement connexe) :
+        seules les composantes modifiées sont recalculées
+
+        Deux entrées par composante : le passage avant (ne dépend que de la
+        composante) et le passage arrière + flottements (dépend aussi de la fin
+        du projet, commune à toutes). Modifier une composante sans changer la
+        durée du projet ne recalcule qu'elle ; sinon seuls les passages arrière
+        des autres composantes sont refaits.
+
+        Returns:
+            (nombre de composantes, nombre de composantes recalculées)
+        """
+        from .portfolio import RESULT_COLUMNS, split_columns, weakly_connected_components
+
+        packed = scheduler.pack()
+        columns = packed.columns() if isinstance(packed, CompiledGraph) else packed
+        ids, _, sources, targets, _, _, _ = columns
+        n = len(ids)
+        labels, count = weakly_connected_components(n, sources, targets)
+        nodes, payloads = split_columns(columns, labels, count)
+
+        keys, forwards = [], []
+        payload_of = {}
+        for payload in payloads:
+            # Arcs d'une composante groupés par cible : forme CSR sans compilation
+            part_ids, part_durations, part_sources, part_targets, part_types, part_lags = payload
+            key = fingerprint(part_ids, part_durations, _pred_ptr(part_targets, len(part_ids)),
+                              part_sources, part_types, part_lags)
+            graph = None
+            forward = self.get(key)
+            if forward is None:
+                graph = CompiledGraph.from_columns(*payload)
+                graph.forward_pass()
+                forward = (graph.project_duration, graph.earliest_start, graph.earliest_finish, graph.order)
+                self.put(key, forward)
+            keys.append(key)
+            payload_of[key] = payload
+            forwards.append((forward, graph))
+        project_duration = max((forward[0] for forward, _ in forwards), default=0)
+
+        merged = [array('d', bytes(8 * n)) for _ in RESULT_COLUMNS[:-1]] + [bytearray(n)]
+        order = array('i')
+        recomputed = 0
+        for part_nodes, key, (forward, graph) in zip(nodes, keys, forwards):
+            backward_key = f"{key}:{project_duration!r}"
+            results = self.get(backward_key)
+            if results is None:
+                recomputed += 1
+                if graph is None:
+                    graph = CompiledGraph.from_columns(*payload_of[key])
+                    _, graph.earliest_start, graph.earliest_finish, _ = forward
+                graph.backward_pass(project_duration)
+                graph.calculate_float(project_duration)
+                results = tuple(getattr(graph, name) for name in RESULT_COLUMNS[2:])
+                self.put(backward_key, results)
+            part_columns = (forward[1], forward[2]) + results
+            for column, values in zip(merged, part_columns):
+                for v, value in zip(part_nodes, values):
+                    column[v] = value
+            order.extend(part_nodes[v] for v in forward[3])
+        scheduler.apply_results(project_duration, merged, order)
+        return count, recomputed
+
+
+DEFAULT_CACHE = ScheduleCache()  # Cache mémoire partagé par le processus
+
+
+def _buffer(column, typecode):
+    if isinstance(column, (bytes, bytearray)):
+        return column
+    if isinstance(column, array) and column.typecode == typecode:
+        return column
+    if hasattr(column, 'tobytes'):  # Tableau NumPy (instantané projeté en mémoire)
+        return column.tobytes()
+    return array(typecode, column)
+
+
+def _pred_ptr(targets, n):
+    """Positions CSR des prédécesseurs (arcs de collect_columns, groupés par cible)"""
+    counts = [0] * (n + 1)
+    for v in targets:
+        counts[v + 1] += 1
+    for v in range(n):
+        counts[v + 1] += counts[v]
+    return array('i', counts)
+
+
+def _size(value):
+    if isinstance(value, (tuple, list)):
+        return sum(_size(item) for item in value)
+    if isinstance(value, array):
+        return value.itemsize * len(value)
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return 8
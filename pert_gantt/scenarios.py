@@ -0,0 +1,317 @@
+# SCÉNARIOS « WHAT-IF » ÉVALUÉS PAR LOT (nécessite NumPy)
+# Chaque scénario est une surcouche légère sur le graphe de base : durées
+# modifiées, liens supprimés ou ajoutés. Aucune copie des tâches : un lot de
+# scénarios est calculé en une seule série de passages vectorisés (une colonne
+# par scénario), couche topologique par couche topologique comme monte_carlo.
+
+from itertools import compress
+
+from .cpm_engine import CompiledGraph, DEPENDENCY_CODES, FS, SS, FF, SF
+from .monte_carlo import (SHARD_CELLS, earliest_starts, group_layers, latest_finishes,
+                          topological_levels)
+from .validation import CycleError
+
+CRITICAL_TOLERANCE = 0.001  # même tolérance que ProjectScheduler.calculate_float
+MAX_FLOAT_CHANGES = 20  # Variations de flottement détaillées par scénario
+
+_BASE = ({}, [], [])  # Différences (durées, liens supprimés, liens ajoutés) du planning de base
+
+
+class Scenario:
+    """
+    Variante du projet décrite par ses seules différences avec la base
+
+        Scenario("API à 12 jours").set_duration('API', 12)
+        Scenario("Sans lien DOC -> FORM").remove_dependency('DOC', 'FORM', 'FF')
+    """
+
+    def __init__(self, name, durations=None, removed=(), added=()):
+        """
+        Args:
+            durations: {id tâche: nouvelle durée}
+            removed: Liens supprimés (prédécesseur, successeur[, type]) ; sans type,
+                     tous les liens entre les deux tâches
+            added: Liens ajoutés (prédécesseur, successeur, type, lag)
+        """
+        self.name = name
+        self.durations = dict(durations or {})
+        self.removed = [tuple(link) for link in removed]
+        self.added = [tuple(link) for link in added]
+
+    def set_duration(self, task_id, duration):
+        self.durations[task_id] = duration
+        return self
+
+    def remove_dependency(self, predecessor_id, task_id, dependency_type=None):
+        self.removed.append((predecessor_id, task_id, dependency_type))
+        return self
+
+    def add_dependency(self, predecessor_id, task_id, dependency_type='FS', lag=0):
+        self.added.append((predecessor_id, task_id, dependency_type, lag))
+        return self
+
+    def change_dependency(self, predecessor_id, task_id, dependency_type='FS', lag=0):
+        """Remplace les liens entre deux tâches par un lien (type, lag)"""
+        return self.remove_dependency(predecessor_id, task_id).add_dependency(
+            predecessor_id, task_id, dependency_type, lag)
+
+    def __repr__(self):
+        return (f"Scenario({self.name!r}, {len(self.durations)} durées, "
+                f"-{len(self.removed)}/+{len(self.added)} liens)")
+
+
+class ScenarioResult:
+    """
+    Comparaison d'un scénario avec la base
+
+    Attributs:
+        project_duration, delta: Durée du projet et écart avec la base (jours)
+        end_date: Date de fin (si un calendrier est disponible)
+        newly_critical, no_longer_critical: Identifiants des tâches changeant d'état critique
+        float_changes: {id tâche: variation du flottement total}, les plus fortes
+        float_changed: Nombre de tâches dont le flottement total varie
+        error: Message si le scénario n'est pas planifiable (cycle)
+    """
+
+    def __init__(self, name, project_duration=None, delta=None, end_date=None, newly_critical=(),
+                 no_longer_critical=(), float_changes=None, float_changed=0, error=None):
+        self.name = name
+        self.project_duration = project_duration
+        self.delta = delta
+        self.end_date = end_date
+        self.newly_critical = list(newly_critical)
+        self.no_longer_critical = list(no_longer_critical)
+        self.float_changes = float_changes or {}
+        self.float_changed = float_changed
+        self.error = error
+
+    def __repr__(self):
+        if self.error:
+            return f"ScenarioResult({self.name!r}, erreur={self.error!r})"
+        return f"ScenarioResult({self.name!r}, {self.project_duration:.1f} j, {self.delta:+.1f} j)"
+
+
+def compare_scenarios(scheduler, scenarios, calendar=None, max_float_changes=MAX_FLOAT_CHANGES):
+    """
+    Évalue des scénarios par lots et les compare au planning de base
+
+    Les scénarios d'un lot partagent un graphe « union » : graphe de base sans
+    les liens que tous suppriment, plus les liens ajoutés par l'un d'eux,
+    désactivés (lag = -inf) dans les autres colonnes. Un lot dont l'union
+    contient un cycle est réévalué scénario par scénario, chacun sur son propre
+    graphe modifié (une inversion de lien est donc acceptée) ; seul un scénario
+    lui-même cyclique reçoit une erreur.
+
+    Args:
+        calendar: WorkCalendar pour les dates de fin (scheduler.calendar par défaut)
+    Returns:
+        [ScenarioResult] : la base (« Référence ») puis les scénarios dans l'ordre
+    """
+    packed = scheduler.pack()
+    columns = packed.columns() if isinstance(packed, CompiledGraph) else packed
+    ids = columns[0]
+    index = {task_id: i for i, task_id in enumerate(ids)}
+    diffs = [_resolve(scenario, index) for scenario in scenarios]
+    if calendar is None:
+        calendar = scheduler.calendar
+    if calendar is None and scheduler.start_date is not None:
+        from .work_calendar import WorkCalendar
+        calendar = WorkCalendar(scheduler.start_date)
+
+    # Matrices (tâches x scénarios) transitoires, bornées comme les lots Monte Carlo
+    batch = max(1, SHARD_CELLS // max(len(ids), 1))
+    reference = _summary(_evaluate(columns, [_BASE]), 0)
+    results = [_compare("Référence", reference, reference, ids, calendar, max_float_changes)]
+    for first in range(0, len(diffs), batch):
+        part = diffs[first:first + batch]
+        try:
+            outcome = _evaluate(columns, part)
+            evaluated = [(outcome, j) for j in range(len(part))]
+        except CycleError:
+            # Union cyclique (liens ajoutés incompatibles, inversion de lien...) : un par un
+            evaluated = []
+            for diff in part:
+                try:
+                    evaluated.append((_evaluate(columns, [diff]), 0))
+                except CycleError as error:
+                    evaluated.append((error, None))
+        for scenario, (outcome, column) in zip(scenarios[first:first + batch], evaluated):
+            if column is None:
+                results.append(ScenarioResult(scenario.name, error=str(outcome)))
+            else:
+                results.append(_compare(scenario.name, reference, _summary(outcome, column), ids,
+                                        calendar, max_float_changes))
+    return results
+
+
+def _resolve(scenario, index):
+    """Scénario -> (durées {index: d}, liens supprimés, liens ajoutés) en index et codes"""
+    def task(task_id):
+        if task_id not in index:
+            raise KeyError(f"Scénario {scenario.name!r}: tâche inconnue {task_id!r}")
+        return index[task_id]
+
+    def code(dep_type):
+        return DEPENDENCY_CODES.get(dep_type, FS)
+
+    durations = {task(task_id): float(duration) for task_id, duration in scenario.durations.items()}
+    removed = [(task(link[0]), task(link[1]), code(link[2]) if len(link) > 2 and link[2] else None)
+               for link in scenario.removed]
+    added = [(task(pred), task(succ), code(dep_type), float(lag))
+             for pred, succ, dep_type, lag in scenario.added]
+    return durations, removed, added
+
+
+def _evaluate(columns, diffs):
+    """
+    Passages avant/arrière vectorisés : colonne j = diffs[j]
+    Returns:
+        (ES, LS, durée du projet) : matrices (tâches x colonnes) et vecteur
+    """
+    import numpy as np
+
+    ids, durations, sources, targets, types, lags, _ = columns
+    n, width = len(ids), len(diffs)
+    inf = float('inf')
+
+    # Liens de base supprimés par chaque scénario (positions dans les colonnes)
+    wanted = {(u, v) for _, removed, _ in diffs for u, v, _ in removed}
+    between = {}
+    if wanted:
+        for k, link in enumerate(zip(sources, targets)):
+            if link in wanted:
+                between.setdefault(link, []).append(k)
+    dropped = None
+    for _, removed, _ in diffs:
+        positions = set()
+        for u, v, t in removed:
+            matching = [k for k in between.get((u, v), ()) if t is None or types[k] == t]
+            if not matching:
+                raise ValueError(f"Lien inexistant: {ids[u]} -> {ids[v]}")
+            positions.update(matching)
+        dropped = positions if dropped is None else dropped & positions
+
+    # Graphe union : liens de base sauf ceux que tous les scénarios suppriment,
+    # plus les liens ajoutés par au moins un scénario, désactivés par défaut
+    if dropped:
+        kept = [k not in dropped for k in range(len(sources))]
+        sources, targets, types, lags = (list(compress(values, kept))
+                                         for values in (sources, targets, types, lags))
+    else:
+        sources, targets, types, lags = list(sources), list(targets), list(types), list(lags)
+    union = {}
+    for _, _, added in diffs:
+        for u, v, t, _ in added:
+            if (u, v, t) not in union:
+                union[u, v, t] = True
+                sources.append(u)
+                targets.append(v)
+                types.append(t)
+                lags.append(-inf)
+    graph = CompiledGraph.from_columns(ids, durations, sources, targets, types, lags)
+
+    # Surcharges de lag (colonne, valeur) par position d'arc dans chaque CSR ; -inf = lien absent
+    forward, backward = {}, {}
+    for column, (_, removed, added) in enumerate(diffs):
+        for u, v, t in removed:
+            for k in _positions(graph.pred_ptr, graph.pred_idx, graph.pred_type, graph.pred_lag, v, u, t, False):
+                forward.setdefault(k, []).append((column, -inf))
+            for k in _positions(graph.succ_ptr, graph.succ_idx, graph.succ_type, graph.succ_lag, u, v, t, False):
+                backward.setdefault(k, []).append((column, -inf))
+        for u, v, t, lag in added:
+            for k in _positions(graph.pred_ptr, graph.pred_idx, graph.pred_type, graph.pred_lag, v, u, t, True):
+                forward.setdefault(k, []).append((column, lag))
+            for k in _positions(graph.succ_ptr, graph.succ_idx, graph.succ_type, graph.succ_lag, u, v, t, True):
+                backward.setdefault(k, []).append((column, lag))
+
+    d = np.repeat(np.asarray(graph.durations, dtype=float)[:, None], width, axis=1)
+    for column, (changed, _, _) in enumerate(diffs):
+        for v, duration in changed.items():
+            d[v, column] = duration
+
+    depth, height = topological_levels(graph)
+    pred_ptr, succ_ptr = np.asarray(graph.pred_ptr), np.asarray(graph.succ_ptr)
+    pred_type, succ_type = np.asarray(graph.pred_type), np.asarray(graph.succ_type)
+    pred_lag, succ_lag = np.asarray(graph.pred_lag), np.asarray(graph.succ_lag)
+    edges = np.arange(len(pred_lag))
+    roots = np.flatnonzero(np.diff(pred_ptr) == 0)
+    sinks = np.flatnonzero(np.diff(succ_ptr) == 0)
+
+    # Passage avant : lignes [0, n) = ES, [n, 2n) = EF (mêmes formules que monte_carlo)
+    from_finish = (pred_type == FS) | (pred_type == FF)
+    uses_duration = (pred_type == FF) | (pred_type == SF)
+    layers = group_layers(depth, np.repeat(np.arange(n), np.diff(pred_ptr)),
+                          np.asarray(graph.pred_idx) + n * from_finish, edges, uses_duration)
+    early = np.zeros((2 * n, width))
+    early[n + roots] = d[roots]
+    for layer in layers:
+        nodes, rows, positions = layer[:3]
+        constraints = early[rows] + pred_lag[positions][:, None]
+        _override(constraints, early, rows, positions, forward, 1.0)
+        start = earliest_starts(constraints, layer, d)
+        early[nodes] = start
+        early[n + nodes] = start + d[nodes]
+    project = early[n:].max(axis=0)
+
+    # Passage arrière : lignes [0, n) = LS, [n, 2n) = LF
+    to_finish = (succ_type == FF) | (succ_type == SF)
+    adds_duration = (succ_type == SS) | (succ_type == SF)
+    layers = group_layers(height, np.repeat(np.arange(n), np.diff(succ_ptr)),
+                          np.asarray(graph.succ_idx) + n * to_finish, edges, adds_duration)
+    late = np.empty((2 * n, width))
+    late[n + sinks] = project
+    late[sinks] = project - d[sinks]
+    for layer in layers:
+        nodes, rows, positions = layer[:3]
+        constraints = late[rows] - succ_lag[positions][:, None]
+        _override(constraints, late, rows, positions, backward, -1.0)
+        finish = latest_finishes(constraints, layer, d)
+        # Tous les liens sortants supprimés dans un scénario : la tâche finit avec le projet
+        finish = np.where(np.isinf(finish), project, finish)
+        late[n + nodes] = finish
+        late[nodes] = finish - d[nodes]
+
+    return early[:n], late[:n], project
+
+
+def _positions(ptr, neighbours, types, lags, node, other, code, added):
+    """Positions CSR des liens node <-> other (type `code`, tous si None) ; liens de base ou ajoutés"""
+    inf = float('inf')
+    return [k for k in range(ptr[node], ptr[node + 1])
+            if neighbours[k] == other and (code is None or types[k] == code)
+            and (lags[k] == -inf) == added]
+
+
+def _override(constraints, values, rows, positions, overrides, sign):
+    """Applique aux arcs d'une couche les lags propres à certains scénarios"""
+    import numpy as np
+
+    if not overrides:
+        return
+    slots = np.flatnonzero(np.isin(positions, list(overrides)))
+    for slot, k in zip(slots.tolist(), positions[slots].tolist()):
+        for column, lag in overrides[k]:
+            constraints[slot, column] = values[rows[slot], column] + sign * lag
+
+
+def _summary(outcome, column):
+    early, late, project = outcome
+    total_float = late[:, column] - early[:, column]
+    return {'project_duration': float(project[column]), 'total_float': total_float,
+            'critical': abs(total_float) < CRITICAL_TOLERANCE}
+
+
+def _compare(name, base, scenario, ids, calendar, max_float_changes):
+    """ScenarioResult d'un scénario (voir _summary) face à la référence"""
+    import numpy as np
+
+    newly = np.flatnonzero(scenario['critical'] & ~base['critical'])
+    dropped = np.flatnonzero(base['critical'] & ~scenario['critical'])
+    delta_float = scenario['total_float'] - base['total_float']
+    changed = np.flatnonzero(np.abs(delta_float) >= CRITICAL_TOLERANCE)
+    top = changed[np.argsort(-np.abs(delta_float[changed]), kind='stable')[:max_float_changes]]
+    duration = scenario['project_duration']
+    end_date = calendar.finish_date(duration) if calendar is not None else None
+    return ScenarioResult(name, duration, duration - base['project_duration'], end_date,
+                          [ids[v] for v in newly.tolist()], [ids[v] for v in dropped.tolist()],
+                          {ids[v]: float(delta_float[v]) for v in top.tolist()}, len(changed))
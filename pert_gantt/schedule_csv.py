@@ -0,0 +1,370 @@
+# IMPORT / EXPORT CSV DU PLANNING EN FLUX
+# Écriture ligne à ligne par paquets (aucune liste de lignes en mémoire) et
+# relecture en une passe. Les prédécesseurs sont désignés par leur identifiant :
+# les noms de tâches ne sont pas uniques. L'aller-retour est sans perte :
+# identifiants entiers, estimations trois points et identifiants contenant
+# « ; », « ( » ou « ) » (échappés par une barre oblique inverse). Les tâches
+# récapitulatives d'un projet hiérarchisé (WBS) sont écrites avec la colonne
+# Parent et leurs liens saisis, sans les jalons internes qui les remplacent.
+
+import csv
+import re
+from array import array
+from contextlib import contextmanager
+from itertools import islice
+
+HEADER = ['ID', 'Nom', 'Durée', 'ES', 'EF', 'LS', 'LF',
+          'Flottement_Total', 'Flottement_Libre', 'Critique', 'Prédécesseurs',
+          'Optimiste', 'Plus_probable', 'Pessimiste', 'Parent']
+ESTIMATE_HEADER = ('Optimiste', 'Plus_probable', 'Pessimiste')  # Vides pour une durée fixe
+CHUNK_SIZE = 10_000  # Lignes écrites par appel à writerows
+
+# Prédécesseurs au format « identifiant(TYPE,lag) » séparés par « ; » non échappés.
+# L'identifiant admet des « ( » non échappées (anciens fichiers désignant les
+# prédécesseurs par leur nom) : seul le suffixe « (TYPE,lag) » délimite le lien.
+_ENTRY = re.compile(r'(?:\\.|[^\\;])+', re.DOTALL)
+_LINK = re.compile(r'\s*((?:\\.|[^\\])+?)\((\w+),\s*([-+0-9.eE]+)\)\s*', re.DOTALL)
+_INTEGER = re.compile(r'-?(?:0|[1-9][0-9]*)')
+_INTEGER_START = '-0123456789'
+# Chaîne écrite telle quelle : ni caractère spécial, ni blanc initial, ni forme d'un entier
+_PLAIN = re.compile(r'(?!\s|-?(?:0|[1-9][0-9]*)\Z)[^\\;()]*')
+_SPECIAL = re.compile(r'[\\;()]')
+_ESCAPE = re.compile(r'\\(.)', re.DOTALL)
+
+
+def _number(value):
+    """Nombre sans perte : entier sans décimale, sinon représentation la plus courte"""
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _parse_number(text):
+    """Relecture de _number : entier si écrit sans décimale"""
+    return int(text) if _INTEGER.fullmatch(text) else float(text)
+
+
+def format_id(task_id):
+    """
+    Identifiant tel qu'écrit dans le CSV (colonnes ID et Prédécesseurs)
+
+    Un entier est écrit tel quel ; dans une chaîne, « \\ ; ( ) » sont échappés
+    par « \\ », ainsi qu'un premier caractère blanc et une chaîne qui se lirait
+    comme un entier (« \\42 » : chaîne '42').
+    """
+    if type(task_id) is str and _PLAIN.fullmatch(task_id):
+        return task_id
+    if isinstance(task_id, int) and not isinstance(task_id, bool):
+        return str(task_id)
+    text = _SPECIAL.sub(r'\\\g<0>', str(task_id))
+    if _INTEGER.fullmatch(text) or text[:1].isspace():
+        text = '\\' + text
+    return text
+
+
+def parse_id(text):
+    """Relecture de format_id : entier si écrit comme tel, chaîne désechappée sinon"""
+    if '\\' in text:
+        return _ESCAPE.sub(r'\1', text)
+    if text[:1] in _INTEGER_START and _INTEGER.fullmatch(text):
+        return int(text)
+    return text
+
+
+def _estimates(task):
+    if not hasattr(task, 'pessimistic_time'):
+        return ['', '', '']
+    return [_number(task.optimistic_time), _number(task.most_likely_time), _number(task.pessimistic_time)]
+
+
+def _result(value):
+    """Date ou flottement calculé, arrondi pour l'affichage (recalculé à la relecture)"""
+    return _number(round(value, 6))
+
+
+def _links(links):
+    return '; '.join(f"{format_id(pred_id)}({dep_type},{_number(lag)})" for pred_id, dep_type, lag in links)
+
+
+def _task_row(task, links, parent=''):
+    return [format_id(task.id), task.name, _number(task.duration),
+            _result(task.earliest_start), _result(task.earliest_finish),
+            _result(task.latest_start), _result(task.latest_finish),
+            _result(task.total_float), _result(task.free_float),
+            'OUI' if task.is_critical else 'NON', _links(links), *_estimates(task), parent]
+
+
+def task_rows(tasks, order=None, wbs=None):
+    """
+    Lignes CSV d'objets Task, générées une à une
+
+    Args:
+        tasks: Dictionnaire id -> Task (scheduler.tasks)
+        order: Identifiants dans l'ordre d'écriture (par défaut, ordre du dictionnaire)
+        wbs: Hiérarchie du projet (scheduler.wbs) : chaque tâche récapitulative
+             est écrite à la place de son jalon de début, le jalon de fin est omis
+    """
+    if wbs is None or not wbs.summaries:
+        for task_id in (order if order is not None else tasks):
+            task = tasks[task_id]
+            yield _task_row(task, ((pred.id, dep_type, lag) for pred, dep_type, lag in task.predecessors))
+        return
+
+    summaries = wbs.summaries
+    for task_id in (order if order is not None else tasks):
+        if wbs.is_milestone(task_id):
+            if task_id.end != 'début':
+                continue
+            task_id = task_id.summary_id
+        task = summaries[task_id] if task_id in summaries else tasks[task_id]
+        parent = wbs.parent_id(task_id)
+        yield _task_row(task, wbs.public_predecessors(tasks, task_id),
+                        format_id(parent) if parent is not None else '')
+
+
+def store_rows(store, order=None):
+    """Lignes CSV d'un TaskStore, lues directement dans les colonnes (sans TaskView)"""
+    from .cpm_engine import DEPENDENCY_NAMES
+
+    ids, ptr = store.ids, store.pred_ptr
+    estimates = (store.optimistic_time, store.most_likely_time, store.pessimistic_time)
+    if estimates[0] is None:
+        estimates = None
+    for v in (order if order is not None else range(len(ids))):
+        links = ((ids[store.pred_idx[k]], DEPENDENCY_NAMES[store.pred_type[k]], store.pred_lag[k])
+                 for k in range(ptr[v], ptr[v + 1]))
+        row = [format_id(ids[v]), store.names[v], _number(store.durations[v]),
+               _result(store.earliest_start[v]), _result(store.earliest_finish[v]),
+               _result(store.latest_start[v]), _result(store.latest_finish[v]),
+               _result(store.total_float[v]), _result(store.free_float[v]),
+               'OUI' if store.critical[v] else 'NON', _links(links)]
+        if estimates is None or estimates[0][v] != estimates[0][v]:  # NaN : durée fixe
+            row += ['', '', '']
+        else:
+            row += [_number(column[v]) for column in estimates]
+        row.append('')  # Pas de hiérarchie dans un TaskStore
+        yield row
+
+
+def schedule_rows(scheduler, order='topological'):
+    """
+    Lignes CSV d'un planificateur
+
+    Args:
+        order: 'topological' (prédécesseurs avant successeurs, relecture sans
+               référence en avant ; ordre d'insertion si le projet n'est pas planifié),
+               'earliest_start' (tri par ES : seul un tableau d'index est trié)
+               ou 'insertion'
+    """
+    store, wbs = scheduler._store, getattr(scheduler, 'wbs', None)
+    if order == 'topological':
+        if store is not None:
+            return store_rows(store, store.order)
+        return task_rows(scheduler.tasks, scheduler._topo.order if scheduler._topo is not None else None, wbs)
+    if order == 'earliest_start':
+        if store is not None:
+            es = store.earliest_start
+            return store_rows(store, sorted(range(len(store.ids)), key=es.__getitem__))
+        tasks = scheduler.tasks
+        if wbs is not None and wbs.summaries:
+            visible = sorted(wbs.visible(tasks), key=lambda task: task.earliest_start)
+            return task_rows(tasks, [task.id for task in visible], wbs)
+        return task_rows(tasks, sorted(tasks, key=lambda task_id: tasks[task_id].earliest_start))
+    if order == 'insertion':
+        return store_rows(store) if store is not None else task_rows(scheduler.tasks, wbs=wbs)
+    raise ValueError(f"Ordre d'export inconnu: {order}")
+
+
+def write_schedule(scheduler, filename, order='topological', chunk_size=CHUNK_SIZE):
+    """
+    Écrit le planning en CSV par paquets de `chunk_size` lignes
+    `filename` peut aussi être un fichier déjà ouvert (sys.stdout...), laissé ouvert.
+    Retourne le nombre de tâches écrites.
+    """
+    rows = schedule_rows(scheduler, order)
+    count = 0
+    with _opened(filename) as file:
+        writer = csv.writer(file)
+        writer.writerow(HEADER)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            writer.writerows(chunk)
+            count += len(chunk)
+    return count
+
+
+@contextmanager
+def _opened(filename):
+    if hasattr(filename, 'write'):
+        yield filename
+        return
+    with open(filename, 'w', newline='', encoding='utf-8') as file:
+        yield file
+
+
+def parse_links(text):
+    """Colonne Prédécesseurs -> liste de (référence, type, lag)"""
+    links = []
+    # Sans échappement, un simple découpage suffit (cas courant, plus rapide)
+    for entry in (_ENTRY.findall(text) if '\\' in text else text.split(';')):
+        if not entry.strip():
+            continue
+        match = _LINK.fullmatch(entry)
+        if match is None:
+            raise ValueError(f"Prédécesseur illisible: {entry.strip()!r}")
+        reference, dep_type, lag = match.groups()
+        lag = float(lag)
+        links.append((parse_id(reference), dep_type, int(lag) if lag.is_integer() else lag))
+    return links
+
+
+def read_schedule(filename, scheduler=None, task_factory=None, compact=False):
+    """
+    Reconstruit un planificateur depuis un CSV (write_schedule ou export_to_csv)
+
+    Lecture en une passe : chaque ligne est convertie dès sa lecture et seuls
+    les liens vers des tâches pas encore lues sont mis en attente (aucun pour
+    un fichier écrit en ordre topologique). Les colonnes calculées (ES, LF...)
+    sont ignorées : appeler schedule_project() pour recalculer le planning.
+    Les identifiants sont relus par parse_id (un identifiant écrit comme un
+    entier redevient un entier) et les estimations trois points, si les
+    colonnes Optimiste / Plus_probable / Pessimiste sont remplies, sont rétablies.
+
+    Une colonne Parent remplie rétablit la hiérarchie WBS (voir
+    ProjectScheduler.set_hierarchy), ce qui exige des objets Task (TypeError
+    avec compact=True). Les anciens fichiers désignant les prédécesseurs par
+    leur nom sont acceptés tant que ce nom est unique.
+
+    Args:
+        scheduler: ProjectScheduler vide à remplir (objets Task)
+        task_factory: Classe ou fonction (id, name, duration=...) -> Task
+        compact: Construit directement un TaskStore (voir ProjectScheduler.from_store) ;
+                 `scheduler` est alors la classe du planificateur à créer
+    Returns:
+        Le planificateur rempli
+    """
+    with open(filename, newline='', encoding='utf-8') as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"Fichier CSV vide: {filename}")
+        column = {name: i for i, name in enumerate(header)}
+        missing = {'ID', 'Durée', 'Prédécesseurs'} - set(column)
+        if missing:
+            raise ValueError(f"Colonnes absentes du CSV: {', '.join(sorted(missing))}")
+        estimates = [column[name] for name in ESTIMATE_HEADER if name in column]
+        if len(estimates) != len(ESTIMATE_HEADER):
+            estimates = None
+        parent = column.get('Parent')
+        rows = ((parse_id(row[column['ID']]), row[column['Nom']] if 'Nom' in column else row[column['ID']],
+                 _parse_number(row[column['Durée']]), row[column['Prédécesseurs']],
+                 _read_estimate(row, estimates), row[parent] if parent is not None else '')
+                for row in reader if row)
+        if compact:
+            return _read_store(rows, scheduler)
+        return _read_tasks(rows, scheduler, task_factory)
+
+
+def _read_estimate(row, columns):
+    """(optimiste, probable, pessimiste) d'une ligne, None pour une durée fixe"""
+    if columns is None or not row[columns[0]]:
+        return None
+    return tuple(_parse_number(row[i]) for i in columns)
+
+
+def _read_tasks(rows, scheduler, task_factory):
+    if scheduler is None or task_factory is None:
+        raise TypeError("read_schedule attend un ProjectScheduler et une fabrique de Task "
+                        "(voir ProjectScheduler.from_csv)")
+    tasks = scheduler.tasks
+    pending = []
+    parents = {}
+    for task_id, name, duration, links, estimate, parent in rows:
+        if parent:
+            parents[task_id] = parse_id(parent)
+        task = task_factory(task_id, name, duration=duration)
+        if estimate is not None:
+            task.optimistic_time, task.most_likely_time, task.pessimistic_time = estimate
+        scheduler.add_task(task)
+        for reference, dep_type, lag in parse_links(links):
+            predecessor = tasks.get(reference)
+            if predecessor is None:
+                pending.append((task_id, reference, dep_type, lag))
+            else:
+                task.add_dependency(predecessor, dep_type, lag)
+
+    if pending:
+        by_name = _resolver(tasks, lambda task_id: tasks[task_id].name, pending)
+        for task_id, reference, dep_type, lag in pending:
+            tasks[task_id].add_dependency(tasks[by_name(reference, task_id)], dep_type, lag)
+    if parents:
+        scheduler.set_hierarchy(parents)
+    return scheduler
+
+
+def _read_store(rows, scheduler_class):
+    from .task_store import TaskStore, dependency_code
+
+    ids, names, durations, estimates = [], [], array('d'), []
+    index = {}
+    sources, targets, types, lags = array('i'), array('i'), array('b'), array('d')
+    pending = []
+    for task_id, name, duration, links, estimate, parent in rows:
+        if parent:
+            raise TypeError(f"Planificateur compact : la hiérarchie WBS nécessite des objets Task "
+                            f"(tâche {task_id} avec parent), utiliser compact=False")
+        v = len(ids)
+        index[task_id] = v
+        ids.append(task_id)
+        names.append(name)
+        durations.append(duration)
+        estimates.append(estimate)
+        for reference, dep_type, lag in parse_links(links):
+            u = index.get(reference)
+            if u is None:
+                pending.append((task_id, reference, dep_type, lag))
+                continue
+            sources.append(u)
+            targets.append(v)
+            types.append(dependency_code(dep_type))
+            lags.append(lag)
+
+    if pending:
+        by_name = _resolver(index, lambda task_id: names[index[task_id]], pending)
+        for task_id, reference, dep_type, lag in pending:
+            sources.append(index[by_name(reference, task_id)])
+            targets.append(index[task_id])
+            types.append(dependency_code(dep_type))
+            lags.append(lag)
+
+    store = TaskStore.from_columns(ids, durations, sources, targets, types, lags, names=names,
+                                   estimates=estimates)
+    return scheduler_class.from_store(store)
+
+
+def _resolver(known_ids, name_of, pending):
+    """
+    Résolution des références en attente : identifiant lu plus loin dans le
+    fichier, sinon nom de tâche unique (anciens exports)
+    """
+    wanted = {str(reference) for _, reference, _, _ in pending if reference not in known_ids}
+    names = {}
+    if wanted:
+        for task_id in known_ids:
+            name = name_of(task_id)
+            if name in wanted:
+                names.setdefault(name, []).append(task_id)
+
+    def resolve(reference, task_id):
+        if reference in known_ids:
+            return reference
+        candidates = names.get(str(reference), ())
+        if len(candidates) == 1:
+            return candidates[0]
+        if candidates:
+            raise ValueError(f"Prédécesseur ambigu pour {task_id}: {len(candidates)} tâches "
+                             f"nommées {reference!r}")
+        raise ValueError(f"Prédécesseur inconnu pour {task_id}: {reference!r}")
+
+    return resolve
@@ -0,0 +1,1213 @@
+# ALGORITHME COMPLET PERT/CPM AVEC TOUS LES TYPES DE DÉPENDANCES
+# Développé pour la gestion de projet avancée avec PERT
+# Module sans effet de bord : les extensions (NumPy, base de données...) sont
+# importées à la première utilisation ; les exemples sont dans demo.py.
+
+class Task:
+    """
+    Classe représentant une tâche dans le projet
+    Supporte les estimations PERT (3 temps) et les dépendances multiples
+    """
+    _links_version = 0  # Incrémenté à chaque modification de liens (cache de ProjectScheduler.compile)
+
+    def __init__(self, id, name, optimistic_time=None, most_likely_time=None, pessimistic_time=None, duration=None):
+        self.id = id
+        self.name = name
+        
+        # Gestion des temps PERT (3 estimations) ou temps fixe
+        if duration is not None:
+            self.duration = duration
+        else:
+            # Formule PERT: (O + 4M + P) / 6
+            self.duration = (optimistic_time + 4 * most_likely_time + pessimistic_time) / 6
+            self.optimistic_time = optimistic_time
+            self.most_likely_time = most_likely_time
+            self.pessimistic_time = pessimistic_time
+            
+        # Variables de calcul CPM
+        self.earliest_start = 0
+        self.earliest_finish = 0
+        self.latest_start = 0
+        self.latest_finish = 0
+        self.total_float = 0
+        self.free_float = 0
+        
+        # Dépendances
+        self.predecessors = []  # Liste de tuples (task, dependency_type, lag)
+        self.successors = []   # Liste de tuples (task, dependency_type, lag)
+        
+        # État critique
+        self.is_critical = False
+        
+    def add_dependency(self, predecessor, dependency_type='FS', lag=0):
+        """
+        Ajoute une dépendance avec un prédécesseur
+        
+        Args:
+            predecessor: Tâche prédécesseur
+            dependency_type: Type de dépendance
+                - 'FS' : Finish-to-Start (défaut)
+                - 'FF' : Finish-to-Finish
+                - 'SS' : Start-to-Start  
+                - 'SF' : Start-to-Finish
+            lag: Temps de décalage en jours
+                - Positif : délai (lag time)
+                - Négatif : avance (lead time)
+        """
+        self.predecessors.append((predecessor, dependency_type, lag))
+        predecessor.successors.append((self, dependency_type, lag))
+        Task._links_version += 1
+
+    def remove_dependency(self, predecessor, dependency_type=None, lag=None):
+        """
+        Supprime les dépendances vers un prédécesseur
+        Si dependency_type ou lag sont fournis, seules les dépendances
+        correspondantes sont supprimées. Retourne le nombre de liens supprimés.
+        """
+        def matches(link):
+            _, dep_type, dep_lag = link
+            return (dependency_type is None or dep_type == dependency_type) and \
+                (lag is None or dep_lag == lag)
+
+        kept = [link for link in self.predecessors if not (link[0] is predecessor and matches(link))]
+        removed = len(self.predecessors) - len(kept)
+        self.predecessors = kept
+        predecessor.successors = [link for link in predecessor.successors
+                                  if not (link[0] is self and matches(link))]
+        Task._links_version += 1
+        return removed
+        
+    def get_variance(self):
+        """Calcule la variance PERT pour l'analyse des risques"""
+        if hasattr(self, 'pessimistic_time') and hasattr(self, 'optimistic_time'):
+            return ((self.pessimistic_time - self.optimistic_time) / 6) ** 2
+        return 0
+
+
+class AdvancedTask(Task):
+    """
+    Tâche avec ressources et avancement réel
+    (voir resource_leveling.task_demands et status_date.progress_from_tasks)
+    """
+    def __init__(self, id, name, optimistic_time=None, most_likely_time=None, pessimistic_time=None, duration=None, resources=None):
+        super().__init__(id, name, optimistic_time, most_likely_time, pessimistic_time, duration)
+        self.resources = resources or []
+        self.actual_start = None
+        self.actual_finish = None
+        self.percent_complete = 0
+
+
+class ProjectScheduler:
+    """
+    Planificateur de projet utilisant les méthodes PERT et CPM
+    Gère tous les types de dépendances et calcule le chemin critique
+    """
+    def __init__(self):
+        self.tasks = {}
+        self.critical_path = []
+        self.project_duration = 0
+        self.start_date = None  # Date de début du projet (chargement depuis la base)
+        self.calendar = None    # Calendrier de travail (work_calendar.WorkCalendar)
+        self._graph = None  # Graphe compilé (cpm_engine.CompiledGraph)
+        self._compiled = {}  # {reduce: ((version des liens, nombre de tâches), graphe)}, voir compile()
+        self._store = None  # Stockage compact (task_store.TaskStore), voir from_store()
+        self._topo = None   # Ordre topologique maintenu pour la replanification incrémentale
+        self._reach = None  # Index d'accessibilité (reachability.ReachabilityIndex), voir reachability()
+        self._redundant = None  # (liens redondants, masque des liens conservés), tant que la structure ne change pas
+        self.reduce_dependencies = False  # Retire les liens redondants du graphe de calcul (voir compile)
+        self._dirty_forward = set()
+        self._dirty_backward = set()
+        self.wbs = None     # Hiérarchie des tâches (wbs.WorkBreakdown), voir set_hierarchy()
+        from .instrumentation import NO_INSTRUMENTATION
+        self.instrumentation = NO_INSTRUMENTATION  # Points d'accroche (voir instrumentation.py)
+        
+    @classmethod
+    def from_store(cls, store):
+        """
+        Planificateur adossé à un stockage compact (task_store.TaskStore)
+        self.tasks devient un dictionnaire en lecture seule de TaskView ;
+        la structure du graphe est figée, seules les durées sont modifiables.
+        """
+        from .task_store import TaskMapping
+
+        scheduler = cls()
+        scheduler._store = store
+        scheduler.tasks = TaskMapping(store)
+        return scheduler
+
+    def to_compact(self):
+        """Copie du projet dans un stockage compact (voir from_store)"""
+        from .task_store import TaskStore
+
+        if self.wbs is not None:
+            raise TypeError("Planificateur compact : la hiérarchie WBS nécessite des objets Task")
+        scheduler = type(self).from_store(TaskStore.from_tasks(self.tasks.values()))
+        scheduler.project_duration = self.project_duration
+        scheduler.start_date = self.start_date
+        scheduler.calendar = self.calendar
+        scheduler.instrumentation = self.instrumentation
+        return scheduler
+
+    @classmethod
+    def from_database(cls, connection, project_id, task_factory=None, compact=False):
+        """
+        Construit le planificateur d'un projet depuis les tables tasks / dependencies
+        Lecture en flux par curseur côté serveur (voir db_loader.load_project).
+        Avec compact=True, le graphe est chargé directement dans un TaskStore,
+        sans créer d'objets Task (portefeuilles volumineux).
+        Les tâches récapitulatives (tasks.parent_task_id) sont retirées du réseau
+        et agrégées depuis leurs enfants (voir set_hierarchy) : un projet
+        hiérarchisé ne peut pas être chargé avec compact=True (TypeError).
+        """
+        from .db_loader import (load_hierarchy, load_project, load_project_calendar, load_project_start,
+                               load_project_store)
+
+        parents = load_hierarchy(connection, project_id)
+        if compact:
+            if parents:
+                raise TypeError(f"Planificateur compact : la hiérarchie WBS nécessite des objets Task "
+                                f"({len(parents)} tâche(s) avec parent_task_id), utiliser compact=False")
+            scheduler = cls.from_store(load_project_store(connection, project_id))
+            scheduler.start_date = load_project_start(connection, project_id)
+            scheduler.calendar = load_project_calendar(connection, project_id, scheduler.start_date)
+            return scheduler
+        scheduler = load_project(connection, project_id, cls(), task_factory or Task)
+        if parents:
+            scheduler.set_hierarchy(parents)
+        return scheduler
+
+    def save_snapshot(self, path):
+        """
+        Enregistre le planning calculé en colonnes binaires .npy (voir snapshot.py)
+        Rechargement quasi instantané avec load_snapshot, sans recalcul.
+        """
+        from .snapshot import save_snapshot
+
+        return save_snapshot(self, path)
+
+    @classmethod
+    def load_snapshot(cls, path, mmap=True):
+        """
+        Planificateur sur un instantané projeté en mémoire
+        Dates, flottements et chemin critique sont ceux de l'instantané ; les
+        durées restent modifiables (update_duration puis reschedule) sans
+        modifier les fichiers.
+        """
+        from datetime import date
+        from .snapshot import load_snapshot
+
+        store, meta, critical_path = load_snapshot(path, mmap)
+        scheduler = cls.from_store(store)
+        scheduler.project_duration = meta['project_duration']
+        if meta['start_date']:
+            scheduler.start_date = date.fromisoformat(meta['start_date'])
+        scheduler.critical_path = [store.view(v) for v in critical_path.tolist()]
+        return scheduler
+
+    def save_to_database(self, connection, to_date=None):
+        """
+        Écrit les résultats CPM dans la table tasks en un seul UPDATE groupé
+        (voir db_loader.save_schedule) ; l'appelant valide la transaction.
+        """
+        from .db_loader import save_schedule
+
+        return save_schedule(connection, self, to_date)
+        
+    def add_task(self, task):
+        """Ajoute une tâche au projet"""
+        if self._store is not None:
+            raise TypeError("Planificateur compact : reconstruire le TaskStore pour ajouter une tâche")
+        self.tasks[task.id] = task
+        self._graph = None
+        self._compiled.clear()
+        self._topo = None
+        self._reach = None
+        self._redundant = None
+
+    def set_hierarchy(self, parents):
+        """
+        Structure le projet en WBS (voir wbs.py)
+
+        Les tâches ayant des enfants deviennent récapitulatives : elles sont
+        retirées du réseau (self.wbs.summaries) et remplacées par des jalons de
+        début et de fin qui portent leurs dépendances ; leurs dates et
+        flottements sont agrégés depuis leurs enfants après chaque calcul.
+        Les jalons restent internes : chemin critique, export CSV, affichage et
+        ensemble des tâches modifiées n'exposent que les tâches et les tâches
+        récapitulatives, qui restent adressables par leur identifiant
+        (add_dependency, remove_dependency).
+
+        Args:
+            parents: {task_id: parent_task_id} (voir db_loader.load_hierarchy)
+        Returns:
+            wbs.WorkBreakdown
+        """
+        from .wbs import WorkBreakdown, expand_summary_links
+
+        if self._store is not None:
+            raise TypeError("Planificateur compact : la hiérarchie WBS nécessite des objets Task")
+        wbs = WorkBreakdown(parents)
+        expand_summary_links(self.tasks, wbs)
+        self.wbs = wbs
+        self._graph = None
+        self._compiled.clear()
+        self._topo = None
+        self._reach = None
+        self._redundant = None
+        return wbs
+
+    def _rollup(self, changed=None):
+        """
+        Agrège les tâches récapitulatives (toutes, ou les ancêtres des tâches `changed`)
+        Retourne les identifiants des tâches récapitulatives mises à jour.
+        """
+        if self.wbs is None:
+            return []
+        if changed is None:
+            self.wbs.rollup(self.tasks)
+            return list(self.wbs.summaries)
+        return self.wbs.update(self.tasks, changed)
+
+    def _visible_task(self, task_id):
+        """Tâche ou tâche récapitulative (identifiants retournés par reschedule)"""
+        if self.wbs is not None and task_id in self.wbs.summaries:
+            return self.wbs.summaries[task_id]
+        return self.tasks[task_id]
+
+    def _visible_tasks(self):
+        """Tâches affichées et exportées : sans les jalons internes du WBS, tâches récapitulatives comprises"""
+        if self.wbs is None:
+            return self.tasks.values()
+        return list(self.wbs.visible(self.tasks))
+        
+    def compile(self, reduce=None):
+        """
+        Compile les tâches en graphe à tableaux plats (voir cpm_engine)
+        Le graphe compilé est conservé pour le passage arrière, et réutilisé
+        (durées relues sur les tâches) tant qu'aucun lien ni aucune tâche n'a
+        été ajouté ou retiré. Lève CycleError / GraphValidationError si le graphe
+        n'est pas planifiable ; les avertissements (liens en double, tâches
+        isolées) ne sont recherchés que par validate().
+
+        Args:
+            reduce: Retire les liens redondants (voir reduction.py) ; par défaut
+                self.reduce_dependencies. Les tâches gardent tous leurs liens et
+                les dates calculées sont identiques ; les liens redondants ne sont
+                recherchés qu'une fois tant que la structure du réseau ne change pas.
+                Le graphe complet est conservé si moins de reduction.MIN_GAIN des
+                liens sont redondants (graph.removed_edges reste alors à 0).
+        """
+        from array import array
+        from .cpm_engine import CompiledGraph, collect_columns
+
+        if self._store is not None:
+            self._graph = self._store  # Le stockage compact est déjà un graphe compilé
+            return self._graph
+        if reduce is None:
+            reduce = self.reduce_dependencies
+        key = (Task._links_version, len(self.tasks))
+        cached = self._compiled.get(reduce)
+        if cached is not None and cached[0] == key:
+            self._graph = cached[1]
+            self._graph.durations = array('d', [task.duration for task in self.tasks.values()])
+            return self._graph
+        if not reduce:
+            graph = CompiledGraph.from_columns(*collect_columns(self.tasks.values()), check=False)
+        else:
+            from .reduction import MIN_GAIN, without_edges
+
+            columns = collect_columns(self.tasks.values())
+            redundant, kept = self._redundant_edges(columns)
+            if len(redundant) < MIN_GAIN * len(columns[2]):  # Gain trop faible : graphe complet
+                graph = CompiledGraph.from_columns(*columns, check=False)
+            else:
+                graph = CompiledGraph.from_columns(*without_edges(columns, kept), check=False)
+                graph.removed_edges = len(redundant)
+        self._compiled[reduce] = (key, graph)
+        self._graph = graph
+        return graph
+
+    def _redundant_edges(self, columns=None):
+        """(liens redondants, masque des liens conservés dans l'ordre de collect_columns)"""
+        from .cpm_engine import CompiledGraph, collect_columns
+        from .reduction import kept_edges, redundant_edges
+
+        if self._redundant is None:
+            if self._store is not None:
+                self._redundant = (redundant_edges(self._store), None)
+            else:
+                columns = columns or collect_columns(self.tasks.values())
+                redundant = redundant_edges(CompiledGraph.from_columns(*columns))
+                self._redundant = (redundant, kept_edges(columns, redundant))
+        return self._redundant
+
+    def redundant_dependencies(self):
+        """
+        Liens impliqués par d'autres chemins du réseau (type et lag compris) :
+        liste de (prédécesseur, tâche, type, lag), voir reduction.py
+        """
+        from .cpm_engine import DEPENDENCY_NAMES
+
+        redundant, _ = self._redundant_edges()
+        ids = list(self.tasks)
+        return [(ids[u], ids[v], DEPENDENCY_NAMES[code], lag) for u, v, code, lag in redundant]
+
+    def print_redundant_dependencies(self, limit=20):
+        """Affiche les liens redondants (voir redundant_dependencies)"""
+        redundant = self.redundant_dependencies()
+        total = sum(len(task.predecessors) for task in self.tasks.values())
+        print(f"\n=== LIENS REDONDANTS ({len(redundant)} sur {total}) ===")
+        for pred_id, task_id, dep_type, lag in redundant[:limit]:
+            print(f"  {pred_id} --[{dep_type}{lag:+g}]--> {task_id}")
+        if len(redundant) > limit:
+            print(f"  ... et {len(redundant) - limit} autres")
+
+    def validate(self):
+        """
+        Valide le graphe de dépendances sans lever d'exception
+        Retourne un validation.ValidationReport (cycles, prédécesseurs absents,
+        types inconnus, liens en double, tâches isolées).
+        """
+        from .validation import GraphValidationError
+
+        try:
+            return self.compile(reduce=False).check()
+        except GraphValidationError as error:
+            self._graph = None
+            return error.report
+    
+    def print_validation(self):
+        """Affiche le diagnostic du graphe de dépendances"""
+        report = self.validate()
+        print("\n=== VALIDATION DU GRAPHE ===")
+        lines = report.format()
+        for line in lines:
+            print(line)
+        if not lines:
+            print("Aucun problème détecté")
+        return report
+
+    def forward_pass(self):
+        """
+        Calcul du passage avant (Forward Pass)
+        Détermine ES (Earliest Start) et EF (Earliest Finish) pour chaque tâche
+        Parcours itératif dans l'ordre topologique du graphe compilé
+        """
+        from .incremental import TopologicalOrder
+
+        graph = self.compile()
+        self.project_duration = graph.forward_pass()
+        self._topo = TopologicalOrder(graph.ids, graph.order)
+        self._dirty_forward.clear()
+        self._dirty_backward.clear()
+        if graph is self._store:
+            return
+
+        for task, es, ef in zip(self.tasks.values(), graph.earliest_start, graph.earliest_finish):
+            task.earliest_start = es
+            task.earliest_finish = ef
+    
+    def backward_pass(self):
+        """
+        Calcul du passage arrière (Backward Pass)
+        Détermine LS (Latest Start) et LF (Latest Finish) pour chaque tâche
+        Parcours itératif dans l'ordre topologique inverse du graphe compilé
+        """
+        graph = self._graph if self._graph is not None else self.compile()
+        graph.backward_pass(self.project_duration)
+        if graph is self._store:
+            return
+
+        for task, ls, lf in zip(self.tasks.values(), graph.latest_start, graph.latest_finish):
+            task.latest_start = ls
+            task.latest_finish = lf
+    
+    def calculate_float(self):
+        """
+        Calcul du flottement (Float/Slack)
+        - Flottement total : retard possible sans impacter le projet
+        - Flottement libre : retard possible sans impacter les successeurs
+        """
+        if self._store is not None:
+            self._store.calculate_float(self.project_duration)
+            return
+        graph = self._graph
+        if graph is None:  # Dates modifiées hors du graphe compilé (replanification incrémentale)
+            for task in self.tasks.values():
+                self._update_float(task)
+            return
+        # Mêmes formules sur les tableaux du graphe : les liens redondants
+        # retirés (voir reduction.py) ne fixent jamais le flottement libre
+        graph.calculate_float(self.project_duration)
+        for task, total, free, critical in zip(self.tasks.values(), graph.total_float,
+                                               graph.free_float, graph.critical):
+            task.total_float = total
+            task.free_float = free
+            task.is_critical = bool(critical)
+
+    def _update_float(self, task):
+        """Calcule les flottements et l'état critique d'une tâche"""
+        # Flottement total
+        task.total_float = task.latest_start - task.earliest_start
+        
+        # Flottement libre
+        if not task.successors:
+            task.free_float = self.project_duration - task.earliest_finish
+        else:
+            min_successor_es = float('inf')
+            for succ_task, dep_type, lag in task.successors:
+                if dep_type == 'FS':
+                    successor_constraint = succ_task.earliest_start - lag
+                elif dep_type == 'SS':
+                    successor_constraint = succ_task.earliest_start - lag + task.duration
+                elif dep_type == 'FF':
+                    successor_constraint = succ_task.earliest_finish - lag - task.duration + task.duration
+                elif dep_type == 'SF':
+                    successor_constraint = succ_task.earliest_finish - lag - task.duration + task.duration
+                else:
+                    successor_constraint = succ_task.earliest_start - lag
+                
+                min_successor_es = min(min_successor_es, successor_constraint)
+            
+            task.free_float = min_successor_es - task.earliest_finish
+            task.free_float = max(0, task.free_float)
+        
+        # Tâche critique si flottement total = 0
+        task.is_critical = (abs(task.total_float) < 0.001)  # tolérance pour les flottants
+    
+    def find_critical_path(self, origin=0):
+        """
+        Identifie le chemin critique
+        Chaîne de tâches reliées par des liens pilotants (marge nulle) allant du
+        début (ou de la date d'état `origin`) à la fin du projet ; voir
+        critical_paths() pour toutes les chaînes critiques lorsque plusieurs
+        branches sont critiques.
+        """
+        from .critical_paths import driving_critical_path
+
+        path = driving_critical_path(self.tasks.values(), origin, self.project_duration)
+        if self.wbs is not None:
+            path = [task for task in path if not self.wbs.is_milestone(task.id)]
+        self.critical_path = path
+        return self.critical_path
+    
+    # --- Analyse des chemins (voir critical_paths) ---
+    
+    def _path_analysis(self):
+        """Marges des liens et des chemins calculées sur les dates actuelles des tâches"""
+        from array import array
+        from .critical_paths import PathAnalysis
+
+        if self._topo is None or self._dirty_forward or self._dirty_backward:
+            self.reschedule()
+        graph = self._graph
+        if graph is None or graph.removed_edges:  # Marges de tous les liens affichés
+            graph = self.compile(reduce=False)
+            if graph is not self._store:
+                graph.earliest_start = array('d', (task.earliest_start for task in self.tasks.values()))
+                graph.earliest_finish = array('d', (task.earliest_finish for task in self.tasks.values()))
+        return PathAnalysis(graph, self.project_duration)
+    
+    def edge_slacks(self):
+        """
+        Marge de chaque dépendance : liste de (prédécesseur, successeur, type, lag, marge)
+        Une marge nulle signifie que le lien fixe la date du successeur (lien pilotant).
+        """
+        from .cpm_engine import DEPENDENCY_NAMES
+
+        analysis = self._path_analysis()
+        graph = analysis.graph
+        ids = graph.ids
+        ptr = graph.succ_ptr
+        return [(ids[u], ids[graph.succ_idx[k]], DEPENDENCY_NAMES[graph.succ_type[k]], graph.succ_lag[k],
+                 analysis.slack[k])
+                for u in range(len(ids)) for k in range(ptr[u], ptr[u + 1])]
+    
+    def critical_subgraph(self, max_float=0):
+        """
+        Sous-graphe des chaînes critiques (ou quasi critiques si max_float > 0)
+        Returns:
+            (identifiants des tâches, liens (prédécesseur, successeur, type, lag))
+        """
+        from .cpm_engine import DEPENDENCY_NAMES
+
+        analysis = self._path_analysis()
+        graph = analysis.graph
+        nodes, edges = analysis.subgraph(max_float)
+        return ([graph.ids[v] for v in nodes],
+                [(graph.ids[u], graph.ids[w], DEPENDENCY_NAMES[graph.succ_type[k]], graph.succ_lag[k])
+                 for u, w, k in edges])
+    
+    def critical_paths(self, k=10, max_float=None):
+        """
+        Chemins du réseau par marge croissante : les k plus longs, ou tous ceux
+        dont la marge ne dépasse pas max_float (chemins quasi critiques)
+        
+        Returns:
+            Liste de (marge, [tâches du chemin]) ; marge 0 = chaîne critique
+        """
+        analysis = self._path_analysis()
+        tasks = list(self.tasks.values())
+        return [(path_float, [tasks[v] for v in path])
+                for path_float, path in analysis.paths(max_float, k)]
+    
+    def print_critical_paths(self, paths):
+        """Affiche des chemins retournés par critical_paths()"""
+        print(f"\n=== CHEMINS LES PLUS LONGS ({len(paths)}) ===")
+        for path_float, path in paths:
+            label = "critique" if path_float < 0.001 else f"marge {path_float:.1f} j"
+            print(f"[{label}] " + " → ".join(task.name for task in path))
+
+    # --- Analyse d'impact (voir reachability) ---
+
+    def reachability(self):
+        """
+        Index d'accessibilité du réseau (reachability.ReachabilityIndex)
+        Construit au premier appel puis tenu à jour par add_dependency /
+        remove_dependency ; l'ajout d'une tâche ou d'une hiérarchie le réinitialise.
+        """
+        from .reachability import ReachabilityIndex
+
+        if self._reach is None:
+            graph = self._graph
+            if graph is None or graph.removed_edges:  # Tous les liens : remove_dependency les retire un à un
+                graph = self.compile(reduce=False)
+            self._reach = ReachabilityIndex.from_graph(graph)
+        return self._reach
+
+    def depends_on(self, task_id, other_id):
+        """Vrai si task_id dépend, directement ou par une chaîne de liens, de other_id"""
+        return task_id != other_id and self.reachability().reaches(other_id, task_id)
+
+    def downstream(self, task_id):
+        """Identifiants des tâches touchées par un glissement de task_id (tous ses descendants)"""
+        return self.reachability().descendants(task_id)
+
+    def print_impact(self, task_id):
+        """Affiche les tâches, jalons et tâches critiques en aval d'une tâche"""
+        affected = self.downstream(task_id)
+        tasks = [task for task in self.tasks.values() if task.id in affected]
+        milestones = [task for task in tasks if task.duration == 0]
+        critical = [task for task in tasks if task.is_critical]
+        print(f"\n=== IMPACT D'UN GLISSEMENT DE {task_id} ({self.tasks[task_id].name}) ===")
+        print(f"Tâches en aval: {len(tasks)} (dont {len(critical)} critiques)")
+        for task in milestones:
+            print(f"  Jalon {task.id}: {task.name}")
+    
+    def schedule_project(self):
+        """
+        Lance le calcul complet du planning
+        Exécute toutes les étapes de l'algorithme PERT/CPM ; aucun affichage
+        par défaut (voir instrumentation.ConsoleInstrumentation)
+        """
+        self._run_phase('forward_pass', self.forward_pass, 1)
+        self._run_phase('backward_pass', self.backward_pass, 2)
+        self._run_phase('calculate_float', self.calculate_float, 3)
+        self._run_phase('find_critical_path', self.find_critical_path, 4)
+        self._rollup()
+        if self.instrumentation.enabled:
+            self.instrumentation.schedule_finished(self)
+    
+    # --- Instrumentation (voir instrumentation.py) ---
+    
+    def instrumented(self, hooks=None):
+        """
+        Context manager activant une instrumentation le temps d'un bloc
+        (par défaut un instrumentation.PhaseRecorder, retourné par le with)
+        """
+        from .instrumentation import instrumented
+
+        return instrumented(self, hooks)
+    
+    def _run_phase(self, phase, run, step=None):
+        """Exécute une phase du calcul, mesurée uniquement si une instrumentation est active"""
+        hooks = self.instrumentation
+        if not hooks.enabled:
+            return run()
+        from time import perf_counter, process_time
+        from .instrumentation import PhaseStats
+
+        hooks.phase_started(phase, step, self)
+        wall, cpu = perf_counter(), process_time()
+        result = run()
+        wall, cpu = perf_counter() - wall, process_time() - cpu
+        hooks.phase_finished(PhaseStats(phase, step, wall, cpu, *self._phase_counters(phase, result)), self)
+        return result
+    
+    def _phase_counters(self, phase, result):
+        """(tâches, liens, relaxations) parcourus par une phase ; None si sans objet"""
+        graph = self._graph
+        if phase == 'forward_pass':
+            return len(graph), graph.edge_count, graph.forward_relaxations
+        if phase == 'backward_pass':
+            return len(graph), graph.edge_count, graph.backward_relaxations
+        if phase == 'calculate_float':
+            edges = graph.edge_count if graph is not None else \
+                sum(len(task.successors) for task in self.tasks.values())
+            return len(self.tasks), edges, None
+        if phase == 'find_critical_path':
+            return len(self.critical_path), None, None
+        if phase == 'reschedule':
+            return len(result), None, None
+        if phase == 'schedule_from_status':
+            return result, None, None
+        return len(self.tasks), None, None
+    
+    # --- Calcul parallèle (voir portfolio.py) ---
+    
+    def pack(self):
+        """
+        Forme compacte et picklable du projet, envoyée aux processus de calcul :
+        le stockage compact lui-même, sinon les colonnes de CompiledGraph.from_columns
+        """
+        from .cpm_engine import collect_columns
+
+        if self._store is not None:
+            return self._store
+        return collect_columns(self.tasks.values())
+    
+    def apply_results(self, project_duration, columns, order, origin=0):
+        """
+        Applique les résultats d'un calcul fait hors du planificateur
+        (colonnes portfolio.RESULT_COLUMNS, dans l'ordre des tâches) puis
+        identifie le chemin critique (depuis `origin`, voir find_critical_path).
+        """
+        from .incremental import TopologicalOrder
+
+        self.project_duration = project_duration
+        self._graph = None
+        ids = list(self.tasks)
+        self._topo = TopologicalOrder(ids, order)
+        self._dirty_forward.clear()
+        self._dirty_backward.clear()
+        if self._store is not None:
+            store = self._store
+            (store.earliest_start, store.earliest_finish, store.latest_start, store.latest_finish,
+             store.total_float, store.free_float, store.critical) = columns
+        else:
+            for task, es, ef, ls, lf, tf, ff, critical in zip(self.tasks.values(), *columns):
+                task.earliest_start = es
+                task.earliest_finish = ef
+                task.latest_start = ls
+                task.latest_finish = lf
+                task.total_float = tf
+                task.free_float = ff
+                task.is_critical = bool(critical)
+        self.find_critical_path(origin)
+        self._rollup()
+    
+    def schedule_parallel(self, workers=None):
+        """
+        Calcule le planning en répartissant les sous-réseaux indépendants
+        (composantes faiblement connexes) sur plusieurs processus
+        Résultats identiques à schedule_project ; retourne le nombre de composantes.
+        """
+        from .portfolio import schedule_components
+
+        return self._run_phase('schedule_parallel', lambda: schedule_components(self, workers))
+    
+    def schedule_cached(self, cache=None, components=False):
+        """
+        Calcule le planning en réutilisant les résultats d'un graphe identique
+        déjà calculé (voir result_cache.ScheduleCache ; cache partagé du processus
+        par défaut). Avec components=True, la réutilisation se fait par
+        composante faiblement connexe.
+
+        Returns:
+            True si tout venait du cache (components=False), sinon le nombre
+            de composantes recalculées
+        """
+        from .result_cache import DEFAULT_CACHE
+
+        cache = cache if cache is not None else DEFAULT_CACHE
+        if components:
+            return self._run_phase('schedule_cached', lambda: cache.schedule_components(self)[1])
+        return self._run_phase('schedule_cached', lambda: cache.schedule(self))
+    
+    def schedule_from_status(self, status_date, progress=None):
+        """
+        Replanifie le projet à la date d'état à partir de l'avancement réel
+
+        Les tâches terminées sont figées sur leurs dates réelles, les tâches en
+        cours ne gardent que leur durée restante (durée x (1 - % d'avancement))
+        et aucune tâche ne commence avant la date d'état ; seules les tâches non
+        terminées sont recalculées (voir status_date.schedule_at_status).
+        Les dates réelles sont converties avec self.calendar, sinon en jours
+        calendaires depuis self.start_date.
+
+        Args:
+            status_date: Date d'état (date ou décalage en jours)
+            progress: {task_id: status_date.TaskProgress} (voir db_loader.load_progress) ;
+                      par défaut actual_start / actual_finish / percent_complete des tâches
+        Returns:
+            Nombre de tâches recalculées
+        """
+        from .status_date import reschedule_from_status
+
+        return self._run_phase('schedule_from_status',
+                               lambda: reschedule_from_status(self, status_date, progress))
+
+    # --- Replanification incrémentale ---
+    
+    def update_duration(self, task_id, duration):
+        """
+        Modifie la durée d'une tâche sans recalculer le planning
+        Appeler reschedule() pour propager la modification. La durée d'une tâche
+        récapitulative est agrégée depuis ses enfants (TypeError).
+        """
+        if self.wbs is not None and task_id in self.wbs.summaries:
+            raise TypeError(f"Tâche récapitulative {task_id} : durée agrégée depuis ses enfants")
+        task = self.tasks[task_id]
+        task.duration = duration
+        self._graph = None
+        self._dirty_forward.add(task_id)
+        self._dirty_backward.add(task_id)
+    
+    def add_dependency(self, task_id, predecessor_id, dependency_type='FS', lag=0):
+        """
+        Ajoute une dépendance entre deux tâches du projet (voir Task.add_dependency)
+        Une dépendance créant un cycle lève CycleError sans rien modifier : l'ordre
+        topologique maintenu (projet déjà planifié) ou l'index d'accessibilité,
+        construit au besoin, est mis à jour localement. Un lien vers une tâche
+        récapitulative est porté par son jalon de début ou de fin (voir
+        wbs.WorkBreakdown.link_endpoint) ; un lien entre une tâche et l'un de
+        ses ancêtres lève ValueError.
+        """
+        if self._store is not None:
+            raise TypeError("Planificateur compact : reconstruire le TaskStore pour ajouter une dépendance")
+        if self.wbs is not None and self.wbs.summaries:
+            if task_id != predecessor_id and self._links_ancestor(task_id, predecessor_id):
+                raise ValueError(f"Lien {predecessor_id} -> {task_id} entre une tâche et son ancêtre WBS")
+            task_id = self.wbs.link_endpoint(task_id, dependency_type)
+            predecessor_id = self.wbs.link_endpoint(predecessor_id, dependency_type, predecessor=True)
+        task, predecessor = self.tasks[task_id], self.tasks[predecessor_id]
+        if self._reach is None and self._topo is None:
+            self.reachability()  # Aucun ordre maintenu : l'index sert de contrôle de cycle
+        if self._reach is not None:
+            self._reach.add_edge(predecessor_id, task_id)
+        if self._topo is not None:
+            self._topo.insert_edge(self.tasks, predecessor_id, task_id)
+        task.add_dependency(predecessor, dependency_type, lag)
+        self._graph = None
+        self._compiled.clear()
+        self._redundant = None
+        self._dirty_forward.add(task_id)
+        self._dirty_backward.add(predecessor_id)
+    
+    def remove_dependency(self, task_id, predecessor_id, dependency_type=None, lag=None):
+        """
+        Supprime une dépendance entre deux tâches du projet (voir Task.remove_dependency)
+        Les tâches récapitulatives sont désignées par leur identifiant, comme
+        pour add_dependency. Retourne le nombre de liens supprimés.
+        """
+        wbs = self.wbs
+        if wbs is not None and (task_id in wbs.milestones or predecessor_id in wbs.milestones):
+            if self._links_ancestor(task_id, predecessor_id):
+                return 0  # Liens de structure : non modifiables
+            types = (dependency_type,) if dependency_type is not None else ('FS', 'SS', 'FF', 'SF')
+            pairs = {(wbs.link_endpoint(task_id, t), wbs.link_endpoint(predecessor_id, t, predecessor=True))
+                     for t in types}
+            return sum(self._remove_dependency(succ_id, pred_id, dependency_type, lag)
+                       for succ_id, pred_id in pairs)
+        return self._remove_dependency(task_id, predecessor_id, dependency_type, lag)
+
+    def _links_ancestor(self, task_id, predecessor_id):
+        """Vrai si l'une des deux tâches contient l'autre dans le WBS"""
+        return self.wbs.contains(task_id, predecessor_id) or self.wbs.contains(predecessor_id, task_id)
+
+    def _remove_dependency(self, task_id, predecessor_id, dependency_type, lag):
+        task, predecessor = self.tasks[task_id], self.tasks[predecessor_id]
+        removed = task.remove_dependency(predecessor, dependency_type, lag)
+        if removed:
+            if self._reach is not None:
+                self._reach.remove_edge(predecessor_id, task_id, removed)
+            self._graph = None
+            self._compiled.clear()
+            self._redundant = None
+            self._dirty_forward.add(task_id)
+            self._dirty_backward.add(predecessor_id)
+        return removed
+    
+    def reschedule(self):
+        """
+        Recalcule uniquement la partie du planning touchée par les modifications
+        faites via update_duration / add_dependency / remove_dependency.
+        
+        Le passage avant se propage vers les successeurs et le passage arrière
+        vers les prédécesseurs, en s'arrêtant dès que les dates ne changent plus.
+        Sans planification préalable, un calcul complet est effectué et toutes
+        les tâches sont considérées comme modifiées.
+        
+        Returns:
+            Ensemble des identifiants des tâches dont les dates ont changé (tâches
+            récapitulatives réagrégées comprises, sans les jalons internes du WBS)
+        """
+        return self._run_phase('reschedule', self._reschedule)
+    
+    def _reschedule(self):
+        from .incremental import propagate_forward, propagate_backward, full_backward
+
+        if self._topo is None:
+            self.forward_pass()
+            self.backward_pass()
+            self.calculate_float()
+            self.find_critical_path()
+            return self._public_ids(set(self.tasks), self._rollup())
+
+        forward_seeds, backward_seeds = self._dirty_forward, self._dirty_backward
+        self._dirty_forward, self._dirty_backward = set(), set()
+        if not forward_seeds and not backward_seeds:
+            return set()
+
+        previous_duration = self.project_duration
+        previous_finish = propagate_forward(self.tasks, self._topo, forward_seeds)
+        if any(finish == previous_duration for finish in previous_finish.values()):
+            # Une tâche qui fixait la fin du projet a bougé : nouveau maximum global
+            self.project_duration = max((task.earliest_finish for task in self.tasks.values()), default=0)
+        else:
+            self.project_duration = max([previous_duration] +
+                                        [self.tasks[task_id].earliest_finish for task_id in previous_finish])
+        changed = set(previous_finish)
+
+        if self.project_duration != previous_duration:
+            # Toutes les dates au plus tard dépendent de la fin du projet
+            changed |= full_backward(self.tasks, self._topo, self.project_duration)
+            self.calculate_float()
+            touched = None
+        else:
+            changed |= propagate_backward(self.tasks, self._topo, backward_seeds, self.project_duration)
+            # Les flottements libres dépendent aussi des dates des successeurs
+            touched = changed | forward_seeds | backward_seeds
+            for task_id in list(touched):
+                task = self.tasks[task_id]
+                self._update_float(task)
+                for pred_task, _, _ in task.predecessors:
+                    self._update_float(pred_task)
+                    touched.add(pred_task.id)
+
+        self.find_critical_path()
+        return self._public_ids(changed, self._rollup(touched))
+
+    def _public_ids(self, changed, summaries):
+        """Tâches modifiées sans les jalons internes, tâches récapitulatives `summaries` ajoutées"""
+        if self.wbs is None:
+            return changed
+        return {task_id for task_id in changed if not self.wbs.is_milestone(task_id)} | set(summaries)
+    
+    def simulate(self, n_iterations=10000, seed=None, distribution='pert', workers=None, calendar=None):
+        """
+        Simulation Monte Carlo du risque planning (nécessite NumPy)
+        
+        Les durées sont tirées selon une loi Beta-PERT ('pert') ou triangulaire
+        ('triangular') à partir des estimations optimiste / probable / pessimiste ;
+        les tâches à durée fixe restent constantes.
+
+        Coût : environ 0,15 µs par tâche et par itération en un seul processus
+        (5 000 tâches x 10 000 itérations : 7 s, dont 60 % pour le tirage des
+        lois Beta) ; 100 000 itérations prennent donc plus d'une minute sur un
+        tel réseau. Répartir les lots avec `workers` (résultat identique pour
+        une même graine) ou utiliser completion_distribution() pour une
+        estimation en un seul passage.
+        
+        Args:
+            n_iterations: Nombre d'itérations
+            seed: Graine aléatoire (résultats reproductibles)
+            distribution: 'pert' ou 'triangular'
+            workers: Nombre de processus ; None ou 1 pour un calcul local
+            calendar: WorkCalendar pour les dates P50/P80/P95 (self.calendar par défaut)
+        
+        Returns:
+            monte_carlo.SimulationResult (P50/P80/P95, criticité, sensibilité)
+        """
+        from .monte_carlo import SimulationModel, run_simulation
+
+        graph = self.compile()
+        model = SimulationModel(graph, self.tasks.values())
+        return run_simulation(model, n_iterations, seed, distribution, workers, calendar or self.calendar)
+    
+    def print_simulation(self, result, top=5):
+        """Affiche la synthèse d'une simulation Monte Carlo"""
+        print(f"\n=== SIMULATION MONTE CARLO ({result.iterations} itérations) ===")
+        print(f"Durée moyenne: {result.mean:.1f} jours (écart-type {result.std:.1f})")
+        for p, value in result.percentiles.items():
+            finish = f" (fin le {result.dates[p]})" if p in result.dates else ""
+            print(f"P{p}: {value:.1f} jours{finish}")
+        print("Tâches les plus critiques:")
+        ranked = sorted(result.criticality.items(), key=lambda item: -item[1])[:top]
+        for task_id, index in ranked:
+            print(f"  - {self.tasks[task_id].name:<25} criticité {index * 100:5.1f}% "
+                  f"sensibilité {result.sensitivity[task_id]:+.2f}")
+    
+    def completion_distribution(self, sources=None, calendar=None):
+        """
+        Loi de la durée du projet en un seul passage (approximation de Clark)
+
+        Alternative rapide à simulate() : moyennes PERT et variances
+        (get_variance) sont propagées dans le réseau, les corrélations entre
+        chemins étant suivies sur les `sources` tâches les plus influentes
+        (0 = méthode de Sculli, dates indépendantes). Compter environ 7 fois
+        schedule_project() avec 16 sources, 4 fois avec sources=0 (voir analytic_risk).
+
+        Returns:
+            analytic_risk.CompletionDistribution (P50/P80/P95, probabilité
+            d'achèvement à une échéance, criticité)
+        """
+        import math
+        from .analytic_risk import MAX_SOURCES, completion_distribution
+
+        graph = self.compile()
+        deviations = [math.sqrt(task.get_variance()) for task in self.tasks.values()]
+        return completion_distribution(graph, deviations, MAX_SOURCES if sources is None else sources,
+                                       calendar or self.calendar)
+
+    def print_completion(self, result, deadlines=(), top=5):
+        """Affiche la loi analytique de la durée du projet"""
+        print("\n=== PROBABILITÉ D'ACHÈVEMENT (CLARK) ===")
+        print(f"Durée moyenne: {result.mean:.1f} jours (écart-type {result.std:.1f})")
+        for p, value in result.percentiles.items():
+            print(f"P{p}: {value:.1f} jours")
+        for deadline in deadlines:
+            print(f"Fin au plus tard à {deadline}: {result.probability_of_completion(deadline) * 100:.1f}%")
+        print("Tâches les plus critiques:")
+        ranked = sorted(result.criticality.items(), key=lambda item: -item[1])[:top]
+        for task_id, index in ranked:
+            print(f"  - {self.tasks[task_id].name:<25} criticité {index * 100:5.1f}%")
+
+    def level_resources(self, capacities=None, demands=None, rule='total_float', method='serial'):
+        """
+        Nivellement des ressources à partir du planning CPM (voir resource_leveling)
+        
+        Les tâches sont décalées pour ne jamais dépasser la capacité journalière
+        des ressources ; les dates CPM (ES/LS...) ne sont pas modifiées.
+        
+        Args:
+            capacities: {resource_id: capacité par jour} (1 par défaut)
+            demands: {task_id: [(resource_id, unités)]} ; par défaut AdvancedTask.resources
+                     (voir db_loader.load_resources pour les tables resources / resource_allocations)
+            rule: Règle de priorité ('total_float', 'latest_finish', 'latest_start',
+                  'earliest_start', 'shortest') ou fonction tâche -> clé
+            method: 'serial' ou 'parallel'
+        
+        Returns:
+            resource_leveling.LevelingResult
+        """
+        from .resource_leveling import level
+
+        if self._topo is None or self._dirty_forward or self._dirty_backward:
+            self.reschedule()
+        return level(self.compile(), self.tasks.values(), capacities, demands, rule, method)
+    
+    def print_leveling(self, result, top=10):
+        """Affiche la synthèse d'un nivellement des ressources"""
+        print(f"\n=== NIVELLEMENT DES RESSOURCES ({result.method}, règle {result.rule}) ===")
+        print(f"Durée CPM: {self.project_duration:.1f} jours - durée nivelée: {result.project_duration:.1f} jours")
+        print(f"Tâches décalées: {len(result.delays)}")
+        ranked = sorted(result.delays.items(), key=lambda item: -item[1])[:top]
+        for task_id, delay in ranked:
+            print(f"  - {self.tasks[task_id].name:<25} +{delay:.1f} jours "
+                  f"(début {result.start[task_id]:.1f})")
+
+    def load_profile(self, capacities=None, demands=None, starts=None, calendar=None):
+        """
+        Charge journalière de chaque ressource sur le planning (voir load_profile)
+
+        Args:
+            capacities, demands: Comme level_resources (voir db_loader.load_resources)
+            starts: {task_id: début} d'un planning nivelé (LevelingResult.start) ; ES sinon
+            calendar: Calendrier des jours (self.calendar par défaut) pour
+                      l'agrégation par semaine ou par mois
+
+        Returns:
+            load_profile.LoadProfile (surcharges, agrégats, carte de charge)
+        """
+        from .load_profile import load_profile
+
+        if self._topo is None or self._dirty_forward or self._dirty_backward:
+            self.reschedule()
+        return load_profile(self.tasks.values(), capacities, demands, starts, calendar or self.calendar)
+
+    def print_load(self, profile, top=10):
+        """Affiche les périodes de surcharge d'un profil de charge"""
+        overallocations = profile.overallocations()
+        print(f"\n=== CHARGE DES RESSOURCES ({len(profile.resources)} ressources, "
+              f"{profile.horizon} jours) ===")
+        print(f"Ressources surchargées: {len(overallocations)}")
+        periods = [(resource, *period) for resource, runs in overallocations.items() for period in runs]
+        for resource, first, last, peak in sorted(periods, key=lambda item: -item[3])[:top]:
+            print(f"  - {resource!s:<25} jours {first}-{last}: pic {peak:.2f}")
+
+    def time_cost_curve(self, costs, limits=None, target=None):
+        """
+        Courbe durée-coût exacte de la compression du projet (voir crashing)
+
+        Args:
+            costs: {task_id: coût d'un jour de compression} ; une tâche absente
+                   est incompressible (voir db_loader.load_crash_costs)
+            limits: {task_id: durée minimale} ; par défaut optimistic_time
+            target: Durée cible ; le calcul s'arrête dès qu'elle est atteinte
+
+        Returns:
+            crashing.CrashCurve
+        """
+        from .crashing import time_cost_curve
+
+        limits = limits or {}
+        graph = self.compile()
+        slopes, minimums = [], []
+        for task_id, task in zip(graph.ids, self.tasks.values()):
+            limit = limits.get(task_id, getattr(task, 'optimistic_time', None))
+            cost = costs.get(task_id)
+            slopes.append(cost if cost is not None else 0.0)
+            minimums.append(limit if cost is not None and limit is not None else task.duration)
+        return time_cost_curve(graph, slopes, minimums, target)
+
+    def crash(self, target, costs, limits=None):
+        """
+        Comprime le projet au moindre coût pour finir en `target` jours et le replanifie
+
+        Returns:
+            (surcoût, {task_id: nouvelle durée})
+
+        Raises:
+            ValueError: si la durée cible est inatteignable
+        """
+        curve = self.time_cost_curve(costs, limits, target)
+        durations = curve.durations(target)
+        for task_id, duration in durations.items():
+            self.update_duration(task_id, duration)
+        self.schedule_project()
+        return curve.cost(target), durations
+
+    def print_time_cost_curve(self, curve):
+        """Affiche les sommets de la courbe durée-coût"""
+        print("\n=== COURBE DURÉE-COÛT (COMPRESSION) ===")
+        print(f"{'Durée':<8} {'Surcoût':<12} {'Coût/jour':<10} Tâches modifiées")
+        print("-" * 70)
+        print(f"{curve.normal_duration:<8.1f} {0:<12.0f} {'-':<10} planning normal")
+        for segment in curve.segments:
+            gained = segment.start_duration - segment.end_duration
+            slope = (segment.end_cost - segment.start_cost) / gained
+            changes = [f"{curve.ids[v]}{change:+.1f}" for v, change in segment.changes.items()]
+            print(f"{segment.end_duration:<8.1f} {segment.end_cost:<12.0f} {slope:<10.0f} {' '.join(changes)}")
+
+    def compare_scenarios(self, scenarios, calendar=None, max_float_changes=20):
+        """
+        Évaluation « what-if » de scénarios sans modifier le projet (nécessite NumPy)
+
+        Chaque scenarios.Scenario ne décrit que ses différences (durées, liens
+        supprimés ou ajoutés) ; tous sont calculés en un seul passage vectorisé
+        sur le graphe partagé, une colonne par scénario.
+
+        Returns:
+            [scenarios.ScenarioResult] : la référence puis chaque scénario
+        """
+        from .scenarios import compare_scenarios
+
+        return compare_scenarios(self, scenarios, calendar, max_float_changes)
+
+    def print_scenarios(self, results):
+        """Affiche le tableau comparatif de compare_scenarios"""
+        print("\n=== COMPARAISON DE SCÉNARIOS ===")
+        print(f"{'Scénario':<30} {'Durée':<8} {'Écart':<8} {'Fin':<12} Chemin critique")
+        print("-" * 80)
+        for result in results:
+            if result.error:
+                print(f"{result.name:<30} non planifiable: {result.error}")
+                continue
+            end_date = result.end_date.isoformat() if result.end_date is not None else '-'
+            changes = [f"+{task_id}" for task_id in result.newly_critical] + \
+                      [f"-{task_id}" for task_id in result.no_longer_critical]
+            print(f"{result.name:<30} {result.project_duration:<8.1f} {result.delta:<+8.1f} "
+                  f"{end_date:<12} {' '.join(changes) or 'inchangé'}")
+
+    def task_dates(self, calendar=None):
+        """
+        Dates réelles de toutes les tâches : {id: (ES, EF, LS, LF)}, fins incluses
+        Les décalages sont des jours ouvrés convertis par le calendrier
+        (self.calendar par défaut, sinon lundi-vendredi depuis self.start_date),
+        par accès direct à son index cumulatif.
+        """
+        from .work_calendar import WorkCalendar
+
+        calendar = calendar or self.calendar
+        if calendar is None:
+            if self.start_date is None:
+                raise ValueError("Date de début du projet inconnue : fournir un calendrier ou start_date")
+            calendar = self.calendar = WorkCalendar(self.start_date)
+        tasks = self._visible_tasks()
+        calendar.ensure(max((task.latest_finish for task in tasks), default=0))
+        return {task.id: calendar.task_dates(task) for task in tasks}
+    
+    def print_schedule(self):
+        """Affiche le planning détaillé sous forme de tableau"""
+        print("\n=== PLANNING DÉTAILLÉ ===")
+        print(f"{'ID':<8} {'Nom':<20} {'Durée':<6} {'ES':<4} {'EF':<4} {'LS':<4} {'LF':<4} {'TF':<4} {'FF':<4} {'Critique':<8}")
+        print("-" * 88)
+        
+        for task in sorted(self._visible_tasks(), key=lambda t: t.earliest_start):
+            print(f"{task.id:<8} {task.name:<20} {task.duration:<6.1f} {task.earliest_start:<4.0f} "
+                  f"{task.earliest_finish:<4.0f} {task.latest_start:<4.0f} {task.latest_finish:<4.0f} "
+                  f"{task.total_float:<4.1f} {task.free_float:<4.1f} {'OUI' if task.is_critical else 'NON':<8}")
+    
+    def print_wbs(self, expanded=None):
+        """
+        Affiche la hiérarchie WBS avec les dates agrégées
+        Args:
+            expanded: Tâches récapitulatives dépliées (None : tout déplier) ;
+                      un sous-arbre replié n'est pas parcouru
+        """
+        print("\n=== STRUCTURE WBS ===")
+        if self.wbs is None:
+            print("Aucune hiérarchie (voir set_hierarchy)")
+            return
+        for row in self.wbs.gantt_rows(expanded):
+            task = self.wbs.summaries.get(row.id) if row.summary else self.tasks.get(row.id)
+            if task is None:
+                continue
+            marker = '+' if row.collapsed else ('-' if row.summary else ' ')
+            label = f"{'  ' * row.depth}{marker} {task.name}"
+            print(f"{label:<40} {task.earliest_start:>6.1f} → {task.earliest_finish:<6.1f} "
+                  f"TF {task.total_float:<5.1f} {'CRITIQUE' if task.is_critical else ''}")
+    
+    def print_dependencies(self):
+        """Affiche toutes les dépendances du projet"""
+        print("\n=== DÉPENDANCES ===")
+        for task in self.tasks.values():
+            if task.predecessors:
+                for pred_task, dep_type, lag in task.predecessors:
+                    lag_str = f" (lag: {lag})" if lag != 0 else ""
+                    print(f"{pred_task.name} --[{dep_type}]--> {task.name}{lag_str}")
+    
+    def print_critical_path(self):
+        """Affiche le chemin critique"""
+        print("\n=== CHEMIN CRITIQUE ===")
+        if self.critical_path:
+            path_names = [task.name for task in self.critical_path]
+            print(" → ".join(path_names))
+            print(f"Durée: {sum(task.duration for task in self.critical_path):.1f} jours")
+        else:
+            print("Aucun chemin critique identifié")
+    
+    def export_to_csv(self, filename="project_schedule.csv", order='topological'):
+        """
+        Exporte le planning vers un fichier CSV
+        Écriture en flux, prédécesseurs désignés par leur identifiant
+        (voir schedule_csv.write_schedule ; relecture avec from_csv). Les
+        tâches récapitulatives sont écrites avec leur parent, sans les jalons internes.
+        Retourne le nombre de tâches écrites.
+        """
+        from .schedule_csv import write_schedule
+
+        return write_schedule(self, filename, order)
+
+    @classmethod
+    def from_csv(cls, filename, task_factory=None, compact=False):
+        """
+        Reconstruit un projet depuis un CSV exporté (voir schedule_csv.read_schedule)
+        Avec compact=True, les tâches sont chargées directement dans un TaskStore.
+        """
+        from .schedule_csv import read_schedule
+
+        if compact:
+            return read_schedule(filename, cls, compact=True)
+        return read_schedule(filename, cls(), task_factory or Task)
@@ -0,0 +1,284 @@
+# SERVICE DE PLANIFICATION ASYNCHRONE (asyncio)
+# Point d'entrée commun aux applications : les projets consultés restent en
+# mémoire entre deux requêtes, les rafales de modifications d'un même projet
+# (glisser-déposer dans le Gantt) sont regroupées en un seul recalcul, et les
+# calculs lourds partent dans un pool de processus en nombre limité.
+
+import asyncio
+import os
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+DEBOUNCE = 0.05      # Silence (s) attendu après la dernière modification avant de recalculer
+MAX_DELAY = 0.5      # Attente maximale (s) d'une requête avant le début de son recalcul
+MAX_RESIDENT = 64    # Projets gardés en mémoire (LRU)
+
+# Méthodes de ProjectScheduler utilisables comme modification : (méthode, *arguments)
+EDIT_METHODS = frozenset(('update_duration', 'add_dependency', 'remove_dependency'))
+
+ScheduleResult = namedtuple('ScheduleResult', 'project_id version project_duration critical_path '
+                                              'dates full coalesced')
+ScheduleResult.__doc__ = """
+Résultat d'un recalcul, partagé par toutes les requêtes regroupées
+
+    version: Numéro du calcul pour ce projet (croissant)
+    critical_path: Identifiants des tâches du chemin critique
+    dates: {task_id: (ES, EF, LS, LF, flottement total, critique)} des tâches
+           recalculées (toutes si full)
+    full: Calcul complet (pool de processus) plutôt qu'incrémental
+    coalesced: Nombre de requêtes servies par ce calcul
+"""
+
+
+class _Project:
+    """Projet résident : planificateur, modifications en attente et calcul en cours"""
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.pending = []    # (future, modifications) reçues depuis le dernier calcul
+        self.first = None    # Arrivée de la plus ancienne requête en attente
+        self.last = None     # Arrivée de la dernière requête
+        self.runner = None   # Tâche asyncio qui regroupe et lance les calculs
+        self.version = 0
+
+
+class SchedulingService:
+    """
+    Service de planification pour une boucle asyncio
+
+        async with SchedulingService(lambda pid: ProjectScheduler.from_database(connect(), pid)) as service:
+            result = await service.submit(project_id, [('update_duration', 'API', 12)])
+
+    Toutes les requêtes reçues pendant la fenêtre de regroupement (DEBOUNCE
+    de silence, au plus MAX_DELAY) sont servies par un seul calcul : les états
+    intermédiaires ne sont jamais calculés. Un projet déjà planifié est mis à
+    jour par replanification incrémentale (thread) ; le premier calcul, et
+    tout calcul d'un planificateur compact, est complet (pool de processus).
+
+    Attributs:
+        requests, computations, full_computations: Compteurs
+    """
+
+    def __init__(self, loader, workers=None, max_concurrent=None, debounce=DEBOUNCE,
+                 max_delay=MAX_DELAY, max_resident=MAX_RESIDENT, executor=None):
+        """
+        Args:
+            loader: Fonction project_id -> ProjectScheduler (appelée dans un thread)
+            workers: Processus de calcul (par défaut, nombre de cœurs)
+            max_concurrent: Calculs simultanés, tous projets confondus (par défaut, workers)
+            executor: Pool de calcul à utiliser à la place du ProcessPoolExecutor
+        """
+        workers = workers or os.cpu_count() or 1
+        self.loader = loader
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.max_resident = max_resident
+        self._own_executor = executor is None
+        self._executor = executor if executor is not None else ProcessPoolExecutor(max_workers=workers)
+        self._threads = ThreadPoolExecutor(max_workers=max_concurrent or workers)
+        self._slots = asyncio.Semaphore(max_concurrent or workers)
+        self._projects = OrderedDict()  # project_id -> _Project
+        self._loading = {}              # project_id -> future du chargement en cours
+        self.requests = self.computations = self.full_computations = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Attend les calculs en cours puis libère les pools"""
+        runners = [project.runner for project in self._projects.values() if project.runner is not None]
+        await asyncio.gather(*runners, return_exceptions=True)
+        self._threads.shutdown()
+        if self._own_executor:
+            self._executor.shutdown()
+
+    async def submit(self, project_id, edits=()):
+        """
+        Applique des modifications à un projet et attend le planning recalculé
+
+        Args:
+            edits: Modifications (méthode, *arguments), ex: ('update_duration', 'API', 12),
+                   ('add_dependency', 'TEST', 'API', 'FS', 0) ; voir EDIT_METHODS
+        Returns:
+            ScheduleResult du calcul qui inclut ces modifications
+        Raises:
+            L'erreur d'une modification invalide (tâche inconnue, cycle...) : aucune
+            modification de la requête n'est alors appliquée et les autres requêtes
+            regroupées ne sont pas affectées
+        """
+        edits = [tuple(edit) for edit in edits]
+        for edit in edits:
+            if not edit or edit[0] not in EDIT_METHODS:
+                raise ValueError(f"Modification non prise en charge: {edit!r}")
+        self.requests += 1
+        project = await self._resident(project_id)
+        future = asyncio.get_running_loop().create_future()
+        now = time.monotonic()
+        if not project.pending:
+            project.first = now
+        project.last = now
+        project.pending.append((future, edits))
+        if project.runner is None:
+            project.runner = asyncio.create_task(self._run(project_id, project))
+        return await future
+
+    async def schedule(self, project_id):
+        """Planning à jour d'un projet (sans modification)"""
+        return await self.submit(project_id)
+
+    def invalidate(self, project_id):
+        """Oublie un projet résident (modifié hors du service) ; il sera rechargé"""
+        project = self._projects.get(project_id)
+        if project is not None and project.runner is None:
+            del self._projects[project_id]
+
+    def resident(self):
+        """Identifiants des projets en mémoire, du moins au plus récemment utilisé"""
+        return list(self._projects)
+
+    # --- Projets résidents ---
+
+    async def _resident(self, project_id):
+        project = self._projects.get(project_id)
+        if project is not None:
+            self._projects.move_to_end(project_id)
+            return project
+        loading = self._loading.get(project_id)
+        if loading is None:
+            loop = asyncio.get_running_loop()
+            loading = self._loading[project_id] = loop.run_in_executor(self._threads, self.loader, project_id)
+            try:
+                scheduler = await loading
+            finally:
+                del self._loading[project_id]
+            project = self._projects[project_id] = _Project(scheduler)
+            self._evict()
+            return project
+        await loading  # Chargement déjà lancé par une autre requête
+        return self._projects[project_id]
+
+    def _evict(self):
+        """Retire les projets les moins récemment utilisés sans calcul en cours"""
+        excess = len(self._projects) - self.max_resident
+        for project_id in list(self._projects):
+            if excess <= 0:
+                break
+            if self._projects[project_id].runner is None:
+                del self._projects[project_id]
+                excess -= 1
+
+    async def _reload(self, project_id, project):
+        """Recharge le planificateur d'un projet dont le dernier calcul a échoué"""
+        loop = asyncio.get_running_loop()
+        project.scheduler = await loop.run_in_executor(self._threads, self.loader, project_id)
+
+    # --- Regroupement et calcul ---
+
+    async def _run(self, project_id, project):
+        """Regroupe les requêtes d'un projet et enchaîne les calculs tant qu'il en arrive"""
+        try:
+            while project.pending:
+                # Attente d'un silence de `debounce`, bornée à `max_delay` depuis la première requête
+                while True:
+                    now = time.monotonic()
+                    wait = min(project.last + self.debounce, project.first + self.max_delay) - now
+                    if wait <= 0:
+                        break
+                    await asyncio.sleep(wait)
+                async with self._slots:
+                    batch, project.pending = project.pending, []
+                    await self._compute(project_id, project, batch)
+        finally:
+            project.runner = None
+            if project.scheduler is None and self._projects.get(project_id) is project:
+                self.invalidate(project_id)  # Rechargé à la prochaine requête
+
+    async def _compute(self, project_id, project, batch):
+        if project.scheduler is None:
+            try:
+                await self._reload(project_id, project)
+            except Exception as error:
+                for future, _ in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                return
+        scheduler = project.scheduler
+        waiting = []
+        for future, edits in batch:
+            undo = []
+            try:
+                for method, *arguments in edits:
+                    inverse = _inverse(scheduler, method, arguments)
+                    getattr(scheduler, method)(*arguments)
+                    undo.append(inverse)
+            except Exception as error:
+                # Tout ou rien : les modifications déjà appliquées de la requête sont annulées
+                for inverse in reversed(undo):
+                    for method, *arguments in inverse:
+                        getattr(scheduler, method)(*arguments)
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                waiting.append(future)
+
+        loop = asyncio.get_running_loop()
+        full = scheduler._store is not None or scheduler._topo is None
+        try:
+            if full:
+                from .portfolio import schedule_packed
+
+                results = await loop.run_in_executor(self._executor, schedule_packed, scheduler.pack())
+                scheduler.apply_results(*results)
+                changed = [task.id for task in scheduler._visible_tasks()]
+                self.full_computations += 1
+            else:
+                changed = await loop.run_in_executor(self._threads, scheduler.reschedule)
+        except Exception as error:
+            project.scheduler = None  # État incertain : rechargé avant le prochain calcul
+            for future in waiting:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        self.computations += 1
+        project.version += 1
+
+        dates = {}
+        for task_id in changed:
+            task = scheduler._visible_task(task_id)
+            dates[task_id] = (task.earliest_start, task.earliest_finish, task.latest_start,
+                              task.latest_finish, task.total_float, task.is_critical)
+        result = ScheduleResult(project_id, project.version, scheduler.project_duration,
+                                [task.id for task in scheduler.critical_path], dates, full, len(waiting))
+        for future in waiting:
+            if not future.done():
+                future.set_result(result)
+
+
+def _inverse(scheduler, method, arguments):
+    """
+    Modifications (méthode, *arguments) qui annulent (method, *arguments),
+    relevées avant que celle-ci soit appliquée
+    """
+    if method == 'update_duration':
+        task_id = arguments[0]
+        return [('update_duration', task_id, scheduler.tasks[task_id].duration)]
+    # Liens : retrait des liens correspondants puis rétablissement de ceux qui existaient
+    task_id, predecessor_id, *link = arguments
+    adding = method == 'add_dependency'
+    dependency_type = link[0] if link else ('FS' if adding else None)
+    lag = link[1] if len(link) > 1 else (0 if adding else None)
+    wbs = getattr(scheduler, 'wbs', None)
+    if wbs is not None and wbs.summaries:
+        links = wbs.public_predecessors(scheduler.tasks, task_id)  # Tâches récapitulatives désignées par leur id
+    else:
+        links = [(predecessor.id, dep_type, dep_lag)
+                 for predecessor, dep_type, dep_lag in scheduler.tasks[task_id].predecessors]
+    existing = [(dep_type, dep_lag) for pred_id, dep_type, dep_lag in links
+                if pred_id == predecessor_id and (dependency_type is None or dep_type == dependency_type)
+                and (lag is None or dep_lag == lag)]
+    return [('remove_dependency', task_id, predecessor_id, dependency_type, lag)] + \
+        [('add_dependency', task_id, predecessor_id, dep_type, dep_lag) for dep_type, dep_lag in existing]
@@ -0,0 +1,217 @@
+# INSTANTANÉ BINAIRE EN COLONNES D'UN PLANNING CALCULÉ (nécessite NumPy)
+# Un répertoire contenant un fichier .npy par colonne (durées, dates, flottements,
+# adjacence CSR...) et meta.json. Le chargement projette les fichiers en mémoire
+# (mmap) : aucune copie ni analyse, et plusieurs processus de reporting lisant le
+# même instantané partagent les mêmes pages du cache système.
+#
+# Chaînes (identifiants, noms) au format « Arrow » : octets UTF-8 concaténés
+# (<nom>.data.npy) et positions de début (<nom>.offsets.npy, n + 1 entrées).
+# ids.order.npy conserve la permutation triée des identifiants : une recherche
+# par identifiant est une dichotomie dans les fichiers projetés, sans tri ni
+# dictionnaire construit au chargement.
+
+import json
+import os
+from array import array
+from collections.abc import Mapping, Sequence
+from numbers import Integral
+
+from .task_store import ColumnIndex, StringColumn, TaskStore
+from .validation import ValidationReport
+
+SNAPSHOT_VERSION = 1
+META_FILE = 'meta.json'
+
+# Colonnes numériques d'un TaskStore planifié (noms des attributs et des fichiers)
+COLUMNS = ('durations', 'earliest_start', 'earliest_finish', 'latest_start', 'latest_finish',
+           'total_float', 'free_float', 'critical', 'order',
+           'pred_ptr', 'pred_idx', 'pred_type', 'pred_lag',
+           'succ_ptr', 'succ_idx', 'succ_type', 'succ_lag')
+ESTIMATE_COLUMNS = ('optimistic_time', 'most_likely_time', 'pessimistic_time')
+
+
+def save_snapshot(scheduler, path):
+    """
+    Écrit l'instantané d'un planificateur déjà calculé dans le répertoire `path`
+
+    Un planificateur à objets Task est d'abord converti en stockage compact.
+    meta.json est écrit en dernier : un instantané incomplet n'est pas chargeable.
+    Returns:
+        Le chemin du répertoire
+    """
+    import numpy as np
+
+    store = scheduler._store if scheduler._store is not None else TaskStore.from_tasks(scheduler.tasks.values())
+    os.makedirs(path, exist_ok=True)
+    meta_path = os.path.join(path, META_FILE)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    columns = list(COLUMNS)
+    if store.optimistic_time is not None:
+        columns.extend(ESTIMATE_COLUMNS)
+    for name in columns:
+        np.save(os.path.join(path, f"{name}.npy"), _as_numpy(getattr(store, name)))
+
+    index = store.index
+    if all(isinstance(task_id, Integral) for task_id in store.ids):
+        id_type = 'int'
+        ids = np.asarray(store.ids, dtype=np.int64)
+        np.save(os.path.join(path, 'ids.npy'), ids)
+        order = np.argsort(ids, kind='stable')  # Entiers natifs (intp) : sorter de searchsorted sans copie
+    else:
+        id_type = 'str'
+        _save_strings(path, 'ids', store.ids)
+        order = index._order if isinstance(index, ColumnIndex) else \
+            StringColumn.from_strings(store.ids).sorted_positions()
+    np.save(os.path.join(path, 'ids.order.npy'), _as_numpy(order))
+    _save_strings(path, 'names', store.names)
+
+    meta = {
+        'version': SNAPSHOT_VERSION,
+        'tasks': len(store.ids),
+        'edges': store.edge_count,
+        'columns': columns,
+        'id_type': id_type,
+        'project_duration': scheduler.project_duration,
+        'start_date': scheduler.start_date.isoformat() if scheduler.start_date is not None else None,
+    }
+    np.save(os.path.join(path, 'critical_path.npy'),
+            np.asarray([index[task.id] for task in scheduler.critical_path], dtype=np.int32))
+    with open(meta_path, 'w', encoding='utf-8') as file:
+        json.dump(meta, file, indent=1)
+    return path
+
+
+def load_snapshot(path, mmap=True):
+    """
+    Charge un instantané sous forme de SnapshotStore
+
+    Les fichiers sont projetés en copie sur écriture : une page modifiée
+    (update_duration, nouveau calcul) est copiée en mémoire privée, le fichier
+    et les pages partagées avec les autres processus restent intacts.
+
+    Args:
+        mmap: Projection en mémoire (False : lecture complète en mémoire)
+    Returns:
+        (stockage, métadonnées de meta.json, index du chemin critique)
+    """
+    import numpy as np
+
+    meta_path = os.path.join(path, META_FILE)
+    if not os.path.exists(meta_path):
+        raise FileNotFoundError(f"Instantané absent ou incomplet: {meta_path}")
+    with open(meta_path, encoding='utf-8') as file:
+        meta = json.load(file)
+    if meta.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f"Version d'instantané non prise en charge: {meta.get('version')}")
+
+    mode = 'c' if mmap else None
+
+    def load(name):
+        return np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mode)
+
+    store = SnapshotStore.__new__(SnapshotStore)
+    for name in meta['columns']:
+        setattr(store, name, load(name))
+    if 'optimistic_time' not in meta['columns']:
+        store.optimistic_time = store.most_likely_time = store.pessimistic_time = None
+    store.ids = IntColumn(load('ids')) if meta['id_type'] == 'int' else \
+        StringColumn(load('ids.data'), load('ids.offsets'))
+    store.names = StringColumn(load('names.data'), load('names.offsets'))
+    store._index = None  # Instantané sans ids.order.npy : index construit à la première recherche
+    if os.path.exists(os.path.join(path, 'ids.order.npy')):
+        order = load('ids.order')
+        store._index = IntIndex(store.ids, order) if meta['id_type'] == 'int' else ColumnIndex(store.ids, order)
+    store.report = ValidationReport()
+    store._checked = True  # Graphe validé avant l'enregistrement
+    store.project_duration = meta['project_duration']
+    store.forward_relaxations = store.backward_relaxations = 0
+    return store, meta, load('critical_path')
+
+
+class IntColumn(Sequence):
+    """Identifiants entiers restitués en int Python (et non en scalaires NumPy)"""
+
+    def __init__(self, values):
+        self._values = values
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self._values[i].tolist()
+        return int(self._values[i])
+
+    def __iter__(self):
+        return iter(self._values.tolist())
+
+
+class IntIndex(Mapping):
+    """Index identifiant entier -> position par dichotomie (numpy.searchsorted sur la permutation triée)"""
+
+    def __init__(self, column, order):
+        self._column = column
+        self._order = order
+
+    def _find(self, key):
+        if not isinstance(key, Integral) or isinstance(key, bool):
+            return None
+        import numpy as np
+
+        values, order = self._column._values, self._order
+        if not np.iinfo(values.dtype).min <= key <= np.iinfo(values.dtype).max:
+            return None
+        low = int(np.searchsorted(values, key, sorter=order))
+        if low < len(order) and values[order[low]] == key:
+            return int(order[low])
+        return None
+
+    def __getitem__(self, key):
+        i = self._find(key)
+        if i is None:
+            raise KeyError(key)
+        return i
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __iter__(self):
+        return iter(self._column)
+
+    def __len__(self):
+        return len(self._column)
+
+
+class SnapshotStore(TaskStore):
+    """
+    TaskStore dont les colonnes sont des tableaux NumPy projetés en mémoire
+
+    Les lectures (TaskView, rapports, chemins critiques) se font sans copie.
+    Un nouveau calcul (schedule_project) remplace les colonnes de résultats
+    par des tableaux en mémoire ; les écritures en place (update_duration,
+    replanification incrémentale) ne copient que les pages touchées.
+    L'instantané sur disque n'est jamais modifié.
+    """
+
+
+def _as_numpy(column):
+    """Colonne array / bytearray / liste -> tableau NumPy (sans copie pour les buffers)"""
+    import numpy as np
+
+    if isinstance(column, (bytes, bytearray)):
+        return np.frombuffer(column, dtype=np.uint8)
+    if isinstance(column, array):
+        return np.frombuffer(column, dtype=column.typecode)
+    return np.asarray(column)
+
+
+def _save_strings(path, name, values):
+    import numpy as np
+
+    encoded = [str(value).encode('utf-8') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    np.save(os.path.join(path, f"{name}.offsets.npy"), offsets)
+    np.save(os.path.join(path, f"{name}.data.npy"), np.frombuffer(b''.join(encoded), dtype=np.uint8))
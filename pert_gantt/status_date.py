@@ -0,0 +1,194 @@
+# REPLANIFICATION À LA DATE D'ÉTAT (AVANCEMENT RÉEL)
+# Les tâches terminées sont figées sur leurs dates réelles, les tâches en cours
+# ne gardent que leur durée restante à partir de la date d'état et les tâches
+# non commencées ne peuvent pas démarrer avant elle. Seules les tâches non
+# terminées (la partie encore ouverte du réseau) sont recalculées.
+
+from array import array
+from collections import namedtuple
+from .cpm_engine import FS, SS, FF, SF
+from .work_calendar import offset_converter
+
+TaskProgress = namedtuple('TaskProgress', 'actual_start actual_finish percent_complete actual_hours',
+                          defaults=(None, None, 0, 0))
+TaskProgress.__doc__ = """
+Avancement réel d'une tâche (voir db_loader.load_progress)
+
+    actual_start, actual_finish: Dates réelles (fin incluse) ou décalages, None si inconnues
+    percent_complete: Avancement en % (100 = terminée)
+    actual_hours: Heures saisies (time_entries)
+"""
+
+NOT_STARTED, IN_PROGRESS, COMPLETE = 0, 1, 2
+CRITICAL_TOLERANCE = 0.001  # même tolérance que ProjectScheduler.calculate_float
+
+
+def progress_from_tasks(tasks):
+    """
+    Avancement lu sur les tâches (attributs actual_start, actual_finish et
+    percent_complete d'AdvancedTask) ; seules les tâches commencées figurent
+    dans le résultat
+    """
+    progress = {}
+    for task in tasks:
+        start = getattr(task, 'actual_start', None)
+        finish = getattr(task, 'actual_finish', None)
+        percent = getattr(task, 'percent_complete', 0) or 0
+        if start is not None or finish is not None or percent > 0:
+            progress[task.id] = TaskProgress(start, finish, percent, getattr(task, 'actual_hours', 0) or 0)
+    return progress
+
+
+def schedule_at_status(graph, status, progress):
+    """
+    Planning CPM à la date d'état sur un graphe compilé
+
+    Args:
+        graph: CompiledGraph (ou TaskStore)
+        status: Date d'état en décalage (début de la journée)
+        progress: {index de tâche: (début réel, fin réelle, %)} en décalages, None si inconnu
+    Règles:
+        - terminée (fin réelle ou 100 %) : dates réelles, sans flottement ; fin
+          inconnue = date d'état, début inconnu = fin - durée
+        - en cours : début réel (date d'état si inconnu) ; la durée restante,
+          durée x (1 - %), commence à la date d'état. Seuls les liens FF/SF
+          contraignent encore sa fin.
+        - non commencée : passages CPM habituels, ES >= date d'état
+    Returns:
+        (durée du projet, colonnes portfolio.RESULT_COLUMNS, nombre de tâches recalculées)
+    """
+    n = len(graph.ids)
+    dur = graph.durations.tolist()
+    es, ef = [0.0] * n, [0.0] * n
+    remaining = list(dur)
+    state = bytearray(n)
+    for v, (start, finish, percent) in progress.items():
+        if finish is not None or percent >= 100:
+            state[v] = COMPLETE
+            ef[v] = finish if finish is not None else status
+            es[v] = min(start, ef[v]) if start is not None else max(0.0, ef[v] - dur[v])
+        elif start is not None or percent > 0:
+            state[v] = IN_PROGRESS
+            es[v] = start if start is not None else status
+            remaining[v] = dur[v] * (1 - percent / 100)
+
+    # Seule la partie ouverte du réseau est parcourue
+    open_nodes = [v for v in graph.order if state[v] != COMPLETE]
+
+    ptr, src = graph.pred_ptr.tolist(), graph.pred_idx.tolist()
+    typ, lag = graph.pred_type.tolist(), graph.pred_lag.tolist()
+    for v in open_nodes:
+        d = dur[v]
+        if state[v] == IN_PROGRESS:
+            finish = status + remaining[v]
+            for k in range(ptr[v], ptr[v + 1]):
+                t = typ[k]
+                if t == FF:
+                    constraint = ef[src[k]] + lag[k]
+                elif t == SF:
+                    constraint = es[src[k]] + lag[k]
+                else:
+                    continue  # Le début a déjà eu lieu
+                if constraint > finish:
+                    finish = constraint
+            ef[v] = finish
+            continue
+        start = status  # Rien ne peut commencer avant la date d'état
+        for k in range(ptr[v], ptr[v + 1]):
+            u = src[k]
+            t = typ[k]
+            if t == FS:
+                constraint = ef[u] + lag[k]
+            elif t == SS:
+                constraint = es[u] + lag[k]
+            elif t == FF:
+                constraint = ef[u] + lag[k] - d
+            else:  # SF
+                constraint = es[u] + lag[k] - d
+            if constraint > start:
+                start = constraint
+        es[v] = start
+        ef[v] = start + d
+    project_duration = max(ef, default=0)
+
+    # Passage arrière et flottements : tâches ouvertes, liens vers des tâches ouvertes
+    ls, lf = list(es), list(ef)
+    total, free = [0.0] * n, [0.0] * n
+    critical = bytearray(n)
+    ptr, dst = graph.succ_ptr.tolist(), graph.succ_idx.tolist()
+    typ, lag = graph.succ_type.tolist(), graph.succ_lag.tolist()
+    inf = float('inf')
+    for v in reversed(open_nodes):
+        started = state[v] == IN_PROGRESS
+        d = dur[v]
+        finish = inf
+        for k in range(ptr[v], ptr[v + 1]):
+            w = dst[k]
+            t = typ[k]
+            if state[w] == COMPLETE or started and t in (SS, SF):
+                continue
+            if t == FS:
+                constraint = ls[w] - lag[k]
+            elif t == SS:
+                constraint = ls[w] - lag[k] + d
+            elif t == FF:
+                constraint = lf[w] - lag[k]
+            else:  # SF
+                constraint = lf[w] - lag[k] + d
+            if constraint < finish:
+                finish = constraint
+        if finish == inf:
+            finish = project_duration
+        lf[v] = finish
+        ls[v] = finish - (remaining[v] if started else d)
+        total[v] = finish - ef[v] if started else ls[v] - es[v]
+        critical[v] = abs(total[v]) < CRITICAL_TOLERANCE
+
+    for v in open_nodes:
+        min_successor_es = inf
+        for k in range(ptr[v], ptr[v + 1]):
+            w = dst[k]
+            if state[w] == COMPLETE:
+                continue
+            t = typ[k]
+            if t == FS:
+                constraint = es[w] - lag[k]
+            elif t == SS:
+                constraint = es[w] - lag[k] + dur[v]
+            else:  # FF et SF
+                constraint = ef[w] - lag[k]
+            if constraint < min_successor_es:
+                min_successor_es = constraint
+        if min_successor_es == inf:
+            min_successor_es = project_duration
+        free[v] = max(0, min_successor_es - ef[v])
+
+    columns = (array('d', es), array('d', ef), array('d', ls), array('d', lf),
+               array('d', total), array('d', free), critical)
+    return project_duration, columns, len(open_nodes)
+
+
+def reschedule_from_status(scheduler, status_date, progress=None):
+    """
+    Replanifie un projet à la date d'état (voir ProjectScheduler.schedule_from_status)
+
+    Args:
+        status_date: Date d'état (date ou décalage)
+        progress: {task_id: TaskProgress} (par défaut lu sur les tâches, voir progress_from_tasks)
+    Returns:
+        Nombre de tâches recalculées (non terminées)
+    """
+    graph = scheduler.compile(reduce=False)  # L'avancement réel peut rompre les chemins qui dominent un lien
+    if progress is None:
+        progress = progress_from_tasks(scheduler.tasks.values())
+    to_offset = offset_converter(scheduler.calendar, scheduler.start_date)
+    status = to_offset(status_date)
+    index = graph.index
+    offsets = {}
+    for task_id, (start, finish, percent, _) in progress.items():
+        offsets[index[task_id]] = (to_offset(start) if start is not None else None,
+                                   to_offset(finish, finish=True) if finish is not None else None,
+                                   percent)
+    project_duration, columns, recomputed = schedule_at_status(graph, status, offsets)
+    scheduler.apply_results(project_duration, columns, graph.order, origin=status)
+    return recomputed
@@ -0,0 +1,333 @@
+# STOCKAGE COMPACT DES TÂCHES (STRUCTURE DE TABLEAUX)
+# Pour les portefeuilles de plusieurs centaines de milliers de tâches : une colonne
+# par attribut, adjacence CSR dans les deux sens et types de dépendance codés sur
+# un octet. Les objets TaskView conservent l'API d'attributs de Task sans rien stocker.
+
+from array import array
+from collections.abc import Mapping, Sequence
+from itertools import accumulate
+
+from .cpm_engine import CompiledGraph, DEPENDENCY_CODES, DEPENDENCY_NAMES, FS
+
+
+class TaskStore(CompiledGraph):
+    """
+    Graphe compilé enrichi de toutes les colonnes d'une tâche
+
+    En plus des colonnes de CompiledGraph (durées, ES/EF/LS/LF, CSR), le
+    stockage conserve les noms, les estimations 3 points (NaN si absentes),
+    les flottements et l'état critique. La structure du graphe est figée :
+    seules les valeurs (durées, dates...) peuvent être modifiées.
+
+    Les noms, et les identifiants s'ils sont tous des chaînes (UUID...), sont
+    conservés en StringColumn ; `index` recherche alors un identifiant par
+    dichotomie (ColumnIndex) au lieu d'un dictionnaire de toutes les chaînes.
+    """
+
+    def __init__(self, ids, durations, edges, names=None, estimates=None, report=None):
+        """
+        Args:
+            ids, durations, edges: voir CompiledGraph
+            names: Noms des tâches (par défaut, l'identifiant), conservés en StringColumn
+            estimates: Tuples (optimiste, probable, pessimiste) ou None, par tâche ;
+                       les colonnes ne sont allouées que si au moins une tâche en a
+        """
+        super().__init__(ids, durations, edges, report)
+        self._init_task_columns(names, estimates)
+
+    @classmethod
+    def from_columns(cls, ids, durations, sources, targets, types, lags, report=None, names=None,
+                     estimates=None):
+        """Stockage construit à partir des arcs en colonnes (voir CompiledGraph.from_columns)"""
+        store = super().from_columns(ids, durations, sources, targets, types, lags, report)
+        store._init_task_columns(names, estimates)
+        return store
+
+    def _init_task_columns(self, names, estimates):
+        n = len(self.ids)
+        # Chaînes en octets UTF-8 concaténés : aucun objet str conservé par tâche
+        if n and all(isinstance(task_id, str) for task_id in self.ids):
+            self.ids = StringColumn.from_strings(self.ids)
+        self.names = StringColumn.from_strings(names if names is not None else self.ids)
+
+        self.optimistic_time = self.most_likely_time = self.pessimistic_time = None
+        if estimates is not None and any(estimate is not None for estimate in estimates):
+            nan = float('nan')
+            self.optimistic_time = array('d', [nan]) * n
+            self.most_likely_time = array('d', [nan]) * n
+            self.pessimistic_time = array('d', [nan]) * n
+            for i, estimate in enumerate(estimates):
+                if estimate is not None:
+                    (self.optimistic_time[i], self.most_likely_time[i],
+                     self.pessimistic_time[i]) = estimate
+
+        self.total_float = array('d', bytes(8 * n))
+        self.free_float = array('d', bytes(8 * n))
+        self.critical = bytearray(n)
+
+    @classmethod
+    def from_tasks(cls, tasks):
+        """
+        Convertit des objets Task (ex: scheduler.tasks.values()) en stockage compact
+        L'ordre des successeurs de chaque tâche est conservé (parcours du chemin
+        critique identique) ; les prédécesseurs sont classés par index de tâche.
+        """
+        tasks = list(tasks)
+        graph = CompiledGraph.from_tasks(tasks)  # Validation et codes des types
+        edges = []
+        index = graph.index
+        for u, task in enumerate(tasks):
+            for succ_task, dep_type, lag in task.successors:
+                edges.append((u, index[succ_task.id], DEPENDENCY_CODES.get(dep_type, FS), lag))
+        estimates = [
+            (task.optimistic_time, task.most_likely_time, task.pessimistic_time)
+            if hasattr(task, 'pessimistic_time') else None
+            for task in tasks
+        ]
+        store = cls(graph.ids, graph.durations, edges, [task.name for task in tasks],
+                    estimates, graph.report)
+        for i, task in enumerate(tasks):
+            store.earliest_start[i] = task.earliest_start
+            store.earliest_finish[i] = task.earliest_finish
+            store.latest_start[i] = task.latest_start
+            store.latest_finish[i] = task.latest_finish
+            store.total_float[i] = task.total_float
+            store.free_float[i] = task.free_float
+            store.critical[i] = task.is_critical
+        return store
+
+    @property
+    def index(self):
+        """Identifiant -> index : dichotomie sur une StringColumn, dictionnaire sinon"""
+        if self._index is None and isinstance(self.ids, StringColumn):
+            self._index = ColumnIndex(self.ids)
+        return super().index
+
+    def view(self, index):
+        return TaskView(self, index)
+
+    def memory_usage(self):
+        """Octets occupés par les colonnes numériques et l'adjacence (hors chaînes)"""
+        columns = (self.durations, self.earliest_start, self.earliest_finish, self.latest_start,
+                   self.latest_finish, self.total_float, self.free_float, self.optimistic_time,
+                   self.most_likely_time, self.pessimistic_time, self.order,
+                   self.pred_ptr, self.pred_idx, self.pred_type, self.pred_lag,
+                   self.succ_ptr, self.succ_idx, self.succ_type, self.succ_lag)
+        return sum(column.itemsize * len(column) for column in columns if column is not None) + \
+            len(self.critical)
+
+
+class StringColumn(Sequence):
+    """Colonne de chaînes décodées à la demande depuis les octets UTF-8 concaténés"""
+
+    def __init__(self, data, offsets):
+        self._data = data
+        self._offsets = offsets
+
+    @classmethod
+    def from_strings(cls, values):
+        """Colonne construite à partir de chaînes (ou de valeurs converties par str)"""
+        if isinstance(values, cls):
+            return values
+        encoded = [str(value).encode('utf-8') for value in values]
+        return cls(b''.join(encoded), array('q', accumulate(map(len, encoded), initial=0)))
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def sorted_positions(self):
+        """Positions des chaînes dans l'ordre de leurs octets UTF-8 (array 'i', voir ColumnIndex)"""
+        data, offsets = self._data, self._offsets.tolist()
+        return array('i', sorted(range(len(self)), key=lambda i: bytes(data[offsets[i]:offsets[i + 1]])))
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return bytes(self._data[self._offsets[i]:self._offsets[i + 1]]).decode('utf-8')
+
+    def __iter__(self):
+        data, offsets = self._data, self._offsets.tolist()
+        for start, end in zip(offsets, offsets[1:]):
+            yield bytes(data[start:end]).decode('utf-8')
+
+
+class ColumnIndex(Mapping):
+    """
+    Index chaîne -> position d'une StringColumn par recherche dichotomique
+
+    Seule la permutation des positions dans l'ordre des octets UTF-8 est
+    conservée (4 octets par chaîne) ; chaque recherche décode O(log n) chaînes.
+    """
+
+    def __init__(self, column, order=None):
+        """
+        Args:
+            column: StringColumn indexée
+            order: Positions triées (voir sorted_positions), calculées si absentes
+        """
+        self._column = column
+        self._order = order if order is not None else column.sorted_positions()
+
+    def _find(self, key):
+        if not isinstance(key, str):
+            return None
+        key = key.encode('utf-8')
+        data, offsets, order = self._column._data, self._column._offsets, self._order
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            i = order[middle]
+            if bytes(data[offsets[i]:offsets[i + 1]]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(order):
+            i = order[low]
+            if bytes(data[offsets[i]:offsets[i + 1]]) == key:
+                return int(i)
+        return None
+
+    def __getitem__(self, key):
+        i = self._find(key)
+        if i is None:
+            raise KeyError(key)
+        return i
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __iter__(self):
+        return iter(self._column)
+
+    def __len__(self):
+        return len(self._column)
+
+
+def _column(name, doc):
+    def get(self):
+        return getattr(self._store, name)[self._index]
+
+    def set(self, value):
+        getattr(self._store, name)[self._index] = value
+
+    return property(get, set, doc=doc)
+
+
+def _estimate(name):
+    def get(self):
+        column = getattr(self._store, name)
+        value = column[self._index] if column is not None else float('nan')
+        if value != value:  # NaN : tâche à durée fixe, comme un Task sans estimation 3 points
+            raise AttributeError(name)
+        return value
+
+    return property(get)
+
+
+class TaskView:
+    """
+    Vue légère sur une tâche d'un TaskStore, avec les attributs de Task
+
+    Ne stocke que (stockage, index) ; les listes predecessors / successors
+    sont reconstruites à la demande à partir de l'adjacence CSR.
+    """
+
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    @property
+    def id(self):
+        return self._store.ids[self._index]
+
+    @property
+    def name(self):
+        return self._store.names[self._index]
+
+    duration = _column('durations', "Durée de la tâche")
+    earliest_start = _column('earliest_start', "ES")
+    earliest_finish = _column('earliest_finish', "EF")
+    latest_start = _column('latest_start', "LS")
+    latest_finish = _column('latest_finish', "LF")
+    total_float = _column('total_float', "Flottement total")
+    free_float = _column('free_float', "Flottement libre")
+    optimistic_time = _estimate('optimistic_time')
+    most_likely_time = _estimate('most_likely_time')
+    pessimistic_time = _estimate('pessimistic_time')
+
+    @property
+    def is_critical(self):
+        return bool(self._store.critical[self._index])
+
+    @is_critical.setter
+    def is_critical(self, value):
+        self._store.critical[self._index] = bool(value)
+
+    @property
+    def predecessors(self):
+        """Liste de tuples (tâche, type de dépendance, lag), comme Task.predecessors"""
+        store, v = self._store, self._index
+        return [(TaskView(store, store.pred_idx[k]), DEPENDENCY_NAMES[store.pred_type[k]], store.pred_lag[k])
+                for k in range(store.pred_ptr[v], store.pred_ptr[v + 1])]
+
+    @property
+    def successors(self):
+        """Liste de tuples (tâche, type de dépendance, lag), comme Task.successors"""
+        store, v = self._store, self._index
+        return [(TaskView(store, store.succ_idx[k]), DEPENDENCY_NAMES[store.succ_type[k]], store.succ_lag[k])
+                for k in range(store.succ_ptr[v], store.succ_ptr[v + 1])]
+
+    def add_dependency(self, predecessor, dependency_type='FS', lag=0):
+        raise TypeError("La structure d'un TaskStore est figée : reconstruire le stockage "
+                        "pour ajouter une dépendance")
+
+    def remove_dependency(self, predecessor, dependency_type=None, lag=None):
+        raise TypeError("La structure d'un TaskStore est figée : reconstruire le stockage "
+                        "pour supprimer une dépendance")
+
+    def get_variance(self):
+        """Calcule la variance PERT pour l'analyse des risques"""
+        if hasattr(self, 'pessimistic_time') and hasattr(self, 'optimistic_time'):
+            return ((self.pessimistic_time - self.optimistic_time) / 6) ** 2
+        return 0
+
+    def __eq__(self, other):
+        return isinstance(other, TaskView) and other._store is self._store and other._index == self._index
+
+    def __hash__(self):
+        return hash((id(self._store), self._index))
+
+    def __repr__(self):
+        return f"TaskView({self.id!r}, {self.name!r})"
+
+
+class TaskMapping(Mapping):
+    """Dictionnaire en lecture seule id -> TaskView (remplace ProjectScheduler.tasks)"""
+
+    def __init__(self, store):
+        self._store = store
+
+    def __getitem__(self, task_id):
+        return TaskView(self._store, self._store.index[task_id])
+
+    def __iter__(self):
+        return iter(self._store.ids)
+
+    def __len__(self):
+        return len(self._store.ids)
+
+    def __contains__(self, task_id):
+        return task_id in self._store.index
+
+    def values(self):
+        store = self._store
+        return [TaskView(store, i) for i in range(len(store.ids))]
+
+
+def dependency_code(dep_type):
+    """Code interne d'un type de dépendance (types inconnus traités comme FS)"""
+    return DEPENDENCY_CODES.get(dep_type or 'FS', FS)
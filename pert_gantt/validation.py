@@ -0,0 +1,221 @@
+# VALIDATION DU GRAPHE DE DÉPENDANCES
+# Exécutée une seule fois à la compilation du graphe (cpm_engine.CompiledGraph) :
+# cycles (composantes fortement connexes de Tarjan), types de dépendance
+# inconnus, liens en double, tâches isolées et prédécesseurs absents.
+
+
+class GraphValidationError(ValueError):
+    """Levée lorsque le graphe ne peut pas être planifié ; `report` détaille les problèmes"""
+
+    def __init__(self, message, report=None):
+        super().__init__(message)
+        self.report = report
+
+    def __reduce__(self):
+        # Transmission depuis un processus de calcul (portfolio.py) avec le rapport
+        return type(self), (self.args[0], self.report)
+
+
+class CycleError(GraphValidationError):
+    """Levée lorsque le graphe de dépendances contient au moins un cycle"""
+
+    def __init__(self, message, task_ids=(), report=None):
+        super().__init__(message, report)
+        self.task_ids = list(task_ids)
+
+    def __reduce__(self):
+        return type(self), (self.args[0], self.task_ids, self.report)
+
+
+class ValidationReport:
+    """
+    Diagnostic du graphe de dépendances
+
+    Erreurs (le planning ne peut pas être calculé) :
+        cycles: Liste de cycles, un par composante fortement connexe ; chaque
+                cycle est la liste ordonnée des tâches, la première étant répétée
+                implicitement à la fin (A -> B -> C -> A)
+        missing_tasks: Liens (prédécesseur, tâche) vers une tâche absente du planificateur
+    Avertissements :
+        unknown_types: Liens (prédécesseur, tâche, type) au type inconnu, traités comme FS
+        duplicate_edges: Liens (prédécesseur, tâche, type, lag) déclarés plusieurs fois à l'identique
+        orphans: Tâches sans aucune dépendance dans un projet de plusieurs tâches
+    """
+
+    def __init__(self):
+        self.cycles = []
+        self.cyclic_components = []
+        self.missing_tasks = []
+        self.unknown_types = []
+        self.duplicate_edges = []
+        self.orphans = []
+
+    @property
+    def has_errors(self):
+        return bool(self.cycles or self.missing_tasks)
+
+    @property
+    def has_warnings(self):
+        return bool(self.unknown_types or self.duplicate_edges or self.orphans)
+
+    def format(self):
+        """Retourne le diagnostic sous forme de lignes de texte"""
+        lines = []
+        for component, cycle in zip(self.cyclic_components, self.cycles):
+            path = ' -> '.join(str(task_id) for task_id in cycle + cycle[:1])
+            lines.append(f"ERREUR cycle ({len(component)} tâches concernées): {path}")
+        for pred_id, task_id in self.missing_tasks:
+            lines.append(f"ERREUR prédécesseur absent du planificateur: {pred_id} -> {task_id}")
+        for pred_id, task_id, dep_type in self.unknown_types:
+            lines.append(f"AVERTISSEMENT type de dépendance inconnu '{dep_type}' "
+                         f"(traité comme FS): {pred_id} -> {task_id}")
+        for pred_id, task_id, dep_type, lag in self.duplicate_edges:
+            lines.append(f"AVERTISSEMENT dépendance en double: {pred_id} --[{dep_type}{lag:+g}]--> {task_id}")
+        for task_id in self.orphans:
+            lines.append(f"AVERTISSEMENT tâche isolée (aucune dépendance): {task_id}")
+        return lines
+
+    def raise_for_errors(self):
+        """Lève CycleError / GraphValidationError si le graphe n'est pas planifiable"""
+        if self.cycles:
+            task_ids = [task_id for component in self.cyclic_components for task_id in component]
+            raise CycleError(
+                f"{len(self.cycles)} cycle(s) de dépendances détecté(s): " + '; '.join(
+                    ' -> '.join(str(task_id) for task_id in cycle + cycle[:1]) for cycle in self.cycles),
+                task_ids, self,
+            )
+        if self.missing_tasks:
+            raise GraphValidationError(
+                f"{len(self.missing_tasks)} prédécesseur(s) absent(s) du planificateur: " + ', '.join(
+                    f"{pred_id} -> {task_id}" for pred_id, task_id in self.missing_tasks),
+                self,
+            )
+
+
+def strongly_connected_components(n, ptr, adj, nodes=None):
+    """
+    Algorithme de Tarjan, version itérative (pas de limite de récursion)
+
+    Args:
+        n: Nombre de nœuds
+        ptr, adj: Liste d'adjacence au format CSR (successeurs)
+        nodes: Nœuds de départ à explorer (tous par défaut)
+    Returns:
+        Liste des composantes (listes d'index), en ordre topologique inverse
+    """
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack = []
+    components = []
+    counter = 0
+
+    for root in (range(n) if nodes is None else nodes):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, ptr[root])]
+        while work:
+            v, k = work[-1]
+            if k < ptr[v + 1]:
+                work[-1] = (v, k + 1)
+                w = adj[k]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, ptr[w]))
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                if low[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(component)
+    return components
+
+
+def find_cycles(n, ptr, adj, nodes=None):
+    """
+    Retourne (composantes cycliques, un cycle explicite par composante)
+    Une composante est cyclique si elle a plus d'un nœud ou une boucle sur elle-même.
+    """
+    components = []
+    cycles = []
+    for component in strongly_connected_components(n, ptr, adj, nodes):
+        if len(component) == 1:
+            v = component[0]
+            if v not in adj[ptr[v]:ptr[v + 1]]:
+                continue
+            components.append(component)
+            cycles.append([v])
+            continue
+        components.append(component)
+        cycles.append(_cycle_in_component(component, ptr, adj))
+    return components, cycles
+
+
+def _cycle_in_component(component, ptr, adj):
+    """Parcours en largeur depuis un nœud de la composante jusqu'à revenir à lui"""
+    members = set(component)
+    start = component[-1]
+    parent = {start: None}
+    queue = [start]
+    head = 0
+    while head < len(queue):
+        v = queue[head]
+        head += 1
+        for k in range(ptr[v], ptr[v + 1]):
+            w = adj[k]
+            if w == start:
+                path = [v]
+                while parent[path[-1]] is not None:
+                    path.append(parent[path[-1]])
+                return path[::-1]
+            if w in members and w not in parent:
+                parent[w] = v
+                queue.append(w)
+    return list(component)  # Inatteignable pour une composante fortement connexe
+
+
+def find_duplicate_edges(n, ptr, src, types, lags):
+    """
+    Liens (index_pred, index_succ, code_type, lag) déclarés plusieurs fois
+    Deux liens de même type mais de lags différents ne sont pas des doublons
+    (le plus contraignant l'emporte, voir reduction.py pour les liens redondants).
+    """
+    duplicates = []
+    for v in range(n):
+        first, last = ptr[v], ptr[v + 1]
+        if last - first < 2:
+            continue
+        seen = set()
+        for k in range(first, last):
+            key = (src[k], types[k], lags[k])
+            if key in seen:
+                duplicates.append((src[k], v, types[k], lags[k]))
+            else:
+                seen.add(key)
+    return duplicates
+
+
+def find_orphans(n, pred_ptr, succ_ptr):
+    """Index des tâches sans prédécesseur ni successeur (projets de plus d'une tâche)"""
+    if n < 2:
+        return []
+    return [v for v in range(n)
+            if pred_ptr[v] == pred_ptr[v + 1] and succ_ptr[v] == succ_ptr[v + 1]]
@@ -0,0 +1,441 @@
+# STRUCTURE DE DÉCOMPOSITION DU PROJET (WBS)
+# Hiérarchie des tâches (tasks.parent_task_id) : les tâches récapitulatives ne
+# sont pas planifiées elles-mêmes, leurs dates et flottements sont agrégés
+# depuis leurs enfants en une passe ascendante (temps linéaire). Une
+# modification ne recalcule que les ancêtres des tâches touchées, et un
+# sous-arbre replié se lit comme un agrégat (vue Gantt).
+
+from array import array
+from collections import namedtuple
+
+SummaryRow = namedtuple('SummaryRow', 'id earliest_start earliest_finish latest_start latest_finish '
+                                      'total_float free_float critical leaves work')
+SummaryRow.__doc__ = """
+Agrégat d'un sous-arbre (tâche récapitulative)
+
+    earliest_start, latest_start: Minimum sur les tâches du sous-arbre
+    earliest_finish, latest_finish: Maximum sur les tâches du sous-arbre
+    total_float, free_float: Minimum sur les tâches du sous-arbre
+    critical: Au moins une tâche critique
+    leaves: Nombre de tâches planifiées du sous-arbre
+    work: Somme de leurs durées (jours)
+"""
+
+GanttRow = namedtuple('GanttRow', 'depth id summary collapsed')
+
+
+class MilestoneId(namedtuple('MilestoneId', 'summary_id end')):
+    """
+    Identifiant d'un jalon de tâche récapitulative (end : 'début' ou 'fin')
+
+    Un tuple et non une chaîne : aucun identifiant lu en base ou en CSV (chaîne
+    ou entier) ne peut le reproduire. Affiché « <id>#début » / « <id>#fin ».
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        return f"{self.summary_id}#{self.end}"
+
+
+class WorkBreakdown:
+    """
+    Hiérarchie WBS indexée (parents, enfants en CSR, ordre préfixe)
+
+    Chaque nœud reçoit un index ; le sous-arbre du nœud v occupe les rangs
+    [rank[v], end[v]) de l'ordre préfixe `preorder`, ce qui donne en O(1) le
+    test d'ascendance et en temps proportionnel à sa taille la liste des feuilles.
+
+    Attributs:
+        summaries: {id: Task} des tâches récapitulatives retirées du réseau
+        milestones: {id récapitulatif: (id du jalon de début, id du jalon de fin)}
+            planifiés à la place de la tâche récapitulative (voir expand_summary_links) ;
+            ces jalons restent internes au réseau (voir visible, public_predecessors)
+    """
+
+    def __init__(self, parents):
+        """
+        Args:
+            parents: {task_id: parent_task_id} (parent None ou absent : racine)
+        Raises:
+            ValueError: si la hiérarchie contient un cycle
+        """
+        ids = []
+        index = {}
+        for task_id, parent_id in parents.items():
+            for node in (task_id, parent_id):
+                if node is not None and node not in index:
+                    index[node] = len(ids)
+                    ids.append(node)
+        n = len(ids)
+        self.ids = ids
+        self.index = index
+        parent = array('i', [-1]) * n
+        for task_id, parent_id in parents.items():
+            if parent_id is not None:
+                parent[index[task_id]] = index[parent_id]
+        self.parent = parent
+
+        counts = [0] * (n + 1)
+        for p in parent:
+            if p >= 0:
+                counts[p + 1] += 1
+        for v in range(n):
+            counts[v + 1] += counts[v]
+        self.child_ptr = array('i', counts)
+        child_idx = array('i', bytes(4 * counts[n]))
+        fill = counts[:n]
+        for v, p in enumerate(parent):
+            if p >= 0:
+                child_idx[fill[p]] = v
+                fill[p] += 1
+        self.child_idx = child_idx
+
+        # Ordre préfixe itératif (profondeur quelconque)
+        ptr = self.child_ptr
+        preorder = array('i')
+        rank = array('i', [-1]) * n
+        end = array('i', bytes(4 * n))
+        depth = array('i', bytes(4 * n))
+        for root in (v for v in range(n) if parent[v] < 0):
+            stack = [(root, False)]
+            while stack:
+                v, closing = stack.pop()
+                if closing:
+                    end[v] = len(preorder)
+                    continue
+                rank[v] = len(preorder)
+                preorder.append(v)
+                stack.append((v, True))
+                for k in range(ptr[v + 1] - 1, ptr[v] - 1, -1):
+                    child = child_idx[k]
+                    depth[child] = depth[v] + 1
+                    stack.append((child, False))
+        if len(preorder) != n:
+            cyclic = [ids[v] for v in range(n) if rank[v] < 0]
+            raise ValueError(f"Hiérarchie WBS cyclique ({len(cyclic)} tâches): {cyclic[:10]}")
+        self.preorder = preorder
+        self.rank = rank
+        self.end = end
+        self.depth = depth
+        self.summaries = {}
+        self.milestones = {}
+        self._milestone_of = {}  # id du jalon -> id de la tâche récapitulative
+
+        self._rows = [None] * n  # Agrégats des nœuds récapitulatifs (SummaryRow), voir rollup
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add_milestones(self, summary_id, start_id, finish_id):
+        """Enregistre les jalons de début et de fin d'une tâche récapitulative"""
+        self.milestones[summary_id] = (start_id, finish_id)
+        self._milestone_of[start_id] = self._milestone_of[finish_id] = summary_id
+
+    def is_milestone(self, task_id):
+        """Vrai pour un jalon de début ou de fin de tâche récapitulative"""
+        return task_id in self._milestone_of
+
+    def link_endpoint(self, task_id, dep_type, predecessor=False):
+        """
+        Tâche du réseau qui porte un lien d'une tâche récapitulative : le jalon
+        de début pour un lien qui contraint (entrant FS/SS) ou utilise (sortant
+        SS/SF) son début, le jalon de fin sinon. Une autre tâche se porte elle-même.
+        """
+        milestones = self.milestones.get(task_id)
+        if milestones is None:
+            return task_id
+        starts = ('SS', 'SF') if predecessor else ('FS', 'SS')
+        return milestones[0 if dep_type in starts else 1]
+
+    def public_predecessors(self, tasks, task_id):
+        """
+        Liens saisis vers une tâche ou une tâche récapitulative : (id du
+        prédécesseur, type, lag), jalons remplacés par leur tâche récapitulative
+        et liens de structure (jalon - enfant) exclus
+        """
+        carriers = self.milestones.get(task_id) or (task_id,)
+        links = []
+        for carrier in carriers:
+            for pred, dep_type, lag in tasks[carrier].predecessors:
+                pred_id = self._milestone_of.get(pred.id, pred.id)
+                if not (self.contains(pred_id, task_id) or self.contains(task_id, pred_id)):
+                    links.append((pred_id, dep_type, lag))
+        return links
+
+    def visible(self, tasks):
+        """Tâches du réseau sans les jalons internes, puis les tâches récapitulatives"""
+        for task in tasks.values():
+            if task.id not in self._milestone_of:
+                yield task
+        yield from self.summaries.values()
+
+    def parent_id(self, task_id):
+        """Tâche récapitulative parente (None pour une racine ou une tâche hors hiérarchie)"""
+        v = self.index.get(task_id)
+        if v is None or self.parent[v] < 0:
+            return None
+        return self.ids[self.parent[v]]
+
+    def ancestors(self, task_ids):
+        """Tâches récapitulatives contenant au moins une des tâches données"""
+        parent, found = self.parent, set()
+        for task_id in task_ids:
+            v = self.index.get(task_id)
+            p = parent[v] if v is not None else -1
+            while p >= 0 and p not in found:
+                found.add(p)
+                p = parent[p]
+        return {self.ids[v] for v in found}
+
+    def is_summary(self, task_id):
+        v = self.index.get(task_id)
+        return v is not None and self.child_ptr[v + 1] > self.child_ptr[v]
+
+    def summary_ids(self):
+        ptr = self.child_ptr
+        return [self.ids[v] for v in range(len(self.ids)) if ptr[v + 1] > ptr[v]]
+
+    def contains(self, ancestor_id, task_id):
+        """Vrai si `task_id` appartient au sous-arbre de `ancestor_id` (lui compris)"""
+        a, v = self.index.get(ancestor_id), self.index.get(task_id)
+        if a is None or v is None:
+            return False
+        return self.rank[a] <= self.rank[v] < self.end[a]
+
+    def leaves(self, task_id):
+        """Tâches terminales (non récapitulatives) du sous-arbre de `task_id`"""
+        v = self.index[task_id]
+        ptr = self.child_ptr
+        return [self.ids[u] for u in self.preorder[self.rank[v]:self.end[v]] if ptr[u + 1] == ptr[u]]
+
+    # --- Agrégation ---
+
+    def rollup(self, tasks):
+        """
+        Agrège dates et flottements de toutes les tâches récapitulatives
+        Une seule passe ascendante (ordre préfixe inverse) : temps linéaire.
+
+        Args:
+            tasks: Tâches planifiées (scheduler.tasks) ; les nœuds absents sont ignorés
+        """
+        n = len(self.ids)
+        inf = float('inf')
+        es, ls, tf, ff = [inf] * n, [inf] * n, [inf] * n, [inf] * n
+        ef, lf = [-inf] * n, [-inf] * n
+        critical = bytearray(n)
+        leaves, work = [0] * n, [0.0] * n
+        ptr, parent, ids = self.child_ptr, self.parent, self.ids
+        for v in range(n):
+            if ptr[v + 1] == ptr[v]:
+                task = tasks.get(ids[v])
+                if task is not None:
+                    es[v], ef[v] = task.earliest_start, task.earliest_finish
+                    ls[v], lf[v] = task.latest_start, task.latest_finish
+                    tf[v], ff[v] = task.total_float, task.free_float
+                    critical[v] = bool(task.is_critical)
+                    leaves[v], work[v] = 1, task.duration
+
+        for v in reversed(self.preorder):
+            p = parent[v]
+            if p < 0 or not leaves[v]:
+                continue
+            if es[v] < es[p]:
+                es[p] = es[v]
+            if ef[v] > ef[p]:
+                ef[p] = ef[v]
+            if ls[v] < ls[p]:
+                ls[p] = ls[v]
+            if lf[v] > lf[p]:
+                lf[p] = lf[v]
+            if tf[v] < tf[p]:
+                tf[p] = tf[v]
+            if ff[v] < ff[p]:
+                ff[p] = ff[v]
+            critical[p] |= critical[v]
+            leaves[p] += leaves[v]
+            work[p] += work[v]
+
+        rows = self._rows
+        for v in range(n):
+            if ptr[v + 1] > ptr[v]:
+                rows[v] = SummaryRow(ids[v], es[v], ef[v], ls[v], lf[v], tf[v], ff[v],
+                                     bool(critical[v]), leaves[v], work[v]) if leaves[v] else None
+        self._apply(range(n))
+
+    def update(self, tasks, changed):
+        """
+        Agrégation partielle après une replanification : seuls les ancêtres
+        des tâches modifiées sont recalculés (depuis leurs enfants directs),
+        du plus profond au moins profond, en s'arrêtant dès qu'un agrégat ne change pas.
+
+        Returns:
+            Identifiants des tâches récapitulatives mises à jour
+        """
+        parent, depth = self.parent, self.depth
+        levels = {}
+        for task_id in changed:
+            v = self.index.get(task_id)
+            if v is not None and parent[v] >= 0:
+                levels.setdefault(depth[parent[v]], set()).add(parent[v])
+
+        updated = []
+        for level in sorted(levels, reverse=True):
+            for v in levels[level]:
+                row = self._aggregate(v, tasks)
+                if row == self._rows[v]:
+                    continue
+                self._rows[v] = row
+                updated.append(v)
+                if parent[v] >= 0:
+                    levels.setdefault(level - 1, set()).add(parent[v])
+        self._apply(updated)
+        return [self.ids[v] for v in updated]
+
+    def _aggregate(self, v, tasks):
+        """Agrégat d'un nœud récapitulatif à partir de ses enfants directs"""
+        ptr, ids = self.child_ptr, self.ids
+        children = []
+        for k in range(ptr[v], ptr[v + 1]):
+            child = self.child_idx[k]
+            if ptr[child + 1] > ptr[child]:
+                row = self._rows[child]
+            else:
+                task = tasks.get(ids[child])
+                row = task and SummaryRow(task.id, task.earliest_start, task.earliest_finish,
+                                          task.latest_start, task.latest_finish, task.total_float,
+                                          task.free_float, bool(task.is_critical), 1, task.duration)
+            if row:
+                children.append(row)
+        if not children:
+            return None
+        return SummaryRow(ids[v],
+                          min(row.earliest_start for row in children),
+                          max(row.earliest_finish for row in children),
+                          min(row.latest_start for row in children),
+                          max(row.latest_finish for row in children),
+                          min(row.total_float for row in children),
+                          min(row.free_float for row in children),
+                          any(row.critical for row in children),
+                          sum(row.leaves for row in children),
+                          sum(row.work for row in children))
+
+    def _apply(self, nodes):
+        """Reporte les agrégats sur les objets Task récapitulatifs"""
+        summaries, ids, rows = self.summaries, self.ids, self._rows
+        if not summaries:
+            return
+        for v in nodes:
+            task = summaries.get(ids[v])
+            row = rows[v]
+            if task is None or not row:
+                continue
+            task.earliest_start, task.earliest_finish = row.earliest_start, row.earliest_finish
+            task.latest_start, task.latest_finish = row.latest_start, row.latest_finish
+            task.total_float, task.free_float = row.total_float, row.free_float
+            task.is_critical = row.critical
+            task.duration = row.earliest_finish - row.earliest_start
+
+    # --- Lecture (vue Gantt) ---
+
+    def summary(self, task_id):
+        """Agrégat d'une tâche récapitulative (SummaryRow, None si aucune tâche planifiée)"""
+        return self._rows[self.index[task_id]]
+
+    def gantt_rows(self, expanded=None):
+        """
+        Lignes visibles de la vue Gantt, en ordre préfixe
+
+        Les sous-arbres repliés ne sont pas parcourus : le coût est celui des
+        lignes affichées (lire leurs dates avec summary()).
+
+        Args:
+            expanded: Identifiants des tâches récapitulatives dépliées (None : tout déplier)
+        Returns:
+            Liste de GanttRow(profondeur, id, récapitulative, repliée)
+        """
+        ptr, preorder, ids = self.child_ptr, self.preorder, self.ids
+        rows = []
+        i = 0
+        while i < len(preorder):
+            v = preorder[i]
+            summary = ptr[v + 1] > ptr[v]
+            collapsed = summary and expanded is not None and ids[v] not in expanded
+            rows.append(GanttRow(self.depth[v], ids[v], summary, collapsed))
+            i = self.end[v] if collapsed else i + 1
+        return rows
+
+
+def expand_summary_links(tasks, wbs):
+    """
+    Remplace chaque tâche récapitulative par deux jalons (durée nulle) reliés à ses enfants
+
+    Le jalon de début précède chaque enfant (SS 0) et le jalon de fin le suit
+    (FS 0) ; pour un enfant récapitulatif, ce sont ses propres jalons qui sont
+    reliés, ce qui garde un nombre de liens proportionnel à la taille de la
+    hiérarchie. Les liens qui contraignent ou utilisent le début de la tâche
+    récapitulative (entrants FS/SS, sortants SS/SF) passent par le jalon de
+    début, les autres par le jalon de fin. Les liens entre une tâche et l'un
+    de ses propres ancêtres sont ignorés. Les tâches récapitulatives sont
+    ensuite retirées de `tasks` (dictionnaire id -> Task) et conservées dans
+    wbs.summaries ; les jalons sont ajoutés à `tasks` (voir wbs.add_milestones).
+
+    Returns:
+        Nombre de liens ajoutés
+    """
+    from .scheduler import Task
+
+    summaries = {task_id: tasks[task_id] for task_id in wbs.summary_ids() if task_id in tasks}
+    links = {}
+    neighbours = {}
+    for summary in summaries.values():
+        for pred, dep_type, lag in summary.predecessors:
+            links[pred.id, summary.id, dep_type, lag] = (pred, summary)
+            neighbours[pred.id] = pred
+        for succ, dep_type, lag in summary.successors:
+            links[summary.id, succ.id, dep_type, lag] = (summary, succ)
+            neighbours[succ.id] = succ
+
+    for task in neighbours.values():
+        task.predecessors = [link for link in task.predecessors if link[0].id not in summaries]
+        task.successors = [link for link in task.successors if link[0].id not in summaries]
+    for task_id, summary in summaries.items():
+        summary.predecessors, summary.successors = [], []
+        del tasks[task_id]
+    wbs.summaries.update(summaries)
+
+    # Jalons de début et de fin de chaque tâche récapitulative
+    milestones = {}
+    for task_id, summary in summaries.items():
+        start = Task(MilestoneId(task_id, 'début'), f"Début {summary.name}", duration=0)
+        finish = Task(MilestoneId(task_id, 'fin'), f"Fin {summary.name}", duration=0)
+        milestones[task_id] = (start, finish)
+        tasks[start.id], tasks[finish.id] = start, finish
+        wbs.add_milestones(task_id, start.id, finish.id)
+
+    added = 0
+    ptr, child_idx, ids = wbs.child_ptr, wbs.child_idx, wbs.ids
+    for task_id, (start, finish) in milestones.items():
+        v = wbs.index[task_id]
+        for k in range(ptr[v], ptr[v + 1]):
+            child_id = ids[child_idx[k]]
+            if child_id in milestones:
+                child_start, child_finish = milestones[child_id]
+            elif child_id in tasks:
+                child_start = child_finish = tasks[child_id]
+            else:
+                continue
+            child_start.add_dependency(start, 'SS', 0)
+            finish.add_dependency(child_finish, 'FS', 0)
+            added += 2
+
+    for (pred_id, succ_id, dep_type, lag), (pred, succ) in links.items():
+        if wbs.contains(pred_id, succ_id) or wbs.contains(succ_id, pred_id):
+            continue
+        if pred_id in milestones:
+            pred = tasks[wbs.link_endpoint(pred_id, dep_type, predecessor=True)]
+        if succ_id in milestones:
+            succ = tasks[wbs.link_endpoint(succ_id, dep_type)]
+        succ.add_dependency(pred, dep_type, lag)
+        added += 1
+    return added
@@ -0,0 +1,215 @@
+# CALENDRIER DE TRAVAIL : CONVERSION DÉCALAGE (JOURS OUVRÉS) <-> DATE
+# Jours ouvrés de la semaine, jours fériés et exceptions par ressource.
+# Un index cumulatif des jours ouvrés, étendu par blocs à la demande, rend
+# chaque conversion O(1) : aucune boucle jour par jour au moment de convertir.
+
+import math
+from array import array
+from datetime import date, timedelta
+
+WEEKDAYS = (1, 2, 3, 4, 5)  # Lundi à vendredi (numérotation ISO, 7 = dimanche)
+INDEX_BLOCK = 366  # Jours calendaires ajoutés à l'index à chaque extension
+
+
+class WorkCalendar:
+    """
+    Calendrier de travail d'un projet
+
+    Le décalage k (jours ouvrés depuis le début, comme ES/EF) correspond au
+    k-ième jour ouvré à partir de `start_date`. Deux tableaux sont tenus :
+        - _dates[k] : ordinal du jour ouvré k (décalage -> date)
+        - _counts[i] : nombre de jours ouvrés avant start_date + i jours (date -> décalage)
+    """
+
+    def __init__(self, start_date, working_days=WEEKDAYS, holidays=(), extra_working_days=(),
+                 country_code=None):
+        """
+        Args:
+            start_date: Date de début du projet (décalage 0)
+            working_days: Jours ouvrés de la semaine (ISO : 1 = lundi ... 7 = dimanche)
+            holidays: Dates chômées (fermetures, ponts...)
+            extra_working_days: Dates travaillées hors semaine type (ex: samedi exceptionnel)
+            country_code: Pays dont les jours fériés sont chômés (voir public_holidays)
+        """
+        if not set(working_days) & set(range(1, 8)):
+            raise ValueError("Le calendrier doit comporter au moins un jour ouvré par semaine")
+        self.start_date = start_date
+        self.working_days = frozenset(working_days)
+        self.holidays = frozenset(holidays)
+        self.extra_working_days = frozenset(extra_working_days)
+        self.country_code = country_code
+        self._origin = start_date.toordinal()
+        self._weekly = [(weekday + 1) in self.working_days for weekday in range(7)]
+        self._public = set()  # Jours fériés des années déjà indexées
+        self._public_years = set()
+        self._dates = array('i')
+        self._counts = array('i', [0])
+        self._resources = {}
+        self._resource_calendars = {}
+
+    def is_working_day(self, day):
+        if day in self.extra_working_days:
+            return True
+        if day.year not in self._public_years:
+            self._add_public_holidays(day.year, day.year)
+        return self._weekly[day.weekday()] and day not in self.holidays and day not in self._public
+
+    def _add_public_holidays(self, first_year, last_year):
+        years = set(range(first_year, last_year + 1)) - self._public_years
+        if years:
+            self._public.update(public_holidays(self.country_code, years))
+            self._public_years.update(years)
+
+    def _extend(self, days):
+        """Ajoute au moins `days` jours calendaires à l'index"""
+        days = max(days, INDEX_BLOCK)
+        first = self._origin + len(self._counts) - 1
+        count = self._counts[-1]
+        dates, counts = self._dates, self._counts
+        day = date.fromordinal(first)
+        self._add_public_holidays(day.year, date.fromordinal(first + days).year)
+        closed = (self.holidays | self._public) - self.extra_working_days
+        weekly, extra = self._weekly, self.extra_working_days
+        weekday = day.weekday()
+        one_day = timedelta(days=1)
+        for ordinal in range(first, first + days):
+            if (weekly[weekday] and day not in closed) or day in extra:
+                dates.append(ordinal)
+                count += 1
+            counts.append(count)
+            day += one_day
+            weekday = (weekday + 1) % 7
+
+    def _ensure_offset(self, offset):
+        per_week = self._weekly.count(True)
+        while len(self._dates) <= offset:
+            missing = offset - len(self._dates) + 1
+            self._extend(math.ceil(missing * 7 / per_week) + 7)
+
+    def ensure(self, max_offset):
+        """Prépare l'index jusqu'au décalage `max_offset` (conversions en masse)"""
+        self._ensure_offset(max(0, math.ceil(max_offset)))
+
+    def date_at(self, offset):
+        """Date du jour ouvré où commence le décalage `offset` (partie entière)"""
+        k = math.floor(offset)
+        if k < 0:
+            raise ValueError(f"Décalage négatif: {offset}")
+        if k >= len(self._dates):
+            self._ensure_offset(k)
+        return date.fromordinal(self._dates[k])
+
+    def finish_date(self, offset):
+        """
+        Date de fin incluse d'une période se terminant au décalage `offset` :
+        dernier jour ouvré entamé (une tâche de 0 à 5 finit le 5e jour ouvré)
+        """
+        return self.date_at(max(math.ceil(offset) - 1, 0))
+
+    def offset_of(self, day):
+        """Décalage (jours ouvrés depuis le début) du jour `day` ; jour chômé : jour ouvré suivant"""
+        i = day.toordinal() - self._origin
+        if i < 0:
+            raise ValueError(f"Date {day} antérieure au début du calendrier ({self.start_date})")
+        if i >= len(self._counts):
+            self._extend(i - len(self._counts) + 1)
+        return self._counts[i]
+
+    def working_days_between(self, first, last):
+        """Nombre de jours ouvrés dans [first, last)"""
+        return self.offset_of(last) - self.offset_of(first)
+
+    def add_working_days(self, day, days):
+        """Date atteinte `days` jours ouvrés après `day` (équivalent de addWorkingDays)"""
+        return self.date_at(self.offset_of(day) + days)
+
+    def task_dates(self, task):
+        """
+        Dates (ES, EF, LS, LF) d'une tâche, fins incluses ; un jalon (durée nulle)
+        finit le jour de son début
+        """
+        es, ef = task.earliest_start, task.earliest_finish
+        ls, lf = task.latest_start, task.latest_finish
+        es_date, ls_date = self.date_at(es), self.date_at(ls)
+        return (es_date, self.finish_date(ef) if ef > es else es_date,
+                ls_date, self.finish_date(lf) if lf > ls else ls_date)
+
+    def __call__(self, offset):
+        """Un calendrier s'utilise comme fonction décalage -> date (voir db_loader.save_schedule)"""
+        return self.date_at(offset)
+
+    # --- Exceptions par ressource ---
+
+    def add_resource_exceptions(self, resource_id, days_off=(), days_on=()):
+        """Absences (days_off) et jours travaillés supplémentaires (days_on) d'une ressource"""
+        off, on = self._resources.setdefault(resource_id, (set(), set()))
+        off.update(days_off)
+        on.update(days_on)
+        self._resource_calendars.pop(resource_id, None)
+
+    def for_resource(self, resource_id):
+        """Calendrier d'une ressource : calendrier du projet + ses exceptions (mis en cache)"""
+        if resource_id not in self._resources:
+            return self
+        calendar = self._resource_calendars.get(resource_id)
+        if calendar is None:
+            off, on = self._resources[resource_id]
+            calendar = WorkCalendar(self.start_date, self.working_days, (self.holidays | off) - on,
+                                    (self.extra_working_days | on) - off, self.country_code)
+            self._resource_calendars[resource_id] = calendar
+        return calendar
+
+
+def offset_converter(calendar=None, start_date=None):
+    """
+    Conversion date -> décalage : jours ouvrés du calendrier, sinon jours
+    calendaires depuis start_date. Un nombre est déjà un décalage.
+    Une date de fin (finish=True) est incluse : la tâche finit le soir de ce jour.
+    """
+    def to_offset(day, finish=False):
+        if not isinstance(day, date):
+            return float(day)
+        if calendar is not None:
+            offset = calendar.offset_of(day)
+        elif start_date is not None:
+            offset = (day - start_date).days
+        else:
+            raise ValueError("Date de début du projet inconnue : fournir un calendrier ou start_date")
+        return float(offset + 1 if finish else offset)
+    return to_offset
+
+
+def easter_sunday(year):
+    """Dimanche de Pâques (calendrier grégorien, algorithme de Meeus/Jones/Butcher)"""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month = (h + l - 7 * m + 114) // 31
+    day = (h + l - 7 * m + 114) % 31 + 1
+    return date(year, month, day)
+
+
+def public_holidays(country_code, years):
+    """
+    Jours fériés d'un pays pour les années données
+    Seule la France (projects.country_code = 'FR', valeur par défaut) est fournie ;
+    les autres pays retournent un ensemble vide (à compléter via `holidays`).
+    """
+    holidays = set()
+    if (country_code or '').upper() != 'FR':
+        return holidays
+    for year in years:
+        easter = easter_sunday(year)
+        holidays.update((
+            date(year, 1, 1), date(year, 5, 1), date(year, 5, 8), date(year, 7, 14),
+            date(year, 8, 15), date(year, 11, 1), date(year, 11, 11), date(year, 12, 25),
+            easter + timedelta(days=1),   # Lundi de Pâques
+            easter + timedelta(days=39),  # Ascension
+            easter + timedelta(days=50),  # Lundi de Pentecôte
+        ))
+    return holidays
@@ -0,0 +1,48 @@
+# Loi analytique de la durée du projet (voir analytic_risk.py)
+
+from pert_gantt import ProjectScheduler, Task
+from pert_gantt.analytic_risk import _strongest
+
+
+def _project():
+    scheduler = ProjectScheduler()
+    scheduler.add_task(Task('A', 'A', optimistic_time=2, most_likely_time=3, pessimistic_time=7))
+    scheduler.add_task(Task('B', 'B', duration=4))
+    scheduler.add_task(Task('C', 'C', duration=1))
+    scheduler.add_task(Task('D', 'D', duration=2))
+    scheduler.add_dependency('B', 'A')
+    scheduler.add_dependency('C', 'B', 'SS', 0)
+    scheduler.add_dependency('D', 'A', 'FF', 0)
+    scheduler.schedule_project()
+    return scheduler
+
+
+def test_project_end_includes_task_with_start_successor():
+    # B finit le projet bien qu'elle ait un successeur (lien SS)
+    scheduler = _project()
+    result = scheduler.completion_distribution()
+    assert abs(result.mean - scheduler.project_duration) < 1e-3
+    assert abs(result.std - scheduler.tasks['A'].get_variance() ** 0.5) < 1e-3
+    assert result.criticality['B'] == 1.0
+    assert result.criticality['D'] == 0.0
+
+
+def test_strongest_coefficients_kept_with_ties():
+    coefficients = {'a': 0.5, 'b': -2.0, 'c': 1.0, 'd': -1.0, 'e': 0.1}
+    assert _strongest(coefficients, 2) == {'b': -2.0, 'c': 1.0}  # Ex aequo au seuil : le premier gardé
+    assert _strongest(coefficients, 3) == {'b': -2.0, 'c': 1.0, 'd': -1.0}
+    assert _strongest(coefficients, 0) == {}
+
+
+def test_sources_trade_accuracy_for_cost():
+    # Deux branches partageant A : avec sources > 0, la corrélation réduit la moyenne du maximum
+    scheduler = ProjectScheduler()
+    scheduler.add_task(Task('A', 'A', optimistic_time=2, most_likely_time=5, pessimistic_time=14))
+    for task_id in ('B', 'C'):
+        scheduler.add_task(Task(task_id, task_id, optimistic_time=1, most_likely_time=3, pessimistic_time=5))
+        scheduler.add_dependency(task_id, 'A')
+    scheduler.schedule_project()
+    correlated = scheduler.completion_distribution()
+    independent = scheduler.completion_distribution(sources=0)
+    assert correlated.mean < independent.mean
+    assert correlated.std > independent.std
@@ -0,0 +1,19 @@
+# Réseaux synthétiques des benchmarks (voir benchmarks/networks.py)
+
+import pytest
+
+from pert_gantt.benchmarks.networks import GENERATORS, build_compact, build_scheduler, load_engine
+
+
+@pytest.mark.parametrize('name', sorted(GENERATORS))
+def test_networks_schedule_identically_in_both_layouts(name):
+    network = GENERATORS[name](300)
+    assert GENERATORS[name](300) == network  # Déterministe (graine)
+    assert all(u < v for u, v, _, _ in network.edges)
+    engine = load_engine()
+    objects = build_scheduler(engine, network)
+    compact = build_compact(engine, network)
+    objects.schedule_project()
+    compact.schedule_project()
+    assert compact.project_duration == objects.project_duration
+    assert [task.id for task in compact.critical_path] == [task.id for task in objects.critical_path]
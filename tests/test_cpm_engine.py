@@ -0,0 +1,136 @@
+# Moteur CPM compilé face au calcul sur objets Task (voir cpm_engine.py)
+
+import random
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task
+from pert_gantt import cpm_engine
+from pert_gantt.cpm_engine import CompiledGraph, collect_columns
+
+TYPES = ('FS', 'SS', 'FF', 'SF')
+
+
+def _random_project(seed, n=60, m=150):
+    rng = random.Random(seed)
+    scheduler = ProjectScheduler()
+    tasks = [Task(f'T{i}', f'Tâche {i}', duration=rng.randint(0, 8)) for i in range(n)]
+    for task in tasks:
+        scheduler.add_task(task)
+    for _ in range(m):
+        u = rng.randrange(n - 1)
+        v = rng.randrange(u + 1, n)
+        tasks[v].add_dependency(tasks[u], rng.choice(TYPES), rng.choice((0, 0, 1, 2, -1)))
+    return scheduler
+
+
+def _reference_dates(tasks):
+    """ES/EF puis LS/LF par relaxation répétée directement sur les objets Task"""
+    tasks = list(tasks)
+    es = {task.id: 0 for task in tasks}
+    changed = True
+    while changed:
+        changed = False
+        for task in tasks:
+            start = 0
+            for pred, dep_type, lag in task.predecessors:
+                start = max(start, {
+                    'FS': es[pred.id] + pred.duration + lag, 'SS': es[pred.id] + lag,
+                    'FF': es[pred.id] + pred.duration + lag - task.duration,
+                    'SF': es[pred.id] + lag - task.duration}[dep_type])
+            if start != es[task.id]:
+                es[task.id], changed = start, True
+    end = max((es[task.id] + task.duration for task in tasks), default=0)
+    lf = {task.id: end for task in tasks}
+    changed = True
+    while changed:
+        changed = False
+        for task in tasks:
+            finish = end if not task.successors else float('inf')
+            for succ, dep_type, lag in task.successors:
+                finish = min(finish, {
+                    'FS': lf[succ.id] - succ.duration - lag,
+                    'SS': lf[succ.id] - succ.duration - lag + task.duration,
+                    'FF': lf[succ.id] - lag, 'SF': lf[succ.id] - lag + task.duration}[dep_type])
+            if finish != lf[task.id]:
+                lf[task.id], changed = finish, True
+    return end, es, lf
+
+
+def _results(scheduler):
+    return {task_id: (task.earliest_start, task.earliest_finish, task.latest_start, task.latest_finish,
+                      task.total_float, task.free_float, task.is_critical)
+            for task_id, task in scheduler.tasks.items()}
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_compiled_passes_match_object_reference(seed):
+    scheduler = _random_project(seed)
+    scheduler.schedule_project()
+    end, es, lf = _reference_dates(scheduler.tasks.values())
+    assert scheduler.project_duration == end
+    for task_id, task in scheduler.tasks.items():
+        assert (task.earliest_start, task.latest_finish) == (es[task_id], lf[task_id])
+        assert task.earliest_finish == es[task_id] + task.duration
+        assert task.latest_start == lf[task_id] - task.duration
+
+    # Flottements du graphe compilé identiques à la formule par objet Task
+    compiled = _results(scheduler)
+    for task in scheduler.tasks.values():
+        scheduler._update_float(task)
+    assert _results(scheduler) == compiled
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_cached_graph_follows_durations_and_links(seed):
+    scheduler = _random_project(seed)
+    scheduler.schedule_project()
+    graph = scheduler._graph
+    tasks = list(scheduler.tasks.values())
+
+    tasks[10].duration += 5  # Modification directe : le graphe est réutilisé
+    tasks[30].add_dependency(tasks[3], 'FS', 4)  # Lien ajouté hors du planificateur
+    scheduler.schedule_project()
+    assert scheduler._graph is not graph
+    end, es, _ = _reference_dates(tasks)
+    assert scheduler.project_duration == end
+    assert all(task.earliest_start == es[task.id] for task in tasks)
+
+    graph = scheduler._graph
+    tasks[20].duration = 0
+    scheduler.schedule_project()
+    assert scheduler._graph is graph
+    cached = _results(scheduler)
+    fresh = _random_project(seed)
+    fresh_tasks = list(fresh.tasks.values())
+    fresh_tasks[10].duration += 5
+    fresh_tasks[30].add_dependency(fresh_tasks[3], 'FS', 4)
+    fresh_tasks[20].duration = 0
+    fresh.schedule_project()
+    assert _results(fresh) == cached
+
+
+def test_warnings_only_searched_by_validate():
+    scheduler = ProjectScheduler()
+    for task_id in 'ABC':
+        scheduler.add_task(Task(task_id, task_id, duration=1))
+    scheduler.add_dependency('B', 'A')
+    scheduler.add_dependency('B', 'A')
+    scheduler.schedule_project()
+    assert scheduler._graph.report.duplicate_edges == []
+    report = scheduler.validate()
+    assert report.duplicate_edges == [('A', 'B', 'FS', 0)]
+    assert report.orphans == ['C']
+    assert scheduler.validate().duplicate_edges == [('A', 'B', 'FS', 0)]  # Rapport non dupliqué
+
+
+def test_numpy_csr_matches_python(monkeypatch):
+    pytest.importorskip('numpy')
+    columns = collect_columns(_random_project(7).tasks.values())
+    monkeypatch.setattr(cpm_engine, 'NUMPY_MIN_EDGES', 0)
+    vectorized = CompiledGraph.from_columns(*columns)
+    monkeypatch.setattr(cpm_engine, 'NUMPY_MIN_EDGES', float('inf'))
+    plain = CompiledGraph.from_columns(*columns)
+    for name in ('pred_ptr', 'pred_idx', 'pred_type', 'pred_lag', 'succ_ptr', 'succ_idx', 'succ_type',
+                 'succ_lag', 'order'):
+        assert getattr(vectorized, name) == getattr(plain, name), name
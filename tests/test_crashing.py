@@ -0,0 +1,69 @@
+# Courbe durée-coût de la compression (voir crashing.py)
+
+import itertools
+import random
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task
+from pert_gantt.cpm_engine import CompiledGraph
+from pert_gantt.crashing import time_cost_curve
+
+
+def _network(rng, n):
+    edges = [(u, v, rng.randint(0, 3), rng.randint(-1, 2)) for v in range(1, n) for u in range(v)
+             if rng.random() < 0.45]
+    normal = [rng.randint(1, 5) for _ in range(n)]
+    limits = [max(0, d - rng.randint(0, 3)) for d in normal]
+    costs = [rng.randint(1, 9) for _ in range(n)]
+    return edges, normal, limits, costs
+
+
+def _brute_force(n, edges, normal, limits, costs):
+    """Coût minimal pour finir en au plus T jours, durées entières énumérées"""
+    best = {}
+    for durations in itertools.product(*[range(limit, d + 1) for limit, d in zip(limits, normal)]):
+        project = CompiledGraph(list(range(n)), durations, edges).forward_pass()
+        cost = sum(c * (d - x) for c, d, x in zip(costs, normal, durations))
+        best[project] = min(best.get(project, cost), cost)
+    return {duration: min(cost for other, cost in best.items() if other <= duration) for duration in best}
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_curve_matches_brute_force(seed):
+    rng = random.Random(seed)
+    for _ in range(25):
+        n = rng.randint(2, 6)
+        edges, normal, limits, costs = _network(rng, n)
+        curve = time_cost_curve(CompiledGraph(list(range(n)), normal, edges), costs, limits)
+        expected = _brute_force(n, edges, normal, limits, costs)
+        assert curve.min_duration == pytest.approx(min(expected))
+        for duration, cost in expected.items():
+            if curve.min_duration <= duration <= curve.normal_duration:
+                assert curve.cost(duration) == pytest.approx(cost)
+                durations = list(normal)
+                for v, d in curve.durations(duration).items():
+                    durations[v] = d
+                assert CompiledGraph(list(range(n)), durations, edges).forward_pass() <= duration + 1e-6
+
+
+def test_target_stops_early_and_crash_applies():
+    scheduler = ProjectScheduler()
+    for task_id, duration in (('A', 4), ('B', 6), ('C', 3), ('D', 5)):
+        scheduler.add_task(Task(task_id, task_id, duration=duration))
+    scheduler.add_dependency('B', 'A')
+    scheduler.add_dependency('D', 'C')
+    scheduler.schedule_project()
+    costs = {'A': 2, 'B': 1, 'C': 3, 'D': 1}
+    limits = {'A': 2, 'B': 3, 'C': 1, 'D': 2}
+    full = scheduler.time_cost_curve(costs, limits)
+    assert full.min_duration == 5 and len(full.segments) > 1
+    partial = scheduler.time_cost_curve(costs, limits, target=8)
+    assert partial.min_duration == 8 and len(partial.segments) < len(full.segments)
+    assert partial.cost(8) == full.cost(8) == 2  # B comprimée de 2 jours ; C -> D dure déjà 8
+    assert full.cost(7) == 4  # Puis B et D ensemble
+    cost, durations = scheduler.crash(8, costs, limits)
+    assert (cost, scheduler.project_duration) == (2, 8)
+    assert durations == {'B': 4}
+    with pytest.raises(ValueError):
+        full.cost(4)
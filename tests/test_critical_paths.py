@@ -0,0 +1,30 @@
+# Chemins critiques et quasi critiques (voir critical_paths.py)
+
+from pert_gantt import ProjectScheduler, Task
+
+
+def _project(links):
+    scheduler = ProjectScheduler()
+    for task_id, duration in (('A', 3), ('B', 4), ('C', 1), ('D', 2)):
+        scheduler.add_task(Task(task_id, task_id, duration=duration))
+    for task_id, predecessor_id, dep_type in links:
+        scheduler.add_dependency(task_id, predecessor_id, dep_type, 0)
+    scheduler.schedule_project()
+    return scheduler
+
+
+def _ids(paths):
+    return [(path_float, [task.id for task in path]) for path_float, path in paths]
+
+
+def test_path_ends_at_task_finishing_with_project():
+    # B finit avec le projet ; son successeur SS ne prolonge pas la chaîne critique
+    scheduler = _project([('B', 'A', 'FS'), ('C', 'B', 'SS')])
+    assert scheduler.project_duration == 7
+    assert _ids(scheduler.critical_paths(k=2)) == [(0.0, ['A', 'B']), (3.0, ['A', 'B', 'C'])]
+
+
+def test_critical_successor_still_extends_path():
+    scheduler = _project([('B', 'A', 'FS'), ('D', 'B', 'FF')])
+    assert _ids(scheduler.critical_paths(k=1)) == [(0.0, ['A', 'B', 'D'])]
+    assert [task.id for task in scheduler.critical_path] == ['A', 'B', 'D']
@@ -0,0 +1,86 @@
+# Chargement et sauvegarde en base, aller-retour sur SQLite (voir db_loader.py)
+
+import datetime
+import sqlite3
+
+import pytest
+
+from pert_gantt import ProjectScheduler
+from pert_gantt.db_loader import save_tasks
+
+SCHEMA = """
+    CREATE TABLE projects (id TEXT PRIMARY KEY, start_date DATE, working_days_per_week INTEGER,
+                           exclude_weekends BOOLEAN, country_code TEXT);
+    CREATE TABLE tasks (id TEXT PRIMARY KEY, project_id TEXT, name TEXT, duration INTEGER,
+                        start_date DATE, parent_task_id TEXT,
+                        earliest_start DATE, earliest_finish DATE, latest_start DATE, latest_finish DATE,
+                        total_float INTEGER, free_float INTEGER, is_critical BOOLEAN);
+    CREATE TABLE dependencies (source_task_id TEXT, target_task_id TEXT, type TEXT, lag_days INTEGER);
+"""
+
+
+def _database(parents=None):
+    connection = sqlite3.connect(':memory:')
+    connection.executescript(SCHEMA)
+    connection.execute("INSERT INTO projects VALUES ('P1', '2026-01-05', 5, 1, 'FR')")
+    for task_id, duration in (('A', 3), ('B', None), ('C', 2), ('D', 4)):
+        connection.execute("INSERT INTO tasks (id, project_id, name, duration, parent_task_id) "
+                           "VALUES (?, 'P1', ?, ?, ?)", (task_id, f'Tâche {task_id}', duration,
+                                                         (parents or {}).get(task_id)))
+    connection.executemany("INSERT INTO dependencies VALUES (?, ?, ?, ?)",
+                           [('A', 'B', 'FS', 0), ('B', 'C', 'SS', 1), ('A', 'D', None, None)])
+    return connection
+
+
+def _saved(connection):
+    return {row[0]: row[1:] for row in connection.execute(
+        "SELECT id, earliest_start, earliest_finish, latest_start, latest_finish, total_float, "
+        "free_float, is_critical FROM tasks")}
+
+
+def _expected(scheduler):
+    calendar = scheduler.calendar
+    return {task.id: (*(day.isoformat() for day in calendar.task_dates(task)),
+                      round(task.total_float), round(task.free_float), int(task.is_critical))
+            for task in scheduler.tasks.values()}
+
+
+def test_schedule_round_trip():
+    connection = _database()
+    scheduler = ProjectScheduler.from_database(connection, 'P1')
+    assert scheduler.start_date == datetime.date(2026, 1, 5)
+    assert scheduler.tasks['B'].duration == 1  # Durée NULL : 1 jour
+    scheduler.schedule_project()
+    assert scheduler.project_duration == 7
+    assert scheduler.save_to_database(connection) == 4
+    assert _saved(connection) == _expected(scheduler)
+
+    compact = ProjectScheduler.from_database(connection, 'P1', compact=True)
+    compact.schedule_project()
+    connection.execute("UPDATE tasks SET earliest_start = NULL, total_float = NULL")
+    assert compact.save_to_database(connection) == 4
+    assert _saved(connection) == _expected(scheduler)
+
+
+def test_interrupted_save_does_not_block_the_next_one():
+    connection = _database()
+    scheduler = ProjectScheduler.from_database(connection, 'P1')
+    scheduler.schedule_project()
+
+    def failing(offset):
+        raise RuntimeError("conversion impossible")
+
+    with pytest.raises(RuntimeError):
+        save_tasks(connection, scheduler.tasks.values(), failing)
+    assert scheduler.save_to_database(connection) == 4
+    assert _saved(connection) == _expected(scheduler)
+    assert connection.execute("SELECT COUNT(*) FROM sqlite_temp_master WHERE name = 'pert_results'"
+                              ).fetchone() == (0,)
+
+
+def test_hierarchy_requires_task_objects():
+    connection = _database({'B': 'D', 'C': 'D'})
+    with pytest.raises(TypeError):
+        ProjectScheduler.from_database(connection, 'P1', compact=True)
+    scheduler = ProjectScheduler.from_database(connection, 'P1')
+    assert set(scheduler.wbs.summaries) == {'D'}
@@ -0,0 +1,81 @@
+# Replanification incrémentale face au calcul complet (voir incremental.py)
+
+import copy
+import random
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task
+from pert_gantt.validation import CycleError
+
+TYPES = ('FS', 'SS', 'FF', 'SF')
+
+
+def _project(n, links, durations):
+    scheduler = ProjectScheduler()
+    for i in range(n):
+        scheduler.add_task(Task(f'T{i}', f'Tâche {i}', duration=durations[i]))
+    for task_id, predecessor_id, dep_type, lag in links:
+        scheduler.tasks[task_id].add_dependency(scheduler.tasks[predecessor_id], dep_type, lag)
+    return scheduler
+
+
+def _links(scheduler):
+    return [(task.id, pred.id, dep_type, lag)
+            for task in scheduler.tasks.values() for pred, dep_type, lag in task.predecessors]
+
+
+def _dates(scheduler):
+    return {task_id: (task.earliest_start, task.earliest_finish, task.latest_start, task.latest_finish)
+            for task_id, task in scheduler.tasks.items()}
+
+
+def _floats(scheduler):
+    return {task_id: (task.total_float, task.free_float, task.is_critical)
+            for task_id, task in scheduler.tasks.items()}
+
+
+def _edit(scheduler, rng, n):
+    """Modification aléatoire via l'API du planificateur (durée, ajout ou retrait de lien)"""
+    action = rng.random()
+    if action < 0.4:
+        scheduler.update_duration(f'T{rng.randrange(n)}', rng.randint(0, 9))
+    elif action < 0.75:
+        u, v = rng.sample(range(n), 2)
+        try:
+            scheduler.add_dependency(f'T{v}', f'T{u}', rng.choice(TYPES), rng.choice((0, 1, 3, -1)))
+        except CycleError:
+            pass
+    else:
+        links = _links(scheduler)
+        if links:
+            task_id, predecessor_id, dep_type, lag = rng.choice(links)
+            scheduler.remove_dependency(task_id, predecessor_id, dep_type, lag)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_reschedule_matches_full_recompute(seed):
+    rng = random.Random(seed)
+    n = 25
+    links = []
+    for _ in range(40):
+        u = rng.randrange(n - 1)
+        links.append((f'T{rng.randrange(u + 1, n)}', f'T{u}', rng.choice(TYPES), rng.choice((0, 2, -1))))
+    scheduler = _project(n, links, [rng.randint(0, 9) for _ in range(n)])
+    scheduler.schedule_project()
+
+    for _ in range(15):
+        before = _dates(scheduler)
+        for _ in range(rng.randint(1, 3)):
+            _edit(scheduler, rng, n)
+        changed = scheduler.reschedule()
+
+        full = copy.deepcopy(scheduler)  # Mêmes listes de liens (ordre de parcours du chemin critique)
+        full._compiled.clear()
+        full.schedule_project()
+        assert scheduler.project_duration == full.project_duration
+        assert _dates(scheduler) == _dates(full)
+        assert _floats(scheduler) == _floats(full)
+        assert [task.id for task in scheduler.critical_path] == [task.id for task in full.critical_path]
+        after = _dates(scheduler)
+        assert changed == {task_id for task_id in after if after[task_id] != before[task_id]}
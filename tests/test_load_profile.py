@@ -0,0 +1,116 @@
+# Profils de charge journalière des ressources (voir load_profile.py)
+
+import math
+import random
+from datetime import date
+
+import pytest
+
+from pert_gantt import AdvancedTask, ProjectScheduler, Task
+from pert_gantt.work_calendar import WorkCalendar
+
+np = pytest.importorskip('numpy')
+
+from pert_gantt.load_profile import LoadProfile  # noqa: E402
+
+START = date(2026, 1, 5)  # Un lundi
+
+
+def _daily_reference(resources, allocations, horizon):
+    """Charge jour par jour : part de chaque jour couverte par chaque allocation"""
+    load = [[0.0] * horizon for _ in resources]
+    for row, start, finish, units in allocations:
+        finish = max(finish, start)
+        start, finish = min(start, horizon), min(finish, horizon)
+        for day in range(math.floor(start), math.ceil(finish)):
+            load[row][day] += units * (min(finish, day + 1) - max(start, day))
+    return load
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_difference_array_matches_day_by_day(seed):
+    rng = random.Random(seed)
+    resources = [f'R{i}' for i in range(5)]
+    allocations = []
+    for _ in range(300):
+        start = rng.choice((rng.randint(0, 80), rng.uniform(0, 80)))
+        finish = start + rng.choice((0, rng.randint(1, 15), rng.uniform(0, 15)))
+        allocations.append((rng.randrange(5), start, finish, rng.choice((0.5, 1.0, 2.0))))
+    rows, starts, finishes, units = zip(*allocations)
+    for horizon in (None, 40):
+        profile = LoadProfile.from_intervals(resources, rows, starts, finishes, units, [1.0] * 5, horizon)
+        expected_horizon = horizon if horizon is not None else math.ceil(max(finishes))
+        assert profile.horizon == expected_horizon
+        expected = _daily_reference(resources, allocations, expected_horizon)
+        assert np.allclose(profile.load, expected, atol=1e-9)
+        assert np.allclose(profile.daily('R3'), expected[3], atol=1e-9)
+
+
+def test_overallocation_periods_and_utilization():
+    # R1 (capacité 1) : deux tâches en parallèle les jours 2 à 4, puis 1,5 unité le jour 7
+    profile = LoadProfile.from_intervals(
+        ['R1', 'R2', 'R3'], [0, 0, 0, 0, 1], [0, 2, 7, 7, 0], [5, 5, 8, 8, 10], [1, 1, 1, 0.5, 2],
+        [1, 2, 0])
+    assert profile.overallocations() == {'R1': [(2, 4, 2.0), (7, 7, 1.5)]}
+    utilization = profile.utilization()
+    assert utilization[0, 3] == 2.0 and utilization[1, 0] == 1.0
+    assert not utilization[2].any()  # Capacité nulle, aucune charge : pas de division par zéro
+
+
+def test_weekly_and_monthly_aggregates():
+    calendar = WorkCalendar(START, country_code='FR')
+    horizon = 60
+    profile = LoadProfile.from_intervals(['R1', 'R2'], [0, 1], [0, 3.5], [horizon, 12], [1, 2], [1, 4],
+                                         calendar=calendar)
+    days = [calendar.date_at(k) for k in range(horizon)]
+
+    starts, load, capacity = profile.aggregate('week')
+    assert starts[:2] == [date(2026, 1, 5), date(2026, 1, 12)]
+    assert all(day.weekday() == 0 for day in starts)
+    weeks = [sum(1 for day in days if day.toordinal() - day.weekday() == monday.toordinal()) for monday in starts]
+    assert load[0].tolist() == weeks  # Une unité chaque jour ouvré
+    assert capacity[1].tolist() == [4 * size for size in weeks]
+    assert load[1].sum() == pytest.approx(2 * 8.5)
+
+    starts, load, capacity = profile.aggregate('month')
+    assert starts == [date(2026, 1, 1), date(2026, 2, 1), date(2026, 3, 1)]
+    assert load[0].sum() == horizon
+    assert load[0, 0] == sum(1 for day in days if day.month == 1)
+
+    heatmap = profile.heatmap('week')
+    assert heatmap['periods'][0] == '2026-01-05' and heatmap['resources'] == ['R1', 'R2']
+    assert heatmap['utilization'][0][0] == 100.0
+    assert heatmap['utilization'][1][0] == 15.0  # 2 unités × 1,5 jour (3,5 à 5) sur 4 × 5 jours
+
+
+def test_aggregate_requires_calendar_and_known_period():
+    profile = LoadProfile.from_intervals(['R'], [0], [0], [3], [1], [1])
+    with pytest.raises(ValueError):
+        profile.aggregate()
+    profile.calendar = WorkCalendar(START)
+    with pytest.raises(ValueError):
+        profile.aggregate('year')
+    empty = LoadProfile.from_intervals(['R'], [], [], [], [], [1], calendar=profile.calendar)
+    assert empty.horizon == 0 and empty.aggregate()[0] == []
+
+
+def test_scheduler_profile_from_task_resources():
+    scheduler = ProjectScheduler()
+    scheduler.add_task(AdvancedTask('A', 'A', duration=3, resources={'DEV': 2}))
+    scheduler.add_task(AdvancedTask('B', 'B', duration=2, resources=['DEV', ('QA', 0.5)]))
+    scheduler.add_task(Task('C', 'C', duration=4))
+    scheduler.add_dependency('B', 'A')
+    scheduler.schedule_project()
+
+    profile = scheduler.load_profile({'DEV': 2})
+    assert profile.resources == ['DEV', 'QA']
+    assert profile.capacity.tolist() == [2.0, 1.0]  # QA : capacité par défaut
+    assert profile.daily('DEV').tolist() == [2, 2, 2, 1, 1]
+    assert profile.daily('QA').tolist() == [0, 0, 0, 0.5, 0.5]
+    assert profile.overallocations() == {}
+
+    # Besoins et débuts remplacés (planning nivelé)
+    profile = scheduler.load_profile({'DEV': 1}, demands={'A': [('DEV', 1)], 'C': [('DEV', 1)]},
+                                     starts={'C': 1})
+    assert profile.daily('DEV').tolist() == [1, 2, 2, 1, 1]
+    assert profile.overallocations() == {'DEV': [(1, 2, 2.0)]}
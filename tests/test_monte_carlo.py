@@ -0,0 +1,48 @@
+# Simulation Monte Carlo (voir monte_carlo.py)
+
+import datetime
+import random
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task
+
+np = pytest.importorskip('numpy')
+
+from pert_gantt.work_calendar import WorkCalendar  # noqa: E402
+
+
+def _project(estimated):
+    rnd = random.Random(4)
+    scheduler = ProjectScheduler()
+    tasks = []
+    for i in range(60):
+        if estimated and i % 2:
+            low = rnd.randint(1, 4)
+            task = Task(f'T{i}', f'T{i}', optimistic_time=low, most_likely_time=low + 2, pessimistic_time=low + 6)
+        else:
+            task = Task(f'T{i}', f'T{i}', duration=rnd.randint(0, 8))
+        scheduler.add_task(task)
+        tasks.append(task)
+    for _ in range(180):
+        a, b = sorted(rnd.sample(range(60), 2))
+        tasks[b].add_dependency(tasks[a], rnd.choice(('FS', 'SS', 'FF', 'SF')), rnd.choice((0, 1, -1)))
+    scheduler.schedule_project()
+    return scheduler
+
+
+def test_fixed_durations_match_cpm():
+    scheduler = _project(estimated=False)
+    result = scheduler.simulate(20, seed=1)
+    assert np.all(result.durations == scheduler.project_duration)
+    for task in scheduler.tasks.values():
+        assert result.criticality[task.id] == (1.0 if task.is_critical else 0.0)
+
+
+def test_percentiles_as_calendar_dates():
+    scheduler = _project(estimated=True)
+    calendar = WorkCalendar(datetime.date(2026, 1, 5))
+    result = scheduler.simulate(500, seed=2, calendar=calendar)
+    assert result.dates[80] == calendar.finish_date(result.percentiles[80])
+    assert result.dates[50] <= result.dates[80] <= result.dates[95]
+    assert result.probability_of_completion(result.dates[95]) >= 0.95
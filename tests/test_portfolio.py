@@ -0,0 +1,84 @@
+# Planification de portefeuille et par composantes (voir portfolio.py)
+
+import functools
+import random
+import sqlite3
+
+from pert_gantt import ProjectScheduler, Task
+from pert_gantt.portfolio import (schedule_components, schedule_portfolio, schedule_projects,
+                                  weakly_connected_components)
+
+
+def _project(seed, components=1, size=20):
+    rng = random.Random(seed)
+    scheduler = ProjectScheduler()
+    for c in range(components):
+        tasks = [Task(f'P{seed}C{c}T{i}', f'Tâche {i}', duration=rng.randint(0, 7)) for i in range(size)]
+        for task in tasks:
+            scheduler.add_task(task)
+        for _ in range(2 * size):
+            u, v = sorted(rng.sample(range(size), 2))
+            tasks[v].add_dependency(tasks[u], rng.choice(('FS', 'SS', 'FF', 'SF')), rng.choice((0, 2, -1)))
+    return scheduler
+
+
+def _results(scheduler):
+    return {task_id: (task.earliest_start, task.earliest_finish, task.latest_start, task.latest_finish,
+                      task.total_float, task.free_float, task.is_critical)
+            for task_id, task in scheduler.tasks.items()}
+
+
+def _reference(scheduler):
+    scheduler.schedule_project()
+    return scheduler.project_duration, _results(scheduler), [task.id for task in scheduler.critical_path]
+
+
+def test_portfolio_in_processes_matches_local_schedule():
+    expected = {seed: _reference(_project(seed)) for seed in range(3)}
+    schedulers = {seed: _project(seed) for seed in range(3)}
+    done = dict(schedule_portfolio(schedulers, workers=2))
+    assert sorted(done) == [0, 1, 2]
+    for seed, scheduler in done.items():
+        assert (scheduler.project_duration, _results(scheduler),
+                [task.id for task in scheduler.critical_path]) == expected[seed]
+
+
+def test_components_in_processes_match_full_schedule():
+    expected = _reference(_project(5, components=4))
+    scheduler = _project(5, components=4)
+    assert schedule_components(scheduler, workers=2) >= 4
+    assert scheduler.project_duration == expected[0]
+    assert _results(scheduler) == expected[1]
+    assert [task.id for task in scheduler.critical_path] == expected[2]
+
+
+def test_weakly_connected_components():
+    labels, count = weakly_connected_components(6, [0, 3, 4], [1, 5, 3])
+    assert count == 3
+    assert labels[0] == labels[1] and labels[3] == labels[4] == labels[5]
+    assert len({labels[0], labels[2], labels[3]}) == 3
+
+
+def test_projects_scheduled_in_database(tmp_path):
+    path = str(tmp_path / 'portefeuille.db')
+    connection = sqlite3.connect(path)
+    connection.executescript("""
+        CREATE TABLE projects (id TEXT PRIMARY KEY, start_date DATE, working_days_per_week INTEGER,
+                               exclude_weekends BOOLEAN, country_code TEXT);
+        CREATE TABLE tasks (id TEXT PRIMARY KEY, project_id TEXT, name TEXT, duration INTEGER,
+                            start_date DATE, parent_task_id TEXT,
+                            earliest_start DATE, earliest_finish DATE, latest_start DATE, latest_finish DATE,
+                            total_float INTEGER, free_float INTEGER, is_critical BOOLEAN);
+        CREATE TABLE dependencies (source_task_id TEXT, target_task_id TEXT, type TEXT, lag_days INTEGER);
+        INSERT INTO projects VALUES ('P1', '2026-03-02', 5, 1, 'FR'), ('P2', '2026-03-02', 5, 1, 'FR');
+        INSERT INTO tasks (id, project_id, name, duration) VALUES
+            ('A', 'P1', 'A', 3), ('B', 'P1', 'B', 2), ('C', 'P2', 'C', 4);
+        INSERT INTO dependencies VALUES ('A', 'B', 'FS', 0);
+    """)
+    connection.commit()
+    connection.close()
+
+    done = sorted(schedule_projects(functools.partial(sqlite3.connect, path), ['P1', 'P2'], workers=1))
+    assert done == [('P1', 5.0, 2), ('P2', 4.0, 1)]
+    rows = dict(sqlite3.connect(path).execute("SELECT id, earliest_finish FROM tasks").fetchall())
+    assert rows == {'A': '2026-03-04', 'B': '2026-03-06', 'C': '2026-03-05'}
@@ -0,0 +1,178 @@
+# Index d'accessibilité et analyse d'impact (voir reachability.py)
+
+import random
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task
+from pert_gantt.cpm_engine import CycleError
+from pert_gantt.reachability import ReachabilityIndex
+
+TYPES = ('FS', 'SS', 'FF', 'SF')
+
+
+def _random_dag(rng, n, m):
+    """Liens u -> v (u < v) dans un ordre d'index mélangé, pour ne pas favoriser les étiquettes"""
+    ids = [f'T{i}' for i in range(n)]
+    rng.shuffle(ids)
+    edges = []
+    for _ in range(m):
+        u = rng.randrange(n - 1)
+        edges.append((ids[u], ids[rng.randrange(u + 1, n)]))
+    return ids, edges
+
+
+def _index(ids, edges, labels=2):
+    position = {task_id: i for i, task_id in enumerate(ids)}
+    successors = [[] for _ in ids]
+    for u, v in edges:
+        successors[position[u]].append(position[v])
+    return ReachabilityIndex(ids, successors, labels)
+
+
+def _closure(ids, edges):
+    """Référence : parcours en largeur depuis chaque tâche"""
+    succ = {task_id: [] for task_id in ids}
+    for u, v in edges:
+        succ[u].append(v)
+    closure = {}
+    for start in ids:
+        seen, frontier = set(), [start]
+        while frontier:
+            frontier = [w for x in frontier for w in succ[x] if w not in seen]
+            seen.update(frontier)
+        closure[start] = seen
+    return closure
+
+
+def _check(index, ids, edges):
+    closure = _closure(ids, edges)
+    for u in ids:
+        assert index.descendants(u) == closure[u]
+        assert index.ancestors(u) == {v for v in ids if u in closure[v]}
+        for v in ids:
+            assert index.reaches(u, v) == (u == v or v in closure[u])
+
+
+@pytest.mark.parametrize('seed, labels', [(0, 2), (1, 2), (2, 1), (3, 3)])
+def test_queries_match_closure(seed, labels):
+    rng = random.Random(seed)
+    ids, edges = _random_dag(rng, 60, rng.choice((40, 120)))
+    index = _index(ids, edges, labels)
+    _check(index, ids, edges)
+    targets = rng.sample(ids, 10)
+    closure = _closure(ids, edges)
+    for task_id in ids:
+        assert index.affected(task_id, targets) == [t for t in targets if t in closure[task_id]]
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_updates_keep_index_exact(seed):
+    rng = random.Random(seed)
+    ids, edges = _random_dag(rng, 50, 60)
+    index = _index(ids, edges)
+    for step in range(150):  # Assez de modifications pour déclencher un recalcul des étiquettes
+        if edges and rng.random() < 0.4:
+            u, v = edges.pop(rng.randrange(len(edges)))
+            index.remove_edge(u, v)
+        else:
+            u, v = rng.sample(ids, 2)
+            closure = _closure(ids, edges)
+            if u in closure[v]:
+                with pytest.raises(CycleError):
+                    index.add_edge(u, v)
+                continue
+            index.add_edge(u, v)  # Liens à contre-sens de la numérotation : réordonnancement local
+            edges.append((u, v))
+        if step % 15 == 0:
+            _check(index, ids, edges)
+    _check(index, ids, edges)
+
+
+def test_parallel_links_removed_one_at_a_time():
+    index = _index(['A', 'B', 'C'], [('A', 'B'), ('A', 'B'), ('B', 'C')])
+    index.remove_edge('A', 'B')
+    assert index.reaches('A', 'C')
+    index.remove_edge('A', 'B')
+    assert not index.reaches('A', 'C') and index.descendants('A') == set()
+
+
+def _project(seed, n=40, m=80):
+    rng = random.Random(seed)
+    scheduler = ProjectScheduler()
+    tasks = [Task(f'T{i}', f'Tâche {i}', duration=rng.randint(0, 6)) for i in range(n)]
+    for task in tasks:
+        scheduler.add_task(task)
+    for _ in range(m):
+        u = rng.randrange(n - 1)
+        tasks[rng.randrange(u + 1, n)].add_dependency(tasks[u], rng.choice(TYPES), rng.choice((0, 1)))
+    return scheduler
+
+
+def _links(scheduler):
+    return [(pred.id, task.id) for task in scheduler.tasks.values() for pred, _, _ in task.predecessors]
+
+
+@pytest.mark.parametrize('reduce', (False, True))
+def test_scheduler_helpers_follow_edits(reduce):
+    scheduler = _project(5)
+    scheduler.reduce_dependencies = reduce
+    scheduler.schedule_project()
+    ids = list(scheduler.tasks)
+    rng = random.Random(5)
+    for _ in range(40):
+        links = _links(scheduler)
+        closure = _closure(ids, links)
+        if rng.random() < 0.5:
+            pred_id, task_id = rng.choice(links)
+            assert scheduler.remove_dependency(task_id, pred_id) >= 1
+        else:
+            pred_id, task_id = rng.sample(ids, 2)
+            if pred_id in closure[task_id]:
+                before = scheduler.tasks[task_id].predecessors[:]
+                with pytest.raises(CycleError):
+                    scheduler.add_dependency(task_id, pred_id)
+                assert scheduler.tasks[task_id].predecessors == before  # Rien n'est modifié
+                continue
+            scheduler.add_dependency(task_id, pred_id, rng.choice(TYPES))
+    closure = _closure(ids, _links(scheduler))
+    for task_id in ids:
+        assert scheduler.downstream(task_id) == closure[task_id]
+        for other_id in ids:
+            assert scheduler.depends_on(other_id, task_id) == (other_id in closure[task_id])
+    scheduler.reschedule()  # Le réseau modifié reste planifiable
+
+
+def test_redundant_link_removed_after_reduction():
+    scheduler = ProjectScheduler()
+    scheduler.reduce_dependencies = True
+    a, b, c = (Task(task_id, task_id, duration=2) for task_id in 'ABC')
+    for task in (a, b, c):
+        scheduler.add_task(task)
+    b.add_dependency(a)
+    c.add_dependency(b)
+    c.add_dependency(a)
+    scheduler.schedule_project()  # Index construit ensuite, sur le réseau planifié
+    assert scheduler._graph.removed_edges == 1
+    assert scheduler.depends_on('C', 'A')
+    assert scheduler.remove_dependency('C', 'A') == 1  # Lien absent du graphe réduit, présent dans l'index
+    assert scheduler.depends_on('C', 'A')
+    scheduler.remove_dependency('C', 'B')
+    assert not scheduler.depends_on('C', 'A')
+
+
+def test_print_impact_lists_milestones_and_critical(capsys):
+    scheduler = ProjectScheduler()
+    for task_id, duration in (('A', 3), ('B', 2), ('M', 0), ('C', 1)):
+        scheduler.add_task(Task(task_id, task_id, duration=duration))
+    scheduler.add_dependency('B', 'A')
+    scheduler.add_dependency('M', 'B')
+    scheduler.schedule_project()
+    assert not scheduler.depends_on('A', 'A') and scheduler.depends_on('M', 'A')
+    scheduler.print_impact('A')
+    output = capsys.readouterr().out
+    assert 'Tâches en aval: 2 (dont 2 critiques)' in output
+    assert 'Jalon M: M' in output
+    scheduler.add_task(Task('D', 'D', duration=1))  # Nouvelle tâche : index reconstruit
+    scheduler.add_dependency('D', 'M')
+    assert scheduler.downstream('A') == {'B', 'M', 'D'}
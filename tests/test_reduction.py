@@ -0,0 +1,108 @@
+# Réduction des liens redondants (voir reduction.py)
+
+import random
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task, reduction
+from pert_gantt.benchmarks.networks import layered, random_dag
+from pert_gantt.cpm_engine import CompiledGraph
+
+TYPES = ('FS', 'SS', 'FF', 'SF')
+
+
+def _project(seed, n=40, window=6):
+    """Liens locaux nombreux (doublons, raccourcis A -> C, types et lags mélangés)"""
+    rng = random.Random(seed)
+    scheduler = ProjectScheduler()
+    tasks = [Task(f'T{i}', f'Tâche {i}', duration=rng.choice((0, 1, 2, 5, 0.5))) for i in range(n)]
+    for task in tasks:
+        scheduler.add_task(task)
+    for v in range(1, n):
+        for _ in range(rng.randint(1, 4)):
+            u = rng.randrange(max(0, v - window), v)
+            tasks[v].add_dependency(tasks[u], rng.choice(TYPES + ('FS', 'FS')), rng.choice((0, 0, 1, 3, -1)))
+    return scheduler
+
+
+def _state(scheduler):
+    results = {task_id: (task.earliest_start, task.earliest_finish, task.latest_start, task.latest_finish,
+                         task.total_float, task.free_float, task.is_critical)
+               for task_id, task in scheduler.tasks.items()}
+    return scheduler.project_duration, results, [task.id for task in scheduler.critical_path]
+
+
+def _graph(network):
+    return CompiledGraph(list(range(len(network.ids))), network.durations, network.edges)
+
+
+def test_reduced_schedule_is_identical(monkeypatch):
+    monkeypatch.setattr(reduction, 'MIN_GAIN', 0)  # Graphe réduit même pour un faible gain
+    removed = 0
+    for seed in range(60):
+        expected = _project(seed)
+        expected.schedule_project()
+        scheduler = _project(seed)
+        scheduler.reduce_dependencies = True
+        scheduler.schedule_project()
+        removed += scheduler._graph.removed_edges
+        assert _state(scheduler) == _state(expected)
+
+        # Durées modifiées après la réduction : les liens retirés restent impliqués
+        rng = random.Random(seed)
+        for task_id in rng.sample(list(expected.tasks), 5):
+            duration = rng.choice((0, 3, 8))
+            expected.update_duration(task_id, duration)
+            scheduler.update_duration(task_id, duration)
+        expected.schedule_project()
+        scheduler.schedule_project()
+        assert _state(scheduler) == _state(expected)
+    assert removed > 0
+
+
+def test_removed_links_are_reported():
+    scheduler = ProjectScheduler()
+    a, b, c = (Task(task_id, task_id, duration=2) for task_id in 'ABC')
+    for task in (a, b, c):
+        scheduler.add_task(task)
+    b.add_dependency(a)
+    c.add_dependency(b)
+    c.add_dependency(a)          # Raccourci A -> C
+    c.add_dependency(a, 'SS')    # Couvert par A -> C (FS), quelle que soit la durée de A
+    c.add_dependency(a, 'SS', 1)  # Non couvert si A dure moins d'un jour
+    c.add_dependency(b, 'SF')    # Jamais retiré
+    assert sorted(scheduler.redundant_dependencies()) == [('A', 'C', 'FS', 0), ('A', 'C', 'SS', 0)]
+    scheduler.reduce_dependencies = True
+    scheduler.schedule_project()
+    assert scheduler._graph.removed_edges == 2
+    assert len(c.predecessors) == 5  # Les tâches gardent tous leurs liens
+
+
+def test_search_is_bounded():
+    graph = _graph(random_dag(600, edges_per_task=6, window=30))
+    full = reduction.redundant_edges(graph, min_gain=0)
+    assert len(full) > 0.2 * len(graph.succ_idx)
+    short = reduction.redundant_edges(graph, work_per_link=2, min_gain=0)
+    assert 0 < len(short) < len(full)
+    assert set(short) <= set(full)  # Recherche écourtée : seulement moins de liens retirés
+    assert reduction.redundant_edges(graph, max_visits=0) == []
+
+
+@pytest.mark.parametrize('network', [
+    random_dag(2000, edges_per_task=6), random_dag(600, edges_per_task=6, window=60, mixed=True),
+    layered(600, width=30),
+])
+def test_low_gain_keeps_full_graph(network):
+    # Liens tirés dans tout le passé, types et lags mélangés ou couches successives : peu de liens redondants
+    graph = _graph(network)
+    assert len(reduction.redundant_edges(graph)) < reduction.MIN_GAIN * len(network.edges)
+    scheduler = ProjectScheduler()
+    tasks = [Task(task_id, task_id, duration=duration) for task_id, duration in zip(network.ids, network.durations)]
+    for task in tasks:
+        scheduler.add_task(task)
+    for u, v, code, lag in network.edges:
+        tasks[v].add_dependency(tasks[u], TYPES[code], lag)
+    scheduler.reduce_dependencies = True
+    scheduler.schedule_project()
+    assert scheduler._graph.removed_edges == 0
+    assert len(scheduler._graph.succ_idx) == len(network.edges)
@@ -0,0 +1,125 @@
+# Nivellement des ressources sous contrainte de capacité (voir resource_leveling.py)
+
+import math
+import random
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task
+from pert_gantt.resource_leveling import CapacityTimeline
+
+TYPES = ('FS', 'SS', 'FF', 'SF')
+CAPACITIES = {'R1': 2, 'R2': 1}
+
+
+def _project(seed, n=40, m=60):
+    rng = random.Random(seed)
+    scheduler = ProjectScheduler()
+    tasks = [Task(f'T{i}', f'Tâche {i}', duration=rng.randint(0, 6)) for i in range(n)]
+    for task in tasks:
+        scheduler.add_task(task)
+    for _ in range(m):
+        u = rng.randrange(n - 1)
+        v = rng.randrange(u + 1, n)
+        tasks[v].add_dependency(tasks[u], rng.choice(TYPES), rng.choice((0, 0, 1, -1)))
+    demands = {task.id: [(resource, rng.choice((1, 1, 2)))
+                         for resource in rng.sample(sorted(CAPACITIES), rng.randint(0, 2))]
+               for task in tasks}
+    scheduler.schedule_project()
+    return scheduler, demands
+
+
+def _daily_loads(scheduler, result, demands):
+    loads = {}
+    for task_id, task in scheduler.tasks.items():
+        start = result.start[task_id]
+        for day in range(math.floor(start), math.ceil(start + task.duration)):
+            for resource, units in demands[task_id]:
+                loads[resource, day] = loads.get((resource, day), 0) + min(units, CAPACITIES[resource])
+    return loads
+
+
+def _links_respected(scheduler, result):
+    start, finish = result.start, result.finish
+    for task in scheduler.tasks.values():
+        for pred, dep_type, lag in task.predecessors:
+            earliest = {'FS': finish[pred.id] + lag, 'SS': start[pred.id] + lag,
+                        'FF': finish[pred.id] + lag - task.duration,
+                        'SF': start[pred.id] + lag - task.duration}[dep_type]
+            if start[task.id] < earliest - 1e-9:
+                return False
+    return True
+
+
+@pytest.mark.parametrize('method', ('serial', 'parallel'))
+@pytest.mark.parametrize('seed', range(4))
+def test_leveled_schedule_fits_capacity_and_links(seed, method):
+    scheduler, demands = _project(seed)
+    result = scheduler.level_resources(CAPACITIES, demands, method=method)
+    loads = _daily_loads(scheduler, result, demands)
+    assert all(load <= CAPACITIES[resource] for (resource, _), load in loads.items())
+    assert _links_respected(scheduler, result)
+    for task_id, task in scheduler.tasks.items():
+        assert result.finish[task_id] == result.start[task_id] + task.duration
+        assert result.start[task_id] >= task.earliest_start
+        assert result.delays.get(task_id, 0) == result.start[task_id] - task.earliest_start
+    assert result.project_duration >= scheduler.project_duration
+    assert result.peaks == {resource: max(load for (r, _), load in loads.items() if r == resource)
+                            for resource in {r for r, _ in loads}}
+
+
+@pytest.mark.parametrize('method', ('serial', 'parallel'))
+def test_ample_capacity_keeps_cpm_dates(method):
+    scheduler, demands = _project(11)
+    result = scheduler.level_resources({'R1': 100, 'R2': 100}, demands, method=method)
+    assert result.delays == {}
+    assert result.project_duration == scheduler.project_duration
+    assert result.start == {task_id: task.earliest_start for task_id, task in scheduler.tasks.items()}
+
+
+@pytest.mark.parametrize('method', ('serial', 'parallel'))
+def test_single_resource_chains_parallel_tasks(method):
+    scheduler = ProjectScheduler()
+    for task_id, duration in (('A', 3), ('B', 2), ('C', 4)):
+        scheduler.add_task(Task(task_id, task_id, duration=duration))
+    scheduler.add_dependency('C', 'A')
+    scheduler.schedule_project()
+    demands = {'A': [('R', 1)], 'B': [('R', 1)], 'C': [('R', 1)]}
+    result = scheduler.level_resources({'R': 1}, demands, method=method)
+    # B a le plus de flottement : A puis C d'abord, B ensuite
+    assert result.start == {'A': 0, 'C': 3, 'B': 7}
+    assert result.delays == {'B': 7}
+    assert result.project_duration == 9
+    assert result.peaks == {'R': 1}
+
+
+def test_unknown_rule_and_method_rejected():
+    scheduler, demands = _project(0, n=5, m=4)
+    with pytest.raises(ValueError):
+        scheduler.level_resources(CAPACITIES, demands, rule='inconnue')
+    with pytest.raises(ValueError):
+        scheduler.level_resources(CAPACITIES, demands, method='aléatoire')
+
+
+def test_capacity_timeline_matches_daily_array():
+    rng = random.Random(5)
+    timeline = CapacityTimeline(8)  # L'horizon double à la demande
+    daily = [0.0] * 300
+    for _ in range(200):
+        start = rng.randrange(250)
+        end = start + rng.randint(0, 40)
+        amount = rng.choice((0.5, 1.0, 2.0))
+        timeline.add(start, end, amount)
+        for day in range(start, end):
+            daily[day] += amount
+
+        lo = rng.randrange(290)
+        hi = lo + rng.randint(1, 10)
+        limit = rng.choice((0.0, 1.0, 3.0, 6.0))
+        assert timeline.peak(lo, hi) == max(daily[lo:hi])
+        assert timeline.first_over(lo, hi, limit) == next(
+            (day for day in range(lo, hi) if daily[day] > limit), None)
+        assert timeline.first_at_most(lo, limit) == next(
+            day for day in range(lo, len(daily)) if daily[day] <= limit)
+        assert timeline.usage(lo) == daily[lo]
+    assert timeline.peak() == max(daily)
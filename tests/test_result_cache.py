@@ -0,0 +1,144 @@
+# Cache des résultats CPM par empreinte du graphe (voir result_cache.py)
+
+import random
+from array import array
+
+from pert_gantt import ProjectScheduler, Task
+from pert_gantt.result_cache import ScheduleCache, scheduler_fingerprint
+
+TYPES = ('FS', 'SS', 'FF', 'SF')
+
+
+def _project(seed=0, components=1, size=25, estimates=False):
+    rng = random.Random(seed)
+    scheduler = ProjectScheduler()
+    for c in range(components):
+        tasks = [Task(f'C{c}T{i}', f'Tâche {i}', 1, 2, 6) if estimates and i % 3 == 0
+                 else Task(f'C{c}T{i}', f'Tâche {i}', duration=rng.randint(1, 8)) for i in range(size)]
+        for task in tasks:
+            scheduler.add_task(task)
+        for _ in range(2 * size):
+            u, v = sorted(rng.sample(range(size), 2))
+            tasks[v].add_dependency(tasks[u], rng.choice(TYPES), rng.choice((0, 1, -1)))
+    return scheduler
+
+
+def _results(scheduler):
+    return {task_id: (task.earliest_start, task.earliest_finish, task.latest_start, task.latest_finish,
+                      task.total_float, task.free_float, task.is_critical)
+            for task_id, task in scheduler.tasks.items()}
+
+
+def _reference(scheduler):
+    scheduler.schedule_project()
+    return scheduler.project_duration, _results(scheduler), [task.id for task in scheduler.critical_path]
+
+
+def _state(scheduler):
+    return scheduler.project_duration, _results(scheduler), [task.id for task in scheduler.critical_path]
+
+
+def test_fingerprint_follows_every_input():
+    key = scheduler_fingerprint(_project(estimates=True))[0]
+    assert scheduler_fingerprint(_project(estimates=True))[0] == key
+
+    changes = []
+    scheduler = _project(estimates=True)
+    scheduler.tasks['C0T4'].duration += 1
+    changes.append(scheduler)
+    scheduler = _project(estimates=True)
+    scheduler.tasks['C0T3'].pessimistic_time = 9  # Durée inchangée, variance modifiée
+    changes.append(scheduler)
+    scheduler = _project(estimates=True)
+    task = scheduler.tasks['C0T20']
+    pred, dep_type, lag = task.predecessors[0]
+    task.remove_dependency(pred, dep_type, lag)
+    task.add_dependency(pred, dep_type, lag + 1)
+    changes.append(scheduler)
+    scheduler = _project(estimates=True)
+    task = scheduler.tasks['C0T20']
+    pred = scheduler.tasks[pred.id]
+    task.remove_dependency(pred, dep_type, lag)
+    task.add_dependency(pred, 'SS' if dep_type != 'SS' else 'FF', lag)
+    changes.append(scheduler)
+    assert len({key} | {scheduler_fingerprint(scheduler)[0] for scheduler in changes}) == 5
+
+    compact = _project(estimates=True).to_compact()
+    assert scheduler_fingerprint(compact)[0] == scheduler_fingerprint(compact)[0]
+
+
+def test_cached_schedule_matches_full_schedule():
+    expected = _reference(_project(1))
+    cache = ScheduleCache()
+    first, second = _project(1), _project(1)
+    assert first.schedule_cached(cache) is False
+    assert _state(first) == expected
+    assert second.schedule_cached(cache) is True
+    assert _state(second) == expected
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+    # Les colonnes du cache ne sont pas partagées avec le planificateur
+    second.update_duration('C0T5', 30)
+    second.reschedule()
+    third = _project(1)
+    assert third.schedule_cached(cache) is True
+    assert _state(third) == expected
+
+    changed = _project(1)
+    changed.update_duration('C0T5', 30)
+    assert changed.schedule_cached(cache) is False
+    assert _state(changed) == _state(second)
+
+
+def test_lru_bounds():
+    cache = ScheduleCache(max_entries=2, max_bytes=100)
+    cache.put('a', (array('d', [1.0] * 5),))
+    cache.put('b', (array('d', [2.0] * 5),))
+    assert cache.get('a') is not None  # 'a' devient la plus récente
+    cache.put('c', (array('d', [3.0] * 5),))
+    assert 'b' not in cache and 'a' in cache and 'c' in cache
+    assert cache.size == 80
+    cache.put('d', (array('d', [4.0] * 20),))  # 160 octets : trop volumineuse, non conservée
+    assert 'd' not in cache and len(cache) == 2
+    cache.put('e', (array('d', [5.0] * 8),))  # 64 octets : évince les deux autres
+    assert list(cache._entries) == ['e'] and cache.size == 64
+
+
+def test_disk_level_is_shared(tmp_path):
+    directory = str(tmp_path / 'cache')
+    expected = _reference(_project(2))
+    assert _project(2).schedule_cached(ScheduleCache(directory=directory)) is False
+
+    other = ScheduleCache(directory=directory)  # Autre processus : mémoire vide
+    scheduler = _project(2)
+    assert scheduler.schedule_cached(other) is True
+    assert (other.disk_hits, other.hits) == (1, 0)
+    assert _state(scheduler) == expected
+    assert _project(2).schedule_cached(other) is True
+    assert other.hits == 1  # Remontée en mémoire
+
+    other.clear(disk=True)
+    assert _project(2).schedule_cached(ScheduleCache(directory=directory)) is False
+
+
+def test_components_recomputed_only_when_changed():
+    expected = _reference(_project(3, components=4))
+    cache = ScheduleCache()
+    scheduler = _project(3, components=4)
+    assert scheduler.schedule_cached(cache, components=True) == 4
+    assert _state(scheduler) == expected
+
+    # Graphe identique : tout vient du cache
+    assert _project(3, components=4).schedule_cached(cache, components=True) == 0
+
+    # Composante non critique allongée sans changer la durée du projet : seule elle est refaite
+    critical = {task_id[:2] for task_id, result in expected[1].items() if result[-1]}
+    component = next(f'C{c}' for c in range(4) if f'C{c}' not in critical)
+    reference = _project(3, components=4)
+    reference.tasks[f'{component}T0'].duration += 1
+    expected_changed = _reference(reference)
+    assert expected_changed[0] == expected[0]
+    changed = _project(3, components=4)
+    changed.tasks[f'{component}T0'].duration += 1
+    assert changed.schedule_cached(cache, components=True) == 1
+    assert _state(changed) == expected_changed
@@ -0,0 +1,35 @@
+# Scénarios « what-if » évalués par lot (voir scenarios.py)
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task
+
+pytest.importorskip('numpy')
+
+from pert_gantt.scenarios import Scenario  # noqa: E402
+
+
+def _project():
+    scheduler = ProjectScheduler()
+    for task_id, duration in (('A', 3), ('B', 2), ('C', 1), ('D', 4)):
+        scheduler.add_task(Task(task_id, task_id, duration=duration))
+    scheduler.add_dependency('B', 'A')
+    scheduler.add_dependency('C', 'B')
+    scheduler.add_dependency('D', 'A')
+    return scheduler
+
+
+def test_reversed_link_is_not_a_cycle():
+    reverse = Scenario("B avant A", removed=[('A', 'B')], added=[('B', 'A', 'FS', 0)])
+    for batch in ([reverse], [reverse, Scenario("C à 5 jours", {'C': 5})]):
+        reference, result = _project().compare_scenarios(batch)[:2]
+        assert reference.project_duration == 7
+        assert result.error is None
+        assert result.project_duration == 9
+
+
+def test_cyclic_scenario_reports_error_without_affecting_batch():
+    batch = [Scenario("Cycle", added=[('C', 'A', 'FS', 0)]), Scenario("C à 5 jours", {'C': 5})]
+    _, cyclic, longer = _project().compare_scenarios(batch)
+    assert cyclic.error
+    assert longer.project_duration == 10
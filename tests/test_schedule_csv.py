@@ -0,0 +1,71 @@
+# Export et relecture CSV du planning (voir schedule_csv.py)
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task
+from pert_gantt.schedule_csv import format_id, parse_id, parse_links
+
+IDS = ['A', 'B;1', 'C(2)', 7, '42', 'D\\x', ' E', 'F, G', -3]
+
+
+def _project():
+    scheduler = ProjectScheduler()
+    tasks = [Task(IDS[0], 'Conception', 2, 3, 7)] + \
+            [Task(task_id, f'Tâche {task_id}', duration=i + 1) for i, task_id in enumerate(IDS[1:])]
+    tasks[3].duration = 2.5
+    for task in tasks:
+        scheduler.add_task(task)
+    for i, (dep_type, lag) in enumerate((('FS', 0), ('SS', 1), ('FF', -1.5), ('SF', 2)) * 2):
+        tasks[i + 1].add_dependency(tasks[i], dep_type, lag)
+    tasks[8].add_dependency(tasks[1], 'FS', 0.25)
+    return scheduler
+
+
+def _content(scheduler):
+    def links(task):
+        return sorted((str(pred.id), dep_type, lag) for pred, dep_type, lag in task.predecessors)
+    return {task_id: (type(task_id), task.name, task.duration, links(task),
+                      tuple(getattr(task, name, None)
+                            for name in ('optimistic_time', 'most_likely_time', 'pessimistic_time')))
+            for task_id, task in scheduler.tasks.items()}
+
+
+@pytest.mark.parametrize('compact', (False, True))
+@pytest.mark.parametrize('order', ('topological', 'earliest_start', 'insertion'))
+def test_round_trip_is_lossless(tmp_path, compact, order):
+    original = _project()
+    original.schedule_project()
+    path = str(tmp_path / 'planning.csv')
+    assert original.export_to_csv(path, order) == len(IDS)
+    copy = ProjectScheduler.from_csv(path, compact=compact)
+    assert _content(copy) == _content(original)
+    copy.schedule_project()
+    assert copy.project_duration == original.project_duration
+    assert [task.id for task in copy.critical_path] == [task.id for task in original.critical_path]
+
+    # Deuxième aller-retour depuis la copie (TaskStore ou objets) : fichier identique
+    again = str(tmp_path / 'encore.csv')
+    copy.export_to_csv(again, order)
+    with open(path, encoding='utf-8') as first, open(again, encoding='utf-8') as second:
+        assert first.read() == second.read()
+
+
+def test_ids_are_escaped():
+    for task_id in IDS + ['', '\\', '(', '0', '01', 'x\ny']:
+        assert parse_id(format_id(task_id)) == task_id
+    assert format_id('42') == '\\42' and format_id(42) == '42' and format_id('007') == '007'
+    assert parse_links(r'B\;1(FS,0); C\(2\)(SS,-1.5);7(FF,2)') == [
+        ('B;1', 'FS', 0), ('C(2)', 'SS', -1.5), (7, 'FF', 2)]
+
+
+def test_legacy_name_references(tmp_path):
+    path = tmp_path / 'ancien.csv'
+    path.write_text("ID,Nom,Durée,Prédécesseurs\n"
+                    "T1,Étude (phase 1),3,\n"
+                    "T2,Réalisation,2,\"Étude (phase 1)(FS,1)\"\n", encoding='utf-8')
+    scheduler = ProjectScheduler.from_csv(str(path))
+    assert [(pred.id, dep_type, lag) for pred, dep_type, lag in scheduler.tasks['T2'].predecessors] == [
+        ('T1', 'FS', 1)]
+    assert not hasattr(scheduler.tasks['T1'], 'optimistic_time')
+    with pytest.raises(ValueError):
+        parse_links('T1[FS,0]')
@@ -0,0 +1,66 @@
+# Service de planification : modifications invalides et calculs en échec (voir service.py)
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task
+from pert_gantt.service import SchedulingService
+from pert_gantt.validation import CycleError
+
+
+def _load(project_id):
+    scheduler = ProjectScheduler()
+    for task_id, duration in (('A', 3), ('B', 2), ('C', 1)):
+        scheduler.add_task(Task(task_id, task_id, duration=duration))
+    scheduler.add_dependency('B', 'A')
+    scheduler.add_dependency('C', 'B')
+    return scheduler
+
+
+def _run(scenario, loader=_load):
+    async def main():
+        async with SchedulingService(loader, executor=ThreadPoolExecutor(1), debounce=0) as service:
+            return await scenario(service)
+    return asyncio.run(main())
+
+
+def test_cycle_before_first_schedule_is_rejected():
+    async def scenario(service):
+        with pytest.raises(CycleError):
+            await service.submit(1, [('add_dependency', 'A', 'C')])
+        return await service.schedule(1)
+
+    assert _run(scenario).project_duration == 6
+
+
+def test_failing_request_applies_none_of_its_edits():
+    async def scenario(service):
+        with pytest.raises(KeyError):
+            await service.submit(1, [('update_duration', 'A', 10), ('remove_dependency', 'C', 'B'),
+                                     ('update_duration', 'Z', 1)])
+        return await service.schedule(1)
+
+    result = _run(scenario)
+    assert result.project_duration == 6
+    assert result.critical_path == ['A', 'B', 'C']
+
+
+def test_failed_computation_reloads_project():
+    loads = []
+
+    def loader(project_id):
+        loads.append(project_id)
+        scheduler = _load(project_id)
+        if len(loads) == 1:
+            scheduler.pack = None  # Premier chargement inutilisable
+        return scheduler
+
+    async def scenario(service):
+        with pytest.raises(TypeError):
+            await service.schedule(1)
+        return await service.schedule(1)
+
+    assert _run(scenario, loader).project_duration == 6
+    assert loads == [1, 1]
@@ -0,0 +1,79 @@
+# Instantané binaire en colonnes projetées en mémoire (voir snapshot.py)
+
+import os
+import random
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task
+
+np = pytest.importorskip('numpy')
+
+from pert_gantt.snapshot import IntIndex  # noqa: E402
+from pert_gantt.task_store import ColumnIndex  # noqa: E402
+
+
+def _project(ids, compact=False):
+    rng = random.Random(4)
+    scheduler = ProjectScheduler()
+    tasks = [Task(task_id, f'Tâche {task_id}', duration=rng.randint(1, 6)) for task_id in ids]
+    for task in tasks:
+        scheduler.add_task(task)
+    for _ in range(2 * len(tasks)):
+        u, v = sorted(rng.sample(range(len(tasks)), 2))
+        tasks[v].add_dependency(tasks[u], rng.choice(('FS', 'SS', 'FF', 'SF')), rng.choice((0, 1, -1)))
+    if compact:
+        scheduler = scheduler.to_compact()
+    scheduler.schedule_project()
+    return scheduler
+
+
+def _results(scheduler):
+    return {task_id: (task.duration, task.earliest_start, task.earliest_finish, task.latest_start,
+                      task.latest_finish, task.total_float, task.free_float, task.is_critical)
+            for task_id, task in scheduler.tasks.items()}
+
+
+STRING_IDS = [f'tâche-{i:03d}' for i in range(60)][::-1]
+INTEGER_IDS = [7 * i - 100 for i in range(60)][::-1]
+
+
+@pytest.mark.parametrize('ids, index_type', [(STRING_IDS, ColumnIndex), (INTEGER_IDS, IntIndex)])
+def test_lookup_uses_persisted_index(tmp_path, ids, index_type):
+    original = _project(ids)
+    path = original.save_snapshot(str(tmp_path / 'instantane'))
+    loaded = ProjectScheduler.load_snapshot(path)
+    index = loaded._store._index
+    assert isinstance(index, index_type)  # Aucun tri ni dictionnaire au chargement
+    assert [index[task_id] for task_id in ids] == list(range(len(ids)))
+    assert _results(loaded) == _results(original)
+    assert [task.id for task in loaded.critical_path] == [task.id for task in original.critical_path]
+    for missing in ('absente', 3, 2 ** 70, 1.5, None):
+        assert missing not in loaded.tasks
+    with pytest.raises(KeyError):
+        loaded.tasks['absente']
+
+
+def test_snapshot_without_order_file_still_loads(tmp_path):
+    original = _project(STRING_IDS, compact=True)
+    path = original.save_snapshot(str(tmp_path / 'ancien'))
+    os.remove(os.path.join(path, 'ids.order.npy'))
+    loaded = ProjectScheduler.load_snapshot(path)
+    assert loaded.tasks['tâche-010'].earliest_start == original.tasks['tâche-010'].earliest_start
+
+
+@pytest.mark.parametrize('mmap', (True, False))
+def test_durations_editable_without_touching_files(tmp_path, mmap):
+    original = _project(STRING_IDS)
+    path = original.save_snapshot(str(tmp_path / 'instantane'))
+    before = _results(original)
+
+    loaded = ProjectScheduler.load_snapshot(path, mmap=mmap)
+    loaded.update_duration('tâche-030', 25)
+    loaded.reschedule()
+    original.update_duration('tâche-030', 25)
+    original.reschedule()
+    assert loaded.project_duration == original.project_duration
+    assert _results(loaded) == _results(original)
+
+    assert _results(ProjectScheduler.load_snapshot(path)) == before  # Fichiers inchangés
@@ -0,0 +1,123 @@
+# Replanification à la date d'état (voir status_date.py)
+
+import random
+from datetime import date
+
+import pytest
+
+from pert_gantt import AdvancedTask, ProjectScheduler, Task, WorkCalendar
+from pert_gantt.status_date import TaskProgress, progress_from_tasks
+
+TYPES = ('FS', 'SS', 'FF', 'SF')
+
+
+def _chain(task_class=Task):
+    scheduler = ProjectScheduler()
+    for task_id, duration in (('A', 5), ('B', 4), ('C', 3), ('D', 2)):
+        scheduler.add_task(task_class(task_id, task_id, duration=duration))
+    scheduler.add_dependency('B', 'A')
+    scheduler.add_dependency('C', 'B')
+    scheduler.add_dependency('D', 'A', 'SS', 1)
+    return scheduler
+
+
+def _random_project(seed, n=40, m=80):
+    rng = random.Random(seed)
+    scheduler = ProjectScheduler()
+    tasks = [Task(f'T{i}', f'Tâche {i}', duration=rng.randint(1, 6)) for i in range(n)]
+    for task in tasks:
+        scheduler.add_task(task)
+    for _ in range(m):
+        u = rng.randrange(n - 1)
+        v = rng.randrange(u + 1, n)
+        tasks[v].add_dependency(tasks[u], rng.choice(TYPES), rng.choice((0, 1, -1)))
+    return scheduler
+
+
+def _results(scheduler):
+    return {task_id: (task.earliest_start, task.earliest_finish, task.latest_start, task.latest_finish,
+                      task.total_float, task.free_float, task.is_critical)
+            for task_id, task in scheduler.tasks.items()}
+
+
+def test_done_in_progress_and_open_tasks():
+    scheduler = _chain()
+    progress = {'A': TaskProgress(0, 6, 100), 'B': TaskProgress(6, None, 50)}
+    assert scheduler.schedule_from_status(7, progress) == 3  # B, C et D recalculées
+    tasks = scheduler.tasks
+    assert (tasks['A'].earliest_start, tasks['A'].earliest_finish) == (0, 6)  # Dates réelles
+    assert not tasks['A'].is_critical and tasks['A'].total_float == 0
+    assert (tasks['B'].earliest_start, tasks['B'].earliest_finish) == (6, 9)  # Reste 2 jours dès le 7
+    assert (tasks['C'].earliest_start, tasks['C'].earliest_finish) == (9, 12)
+    assert (tasks['D'].earliest_start, tasks['D'].earliest_finish) == (7, 9)  # Pas avant la date d'état
+    assert tasks['D'].total_float == 3
+    assert scheduler.project_duration == 12
+    assert [task.id for task in scheduler.critical_path] == ['B', 'C']
+
+
+def test_unknown_dates_use_status_and_duration():
+    scheduler = _chain()
+    progress = {'A': TaskProgress(percent_complete=100), 'B': TaskProgress(percent_complete=25)}
+    scheduler.schedule_from_status(8, progress)
+    tasks = scheduler.tasks
+    assert (tasks['A'].earliest_start, tasks['A'].earliest_finish) == (3, 8)  # Fin = date d'état
+    assert (tasks['B'].earliest_start, tasks['B'].earliest_finish) == (8, 11)
+    assert tasks['C'].earliest_start == 11
+
+
+def test_progress_read_from_tasks_with_calendar():
+    scheduler = _chain(AdvancedTask)
+    scheduler.start_date = date(2026, 1, 5)
+    scheduler.calendar = WorkCalendar(scheduler.start_date)
+    a, b = scheduler.tasks['A'], scheduler.tasks['B']
+    a.actual_start, a.actual_finish, a.percent_complete = date(2026, 1, 5), date(2026, 1, 9), 100
+    b.actual_start, b.percent_complete = date(2026, 1, 12), 50
+    assert set(progress_from_tasks(scheduler.tasks.values())) == {'A', 'B'}
+    scheduler.schedule_from_status(date(2026, 1, 14))  # Décalage 7
+    assert (a.earliest_start, a.earliest_finish) == (0, 5)
+    assert (b.earliest_start, b.earliest_finish) == (5, 9)
+    assert scheduler.project_duration == 12
+    assert scheduler.task_dates()['C'] == (date(2026, 1, 16), date(2026, 1, 20),
+                                           date(2026, 1, 16), date(2026, 1, 20))
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_no_progress_at_start_matches_schedule(seed):
+    expected = _random_project(seed)
+    expected.schedule_project()
+    scheduler = _random_project(seed)
+    assert scheduler.schedule_from_status(0, {}) == len(scheduler.tasks)
+    assert scheduler.project_duration == expected.project_duration
+    assert _results(scheduler) == _results(expected)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_open_tasks_respect_status_and_links(seed):
+    scheduler = _random_project(seed)
+    scheduler.schedule_project()
+    rng = random.Random(seed)
+    status = scheduler.project_duration / 3
+    progress = {}
+    for task in scheduler.tasks.values():
+        if task.earliest_finish <= status:
+            progress[task.id] = TaskProgress(task.earliest_start, task.earliest_finish + rng.randint(0, 2), 100)
+        elif task.earliest_start < status:
+            progress[task.id] = TaskProgress(task.earliest_start, None, rng.choice((10, 50, 90)))
+    recomputed = scheduler.schedule_from_status(status, progress)
+    done = {task_id for task_id, item in progress.items() if item.percent_complete == 100}
+    assert recomputed == len(scheduler.tasks) - len(done)
+
+    for task in scheduler.tasks.values():
+        if task.id in progress:
+            assert task.earliest_start == progress[task.id].actual_start
+            continue
+        assert task.earliest_start >= status
+        assert task.earliest_finish == task.earliest_start + task.duration
+        for pred, dep_type, lag in task.predecessors:
+            earliest = {'FS': pred.earliest_finish + lag, 'SS': pred.earliest_start + lag,
+                        'FF': pred.earliest_finish + lag - task.duration,
+                        'SF': pred.earliest_start + lag - task.duration}[dep_type]
+            assert task.earliest_start >= earliest
+        assert task.total_float == pytest.approx(task.latest_start - task.earliest_start)
+        assert task.total_float >= -1e-9 and task.free_float >= 0
+    assert scheduler.project_duration == max(task.earliest_finish for task in scheduler.tasks.values())
@@ -0,0 +1,62 @@
+# Stockage compact des tâches (voir task_store.py)
+
+import random
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task
+from pert_gantt.task_store import ColumnIndex, StringColumn, TaskStore
+
+
+def _project(ids):
+    rng = random.Random(3)
+    scheduler = ProjectScheduler()
+    tasks = [Task(task_id, f'Tâche {task_id}', duration=rng.randint(1, 6)) for task_id in ids]
+    for task in tasks:
+        scheduler.add_task(task)
+    for _ in range(2 * len(tasks)):
+        u, v = sorted(rng.sample(range(len(tasks)), 2))
+        tasks[v].add_dependency(tasks[u], rng.choice(('FS', 'SS', 'FF', 'SF')), rng.choice((0, 1, -1)))
+    return scheduler
+
+
+def _results(scheduler):
+    return {task_id: (task.earliest_start, task.earliest_finish, task.latest_start, task.latest_finish,
+                      task.total_float, task.free_float, task.is_critical)
+            for task_id, task in scheduler.tasks.items()}
+
+
+def test_compact_schedule_matches_objects():
+    objects = _project([f'tâche-{i:03d}' for i in range(40)])
+    compact = objects.to_compact()
+    objects.schedule_project()
+    compact.schedule_project()
+    assert compact.project_duration == objects.project_duration
+    assert _results(compact) == _results(objects)
+    assert [task.id for task in compact.critical_path] == [task.id for task in objects.critical_path]
+
+    compact.update_duration('tâche-005', 9)
+    objects.update_duration('tâche-005', 9)
+    assert compact.reschedule() == objects.reschedule()
+    assert _results(compact) == _results(objects)
+
+
+def test_string_ids_are_packed_and_searchable():
+    ids = ['b', 'é', 'a', 'ab', '']
+    store = TaskStore(ids, [1] * len(ids), [(2, 0, 0, 0)], names=['B', 'E', 'A', 'AB', 'vide'])
+    assert isinstance(store.ids, StringColumn) and isinstance(store.names, StringColumn)
+    assert list(store.ids) == ids and store.names[-1] == 'vide'
+    assert isinstance(store.index, ColumnIndex)
+    assert [store.index[task_id] for task_id in ids] == [0, 1, 2, 3, 4]
+    assert 'c' not in store.index and 1 not in store.index
+    with pytest.raises(KeyError):
+        store.index['zz']
+    scheduler = ProjectScheduler.from_store(store)
+    assert scheduler.tasks['é'].name == 'E'
+
+
+def test_integer_ids_stay_python_ints():
+    store = TaskStore([10, 20, 30], [1, 2, 3], [(0, 1, 0, 0), (1, 2, 0, 0)])
+    assert store.ids == [10, 20, 30]
+    assert store.index == {10: 0, 20: 1, 30: 2}
+    assert list(store.names) == ['10', '20', '30']
@@ -0,0 +1,72 @@
+# Diagnostic du graphe de dépendances (voir validation.py)
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task
+from pert_gantt.validation import CycleError, GraphValidationError
+
+
+def _project(ids='ABCD'):
+    scheduler = ProjectScheduler()
+    for task_id in ids:
+        scheduler.add_task(Task(task_id, task_id, duration=2))
+    return scheduler
+
+
+def _link(scheduler, task_id, predecessor_id, dep_type='FS', lag=0):
+    scheduler.tasks[task_id].add_dependency(scheduler.tasks[predecessor_id], dep_type, lag)
+
+
+def test_duplicates_keep_lag_apart():
+    scheduler = _project()
+    _link(scheduler, 'B', 'A')
+    _link(scheduler, 'B', 'A')
+    _link(scheduler, 'B', 'A', 'FS', 3)  # Même type, autre lag : pas un doublon
+    _link(scheduler, 'C', 'B', 'SS', 1)
+    _link(scheduler, 'C', 'B', 'SS', 1)
+    report = scheduler.validate()
+    assert report.duplicate_edges == [('A', 'B', 'FS', 0), ('B', 'C', 'SS', 1)]
+    assert report.orphans == ['D']
+    assert not report.has_errors and report.has_warnings
+    assert report.format() == [
+        "AVERTISSEMENT dépendance en double: A --[FS+0]--> B",
+        "AVERTISSEMENT dépendance en double: B --[SS+1]--> C",
+        "AVERTISSEMENT tâche isolée (aucune dépendance): D",
+    ]
+
+
+def test_unknown_type_is_reported_and_scheduled_as_fs():
+    scheduler = _project('AB')
+    _link(scheduler, 'B', 'A', 'XX')
+    report = scheduler.validate()
+    assert report.unknown_types == [('A', 'B', 'XX')]
+    scheduler.schedule_project()
+    assert scheduler.tasks['B'].earliest_start == 2
+
+
+def test_every_cycle_is_reported():
+    scheduler = _project('ABCDE')
+    _link(scheduler, 'B', 'A')
+    _link(scheduler, 'A', 'B')
+    _link(scheduler, 'D', 'C')
+    _link(scheduler, 'E', 'D')
+    _link(scheduler, 'C', 'E')
+    report = scheduler.validate()
+    assert report.has_errors
+    assert sorted(sorted(component) for component in report.cyclic_components) == [['A', 'B'], ['C', 'D', 'E']]
+    assert all(len(cycle) in (2, 3) for cycle in report.cycles)
+    with pytest.raises(CycleError) as error:
+        scheduler.schedule_project()
+    assert sorted(error.value.task_ids) == ['A', 'B', 'C', 'D', 'E']
+
+
+def test_missing_predecessors_raise_with_report():
+    scheduler = _project('AB')
+    _link(scheduler, 'B', 'A')
+    scheduler.tasks['B'].add_dependency(Task('X', 'X', duration=1))
+    scheduler.tasks['A'].add_dependency(Task('Y', 'Y', duration=1))
+    report = scheduler.validate()
+    assert report.missing_tasks == [('Y', 'A'), ('X', 'B')]
+    with pytest.raises(GraphValidationError) as error:
+        scheduler.schedule_project()
+    assert error.value.report.missing_tasks == report.missing_tasks
@@ -0,0 +1,126 @@
+# Hiérarchie WBS : liens des tâches récapitulatives (voir wbs.expand_summary_links)
+
+import csv
+from datetime import date
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task
+
+
+def _project(links):
+    scheduler = ProjectScheduler()
+    for task_id, duration in (('A', 1), ('B', 5), ('S', 0), ('X', 2)):
+        scheduler.add_task(Task(task_id, task_id, duration=duration))
+    for task_id, predecessor_id, dep_type in links:
+        scheduler.tasks[task_id].add_dependency(scheduler.tasks[predecessor_id], dep_type, 0)
+    scheduler.set_hierarchy({'A': 'S', 'B': 'S'})
+    scheduler.schedule_project()
+    return scheduler
+
+
+def test_ss_link_leaving_summary_starts_with_summary():
+    scheduler = _project([('B', 'A', 'FS'), ('X', 'S', 'SS')])
+    assert scheduler.tasks['X'].earliest_start == 0
+    assert scheduler.wbs.summary('S').earliest_finish == 6
+
+
+def test_fs_link_leaving_summary_waits_for_last_child():
+    scheduler = _project([('B', 'A', 'FS'), ('X', 'S', 'FS')])
+    assert scheduler.tasks['X'].earliest_start == 6
+
+
+def test_ff_link_entering_summary_constrains_its_finish():
+    scheduler = _project([('S', 'X', 'FF')])
+    summary = scheduler.wbs.summary('S')
+    assert (summary.earliest_start, summary.earliest_finish) == (0, 5)
+    assert scheduler.tasks['A'].earliest_start == 0
+
+
+def test_summary_links_grow_linearly():
+    scheduler = ProjectScheduler()
+    parents = {}
+    for group in ('P', 'Q'):
+        scheduler.add_task(Task(group, group, duration=0))
+        for i in range(50):
+            scheduler.add_task(Task(f"{group}{i}", f"{group}{i}", duration=1))
+            parents[f"{group}{i}"] = group
+    scheduler.tasks['Q'].add_dependency(scheduler.tasks['P'])
+    scheduler.set_hierarchy(parents)
+    links = sum(len(task.predecessors) for task in scheduler.tasks.values())
+    assert links == 2 * 100 + 1
+    scheduler.schedule_project()
+    assert scheduler.tasks['Q0'].earliest_start == 1
+
+
+def _phases():
+    """PH1 ⊃ {S ⊃ {A, B}, C}, X après PH1 ; « S#début » est une vraie tâche"""
+    scheduler = ProjectScheduler()
+    scheduler.start_date = date(2026, 1, 5)
+    for task_id, duration in (('PH1', 0), ('S', 0), ('A', 1), ('B', 5), ('C', 2), ('X', 2), ('S#début', 1)):
+        scheduler.add_task(Task(task_id, task_id, duration=duration))
+    tasks = scheduler.tasks
+    tasks['B'].add_dependency(tasks['A'])
+    tasks['C'].add_dependency(tasks['S'])
+    tasks['X'].add_dependency(tasks['PH1'])
+    tasks['S#début'].add_dependency(tasks['X'])
+    scheduler.set_hierarchy({'S': 'PH1', 'C': 'PH1', 'A': 'S', 'B': 'S'})
+    scheduler.schedule_project()
+    return scheduler
+
+
+def _dates(scheduler):
+    return {task.id: (task.earliest_start, task.earliest_finish, task.total_float)
+            for task in scheduler._visible_tasks()}
+
+
+def test_milestones_stay_internal():
+    scheduler = _phases()
+    assert [task.id for task in scheduler.critical_path] == ['A', 'B', 'C', 'X', 'S#début']
+    assert _dates(scheduler) == {'A': (0, 1, 0), 'B': (1, 6, 0), 'C': (6, 8, 0), 'X': (8, 10, 0),
+                                 'S#début': (10, 11, 0), 'S': (0, 6, 0), 'PH1': (0, 8, 0)}
+    assert set(scheduler.task_dates()) == {'A', 'B', 'C', 'X', 'S#début', 'S', 'PH1'}
+    assert not any(scheduler.wbs.is_milestone(task_id) for task_id in ('S#début', 'S#fin'))
+
+
+def test_csv_round_trip_keeps_hierarchy(tmp_path):
+    scheduler = _phases()
+    for order in ('topological', 'earliest_start', 'insertion'):
+        path = str(tmp_path / f'{order}.csv')
+        assert scheduler.export_to_csv(path, order) == 7
+        with open(path, newline='', encoding='utf-8') as file:
+            rows = {row['ID']: row for row in csv.DictReader(file)}
+        assert set(rows) == {'A', 'B', 'C', 'X', 'S#début', 'S', 'PH1'}
+        assert (rows['S']['Parent'], rows['A']['Parent'], rows['X']['Parent']) == ('PH1', 'S', '')
+        assert rows['C']['Prédécesseurs'] == 'S(FS,0)' and rows['S']['Prédécesseurs'] == ''
+
+        loaded = ProjectScheduler.from_csv(path)
+        loaded.schedule_project()
+        assert _dates(loaded) == _dates(scheduler)
+        assert [task.id for task in loaded.critical_path] == [task.id for task in scheduler.critical_path]
+    with pytest.raises(TypeError):
+        ProjectScheduler.from_csv(path, compact=True)
+
+
+def test_summaries_addressable_and_changes_reported():
+    scheduler = _phases()
+    scheduler.add_task(Task('Y', 'Y', duration=1))
+    scheduler.add_dependency('Y', 'PH1')
+    changed = scheduler.reschedule()
+    assert scheduler.tasks['Y'].earliest_start == 8
+    assert not any(scheduler.wbs.is_milestone(task_id) for task_id in changed)
+
+    scheduler.update_duration('B', 7)
+    changed = scheduler.reschedule()
+    assert {'B', 'S', 'PH1', 'C', 'Y'} <= changed
+    assert not any(scheduler.wbs.is_milestone(task_id) for task_id in changed)
+    assert scheduler.wbs.summary('PH1').earliest_finish == 10 and scheduler.tasks['Y'].earliest_start == 10
+
+    assert scheduler.remove_dependency('Y', 'PH1') == 1
+    scheduler.reschedule()
+    assert scheduler.tasks['Y'].earliest_start == 0
+    assert scheduler.remove_dependency('A', 'S') == 0  # Lien de structure
+    with pytest.raises(TypeError):
+        scheduler.update_duration('PH1', 3)
+    with pytest.raises(ValueError):
+        scheduler.add_dependency('A', 'PH1')
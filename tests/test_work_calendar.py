@@ -0,0 +1,101 @@
+# Calendrier de travail et conversion décalage <-> date (voir work_calendar.py)
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from pert_gantt import ProjectScheduler, Task
+from pert_gantt.work_calendar import WorkCalendar, easter_sunday, offset_converter, public_holidays
+
+START = date(2026, 1, 5)  # Un lundi
+
+
+def _working_days(calendar, count):
+    """Référence jour par jour (équivalent de addWorkingDays côté frontend)"""
+    days, day = [], calendar.start_date
+    while len(days) < count:
+        if calendar.is_working_day(day):
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+@pytest.mark.parametrize('working_days, country_code', [
+    ((1, 2, 3, 4, 5), 'FR'), ((1, 2, 3, 4, 5), None), ((1, 3, 6), 'FR'), ((1, 2, 3, 4, 5, 6, 7), 'fr'),
+])
+def test_conversions_match_day_by_day(working_days, country_code):
+    calendar = WorkCalendar(START, working_days, holidays={date(2026, 2, 4), date(2027, 3, 3)},
+                            extra_working_days={date(2026, 1, 10)}, country_code=country_code)
+    days = _working_days(calendar, 900)  # Plusieurs extensions de l'index
+    assert [calendar.date_at(k) for k in range(len(days))] == days
+    assert [calendar.offset_of(day) for day in days] == list(range(len(days)))
+    assert calendar.date_at(3.7) == days[3]
+    assert calendar.finish_date(5) == days[4] and calendar.finish_date(4.2) == days[4]
+    rng = random.Random(1)
+    for _ in range(50):
+        i, j = sorted(rng.sample(range(len(days)), 2))
+        assert calendar.working_days_between(days[i], days[j]) == j - i
+        assert calendar.add_working_days(days[i], j - i) == days[j]
+
+
+def test_closed_day_maps_to_next_working_day():
+    calendar = WorkCalendar(START, country_code='FR')
+    assert calendar.offset_of(date(2026, 1, 10)) == calendar.offset_of(date(2026, 1, 12)) == 5  # Samedi
+    assert calendar.date_at(calendar.offset_of(date(2026, 5, 1))) == date(2026, 5, 4)  # Fête du travail
+    with pytest.raises(ValueError):
+        calendar.offset_of(date(2026, 1, 4))
+    with pytest.raises(ValueError):
+        calendar.date_at(-1)
+    with pytest.raises(ValueError):
+        WorkCalendar(START, working_days=())
+
+
+def test_french_public_holidays():
+    assert easter_sunday(2024) == date(2024, 3, 31)
+    assert easter_sunday(2026) == date(2026, 4, 5)
+    assert easter_sunday(2038) == date(2038, 4, 25)
+    holidays = public_holidays('FR', [2026])
+    assert len(holidays) == 11
+    assert {date(2026, 4, 6), date(2026, 5, 14), date(2026, 5, 25), date(2026, 7, 14)} <= holidays
+    assert public_holidays('DE', [2026]) == set()
+
+
+def test_resource_exceptions():
+    calendar = WorkCalendar(START, country_code='FR')
+    calendar.add_resource_exceptions('R1', days_off=[date(2026, 1, 6)], days_on=[date(2026, 1, 10)])
+    assert calendar.for_resource('R2') is calendar
+    resource = calendar.for_resource('R1')
+    assert resource is calendar.for_resource('R1')  # Mis en cache
+    assert [resource.date_at(k) for k in range(6)] == [
+        date(2026, 1, 5), date(2026, 1, 7), date(2026, 1, 8), date(2026, 1, 9), date(2026, 1, 10),
+        date(2026, 1, 12)]
+    assert calendar.date_at(1) == date(2026, 1, 6)  # Calendrier du projet inchangé
+    calendar.add_resource_exceptions('R1', days_off=[date(2026, 1, 7)])
+    assert calendar.for_resource('R1').date_at(1) == date(2026, 1, 8)
+
+
+def test_scheduler_task_dates_in_bulk():
+    scheduler = ProjectScheduler()
+    scheduler.start_date = START
+    for task_id, duration in (('A', 3), ('B', 0), ('C', 8)):
+        scheduler.add_task(Task(task_id, task_id, duration=duration))
+    scheduler.add_dependency('B', 'A')
+    scheduler.add_dependency('C', 'B')
+    scheduler.schedule_project()
+    dates = scheduler.task_dates()
+    assert isinstance(scheduler.calendar, WorkCalendar)
+    assert dates['A'] == (date(2026, 1, 5), date(2026, 1, 7), date(2026, 1, 5), date(2026, 1, 7))
+    assert dates['B'] == (date(2026, 1, 8),) * 4  # Jalon : fin le jour du début
+    assert dates['C'] == (date(2026, 1, 8), date(2026, 1, 19), date(2026, 1, 8), date(2026, 1, 19))
+
+
+def test_offset_converter():
+    calendar = WorkCalendar(START)
+    to_offset = offset_converter(calendar)
+    assert to_offset(date(2026, 1, 12)) == 5.0
+    assert to_offset(date(2026, 1, 12), finish=True) == 6.0
+    assert to_offset(4) == 4.0
+    assert offset_converter(start_date=START)(date(2026, 1, 12)) == 7.0
+    with pytest.raises(ValueError):
+        offset_converter()(date(2026, 1, 12))